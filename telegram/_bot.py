@@ -648,20 +648,25 @@ class Bot(TelegramObject, AsyncContextManager["Bot"]):
         # This also converts datetimes into timestamps.
         # We don't do this earlier so that _insert_defaults (see above) has a chance to convert
         # to the default timezone in case this is called by ExtBot
-        request_data = RequestData(
+        # Exiting the context closes files that were opened for this request
+        with RequestData(
             parameters=[RequestParameter.from_input(key, value) for key, value in data.items()],
-        )
-
-        request = self._request[0] if endpoint == "getUpdates" else self._request[1]
+        ) as request_data:
+            return await self._get_request(endpoint).post(
+                url=f"{self._base_url}/{endpoint}",
+                request_data=request_data,
+                read_timeout=read_timeout,
+                write_timeout=write_timeout,
+                connect_timeout=connect_timeout,
+                pool_timeout=pool_timeout,
+            )
 
-        return await request.post(
-            url=f"{self._base_url}/{endpoint}",
-            request_data=request_data,
-            read_timeout=read_timeout,
-            write_timeout=write_timeout,
-            connect_timeout=connect_timeout,
-            pool_timeout=pool_timeout,
-        )
+    def _get_request(self, endpoint: str) -> BaseRequest:
+        """Returns the request object used for requests to the given endpoint. File downloads use
+        the pseudo endpoint ``"file_download"``. Can be overridden to route requests to different
+        request objects.
+        """
+        return self._request[0] if endpoint == "getUpdates" else self._request[1]
 
     async def _send_message(
         self,
@@ -17,13 +17,15 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains an object that represents a Telegram File."""
+import os
 import shutil
+import tempfile
 import urllib.parse as urllib_parse
 from base64 import b64decode
 from pathlib import Path
-from typing import TYPE_CHECKING, BinaryIO, Optional
+from typing import TYPE_CHECKING, AsyncIterator, BinaryIO, Optional
 
-from telegram._passport.credentials import decrypt
+from telegram._passport.credentials import decrypt_stream
 from telegram._telegramobject import TelegramObject
 from telegram._utils.defaultvalue import DEFAULT_NONE
 from telegram._utils.files import is_local_file
@@ -32,6 +34,15 @@ from telegram._utils.types import FilePathInput, JSONDict, ODVInput
 if TYPE_CHECKING:
     from telegram import FileCredentials
 
+# The size of the chunks in which local files are read
+_CHUNK_SIZE = 64 * 1024
+
+
+async def _read_local_file(path: Path) -> AsyncIterator[bytes]:
+    with path.open("rb") as file:
+        while chunk := file.read(_CHUNK_SIZE):
+            yield chunk
+
 
 class File(TelegramObject):
     """
@@ -45,6 +56,11 @@ class File(TelegramObject):
     .. versionchanged:: 20.0
         ``download`` was split into :meth:`download_to_drive` and :meth:`download_to_memory`.
 
+    .. versionchanged:: NEXT.VERSION
+        The file is downloaded chunk by chunk and written to its destination as the chunks
+        arrive, such that it never has to be held in memory completely. See
+        :meth:`telegram.request.BaseRequest.retrieve_stream`.
+
     Note:
         * Maximum file size to download is
           :tg-const:`telegram.constants.FileSizeLimit.FILESIZE_DOWNLOAD`.
@@ -114,8 +130,33 @@ class File(TelegramObject):
             )
         )
 
-    def _prepare_decrypt(self, buf: bytes) -> bytes:
-        return decrypt(b64decode(self._credentials.secret), b64decode(self._credentials.hash), buf)
+    def _download_chunks(
+        self,
+        read_timeout: ODVInput[float],
+        write_timeout: ODVInput[float],
+        connect_timeout: ODVInput[float],
+        pool_timeout: ODVInput[float],
+    ) -> AsyncIterator[bytes]:
+        chunks: AsyncIterator[bytes]
+        if is_local_file(self.file_path):
+            chunks = _read_local_file(Path(self.file_path))
+        else:
+            request = self.get_bot()._get_request(  # pylint: disable=protected-access
+                "file_download"
+            )
+            chunks = request.retrieve_stream(
+                self._get_encoded_url(),
+                read_timeout=read_timeout,
+                write_timeout=write_timeout,
+                connect_timeout=connect_timeout,
+                pool_timeout=pool_timeout,
+            )
+        # if _credentials exists we want to decrypt the file
+        if self._credentials:
+            chunks = decrypt_stream(
+                b64decode(self._credentials.secret), b64decode(self._credentials.hash), chunks
+            )
+        return chunks
 
     async def download_to_drive(
         self,
@@ -177,24 +218,17 @@ class File(TelegramObject):
 
         """
         local_file = is_local_file(self.file_path)
-        url = None if local_file else self._get_encoded_url()
 
-        # if _credentials exists we want to decrypt the file
         if local_file and self._credentials:
             file_to_decrypt = Path(self.file_path)
-            buf = self._prepare_decrypt(file_to_decrypt.read_bytes())
             if custom_path is not None:
-                path = Path(custom_path)
+                filename = Path(custom_path)
             else:
-                path = Path(str(file_to_decrypt.parent) + "/decrypted_" + file_to_decrypt.name)
-            path.write_bytes(buf)
-            return path
-
-        if custom_path is not None and local_file:
+                filename = Path(str(file_to_decrypt.parent) + "/decrypted_" + file_to_decrypt.name)
+        elif custom_path is not None and local_file:
             shutil.copyfile(self.file_path, str(custom_path))
             return Path(custom_path)
-
-        if custom_path:
+        elif custom_path:
             filename = Path(custom_path)
         elif local_file:
             return Path(self.file_path)
@@ -203,16 +237,31 @@ class File(TelegramObject):
         else:
             filename = Path.cwd() / self.file_id
 
-        buf = await self.get_bot().request.retrieve(
-            url,
-            read_timeout=read_timeout,
-            write_timeout=write_timeout,
-            connect_timeout=connect_timeout,
-            pool_timeout=pool_timeout,
-        )
-        if self._credentials:
-            buf = self._prepare_decrypt(buf)
-        filename.write_bytes(buf)
+        chunks = self._download_chunks(read_timeout, write_timeout, connect_timeout, pool_timeout)
+        # The file is downloaded to a temporary file first and moved to its destination only on
+        # success. This way, an existing file is neither truncated nor deleted on failure.
+        with tempfile.NamedTemporaryFile(
+            dir=filename.parent, prefix=f".{filename.name}.", suffix=".part", delete=False
+        ) as file:
+            temp_path = Path(file.name)
+            try:
+                async for chunk in chunks:
+                    file.write(chunk)
+            except BaseException:
+                file.close()
+                temp_path.unlink(missing_ok=True)
+                raise
+
+        try:
+            # Temporary files are only readable by the owner. Use the same permissions as
+            # `open` would have used instead.
+            umask = os.umask(0)
+            os.umask(umask)
+            temp_path.chmod(0o666 & ~umask)
+            os.replace(temp_path, filename)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
         return filename
 
     async def download_to_memory(
@@ -235,6 +284,12 @@ class File(TelegramObject):
             If you want to immediately read the data from ``out`` after calling this method, you
             should call ``out.seek(0)`` first. See also :meth:`io.IOBase.seek`.
 
+        Note:
+            The chunks of the file are written to ``out`` as they arrive. For encrypted files,
+            the hash of the decrypted data can only be checked once all chunks were written, i.e.
+            ``out`` may contain data even if :exc:`telegram.error.PassportDecryptionError` is
+            raised.
+
         .. versionadded:: 20.0
 
         Args:
@@ -255,22 +310,10 @@ class File(TelegramObject):
                 :paramref:`telegram.request.BaseRequest.post.pool_timeout`. Defaults to
                 :attr:`~telegram.request.BaseRequest.DEFAULT_NONE`.
         """
-        local_file = is_local_file(self.file_path)
-        url = None if local_file else self._get_encoded_url()
-        path = Path(self.file_path) if local_file else None
-        if local_file:
-            buf = path.read_bytes()
-        else:
-            buf = await self.get_bot().request.retrieve(
-                url,
-                read_timeout=read_timeout,
-                write_timeout=write_timeout,
-                connect_timeout=connect_timeout,
-                pool_timeout=pool_timeout,
-            )
-        if self._credentials:
-            buf = self._prepare_decrypt(buf)
-        out.write(buf)
+        async for chunk in self._download_chunks(
+            read_timeout, write_timeout, connect_timeout, pool_timeout
+        ):
+            out.write(chunk)
 
     async def download_as_bytearray(
         self,
@@ -316,20 +359,10 @@ class File(TelegramObject):
         if buf is None:
             buf = bytearray()
 
-        if is_local_file(self.file_path):
-            bytes_data = Path(self.file_path).read_bytes()
-        else:
-            bytes_data = await self.get_bot().request.retrieve(
-                self._get_encoded_url(),
-                read_timeout=read_timeout,
-                write_timeout=write_timeout,
-                connect_timeout=connect_timeout,
-                pool_timeout=pool_timeout,
-            )
-        if self._credentials:
-            buf.extend(self._prepare_decrypt(bytes_data))
-        else:
-            buf.extend(bytes_data)
+        async for chunk in self._download_chunks(
+            read_timeout, write_timeout, connect_timeout, pool_timeout
+        ):
+            buf.extend(chunk)
         return buf
 
     def set_credentials(self, credentials: "FileCredentials") -> None:
@@ -19,11 +19,12 @@
 """This module contains an object that represents a Telegram InputFile."""
 
 import mimetypes
-from typing import IO, Optional, Union
+from pathlib import Path
+from typing import IO, Optional, Union, cast
 from uuid import uuid4
 
-from telegram._utils.files import load_file
-from telegram._utils.types import FieldTuple
+from telegram._utils.files import guess_file_name, load_file
+from telegram._utils.types import FieldTuple, StreamingFieldTuple
 
 _DEFAULT_MIME_TYPE = "application/octet-stream"
 
@@ -39,22 +40,41 @@ class InputFile:
           in addition.
 
     Args:
-        obj (:term:`file object` | :obj:`bytes` | :obj:`str`): An open file descriptor or the files
-            content as bytes or string.
+        obj (:term:`file object` | :obj:`bytes` | :obj:`str` | :class:`pathlib.Path`): An open
+            file descriptor, the files content as bytes or string or the path of a local file.
 
             Note:
-                If :paramref:`obj` is a string, it will be encoded as bytes via
-                :external:obj:`obj.encode('utf-8') <str.encode>`.
+                * If :paramref:`obj` is a string, it will be encoded as bytes via
+                  :external:obj:`obj.encode('utf-8') <str.encode>`.
+                * If :paramref:`obj` is a path, the file is opened by this object and read only
+                  while uploading it, just like a file handle with :paramref:`read_file_handle`
+                  set to :obj:`False`. The file is closed by :meth:`close` after each request and
+                  opened again if this object is uploaded again.
 
             .. versionchanged:: 20.0
                 Accept string input.
+
+            .. versionchanged:: NEXT.VERSION
+                Accept :class:`pathlib.Path` input.
         filename (:obj:`str`, optional): Filename for this InputFile.
         attach (:obj:`bool`, optional): Pass :obj:`True` if the parameter this file belongs to in
             the request to Telegram should point to the multipart data via an ``attach://`` URI.
             Defaults to `False`.
+        read_file_handle (:obj:`bool`, optional): If :obj:`True` and :paramref:`obj` is a file
+            handle, the data will be read from the file handle on initialization of this object.
+            If :obj:`False`, the file handle is read only when the file is uploaded.
+            :class:`~telegram.request.HTTPXRequest` streams the data in chunks via
+            :attr:`streaming_field_tuple`, such that the file never has to be held in memory
+            completely. Defaults to :obj:`True`.
+
+            Note:
+                The file handle must stay open until the request was made. If the file handle
+                supports :meth:`~io.IOBase.seek`, it is read from its beginning on each upload
+                of this object.
+
+            .. versionadded:: NEXT.VERSION
 
     Attributes:
-        input_file_content (:obj:`bytes`): The binary content of the file to send.
         attach_name (:obj:`str`): Optional. If present, the parameter this file belongs to in
             the request to Telegram should point to the multipart data via a an URI of the form
             ``attach://<attach_name>`` URI.
@@ -63,21 +83,32 @@ class InputFile:
 
     """
 
-    __slots__ = ("attach_name", "filename", "input_file_content", "mimetype")
+    __slots__ = ("_content", "_path", "attach_name", "filename", "mimetype")
 
     def __init__(
         self,
-        obj: Union[IO[bytes], bytes, str],
+        obj: Union[IO[bytes], bytes, str, Path],
         filename: Optional[str] = None,
         attach: bool = False,
+        read_file_handle: bool = True,
     ):
+        # Only set if this object opened the file itself and hence is responsible for closing it
+        self._path: Optional[Path] = None
+
         if isinstance(obj, bytes):
-            self.input_file_content: bytes = obj
+            self._content: Union[bytes, IO[bytes]] = obj
+        elif isinstance(obj, Path):
+            self._path = obj
+            self._content = obj.open(mode="rb")
+            filename = filename or obj.name
         elif isinstance(obj, str):
-            self.input_file_content = obj.encode("utf-8")
-        else:
-            reported_filename, self.input_file_content = load_file(obj)
+            self._content = obj.encode("utf-8")
+        elif read_file_handle:
+            reported_filename, self._content = load_file(obj)
             filename = filename or reported_filename
+        else:
+            self._content = obj
+            filename = filename or guess_file_name(obj)
 
         self.attach_name: Optional[str] = "attached" + uuid4().hex if attach else None
 
@@ -90,6 +121,26 @@ class InputFile:
 
         self.filename: str = filename or self.mimetype.replace("/", ".")
 
+    def _get_content(self) -> Union[bytes, IO[bytes]]:
+        if self._path is not None and cast(IO[bytes], self._content).closed:
+            self._content = self._path.open(mode="rb")
+        return self._content
+
+    @property
+    def input_file_content(self) -> bytes:
+        """:obj:`bytes`: The binary content of the file to send.
+
+        .. versionchanged:: NEXT.VERSION
+            This is now a read-only property. If the file is read only while uploading, see
+            :paramref:`read_file_handle`, accessing it reads the complete file.
+        """
+        content = self._get_content()
+        if isinstance(content, bytes):
+            return content
+        if content.seekable():
+            content.seek(0)
+        return content.read()
+
     @property
     def field_tuple(self) -> FieldTuple:
         """Field tuple representing the contents of the file for upload to the Telegram servers.
@@ -99,6 +150,30 @@ class InputFile:
         """
         return self.filename, self.input_file_content, self.mimetype
 
+    @property
+    def streaming_field_tuple(self) -> StreamingFieldTuple:
+        """Same as :attr:`field_tuple`, except that the file handle is returned instead of the
+        content if the file is read only while uploading, see :paramref:`read_file_handle`.
+        Networking backends can use this to read the file in chunks while uploading it.
+
+        .. versionadded:: NEXT.VERSION
+
+        Returns:
+            Tuple[:obj:`str`, :obj:`bytes` | :term:`file object`, :obj:`str`]:
+        """
+        return self.filename, self._get_content(), self.mimetype
+
+    def close(self) -> None:
+        """Closes the file handle, if this object opened it itself, i.e. if a
+        :class:`pathlib.Path` was passed as :paramref:`obj`. File handles that were passed as
+        :paramref:`obj` are left untouched. This is called after each request that uploads this
+        object.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        if self._path is not None:
+            cast(IO[bytes], self._content).close()
+
     @property
     def attach_uri(self) -> Optional[str]:
         """URI to insert into the JSON data for uploading the file. Returns :obj:`None`, if
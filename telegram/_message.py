@@ -21,7 +21,19 @@
 import datetime
 import re
 from html import escape
-from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, TypedDict, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 from telegram._chat import Chat
 from telegram._chatboost import ChatBoostAdded
@@ -829,6 +841,7 @@ class Message(MaybeInaccessibleMessage):
     # fmt: on
     __slots__ = (
         "_effective_attachment",
+        "_lazy_data",
         "animation",
         "audio",
         "author_signature",
@@ -905,6 +918,10 @@ class Message(MaybeInaccessibleMessage):
         "write_access_allowed",
     )
 
+    # Maps the keys of the JSON data to the functions converting the respective values.
+    # Built on first use, see _get_de_json_converters
+    __DE_JSON_CONVERTERS: ClassVar[Optional[Dict[str, Callable[[Any, "Bot"], object]]]] = None
+
     def __init__(
         self,
         message_id: int,
@@ -1081,6 +1098,8 @@ class Message(MaybeInaccessibleMessage):
             self.sender_boost_count: Optional[int] = sender_boost_count
 
             self._effective_attachment = DEFAULT_NONE
+            # Raw data of the fields whose conversion was deferred, see _defer_fields
+            self._lazy_data: Optional[JSONDict] = None
 
             self._id_attrs = (self.message_id, self.chat)
 
@@ -1119,80 +1138,9 @@ class Message(MaybeInaccessibleMessage):
         return None
 
     @classmethod
-    def de_json(cls, data: Optional[JSONDict], bot: "Bot") -> Optional["Message"]:
-        """See :meth:`telegram.TelegramObject.de_json`."""
-        data = cls._parse_data(data)
-
-        if not data:
-            return None
-
-        # Get the local timezone from the bot if it has defaults
-        loc_tzinfo = extract_tzinfo_from_defaults(bot)
-
-        data["from_user"] = User.de_json(data.pop("from", None), bot)
-        data["sender_chat"] = Chat.de_json(data.get("sender_chat"), bot)
-        data["entities"] = MessageEntity.de_list(data.get("entities"), bot)
-        data["caption_entities"] = MessageEntity.de_list(data.get("caption_entities"), bot)
-        data["reply_to_message"] = Message.de_json(data.get("reply_to_message"), bot)
-        data["edit_date"] = from_timestamp(data.get("edit_date"), tzinfo=loc_tzinfo)
-        data["audio"] = Audio.de_json(data.get("audio"), bot)
-        data["document"] = Document.de_json(data.get("document"), bot)
-        data["animation"] = Animation.de_json(data.get("animation"), bot)
-        data["game"] = Game.de_json(data.get("game"), bot)
-        data["photo"] = PhotoSize.de_list(data.get("photo"), bot)
-        data["sticker"] = Sticker.de_json(data.get("sticker"), bot)
-        data["story"] = Story.de_json(data.get("story"), bot)
-        data["video"] = Video.de_json(data.get("video"), bot)
-        data["voice"] = Voice.de_json(data.get("voice"), bot)
-        data["video_note"] = VideoNote.de_json(data.get("video_note"), bot)
-        data["contact"] = Contact.de_json(data.get("contact"), bot)
-        data["location"] = Location.de_json(data.get("location"), bot)
-        data["venue"] = Venue.de_json(data.get("venue"), bot)
-        data["new_chat_members"] = User.de_list(data.get("new_chat_members"), bot)
-        data["left_chat_member"] = User.de_json(data.get("left_chat_member"), bot)
-        data["new_chat_photo"] = PhotoSize.de_list(data.get("new_chat_photo"), bot)
-        data["message_auto_delete_timer_changed"] = MessageAutoDeleteTimerChanged.de_json(
-            data.get("message_auto_delete_timer_changed"), bot
-        )
-        data["pinned_message"] = MaybeInaccessibleMessage.de_json(data.get("pinned_message"), bot)
-        data["invoice"] = Invoice.de_json(data.get("invoice"), bot)
-        data["successful_payment"] = SuccessfulPayment.de_json(data.get("successful_payment"), bot)
-        data["passport_data"] = PassportData.de_json(data.get("passport_data"), bot)
-        data["poll"] = Poll.de_json(data.get("poll"), bot)
-        data["dice"] = Dice.de_json(data.get("dice"), bot)
-        data["via_bot"] = User.de_json(data.get("via_bot"), bot)
-        data["proximity_alert_triggered"] = ProximityAlertTriggered.de_json(
-            data.get("proximity_alert_triggered"), bot
-        )
-        data["reply_markup"] = InlineKeyboardMarkup.de_json(data.get("reply_markup"), bot)
-        data["video_chat_scheduled"] = VideoChatScheduled.de_json(
-            data.get("video_chat_scheduled"), bot
-        )
-        data["video_chat_started"] = VideoChatStarted.de_json(data.get("video_chat_started"), bot)
-        data["video_chat_ended"] = VideoChatEnded.de_json(data.get("video_chat_ended"), bot)
-        data["video_chat_participants_invited"] = VideoChatParticipantsInvited.de_json(
-            data.get("video_chat_participants_invited"), bot
-        )
-        data["web_app_data"] = WebAppData.de_json(data.get("web_app_data"), bot)
-        data["forum_topic_closed"] = ForumTopicClosed.de_json(data.get("forum_topic_closed"), bot)
-        data["forum_topic_created"] = ForumTopicCreated.de_json(
-            data.get("forum_topic_created"), bot
-        )
-        data["forum_topic_reopened"] = ForumTopicReopened.de_json(
-            data.get("forum_topic_reopened"), bot
-        )
-        data["forum_topic_edited"] = ForumTopicEdited.de_json(data.get("forum_topic_edited"), bot)
-        data["general_forum_topic_hidden"] = GeneralForumTopicHidden.de_json(
-            data.get("general_forum_topic_hidden"), bot
-        )
-        data["general_forum_topic_unhidden"] = GeneralForumTopicUnhidden.de_json(
-            data.get("general_forum_topic_unhidden"), bot
-        )
-        data["write_access_allowed"] = WriteAccessAllowed.de_json(
-            data.get("write_access_allowed"), bot
-        )
-        data["users_shared"] = UsersShared.de_json(data.get("users_shared"), bot)
-        data["chat_shared"] = ChatShared.de_json(data.get("chat_shared"), bot)
+    def _get_de_json_converters(cls) -> Dict[str, Callable[[Any, "Bot"], object]]:
+        if Message.__DE_JSON_CONVERTERS is not None:
+            return Message.__DE_JSON_CONVERTERS
 
         # Unfortunately, this needs to be here due to cyclic imports
         from telegram._giveaway import (  # pylint: disable=import-outside-toplevel
@@ -1209,18 +1157,92 @@ class Message(MaybeInaccessibleMessage):
             TextQuote,
         )
 
-        data["giveaway"] = Giveaway.de_json(data.get("giveaway"), bot)
-        data["giveaway_completed"] = GiveawayCompleted.de_json(data.get("giveaway_completed"), bot)
-        data["giveaway_created"] = GiveawayCreated.de_json(data.get("giveaway_created"), bot)
-        data["giveaway_winners"] = GiveawayWinners.de_json(data.get("giveaway_winners"), bot)
-        data["link_preview_options"] = LinkPreviewOptions.de_json(
-            data.get("link_preview_options"), bot
-        )
-        data["external_reply"] = ExternalReplyInfo.de_json(data.get("external_reply"), bot)
-        data["quote"] = TextQuote.de_json(data.get("quote"), bot)
-        data["forward_origin"] = MessageOrigin.de_json(data.get("forward_origin"), bot)
-        data["reply_to_story"] = Story.de_json(data.get("reply_to_story"), bot)
-        data["boost_added"] = ChatBoostAdded.de_json(data.get("boost_added"), bot)
+        def convert_edit_date(value: Optional[int], bot: "Bot") -> Optional[datetime.datetime]:
+            # Get the local timezone from the bot if it has defaults
+            return from_timestamp(value, tzinfo=extract_tzinfo_from_defaults(bot))
+
+        Message.__DE_JSON_CONVERTERS = {
+            "sender_chat": Chat.de_json,
+            "entities": MessageEntity.de_list,
+            "caption_entities": MessageEntity.de_list,
+            "reply_to_message": Message.de_json,
+            "edit_date": convert_edit_date,
+            "audio": Audio.de_json,
+            "document": Document.de_json,
+            "animation": Animation.de_json,
+            "game": Game.de_json,
+            "photo": PhotoSize.de_list,
+            "sticker": Sticker.de_json,
+            "story": Story.de_json,
+            "video": Video.de_json,
+            "voice": Voice.de_json,
+            "video_note": VideoNote.de_json,
+            "contact": Contact.de_json,
+            "location": Location.de_json,
+            "venue": Venue.de_json,
+            "new_chat_members": User.de_list,
+            "left_chat_member": User.de_json,
+            "new_chat_photo": PhotoSize.de_list,
+            "message_auto_delete_timer_changed": MessageAutoDeleteTimerChanged.de_json,
+            "pinned_message": MaybeInaccessibleMessage.de_json,
+            "invoice": Invoice.de_json,
+            "successful_payment": SuccessfulPayment.de_json,
+            "passport_data": PassportData.de_json,
+            "poll": Poll.de_json,
+            "dice": Dice.de_json,
+            "via_bot": User.de_json,
+            "proximity_alert_triggered": ProximityAlertTriggered.de_json,
+            "reply_markup": InlineKeyboardMarkup.de_json,
+            "video_chat_scheduled": VideoChatScheduled.de_json,
+            "video_chat_started": VideoChatStarted.de_json,
+            "video_chat_ended": VideoChatEnded.de_json,
+            "video_chat_participants_invited": VideoChatParticipantsInvited.de_json,
+            "web_app_data": WebAppData.de_json,
+            "forum_topic_closed": ForumTopicClosed.de_json,
+            "forum_topic_created": ForumTopicCreated.de_json,
+            "forum_topic_reopened": ForumTopicReopened.de_json,
+            "forum_topic_edited": ForumTopicEdited.de_json,
+            "general_forum_topic_hidden": GeneralForumTopicHidden.de_json,
+            "general_forum_topic_unhidden": GeneralForumTopicUnhidden.de_json,
+            "write_access_allowed": WriteAccessAllowed.de_json,
+            "users_shared": UsersShared.de_json,
+            "chat_shared": ChatShared.de_json,
+            "giveaway": Giveaway.de_json,
+            "giveaway_completed": GiveawayCompleted.de_json,
+            "giveaway_created": GiveawayCreated.de_json,
+            "giveaway_winners": GiveawayWinners.de_json,
+            "link_preview_options": LinkPreviewOptions.de_json,
+            "external_reply": ExternalReplyInfo.de_json,
+            "quote": TextQuote.de_json,
+            "forward_origin": MessageOrigin.de_json,
+            "reply_to_story": Story.de_json,
+            "boost_added": ChatBoostAdded.de_json,
+        }
+        return Message.__DE_JSON_CONVERTERS
+
+    @classmethod
+    def de_json(cls, data: Optional[JSONDict], bot: "Bot") -> Optional["Message"]:
+        """See :meth:`telegram.TelegramObject.de_json`."""
+        data = cls._parse_data(data)
+
+        if not data:
+            return None
+
+        data["from_user"] = User.de_json(data.pop("from", None), bot)
+        converters = cls._get_de_json_converters()
+        lazy_data: Optional[JSONDict] = None
+        # We don't use `isinstance(bot, ExtBot)` here so that this works
+        # in `python-telegram-bot-raw` as well
+        if getattr(bot, "lazy_de_json", False):
+            lazy_data = {
+                key: data.pop(key)
+                for key in [key for key, value in data.items() if value is not None]
+                if key in converters
+            }
+        else:
+            # Only the fields that are actually present are converted. Absent fields are
+            # filled by the defaults of __init__.
+            cls._convert_fields(data, bot, converters)
 
         api_kwargs = {}
         # This is a deprecated field that TG still returns for backwards compatibility
@@ -1237,9 +1259,51 @@ class Message(MaybeInaccessibleMessage):
             if entry := data.get(key):
                 api_kwargs = {key: entry}
 
-        return super()._de_json(  # type: ignore[return-value]
-            data=data, bot=bot, api_kwargs=api_kwargs
-        )
+        message = super()._de_json(data=data, bot=bot, api_kwargs=api_kwargs)
+        if lazy_data and message is not None:
+            message._defer_fields(lazy_data)  # type: ignore[attr-defined]
+        return message  # type: ignore[return-value]
+
+    def _defer_fields(self, lazy_data: JSONDict) -> None:
+        """Removes the attributes for the keys of ``lazy_data`` from the object, such that they
+        are converted by :meth:`__getattr__` from the stored raw data on first access.
+        """
+        self._lazy_data = lazy_data
+        for key in lazy_data:
+            # object.__delattr__ bypasses the protection of frozen attributes
+            object.__delattr__(self, key)
+
+    if not TYPE_CHECKING:
+        # Hidden from type checkers, which would otherwise accept any attribute of Message
+
+        def __getattr__(self, name: str) -> object:
+            # This is only called if the attribute was not found the usual way, i.e. for the
+            # fields deferred by _defer_fields
+            if name != "_lazy_data":
+                lazy_data = getattr(self, "_lazy_data", None)
+                if lazy_data and name in lazy_data:
+                    value = self._get_de_json_converters()[name](lazy_data.pop(name), self._bot)
+                    object.__setattr__(self, name, value)
+                    return value
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+    def _convert_deferred_fields(self) -> None:
+        lazy_data = getattr(self, "_lazy_data", None)
+        if lazy_data:
+            for name in tuple(lazy_data):
+                getattr(self, name)
+
+    def __getstate__(self) -> Dict[str, Union[str, object]]:
+        """See :meth:`telegram.TelegramObject.__getstate__`."""
+        # Converting the deferred fields while the bot is still available
+        self._convert_deferred_fields()
+        return super().__getstate__()
+
+    def __deepcopy__(self, memodict: Dict[int, object]) -> "Message":
+        """See :meth:`telegram.TelegramObject.__deepcopy__`."""
+        # Converting the deferred fields while the bot is still available
+        self._convert_deferred_fields()
+        return super().__deepcopy__(memodict)
 
     @property
     def effective_attachment(
@@ -46,6 +46,24 @@ if TYPE_CHECKING:
     from telegram import Bot
 
 
+@no_type_check
+def _get_decryptor(secret, hash):
+    if not CRYPTO_INSTALLED:
+        raise RuntimeError(
+            "To use Telegram Passports, PTB must be installed via `pip install "
+            '"python-telegram-bot[passport]"`.'
+        )
+    # Make a SHA512 hash of secret + update
+    digest = Hash(SHA512(), backend=default_backend())
+    digest.update(secret + hash)
+    secret_hash_hash = digest.finalize()
+    # First 32 chars is our key, next 16 is the initialisation vector
+    key, init_vector = secret_hash_hash[:32], secret_hash_hash[32 : 32 + 16]
+    # Init a AES-CBC cipher
+    cipher = Cipher(AES(key), CBC(init_vector), backend=default_backend())
+    return cipher.decryptor()
+
+
 @no_type_check
 def decrypt(secret, hash, data):
     """
@@ -68,20 +86,7 @@ def decrypt(secret, hash, data):
         :obj:`bytes`: The decrypted data as bytes.
 
     """
-    if not CRYPTO_INSTALLED:
-        raise RuntimeError(
-            "To use Telegram Passports, PTB must be installed via `pip install "
-            '"python-telegram-bot[passport]"`.'
-        )
-    # Make a SHA512 hash of secret + update
-    digest = Hash(SHA512(), backend=default_backend())
-    digest.update(secret + hash)
-    secret_hash_hash = digest.finalize()
-    # First 32 chars is our key, next 16 is the initialisation vector
-    key, init_vector = secret_hash_hash[:32], secret_hash_hash[32 : 32 + 16]
-    # Init a AES-CBC cipher and decrypt the data
-    cipher = Cipher(AES(key), CBC(init_vector), backend=default_backend())
-    decryptor = cipher.decryptor()
+    decryptor = _get_decryptor(secret, hash)
     data = decryptor.update(data) + decryptor.finalize()
     # Calculate SHA256 hash of the decrypted data
     digest = Hash(SHA256(), backend=default_backend())
@@ -95,6 +100,46 @@ def decrypt(secret, hash, data):
     return data[data[0] :]
 
 
+@no_type_check
+async def decrypt_stream(secret, hash, chunks):
+    """
+    Like :func:`decrypt`, but decrypts the data chunk by chunk as it arrives, such that it never
+    has to be held in memory completely.
+
+    Args:
+        secret (:obj:`bytes`): The encryption secret.
+        hash (:obj:`bytes`): The hash.
+        chunks (AsyncIterator[:obj:`bytes`]): The chunks of the data to decrypt.
+
+    Raises:
+        :class:`PassportDecryptionError`: Given hash does not match hash of decrypted data. Note
+            that this can only be checked after all chunks were decrypted.
+
+    Yields:
+        :obj:`bytes`: The chunks of the decrypted data.
+
+    """
+    decryptor = _get_decryptor(secret, hash)
+    digest = Hash(SHA256(), backend=default_backend())
+    # The first byte of the decrypted data is the length of the padding at its beginning
+    padding = None
+    async for chunk in chunks:
+        data = decryptor.update(chunk)
+        digest.update(data)
+        if padding is None and data:
+            padding = data[0]
+        if padding:
+            skip = min(padding, len(data))
+            data, padding = data[skip:], padding - skip
+        if data:
+            yield data
+    # CBC doesn't pad, so finalizing yields no more data but checks that the data was complete
+    decryptor.finalize()
+    data_hash = digest.finalize()
+    if data_hash != hash:
+        raise PassportDecryptionError(f"Hashes are not equal! {data_hash} != {hash}")
+
+
 @no_type_check
 def decrypt_json(secret, hash, data):
     """Decrypts data using secret and hash and then decodes utf-8 string and loads json"""
@@ -20,7 +20,6 @@
 import contextlib
 import datetime
 import inspect
-import json
 from collections.abc import Sized
 from contextlib import contextmanager
 from copy import deepcopy
@@ -29,8 +28,10 @@ from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
     Dict,
+    FrozenSet,
     Iterator,
     List,
     Mapping,
@@ -45,6 +46,7 @@ from typing import (
 
 from telegram._utils.datetime import to_timestamp
 from telegram._utils.defaultvalue import DefaultValue
+from telegram._utils.jsoncodec import get_json_codec
 from telegram._utils.types import JSONDict
 from telegram._utils.warnings import warn
 
@@ -53,6 +55,9 @@ if TYPE_CHECKING:
 
 Tele_co = TypeVar("Tele_co", bound="TelegramObject", covariant=True)
 
+# Types of attribute values that can be serialized as is. Used as fast path in to_dict
+_SCALAR_TYPES: FrozenSet[type] = frozenset({str, int, float, bool})
+
 
 class TelegramObject:
     """Base class for most Telegram objects.
@@ -100,6 +105,12 @@ class TelegramObject:
     # just check if `__INIT_PARAMS is None`, since subclasses use the parent class' __INIT_PARAMS
     # unless it's overridden
     __INIT_PARAMS_CHECK: Optional[Type["TelegramObject"]] = None
+    # Used to cache the names of the slots of the class, see _get_attrs_names. The same logic as
+    # for __INIT_PARAMS applies
+    __ALL_SLOTS: ClassVar[Tuple[str, ...]] = ()
+    __PUBLIC_SLOTS: ClassVar[Tuple[str, ...]] = ()
+    __HAS_DICT: ClassVar[bool] = False
+    __ATTRS_NAMES_CHECK: Optional[Type["TelegramObject"]] = None
 
     def __init__(self, *, api_kwargs: Optional[JSONDict] = None) -> None:
         # Setting _frozen to `False` here means that classes without arguments still need to
@@ -409,28 +420,60 @@ class TelegramObject:
         if data is None:
             return None
 
-        # try-except is significantly faster in case we already have a correct argument set
-        try:
-            obj = cls(**data, api_kwargs=api_kwargs)
-        except TypeError as exc:
-            if "__init__() got an unexpected keyword argument" not in str(exc):
-                raise exc
+        if cls.__INIT_PARAMS_CHECK is cls:
+            # The class already received unknown arguments before, which is likely to happen
+            # again (e.g. for fields that TG still sends for backwards compatibility). Checking
+            # the keys is cheaper than raising and handling the TypeError below each time.
+            obj = cls._de_json_with_api_kwargs(data, api_kwargs)
+        else:
+            # try-except is significantly faster in case we already have a correct argument set
+            try:
+                obj = cls(**data, api_kwargs=api_kwargs)
+            except TypeError as exc:
+                if "__init__() got an unexpected keyword argument" not in str(exc):
+                    raise exc
 
-            if cls.__INIT_PARAMS_CHECK is not cls:
                 signature = inspect.signature(cls)
                 cls.__INIT_PARAMS = set(signature.parameters.keys())
                 cls.__INIT_PARAMS_CHECK = cls
-
-            api_kwargs = api_kwargs or {}
-            existing_kwargs: JSONDict = {}
-            for key, value in data.items():
-                (existing_kwargs if key in cls.__INIT_PARAMS else api_kwargs)[key] = value
-
-            obj = cls(api_kwargs=api_kwargs, **existing_kwargs)
+                obj = cls._de_json_with_api_kwargs(data, api_kwargs)
 
         obj.set_bot(bot=bot)
         return obj
 
+    @classmethod
+    def _de_json_with_api_kwargs(
+        cls: Type[Tele_co], data: JSONDict, api_kwargs: Optional[JSONDict]
+    ) -> Tele_co:
+        """Instantiates the class, passing all keys of ``data`` that are not parameters of
+        ``__init__`` as ``api_kwargs``. Requires ``__INIT_PARAMS`` to be set for the class.
+        """
+        if data.keys() <= cls.__INIT_PARAMS:
+            return cls(**data, api_kwargs=api_kwargs)
+
+        api_kwargs = api_kwargs or {}
+        existing_kwargs: JSONDict = {}
+        for key, value in data.items():
+            (existing_kwargs if key in cls.__INIT_PARAMS else api_kwargs)[key] = value
+
+        return cls(api_kwargs=api_kwargs, **existing_kwargs)
+
+    @staticmethod
+    def _convert_fields(
+        data: JSONDict, bot: "Bot", converters: Mapping[str, Callable[[Any, "Bot"], object]]
+    ) -> None:
+        """Can be used by subclasses that override de_json to convert the values of ``data``
+        *in place*. For each key of ``data`` that has an entry in ``converters``, the value is
+        replaced by ``converter(value, bot)``.
+
+        In contrast to calling e.g. ``SomeClass.de_json(data.get("key"), bot)`` for every field
+        that the class may contain, only the keys actually present in the data are visited. This
+        makes a difference for classes with many optional fields, like :class:`telegram.Message`.
+        """
+        for key, value in data.items():
+            if (converter := converters.get(key)) is not None:
+                data[key] = converter(value, bot)
+
     @classmethod
     def de_json(cls: Type[Tele_co], data: Optional[JSONDict], bot: "Bot") -> Optional[Tele_co]:
         """Converts JSON data to a Telegram object.
@@ -523,18 +566,27 @@ class TelegramObject:
         Returns:
             Iterator[:obj:`str`]: An iterator over the names of the attributes of this object.
         """
-        # We want to get all attributes for the class, using self.__slots__ only includes the
-        # attributes used by that class itself, and not its superclass(es). Hence, we get its MRO
-        # and then get their attributes. The `[:-1]` slice excludes the `object` class
-        all_slots = (s for c in self.__class__.__mro__[:-1] for s in c.__slots__)  # type: ignore
+        cls = self.__class__
+        if cls.__ATTRS_NAMES_CHECK is not cls:
+            # We want to get all attributes for the class, using self.__slots__ only includes the
+            # attributes used by that class itself, and not its superclass(es). Hence, we get its
+            # MRO and then get their attributes. The `[:-1]` slice excludes the `object` class.
+            # This only depends on the class, so we compute it once per class.
+            all_slots = tuple(
+                s for c in cls.__mro__[:-1] for s in c.__slots__  # type: ignore[attr-defined]
+            )
+            cls.__ALL_SLOTS = all_slots
+            cls.__PUBLIC_SLOTS = tuple(s for s in all_slots if not s.startswith("_"))
+            cls.__HAS_DICT = hasattr(self, "__dict__")
+            cls.__ATTRS_NAMES_CHECK = cls
+
+        slots = cls.__ALL_SLOTS if include_private else cls.__PUBLIC_SLOTS
+        if not cls.__HAS_DICT:
+            return iter(slots)
         # chain the class's slots with the user defined subclass __dict__ (class has no slots)
-        all_attrs = (
-            chain(all_slots, self.__dict__.keys()) if hasattr(self, "__dict__") else all_slots
-        )
-
         if include_private:
-            return all_attrs
-        return (attr for attr in all_attrs if not attr.startswith("_"))
+            return chain(slots, self.__dict__.keys())
+        return chain(slots, (attr for attr in self.__dict__ if not attr.startswith("_")))
 
     def _get_attrs(
         self,
@@ -561,14 +613,14 @@ class TelegramObject:
         data = {}
 
         for key in self._get_attrs_names(include_private=include_private):
-            value = (
-                DefaultValue.get_value(getattr(self, key, None))
-                if convert_default_vault
-                else getattr(self, key, None)
-            )
+            value = getattr(self, key, None)
+            if convert_default_vault and isinstance(value, DefaultValue):
+                value = value.value
 
             if value is not None:
-                if recursive and hasattr(value, "to_dict"):
+                # Checking the type first avoids the comparatively slow failing `hasattr` for
+                # the most common attribute values
+                if recursive and type(value) not in _SCALAR_TYPES and hasattr(value, "to_dict"):
                     data[key] = value.to_dict(recursive=True)
                 else:
                     data[key] = value
@@ -587,10 +639,15 @@ class TelegramObject:
         .. versionchanged:: 20.0
             Now includes all entries of :attr:`api_kwargs`.
 
+        .. versionchanged:: NEXT.VERSION
+            Uses the :class:`telegram.request.JSONCodec` set via
+            :meth:`telegram.ext.ApplicationBuilder.json_codec` when called while the application
+            processes an update.
+
         Returns:
             :obj:`str`
         """
-        return json.dumps(self.to_dict())
+        return get_json_codec().dumps(self.to_dict())
 
     def to_dict(self, recursive: bool = True) -> JSONDict:
         """Gives representation of object as :obj:`dict`.
@@ -617,6 +674,8 @@ class TelegramObject:
         # `to_dict`
         pop_keys: Set[str] = set()
         for key, value in out.items():
+            if type(value) in _SCALAR_TYPES:
+                continue
             if isinstance(value, (tuple, list)):
                 if not value:
                     # not popping directly to avoid changing the dict size during iteration
@@ -625,7 +684,7 @@ class TelegramObject:
 
                 val = []  # empty list to append our converted values to
                 for item in value:
-                    if hasattr(item, "to_dict"):
+                    if type(item) not in _SCALAR_TYPES and hasattr(item, "to_dict"):
                         val.append(item.to_dict(recursive=recursive))
                     # This branch is useful for e.g. Tuple[Tuple[PhotoSize|KeyboardButton]]
                     elif isinstance(item, (tuple, list)):
@@ -61,12 +61,16 @@ def load_file(
     except AttributeError:
         return None, cast(Union[bytes, "InputFile", str, Path], obj)
 
-    if hasattr(obj, "name") and not isinstance(obj.name, int):
-        filename = Path(obj.name).name
-    else:
-        filename = None
+    return guess_file_name(obj), contents
+
 
-    return filename, contents
+def guess_file_name(obj: object) -> Optional[str]:
+    """If the input is a file handle, return the name of the file it belongs to. Otherwise,
+    return :obj:`None`.
+    """
+    if hasattr(obj, "name") and not isinstance(obj.name, int):
+        return Path(obj.name).name
+    return None
 
 
 def is_local_file(obj: Optional[FilePathInput]) -> bool:
@@ -100,8 +104,8 @@ def parse_file_input(  # pylint: disable=too-many-return-statements
 
         * if ``local_mode`` is ``True``, adds the ``file://`` prefix. If the input is a relative
         path of a local file, computes the absolute path and adds the ``file://`` prefix.
-        * if ``local_mode`` is ``False``, loads the file as binary data and builds an
-          :class:`InputFile` from that
+        * if ``local_mode`` is ``False``, builds an :class:`InputFile` from the path, which
+          reads the file only during the upload
 
       Returns the input unchanged, otherwise.
     * :class:`pathlib.Path` objects are treated the same way as strings.
@@ -138,7 +142,8 @@ def parse_file_input(  # pylint: disable=too-many-return-statements
             path = Path(file_input)
             if local_mode:
                 return path.absolute().as_uri()
-            return InputFile(path.open(mode="rb"), filename=filename, attach=attach)
+            # The file is read in chunks only while uploading it and closed afterwards
+            return InputFile(path, filename=filename, attach=attach)
 
         return file_input
     if isinstance(file_input, bytes):
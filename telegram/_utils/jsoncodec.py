@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the classes for JSON encoding and decoding as well as helper functions to
+access the codec that is currently used by the library. The codec is stored in a context variable
+such that different bots in the same process can use different codecs.
+
+The classes are part of the public API and are exposed via :mod:`telegram.request`. They live
+here, because :mod:`telegram._telegramobject` needs access to them and importing from
+:mod:`telegram.request` would lead to circular imports.
+
+Warning:
+    The functions of this module are intended to be used internally by the library and *not* by
+    the user. Changes to them are not considered breaking changes and may not be documented in the
+    changelog.
+"""
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ujson
+
+    UJSON_AVAILABLE = True
+except ImportError:
+    UJSON_AVAILABLE = False
+
+
+class JSONCodec:
+    """This class is used for encoding and decoding JSON throughout the library. This includes
+    the parameters of requests to the Bot API and its responses, the payloads received via
+    webhook, :meth:`telegram.TelegramObject.to_json` and :class:`telegram.ext.DictPersistence`.
+
+    This default implementation uses the standard library's :mod:`json`. Subclasses can
+    override the methods to use a different library.
+
+    .. seealso:: :class:`OrjsonCodec`, :class:`UJSONCodec`,
+        :meth:`telegram.ext.ApplicationBuilder.json_codec`
+
+    .. versionadded:: NEXT.VERSION
+    """
+
+    __slots__ = ()
+
+    def dumps(self, obj: object) -> str:
+        """Serializes an object to a JSON string.
+
+        Args:
+            obj (:obj:`object`): The object to serialize.
+
+        Returns:
+            :obj:`str`: The JSON string.
+        """
+        return json.dumps(obj)
+
+    def dumps_bytes(self, obj: object) -> bytes:
+        """Serializes an object to UTF-8 encoded JSON. Subclasses should override this if the
+        underlying library can produce :obj:`bytes` directly.
+
+        Args:
+            obj (:obj:`object`): The object to serialize.
+
+        Returns:
+            :obj:`bytes`: The UTF-8 encoded JSON.
+        """
+        return self.dumps(obj).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Deserializes a JSON document. UTF-8 encoded input is passed as :obj:`bytes`, so that
+        libraries that can parse :obj:`bytes` directly don't have to decode it first.
+
+        Note:
+            This implementation decodes :obj:`bytes` with ``errors="replace"``.
+
+        Args:
+            data (:obj:`str` | :obj:`bytes`): The JSON document.
+
+        Returns:
+            The deserialized object.
+
+        Raises:
+            :exc:`ValueError`: If :paramref:`data` is not a valid JSON document.
+        """
+        if isinstance(data, bytes):
+            data = data.decode("utf-8", "replace")
+        return json.loads(data)
+
+    @staticmethod
+    def get_fastest_available() -> "JSONCodec":
+        """Returns an instance of the fastest codec shipped with PTB whose underlying library is
+        installed, i.e. :class:`OrjsonCodec`, :class:`UJSONCodec` or :class:`JSONCodec` in this
+        order of preference.
+
+        Returns:
+            :class:`JSONCodec`
+        """
+        if ORJSON_AVAILABLE:
+            return OrjsonCodec()
+        if UJSON_AVAILABLE:
+            return UJSONCodec()
+        return JSONCodec()
+
+
+class OrjsonCodec(JSONCodec):
+    """Implementation of :class:`JSONCodec` based on the `orjson <https://pypi.org/project/\
+    orjson/>`_ library. Non-string keys of dictionaries are converted to strings like with the
+    standard library.
+
+    .. versionadded:: NEXT.VERSION
+
+    Raises:
+        :exc:`RuntimeError`: If ``orjson`` is not installed.
+    """
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        if not ORJSON_AVAILABLE:
+            raise RuntimeError("To use `OrjsonCodec`, the library `orjson` must be installed.")
+
+    def dumps(self, obj: object) -> str:
+        return self.dumps_bytes(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj: object) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+
+class UJSONCodec(JSONCodec):
+    """Implementation of :class:`JSONCodec` based on the `ujson <https://pypi.org/project/\
+    ujson/>`_ library.
+
+    .. versionadded:: NEXT.VERSION
+
+    Raises:
+        :exc:`RuntimeError`: If ``ujson`` is not installed.
+    """
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        if not UJSON_AVAILABLE:
+            raise RuntimeError("To use `UJSONCodec`, the library `ujson` must be installed.")
+
+    def dumps(self, obj: object) -> str:
+        return ujson.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return ujson.loads(data)
+
+
+_CODEC: ContextVar[JSONCodec] = ContextVar("json_codec", default=JSONCodec())
+
+
+def get_json_codec() -> JSONCodec:
+    """Returns the codec that is currently used by the library. This is the codec of the bot
+    whose request or update is currently processed, and the standard library's :mod:`json`
+    otherwise.
+    """
+    return _CODEC.get()
+
+
+@contextmanager
+def use_json_codec(codec: JSONCodec) -> Iterator[None]:
+    """Uses the codec for the current context, i.e. the current task and the tasks created
+    from it, until the context manager is exited.
+    """
+    token = _CODEC.set(codec)
+    try:
+        yield
+    finally:
+        _CODEC.reset(token)
@@ -28,6 +28,8 @@ from typing import (
     IO,
     TYPE_CHECKING,
     Any,
+    Awaitable,
+    Callable,
     Collection,
     Dict,
     Literal,
@@ -86,12 +88,35 @@ FieldTuple = Tuple[str, bytes, str]
 """Alias for return type of `InputFile.field_tuple`."""
 UploadFileDict = Dict[str, FieldTuple]
 """Dictionary containing file data to be uploaded to the API."""
+StreamingFieldTuple = Tuple[str, Union[bytes, IO[bytes]], str]
+"""Alias for return type of `InputFile.streaming_field_tuple`."""
+StreamingUploadFileDict = Dict[str, StreamingFieldTuple]
+"""Dictionary containing file data to be uploaded to the API, where files may be given as file
+handles that are read while uploading."""
 
 HTTPVersion = Literal["1.1", "2.0", "2"]
 """Allowed HTTP versions.
 
 .. versionadded:: 20.4"""
 
+WebhookServerBackend = Literal["tornado", "asyncio"]
+"""Available implementations of the webhook server of :class:`telegram.ext.Updater`.
+
+.. versionadded:: NEXT.VERSION"""
+
+ASGIApp = Callable[
+    [
+        Dict[str, Any],
+        Callable[[], Awaitable[Dict[str, Any]]],
+        Callable[[Dict[str, Any]], Awaitable[None]],
+    ],
+    Awaitable[None],
+]
+"""An `ASGI <https://asgi.readthedocs.io/>`_ application, i.e. a coroutine function accepting
+``scope``, ``receive`` and ``send``.
+
+.. versionadded:: NEXT.VERSION"""
+
 CorrectOptionID = Literal[0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
 
 MarkdownVersion = Literal[1, 2]
@@ -27,6 +27,8 @@ __all__ = (
     "BasePersistence",
     "BaseRateLimiter",
     "BaseUpdateProcessor",
+    "BoundedUpdateQueue",
+    "BulkSendResult",
     "CallbackContext",
     "CallbackDataCache",
     "CallbackQueryHandler",
@@ -46,18 +48,25 @@ __all__ = (
     "JobQueue",
     "MessageHandler",
     "MessageReactionHandler",
+    "MultiBotRunner",
+    "MultiProcessRunner",
     "PersistenceInput",
     "PicklePersistence",
     "PollAnswerHandler",
     "PollHandler",
     "PreCheckoutQueryHandler",
     "PrefixHandler",
+    "PriorityRateLimiter",
+    "ResponseCache",
+    "SQLitePersistence",
+    "ShardedUpdateProcessor",
     "ShippingQueryHandler",
     "SimpleUpdateProcessor",
     "StringCommandHandler",
     "StringRegexHandler",
     "TypeHandler",
     "Updater",
+    "UploadCache",
     "filters",
 )
 
@@ -67,7 +76,13 @@ from ._application import Application, ApplicationHandlerStop
 from ._applicationbuilder import ApplicationBuilder
 from ._basepersistence import BasePersistence, PersistenceInput
 from ._baseratelimiter import BaseRateLimiter
-from ._baseupdateprocessor import BaseUpdateProcessor, SimpleUpdateProcessor
+from ._baseupdateprocessor import (
+    BaseUpdateProcessor,
+    ShardedUpdateProcessor,
+    SimpleUpdateProcessor,
+)
+from ._boundedupdatequeue import BoundedUpdateQueue
+from ._bulksendresult import BulkSendResult
 from ._callbackcontext import CallbackContext
 from ._callbackdatacache import CallbackDataCache, InvalidCallbackData
 from ._contexttypes import ContextTypes
@@ -94,5 +109,11 @@ from ._handlers.stringcommandhandler import StringCommandHandler
 from ._handlers.stringregexhandler import StringRegexHandler
 from ._handlers.typehandler import TypeHandler
 from ._jobqueue import Job, JobQueue
+from ._multibotrunner import MultiBotRunner
+from ._multiprocessrunner import MultiProcessRunner
 from ._picklepersistence import PicklePersistence
+from ._priorityratelimiter import PriorityRateLimiter
+from ._responsecache import ResponseCache
+from ._sqlitepersistence import SQLitePersistence
 from ._updater import Updater
+from ._uploadcache import UploadCache
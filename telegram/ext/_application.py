@@ -39,6 +39,7 @@ from typing import (
     Dict,
     Generator,
     Generic,
+    Iterable,
     List,
     Mapping,
     NoReturn,
@@ -59,9 +60,10 @@ from telegram._utils.defaultvalue import (
     DEFAULT_TRUE,
     DefaultValue,
 )
+from telegram._utils.jsoncodec import get_json_codec, use_json_codec
 from telegram._utils.logging import get_logger
 from telegram._utils.repr import build_repr_with_selected_attrs
-from telegram._utils.types import SCT, DVType, ODVInput
+from telegram._utils.types import SCT, ASGIApp, DVType, ODVInput, WebhookServerBackend
 from telegram._utils.warnings import warn
 from telegram.error import TelegramError
 from telegram.ext._basepersistence import BasePersistence
@@ -69,9 +71,12 @@ from telegram.ext._contexttypes import ContextTypes
 from telegram.ext._extbot import ExtBot
 from telegram.ext._handlers.basehandler import BaseHandler
 from telegram.ext._updater import Updater
+from telegram.ext._utils.asgiapp import WebhookASGIApp
+from telegram.ext._utils.handlerindex import HandlerIndex
 from telegram.ext._utils.stack import was_called_by
-from telegram.ext._utils.trackingdict import TrackingDict
+from telegram.ext._utils.trackingdict import AccessTrackingDict, TrackingDict
 from telegram.ext._utils.types import BD, BT, CCT, CD, JQ, RT, UD, ConversationKey, HandlerCallback
+from telegram.ext._utils.webhookprocessor import WebhookRequestProcessor
 from telegram.warnings import PTBDeprecationWarning
 
 if TYPE_CHECKING:
@@ -262,10 +267,14 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
         "_chat_ids_to_be_deleted_in_persistence",
         "_chat_ids_to_be_updated_in_persistence",
         "_conversation_handler_conversations",
+        "_handler_index",
         "_initialized",
         "_job_queue",
         "_running",
+        "_update_batch_size",
         "_update_processor",
+        "_use_handler_index",
+        "_user_chat_data_cache_size",
         "_user_data",
         "_user_ids_to_be_deleted_in_persistence",
         "_user_ids_to_be_updated_in_persistence",
@@ -303,6 +312,9 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
         post_stop: Optional[
             Callable[["Application[BT, CCT, UD, CD, BD, JQ]"], Coroutine[Any, Any, None]]
         ],
+        handler_index: bool = False,
+        update_batch_size: int = 1,
+        user_chat_data_cache_size: Optional[int] = None,
     ):
         if not was_called_by(
             inspect.currentframe(), Path(__file__).parent.resolve() / "_applicationbuilder.py"
@@ -330,6 +342,15 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
             Callable[[Application[BT, CCT, UD, CD, BD, JQ]], Coroutine[Any, Any, None]]
         ] = post_stop
         self._update_processor = update_processor
+        if update_batch_size < 1:
+            raise ValueError("`update_batch_size` must be a positive integer!")
+        self._update_batch_size: int = update_batch_size
+        self._use_handler_index: bool = handler_index
+        if user_chat_data_cache_size is not None and user_chat_data_cache_size < 1:
+            raise ValueError("`size` must be a positive integer!")
+        self._user_chat_data_cache_size: Optional[int] = user_chat_data_cache_size
+        # Built lazily on the first call of process_update & reset by add/remove_handler
+        self._handler_index: Optional[HandlerIndex] = None
         self.bot_data: BD = self.context_types.bot_data()
         self._user_data: DefaultDict[int, UD] = defaultdict(self.context_types.user_data)
         self._chat_data: DefaultDict[int, CD] = defaultdict(self.context_types.chat_data)
@@ -554,6 +575,7 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
         if self.persistence:
             _LOGGER.debug("Updating & flushing persistence before shutdown")
             await self.update_persistence()
+            await self.persistence._wait_for_executor()  # pylint: disable=protected-access
             await self.persistence.flush()
             _LOGGER.debug("Updated and flushed persistence")
 
@@ -564,16 +586,25 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
         if not self.persistence:
             return
 
-        if self.persistence.store_data.user_data:
-            self._user_data.update(await self.persistence.get_user_data())
-        if self.persistence.store_data.chat_data:
-            self._chat_data.update(await self.persistence.get_chat_data())
+        # If user_chat_data_cache_size is set, user_data and chat_data are loaded on demand in
+        # _load_user_chat_data
+        if self._user_chat_data_cache_size is None:
+            if self.persistence.store_data.user_data:
+                self._user_data.update(await self.persistence.get_user_data())
+            if self.persistence.store_data.chat_data:
+                self._chat_data.update(await self.persistence.get_chat_data())
         if self.persistence.store_data.bot_data:
             self.bot_data = await self.persistence.get_bot_data()
             if not isinstance(self.bot_data, self.context_types.bot_data):
                 raise ValueError(
                     f"bot_data must be of type {self.context_types.bot_data.__name__}"
                 )
+            if type(self.bot_data) is dict and (  # pylint: disable=unidiomatic-typecheck
+                type(self.persistence).update_bot_data_delta
+                is not BasePersistence.update_bot_data_delta
+            ):
+                # Track the accessed keys so that only those are handed to the persistence
+                self.bot_data = AccessTrackingDict(self.bot_data)  # type: ignore[assignment]
 
         # Mypy doesn't know that persistence.set_bot (see above) already checks that
         # self.bot is an instance of ExtBot if callback_data should be stored ...
@@ -620,21 +651,25 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
         self._running = True
         self.__update_persistence_event.clear()
 
+        json_codec = self.bot.json_codec if isinstance(self.bot, ExtBot) else get_json_codec()
         try:
-            if self.persistence:
-                self.__update_persistence_task = asyncio.create_task(
-                    self._persistence_updater(),
-                    name=f"Application:{self.bot.id}:persistence_updater",
-                )
-                _LOGGER.debug("Loop for updating persistence started")
+            # Tasks copy the context they are created in, so the updates and jobs are processed
+            # with the JSON codec of the bot
+            with use_json_codec(json_codec):
+                if self.persistence:
+                    self.__update_persistence_task = asyncio.create_task(
+                        self._persistence_updater(),
+                        name=f"Application:{self.bot.id}:persistence_updater",
+                    )
+                    _LOGGER.debug("Loop for updating persistence started")
 
-            if self._job_queue:
-                await self._job_queue.start()  # type: ignore[union-attr]
-                _LOGGER.debug("JobQueue started")
+                if self._job_queue:
+                    await self._job_queue.start()  # type: ignore[union-attr]
+                    _LOGGER.debug("JobQueue started")
 
-            self.__update_fetcher_task = asyncio.create_task(
-                self._update_fetcher(), name=f"Application:{self.bot.id}:update_fetcher"
-            )
+                self.__update_fetcher_task = asyncio.create_task(
+                    self._update_fetcher(), name=f"Application:{self.bot.id}:update_fetcher"
+                )
             _LOGGER.info("Application started")
 
         except Exception as exc:
@@ -726,6 +761,7 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
         drop_pending_updates: Optional[bool] = None,
         close_loop: bool = True,
         stop_signals: ODVInput[Sequence[int]] = DEFAULT_NONE,
+        confirm_after_processing: bool = False,
     ) -> None:
         """Convenience method that takes care of initializing and starting the app,
         polling updates from Telegram using :meth:`telegram.ext.Updater.start_polling` and
@@ -813,6 +849,12 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
                     :meth:`asyncio.loop.add_signal_handler`. Most notably, the standard event loop
                     on Windows, :class:`asyncio.ProactorEventLoop`, does not implement this method.
                     If this method is not available, stop signals can not be set.
+            confirm_after_processing (:obj:`bool`, optional): Whether fetched updates should be
+                confirmed to Telegram only after they were processed. See
+                :paramref:`telegram.ext.Updater.start_polling.confirm_after_processing`.
+                Defaults to :obj:`False`.
+
+                .. versionadded:: NEXT.VERSION
 
         Raises:
             :exc:`RuntimeError`: If the Application does not have an :class:`telegram.ext.Updater`.
@@ -845,6 +887,7 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
                 allowed_updates=allowed_updates,
                 drop_pending_updates=drop_pending_updates,
                 error_callback=error_callback,  # if there is an error in fetching updates
+                confirm_after_processing=confirm_after_processing,
             ),
             close_loop=close_loop,
             stop_signals=stop_signals,
@@ -867,6 +910,7 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
         stop_signals: ODVInput[Sequence[int]] = DEFAULT_NONE,
         secret_token: Optional[str] = None,
         unix: Optional[Union[str, Path]] = None,
+        server: WebhookServerBackend = "tornado",
     ) -> None:
         """Convenience method that takes care of initializing and starting the app,
         listening for updates from Telegram using :meth:`telegram.ext.Updater.start_webhook` and
@@ -897,8 +941,8 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
         - :meth:`post_shutdown`
 
         Important:
-            If you want to use this method, you must install PTB with the optional requirement
-            ``webhooks``, i.e.
+            If you want to use this method with the default :paramref:`server`, you must install
+            PTB with the optional requirement ``webhooks``, i.e.
 
             .. code-block:: bash
 
@@ -969,6 +1013,11 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
                     appropriate :paramref:`webhook_url`.
 
                 .. versionadded:: 20.8
+            server (:obj:`str`, optional): The implementation of the web server, either
+                ``"tornado"`` (default) or ``"asyncio"``. See
+                :paramref:`telegram.ext.Updater.start_webhook.server` for details.
+
+                .. versionadded:: NEXT.VERSION
         """
         if not self.updater:
             raise RuntimeError(
@@ -990,11 +1039,102 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
                 max_connections=max_connections,
                 secret_token=secret_token,
                 unix=unix,
+                server=server,
             ),
             close_loop=close_loop,
             stop_signals=stop_signals,
         )
 
+    def asgi_app(
+        self,
+        url_path: str = "",
+        secret_token: Optional[str] = None,
+        handle_lifespan: bool = True,
+    ) -> ASGIApp:
+        """Returns an `ASGI <https://asgi.readthedocs.io/>`_ application that receives updates
+        from Telegram via webhook and puts them into :attr:`update_queue`. This allows to serve
+        the webhook with any ASGI server, e.g. `uvicorn <https://www.uvicorn.org/>`_, or to
+        mount it into an ASGI framework, e.g. `Starlette <https://www.starlette.io/>`_.
+
+        Requests are validated and answered in the same way as by the web server started by
+        :meth:`telegram.ext.Updater.start_webhook`. In particular, requests are answered with
+        ``503 Service Unavailable`` while :attr:`update_queue` is a
+        :class:`~telegram.ext.BoundedUpdateQueue` that is
+        :attr:`~telegram.ext.BoundedUpdateQueue.congested`. The ASGI application does not call
+        :meth:`telegram.Bot.set_webhook`, so this has to be done manually, e.g. in
+        :attr:`post_init`.
+
+        If :paramref:`handle_lifespan` is :obj:`True`, the application is initialized and started
+        when the ASGI server starts up and stopped and shut down when the ASGI server shuts down.
+        In this case, :attr:`post_init`, :attr:`post_stop` and :attr:`post_shutdown` are called
+        like in :meth:`run_webhook`, also if the startup fails. Note that ASGI frameworks usually
+        don't pass lifespan events to mounted applications.
+
+        Warning:
+            Serve the ASGI application with a single worker process, i.e. don't pass e.g.
+            ``--workers`` to uvicorn. Each worker process creates its own
+            :class:`~telegram.ext.Application` with its own :attr:`persistence`,
+            :attr:`user_data`, :attr:`chat_data`, :attr:`bot_data`, :attr:`job_queue` and states
+            of :class:`~telegram.ext.ConversationHandler`, and updates are distributed among the
+            workers arbitrarily. To process updates in several processes, see
+            :class:`telegram.ext.MultiProcessRunner`.
+
+        Examples:
+            .. code:: python
+
+                async def post_init(application: Application) -> None:
+                    await application.bot.set_webhook("https://example.com/", secret_token="TOKEN")
+
+                application = (
+                    Application.builder().token("TOKEN").updater(None).post_init(post_init).build()
+                )
+                asgi_app = application.asgi_app(secret_token="TOKEN")
+
+            The ASGI application can then be served with e.g. ``uvicorn module:asgi_app``.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            url_path (:obj:`str`, optional): Path of the webhook, relative to the path the ASGI
+                application is served at. Defaults to ``''``.
+            secret_token (:obj:`str`, optional): The secret token passed to
+                :meth:`telegram.Bot.set_webhook`. If passed, requests without this token in the
+                ``X-Telegram-Bot-Api-Secret-Token`` header are rejected with
+                :class:`http.HTTPStatus.FORBIDDEN <http.HTTPStatus>`.
+            handle_lifespan (:obj:`bool`, optional): Whether to start and stop the application on
+                the lifespan events of the ASGI server. Defaults to :obj:`True`.
+
+        Returns:
+            Callable[[Dict, Callable, Callable], Awaitable[None]]: The ASGI application.
+        """
+        processor = WebhookRequestProcessor(url_path, self.bot, self.update_queue, secret_token)
+        if not handle_lifespan:
+            return WebhookASGIApp(processor)
+        return WebhookASGIApp(
+            processor, startup=self.__asgi_startup, shutdown=self.__asgi_shutdown
+        )
+
+    async def __asgi_startup(self) -> None:
+        try:
+            await self.initialize()
+            if self.post_init:
+                await self.post_init(self)
+            await self.start()
+        except Exception:
+            # ASGI servers don't send the shutdown event if the startup failed, so we clean up
+            # like run_polling and run_webhook do
+            await self.__asgi_shutdown()
+            raise
+
+    async def __asgi_shutdown(self) -> None:
+        if self.running:
+            await self.stop()
+        if self.post_stop:
+            await self.post_stop(self)
+        await self.shutdown()
+        if self.post_shutdown:
+            await self.post_shutdown(self)
+
     def __run(
         self,
         updater_coroutine: Coroutine,
@@ -1179,14 +1319,15 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
                 update = await self.update_queue.get()
 
                 if update is _STOP_SIGNAL:
-                    _LOGGER.debug("Dropping pending updates")
-                    while not self.update_queue.empty():
-                        self.update_queue.task_done()
-
-                    # For the _STOP_SIGNAL
-                    self.update_queue.task_done()
+                    self.__drop_pending_updates()
                     return
 
+                if self._update_batch_size > 1:
+                    if await self.__fetch_update_batch(update):
+                        self.__drop_pending_updates()
+                        return
+                    continue
+
                 _LOGGER.debug("Processing update %s", update)
 
                 if self._update_processor.max_concurrent_updates > 1:
@@ -1208,10 +1349,104 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
                     "be closed via `Application.stop`."
                 )
 
+    def __drop_pending_updates(self) -> None:
+        _LOGGER.debug("Dropping pending updates")
+        while not self.update_queue.empty():
+            self.update_queue.task_done()
+
+        # For the _STOP_SIGNAL
+        self.update_queue.task_done()
+
+    async def __fetch_update_batch(self, update: object) -> bool:
+        # Drains the updates that are already waiting in the queue and processes them together
+        # with `update` as one batch. Returns whether the stop signal was found.
+        updates = [update]
+        stop_signal_found = False
+        while len(updates) < self._update_batch_size and not self.update_queue.empty():
+            next_update = self.update_queue.get_nowait()
+            if next_update is _STOP_SIGNAL:
+                stop_signal_found = True
+                break
+            updates.append(next_update)
+
+        _LOGGER.debug("Processing batch of %d updates", len(updates))
+
+        if self._update_processor.max_concurrent_updates > 1:
+            # We don't await the below because it has to be run concurrently
+            self.create_task(
+                self.__process_updates_wrapper(updates),
+                name=f"Application:{self.bot.id}:process_concurrent_update_batch",
+            )
+        else:
+            await self.__process_updates_wrapper(updates)
+
+        return stop_signal_found
+
     async def __process_update_wrapper(self, update: object) -> None:
         await self._update_processor.process_update(update, self.process_update(update))
         self.update_queue.task_done()
 
+    async def __process_updates_wrapper(self, updates: List[object]) -> None:
+        try:
+            await self.process_updates(updates)
+        finally:
+            for _ in updates:
+                self.update_queue.task_done()
+
+    async def process_updates(self, updates: Sequence[object]) -> None:
+        """Processes a batch of updates. This is called instead of :meth:`process_update` for
+        the updates fetched from :attr:`update_queue` if
+        :meth:`telegram.ext.ApplicationBuilder.update_batch_size` was set.
+
+        By default, each update is passed to :meth:`process_update` via :attr:`update_processor`.
+        If :attr:`concurrent_updates` is greater than ``1``, the updates of the batch are
+        processed concurrently via :func:`asyncio.gather`, i.e. each in its own task, otherwise
+        one after another in the order of the batch. In both cases, exceptions raised while
+        processing one of the updates are passed to :meth:`process_error` and don't prevent the
+        other updates of the batch from being processed.
+
+        Tip:
+            This method can be overridden in a subclass of :class:`Application` to share work
+            across the updates of a batch, e.g. to pre-load data for all users of the batch at
+            once. Make sure to still call :meth:`process_update` for each update.
+
+        .. seealso:: :wiki:`Concurrency`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            updates (Sequence[:class:`telegram.Update` | :obj:`object`]): The updates to process.
+
+        Raises:
+            :exc:`RuntimeError`: If the application was not initialized.
+        """
+        self._check_initialized()
+
+        if self._update_processor.max_concurrent_updates == 1:
+            for update in updates:
+                try:
+                    await self._update_processor.process_update(
+                        update, self.process_update(update)
+                    )
+                except Exception as exc:
+                    # Same as below: a failing update must not prevent the rest of the batch
+                    # from being processed
+                    await self.process_error(update=update, error=exc)
+            return
+
+        results = await asyncio.gather(
+            *(
+                self._update_processor.process_update(update, self.process_update(update))
+                for update in updates
+            ),
+            return_exceptions=True,
+        )
+        # process_update handles exceptions of the handler callbacks itself, so only
+        # exceptions that happen outside of those end up here
+        for update, result in zip(updates, results):
+            if isinstance(result, Exception):
+                await self.process_error(update=update, error=result)
+
     async def process_update(self, update: object) -> None:
         """Processes a single update and marks the update to be updated by the persistence later.
         Exceptions raised by handler callbacks will be processed by :meth:`process_error`.
@@ -1226,16 +1461,31 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
             update (:class:`telegram.Update` | :obj:`object` | \
                 :class:`telegram.error.TelegramError`): The update to process.
 
+        .. versionchanged:: NEXT.VERSION
+            Drops the results of :paramref:`telegram.ext.ExtBot.response_cache` that are changed
+            by the update, see :meth:`telegram.ext.ResponseCache.process_update`.
+
         Raises:
             :exc:`RuntimeError`: If the application was not initialized.
         """
         # Processing updates before initialize() is a problem e.g. if persistence is used
         self._check_initialized()
 
+        if isinstance(self.bot, ExtBot) and self.bot.response_cache is not None:
+            self.bot.response_cache.process_update(update)
+
         context = None
         any_blocking = False  # Flag which is set to True if any handler specifies block=True
 
-        for handlers in self.handlers.values():
+        all_handlers: Iterable[List[BaseHandler[Any, CCT]]]
+        if self._use_handler_index:
+            if self._handler_index is None:
+                self._handler_index = HandlerIndex(self.handlers)
+            all_handlers = self._handler_index.get_handlers(update)
+        else:
+            all_handlers = self.handlers.values()
+
+        for handlers in all_handlers:
             try:
                 for handler in handlers:
                     check = handler.check_update(update)  # Should the handler handle this update?
@@ -1345,6 +1595,7 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
             self.handlers = dict(sorted(self.handlers.items()))  # lower -> higher groups
 
         self.handlers[group].append(handler)
+        self._handler_index = None
 
     def add_handlers(
         self,
@@ -1409,6 +1660,7 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
             self.handlers[group].remove(handler)
             if not self.handlers[group]:
                 del self.handlers[group]
+            self._handler_index = None
 
     def drop_chat_data(self, chat_id: int) -> None:
         """Drops the corresponding entry from the :attr:`chat_data`. Will also be deleted from
@@ -1515,6 +1767,84 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
         self._chat_ids_to_be_updated_in_persistence.add(new_chat_id)
         # old_chat_id is marked for deletion by drop_chat_data above
 
+    async def _load_user_chat_data(self, chat_id: Optional[int], user_id: Optional[int]) -> None:
+        """Loads the chat_data and user_data of the given chat and user from the persistence, if
+        they are not in memory yet, and evicts the least recently used entries.
+        Only does something if ``user_chat_data_cache_size`` is set.
+        """
+        if self._user_chat_data_cache_size is None or not self.persistence:
+            return
+
+        if chat_id is not None and self.persistence.store_data.chat_data:
+            await self.__load_data_entry(self._chat_data, chat_id, self.persistence.load_chat_data)
+        if user_id is not None and self.persistence.store_data.user_data:
+            await self.__load_data_entry(self._user_data, user_id, self.persistence.load_user_data)
+
+        # Data that is not stored in the persistence can't be evicted without losing it
+        evict_chat_data = (
+            self.persistence.store_data.chat_data
+            and len(self._chat_data) > self._user_chat_data_cache_size
+        )
+        evict_user_data = (
+            self.persistence.store_data.user_data
+            and len(self._user_data) > self._user_chat_data_cache_size
+        )
+        if evict_chat_data or evict_user_data:
+            async with self.__update_persistence_lock:
+                if evict_chat_data:
+                    await self.__evict_data_entries(
+                        self._chat_data,
+                        self._chat_ids_to_be_updated_in_persistence,
+                        self.persistence.update_chat_data,
+                    )
+                if evict_user_data:
+                    await self.__evict_data_entries(
+                        self._user_data,
+                        self._user_ids_to_be_updated_in_persistence,
+                        self.persistence.update_user_data,
+                    )
+
+    @staticmethod
+    async def __load_data_entry(
+        data: DefaultDict[int, Any],
+        key: int,
+        load: Callable[[int], Coroutine[Any, Any, Optional[Any]]],
+    ) -> None:
+        if key in data:
+            # Dicts preserve insertion order, so moving the entry to the end keeps the least
+            # recently used entry at the front
+            data[key] = data.pop(key)
+            return
+
+        entry = await load(key)
+        # The entry might have been loaded by another task in the meantime
+        if key not in data:
+            data[key] = data.default_factory() if entry is None else entry  # type: ignore[misc]
+
+    async def __evict_data_entries(
+        self,
+        data: DefaultDict[int, Any],
+        update_ids: Set[int],
+        update: Callable[[int, Any], Coroutine[Any, Any, None]],
+    ) -> None:
+        # Must be called while holding __update_persistence_lock
+        while len(data) > self._user_chat_data_cache_size:  # type: ignore[operator]
+            key = next(iter(data))
+            if key in update_ids:
+                update_ids.discard(key)
+                try:
+                    await update(key, deepcopy(data[key]))
+                except Exception as exc:
+                    # Keep the entry and try again on the next eviction
+                    update_ids.add(key)
+                    data[key] = data.pop(key)
+                    await self.process_error(error=exc, update=None)
+                    return
+                if next(iter(data), None) != key:
+                    # The entry was used again while it was being written
+                    continue
+            data.pop(key, None)
+
     def _mark_for_persistence_update(
         self, *, update: Optional[object] = None, job: Optional["Job"] = None
     ) -> None:
@@ -1594,6 +1924,10 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
             This method will be called in regular intervals by the application. There is usually
             no need to call it manually.
 
+        For :attr:`bot_data`, only the entries that were accessed since the last run of this
+        method are passed to :meth:`telegram.ext.BasePersistence.update_bot_data_delta`, if the
+        persistence implements it.
+
         Note:
             Any data is deep copied with :func:`copy.deepcopy` before handing it over to the
             persistence in order to avoid race conditions, so all persisted data must be copyable.
@@ -1626,7 +1960,14 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
             )
 
         if self.persistence.store_data.bot_data:
-            coroutines.add(self.persistence.update_bot_data(deepcopy(self.bot_data)))
+            if isinstance(self.bot_data, AccessTrackingDict):
+                changed, deleted = self.bot_data.pop_accessed_items()
+                if changed or deleted:
+                    coroutines.add(
+                        self.persistence.update_bot_data_delta(deepcopy(changed), deleted)
+                    )
+            else:
+                coroutines.add(self.persistence.update_bot_data(deepcopy(self.bot_data)))
 
         if self.persistence.store_data.chat_data:
             update_ids = self._chat_ids_to_be_updated_in_persistence
@@ -1636,6 +1977,10 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
 
             # We don't want to update any data that has been deleted!
             update_ids -= delete_ids
+            if self._user_chat_data_cache_size is not None:
+                # Entries that are not in memory were either never loaded or were already
+                # written on eviction
+                update_ids &= self._chat_data.keys()
 
             for chat_id in update_ids:
                 coroutines.add(
@@ -1652,6 +1997,10 @@ class Application(Generic[BT, CCT, UD, CD, BD, JQ], AsyncContextManager["Applica
 
             # We don't want to update any data that has been deleted!
             update_ids -= delete_ids
+            if self._user_chat_data_cache_size is not None:
+                # Entries that are not in memory were either never loaded or were already
+                # written on eviction
+                update_ids &= self._user_data.keys()
 
             for user_id in update_ids:
                 coroutines.add(
@@ -46,13 +46,20 @@ from telegram.ext._extbot import ExtBot
 from telegram.ext._jobqueue import JobQueue
 from telegram.ext._updater import Updater
 from telegram.ext._utils.types import BD, BT, CCT, CD, JQ, UD
-from telegram.request import BaseRequest
+from telegram.request import BaseRequest, JSONCodec
 from telegram.request._httpxrequest import HTTPXRequest
 from telegram.warnings import PTBDeprecationWarning
 
 if TYPE_CHECKING:
     from telegram import Update
-    from telegram.ext import BasePersistence, BaseRateLimiter, CallbackContext, Defaults
+    from telegram.ext import (
+        BasePersistence,
+        BaseRateLimiter,
+        CallbackContext,
+        Defaults,
+        ResponseCache,
+        UploadCache,
+    )
     from telegram.ext._utils.types import RLARGS
 
 # Type hinting is a bit complicated here because we try to get to a sane level of
@@ -96,6 +103,11 @@ _BOT_CHECKS = [
     ("private_key", "private_key"),
     ("rate_limiter", "rate_limiter instance"),
     ("local_mode", "local_mode setting"),
+    ("lazy_de_json", "lazy_de_json setting"),
+    ("upload_cache", "upload_cache instance"),
+    ("response_cache", "response_cache instance"),
+    ("request_pools", "request_pool instance"),
+    ("json_codec", "json_codec instance"),
 ]
 
 _TWO_ARGS_REQ = "The parameter `{}` may only be set, if no {} was set."
@@ -150,8 +162,11 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         "_get_updates_request",
         "_get_updates_socket_options",
         "_get_updates_write_timeout",
+        "_handler_index",
         "_http_version",
         "_job_queue",
+        "_json_codec",
+        "_lazy_de_json",
         "_local_mode",
         "_media_write_timeout",
         "_persistence",
@@ -165,11 +180,16 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         "_rate_limiter",
         "_read_timeout",
         "_request",
+        "_request_pools",
+        "_response_cache",
         "_socket_options",
         "_token",
+        "_update_batch_size",
         "_update_processor",
         "_update_queue",
         "_updater",
+        "_upload_cache",
+        "_user_chat_data_cache_size",
         "_write_timeout",
     )
 
@@ -200,6 +220,7 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._defaults: ODVInput[Defaults] = DEFAULT_NONE
         self._arbitrary_callback_data: Union[DefaultValue[bool], int] = DEFAULT_FALSE
         self._local_mode: DVType[bool] = DEFAULT_FALSE
+        self._lazy_de_json: DVType[bool] = DEFAULT_FALSE
         self._bot: DVInput[Bot] = DEFAULT_NONE
         self._update_queue: DVType[Queue[Union[Update, object]]] = DefaultValue(Queue())
 
@@ -222,7 +243,14 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._post_shutdown: Optional[Callable[[Application], Coroutine[Any, Any, None]]] = None
         self._post_stop: Optional[Callable[[Application], Coroutine[Any, Any, None]]] = None
         self._rate_limiter: ODVInput[BaseRateLimiter] = DEFAULT_NONE
+        self._upload_cache: ODVInput[UploadCache] = DEFAULT_NONE
+        self._response_cache: ODVInput[ResponseCache] = DEFAULT_NONE
+        self._request_pools: DVType[Dict[str, BaseRequest]] = DefaultValue({})
         self._http_version: DVInput[str] = DefaultValue("1.1")
+        self._handler_index: bool = False
+        self._update_batch_size: int = 1
+        self._json_codec: DVInput[JSONCodec] = DEFAULT_NONE
+        self._user_chat_data_cache_size: Optional[int] = None
 
     def _build_request(self, get_updates: bool) -> BaseRequest:
         prefix = "_get_updates_" if get_updates else "_"
@@ -281,6 +309,11 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
             get_updates_request=self._build_request(get_updates=True),
             rate_limiter=DefaultValue.get_value(self._rate_limiter),
             local_mode=DefaultValue.get_value(self._local_mode),
+            lazy_de_json=DefaultValue.get_value(self._lazy_de_json),
+            upload_cache=DefaultValue.get_value(self._upload_cache),
+            response_cache=DefaultValue.get_value(self._response_cache),
+            request_pools=DefaultValue.get_value(self._request_pools),
+            json_codec=DefaultValue.get_value(self._json_codec),
         )
 
     def _bot_check(self, name: str) -> None:
@@ -337,6 +370,9 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
             post_init=self._post_init,
             post_shutdown=self._post_shutdown,
             post_stop=self._post_stop,
+            handler_index=self._handler_index,
+            update_batch_size=self._update_batch_size,
+            user_chat_data_cache_size=self._user_chat_data_cache_size,
             **self._application_kwargs,  # For custom Application subclasses
         )
 
@@ -494,6 +530,60 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._request = request
         return self
 
+    def request_pool(
+        self: BuilderType, endpoints: Collection[str], request: BaseRequest
+    ) -> BuilderType:
+        """Sets a :class:`telegram.request.BaseRequest` instance that is used instead of
+        :meth:`request` for the given Bot API methods. Can be called multiple times to set up
+        several pools. The value is passed to :paramref:`telegram.ext.ExtBot.request_pools`.
+
+        Each request object has its own connection pool and timeouts. Routing slow requests, such
+        as uploads of large media files, to a separate request object prevents them from blocking
+        the connections needed for quick requests, such as
+        :meth:`~telegram.Bot.answer_callback_query`. Downloads via :class:`telegram.File` can be
+        routed by passing the pseudo method name ``"file_download"``.
+
+        Example:
+            .. code:: python
+
+                application = (
+                    ApplicationBuilder()
+                    .token("TOKEN")
+                    .request_pool(
+                        ["sendDocument", "sendPhoto", "sendVideo"],
+                        HTTPXRequest(connection_pool_size=8, write_timeout=120),
+                    )
+                    .request_pool(["file_download"], HTTPXRequest(read_timeout=60))
+                    .build()
+                )
+
+        .. seealso:: :meth:`request`, :meth:`get_updates_request`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            endpoints (Collection[:obj:`str`]): The names of the Bot API methods, e.g.
+                ``"sendVideo"``. ``"getUpdates"`` is not allowed, use
+                :meth:`get_updates_request` instead.
+            request (:class:`telegram.request.BaseRequest`): The request instance.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+
+        Raises:
+            :exc:`ValueError`: If :paramref:`endpoints` contains ``"getUpdates"``.
+        """
+        self._bot_check("request_pool")
+        self._updater_check("request_pool")
+        if "getUpdates" in endpoints:
+            raise ValueError(
+                "Use `get_updates_request` to set the request object for `getUpdates`."
+            )
+        if isinstance(self._request_pools, DefaultValue):
+            self._request_pools = {}
+        self._request_pools.update(dict.fromkeys(endpoints, request))
+        return self
+
     def connection_pool_size(self: BuilderType, connection_pool_size: int) -> BuilderType:
         """Sets the size of the connection pool for the
         :paramref:`~telegram.request.HTTPXRequest.connection_pool_size` parameter of
@@ -1038,6 +1128,77 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._local_mode = local_mode
         return self
 
+    def lazy_de_json(self: BuilderType, lazy_de_json: bool) -> BuilderType:
+        """Specifies the value for :paramref:`~telegram.ext.ExtBot.lazy_de_json` for the
+        :attr:`telegram.ext.Application.bot`. If not called, will default to :obj:`False`.
+
+        If enabled, :class:`telegram.Message` objects received by the bot store the nested
+        objects (e.g. :attr:`~telegram.Message.reply_to_message`,
+        :attr:`~telegram.Message.entities` or :attr:`~telegram.Message.reply_markup`) as raw
+        data and convert them only when the attribute is accessed for the first time. This saves
+        both time and memory for handlers that only look at a few attributes of the updates,
+        especially for updates with large nested payloads. Apart from that, the objects behave
+        exactly the same, i.e. they are immutable and :meth:`~telegram.TelegramObject.to_dict`,
+        comparison, pickling and copying work as usual.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            lazy_de_json (:obj:`bool`): Whether nested objects should be converted on access.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._bot_check("lazy_de_json")
+        self._updater_check("lazy_de_json")
+        self._lazy_de_json = lazy_de_json
+        return self
+
+    def upload_cache(self: BuilderType, upload_cache: "UploadCache") -> BuilderType:
+        """Sets a :class:`telegram.ext.UploadCache` instance for the
+        :paramref:`telegram.ext.ExtBot.upload_cache` parameter of
+        :attr:`telegram.ext.Application.bot`.
+
+        Files uploaded by the bot are then uploaded only once. Sending the same file again, e.g.
+        when sending the same document to many chats, reuses the file id returned by Telegram,
+        which saves both bandwidth and time.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            upload_cache (:class:`telegram.ext.UploadCache`): The upload cache.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._bot_check("upload_cache")
+        self._updater_check("upload_cache")
+        self._upload_cache = upload_cache
+        return self
+
+    def response_cache(self: BuilderType, response_cache: "ResponseCache") -> BuilderType:
+        """Sets a :class:`telegram.ext.ResponseCache` instance for the
+        :paramref:`telegram.ext.ExtBot.response_cache` parameter of
+        :attr:`telegram.ext.Application.bot`.
+
+        The results of read-only methods such as :meth:`~telegram.Bot.get_chat_member` or
+        :meth:`~telegram.Bot.get_chat_administrators` are then cached for a short time, and
+        concurrent identical calls are combined into a single request. This is useful e.g. if
+        many handlers check whether a user is an administrator of a chat.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            response_cache (:class:`telegram.ext.ResponseCache`): The response cache.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._bot_check("response_cache")
+        self._updater_check("response_cache")
+        self._response_cache = response_cache
+        return self
+
     def bot(
         self: "ApplicationBuilder[BT, CCT, UD, CD, BD, JQ]",
         bot: InBT,
@@ -1065,6 +1226,10 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         fetch updates from. Will also be used for the :attr:`telegram.ext.Application.updater`.
         If not called, a queue will be instantiated.
 
+        Tip:
+            Pass a :class:`telegram.ext.BoundedUpdateQueue` to stop accepting new updates while
+            the application can not keep up with processing them.
+
         .. seealso:: :attr:`telegram.ext.Updater.update_queue`
 
         Args:
@@ -1090,6 +1255,11 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
             that your bot does not (explicitly or implicitly) rely on updates being processed
             sequentially.
 
+        Tip:
+            Pass an instance of :class:`telegram.ext.ShardedUpdateProcessor` to process updates
+            from different chats concurrently while still processing updates from the same chat
+            one after another.
+
         .. include:: inclusions/pool_size_tip.rst
 
         .. seealso:: :attr:`telegram.ext.Application.concurrent_updates`
@@ -1125,6 +1295,152 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._update_processor: BaseUpdateProcessor = concurrent_updates  # type: ignore[no-redef]
         return self
 
+    def handler_index(self: BuilderType, handler_index: bool) -> BuilderType:
+        """Specifies whether :meth:`telegram.ext.Application.process_update` should use an index
+        of the registered handlers to determine which handlers can possibly handle an update.
+        If not called, all handlers will be checked for every update.
+
+        With the index, handlers are pre-sorted by the type of update they handle (e.g.
+        :class:`telegram.ext.CallbackQueryHandler` only for updates with
+        :attr:`telegram.Update.callback_query`) and :class:`telegram.ext.CommandHandler` and
+        :class:`telegram.ext.PrefixHandler` additionally by their commands. Only these candidates
+        have their :meth:`~telegram.ext.BaseHandler.check_update` called. The order of groups
+        and handlers is preserved, so the handler selected for an update is the same as without
+        the index. This is especially useful for applications with a large number of handlers.
+
+        Note:
+            * The index is rebuilt on the first update processed after
+              :meth:`telegram.ext.Application.add_handler` or
+              :meth:`telegram.ext.Application.remove_handler` was called. Modifying
+              :attr:`telegram.ext.Application.handlers` directly is not supported when the index
+              is used.
+            * Handlers that override :meth:`~telegram.ext.BaseHandler.check_update` of the
+              built-in handlers as well as handlers that are not restricted to specific update
+              types (e.g. :class:`telegram.ext.MessageHandler` or
+              :class:`telegram.ext.TypeHandler`) are checked for every update.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            handler_index (:obj:`bool`): Whether to use the index.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._handler_index = handler_index
+        return self
+
+    def update_batch_size(self: BuilderType, update_batch_size: int) -> BuilderType:
+        """Sets the maximum number of updates that :class:`telegram.ext.Application` takes from
+        :attr:`telegram.ext.Application.update_queue` at once and processes as a single batch via
+        :meth:`telegram.ext.Application.process_updates`. If not called, updates will be fetched
+        and scheduled one by one.
+
+        Batches consist of the updates that are already waiting in the queue, so there is no
+        additional delay for waiting until a batch is full. With long polling, all updates
+        returned by a single call of :meth:`telegram.Bot.get_updates` are put into the queue at
+        once, so setting this to ``100`` (the maximum number of updates returned by
+        :meth:`~telegram.Bot.get_updates`) processes each response as one batch.
+
+        Note:
+            Batching does not reduce the number of tasks: with :meth:`concurrent_updates`, the
+            updates of a batch are still processed concurrently, each in its own task. The benefit
+            is that :meth:`telegram.ext.Application.process_updates` can be overridden to share
+            work across the updates of a batch.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            update_batch_size (:obj:`int`): The maximum size of a batch.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+
+        Raises:
+            :exc:`ValueError`: If :paramref:`update_batch_size` is a non-positive integer.
+        """
+        if update_batch_size < 1:
+            raise ValueError("`update_batch_size` must be a positive integer!")
+        self._update_batch_size = update_batch_size
+        return self
+
+    def user_chat_data_cache_size(self: BuilderType, size: int) -> BuilderType:
+        """Enables loading :attr:`telegram.ext.Application.user_data` and
+        :attr:`telegram.ext.Application.chat_data` from the persistence on demand instead of
+        loading all of them on :meth:`~telegram.ext.Application.initialize`. At most
+        :paramref:`size` entries of each are kept in memory. Entries are loaded when an update
+        of the respective user or chat is handled or a job for them is run. When the limit is
+        exceeded, the least recently used entries are written to the persistence (if they were
+        changed) and removed from memory.
+
+        This is useful for bots with many users of which only a few are active at the same time.
+
+        Note:
+            * The data is loaded via :meth:`~telegram.ext.BasePersistence.load_user_data` and
+              :meth:`~telegram.ext.BasePersistence.load_chat_data`. Their default
+              implementations load *all* data of the persistence for every entry, so this
+              setting is only useful with persistences that override them, e.g.
+              :class:`~telegram.ext.SQLitePersistence`. Only the kinds of data that are stored
+              according to :attr:`telegram.ext.BasePersistence.store_data` are loaded on demand
+              and evicted.
+            * :attr:`telegram.ext.Application.user_data` and
+              :attr:`telegram.ext.Application.chat_data` only contain the entries that are
+              currently in memory. Accessing other entries directly, e.g. via
+              ``context.application.user_data[user_id]``, creates *new* entries that will
+              overwrite the ones stored in the persistence on the next run of
+              :meth:`~telegram.ext.Application.update_persistence`.
+            * :paramref:`size` should be considerably larger than the number of users and chats
+              that are active concurrently. Otherwise, entries that are still in use by a
+              handler callback may be evicted and changes to them may be lost.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            size (:obj:`int`): The maximum number of entries of ``user_data`` and of
+                ``chat_data`` to keep in memory.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+
+        Raises:
+            :exc:`ValueError`: If :paramref:`size` is a non-positive integer.
+        """
+        if size < 1:
+            raise ValueError("`size` must be a positive integer!")
+        self._user_chat_data_cache_size = size
+        return self
+
+    def json_codec(self: BuilderType, json_codec: JSONCodec) -> BuilderType:
+        """Sets the :class:`telegram.request.JSONCodec` that is used for encoding and decoding
+        JSON, i.e. the parameters of requests to the Bot API, the responses of the Bot API, the
+        updates received via webhook, :meth:`telegram.TelegramObject.to_json` and the data of
+        :class:`telegram.ext.DictPersistence`. If not called, the standard library's :mod:`json`
+        will be used.
+
+        Tip:
+            Use :meth:`telegram.request.JSONCodec.get_fastest_available` to use
+            `orjson <https://pypi.org/project/orjson/>`_ or
+            `ujson <https://pypi.org/project/ujson/>`_ if installed.
+
+        The codec is passed to :paramref:`telegram.ext.ExtBot.json_codec` and only applies to the
+        built application, so applications running in the same process may use different
+        codecs. It is used while the bot makes requests and while the application processes
+        updates, i.e. it also applies to :meth:`telegram.TelegramObject.to_json` calls made in
+        handler callbacks and to tasks created from them.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            json_codec (:class:`telegram.request.JSONCodec`): The codec.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._bot_check("json_codec")
+        self._updater_check("json_codec")
+        self._json_codec = json_codec
+        return self
+
     def job_queue(
         self: "ApplicationBuilder[BT, CCT, UD, CD, BD, JQ]",
         job_queue: InJQ,
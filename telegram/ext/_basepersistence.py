@@ -17,13 +17,18 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the BasePersistence class."""
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Generic, NamedTuple, NoReturn, Optional
+from concurrent.futures import Executor
+from copy import copy
+from typing import Any, Callable, Dict, Generic, NamedTuple, NoReturn, Optional, Set, TypeVar
 
 from telegram._bot import Bot
 from telegram.ext._extbot import ExtBot
 from telegram.ext._utils.types import BD, CD, UD, CDCData, ConversationDict, ConversationKey
 
+_RT = TypeVar("_RT")
+
 
 class PersistenceInput(NamedTuple):
     """Convenience wrapper to group boolean input for the :paramref:`~BasePersistence.store_data`
@@ -85,6 +90,16 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
     For example, if you don't store ``bot_data``, you don't need :meth:`get_bot_data`,
     :meth:`update_bot_data` or :meth:`refresh_bot_data`.
 
+    Optionally, :meth:`update_bot_data_delta` can be overridden to receive only those entries of
+    ``bot_data`` that may have changed instead of the whole ``bot_data``. To support
+    :meth:`telegram.ext.ApplicationBuilder.user_chat_data_cache_size`, :meth:`load_user_data`
+    and :meth:`load_chat_data` must be overridden.
+
+    Serializing the data and writing it to disk or a database can take a while and would block the
+    event loop if done directly in the coroutines listed above. Implementations can therefore pass
+    such work to :meth:`run_in_executor`, which runs it in the :paramref:`executor` passed to this
+    class, if any.
+
     Note:
        You should avoid saving :class:`telegram.Bot` instances. This is because if you change e.g.
        the bots token, this won't propagate to the serialized instances and may lead to exceptions.
@@ -131,6 +146,13 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
             seconds.
 
             .. versionadded:: 20.0
+        executor (:class:`concurrent.futures.Executor`, optional): The executor, e.g. a
+            :class:`concurrent.futures.ThreadPoolExecutor` or
+            :class:`concurrent.futures.ProcessPoolExecutor`, that :meth:`run_in_executor` uses to
+            run serialization and I/O outside of the event loop. By default, such work is done
+            directly in the event loop.
+
+            .. versionadded:: NEXT.VERSION
     Attributes:
         store_data (:class:`~telegram.ext.PersistenceInput`): Specifies which kinds of data will
             be saved by this persistence instance.
@@ -138,6 +160,8 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
     """
 
     __slots__ = (
+        "_executor",
+        "_executor_task",
         "_update_interval",
         "bot",
         "store_data",
@@ -147,9 +171,12 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
         self,
         store_data: Optional[PersistenceInput] = None,
         update_interval: float = 60,
+        executor: Optional[Executor] = None,
     ):
         self.store_data: PersistenceInput = store_data or PersistenceInput()
         self._update_interval: float = update_interval
+        self._executor: Optional[Executor] = executor
+        self._executor_task: Optional[asyncio.Task] = None
 
         self.bot: Bot = None  # type: ignore[assignment]
 
@@ -168,6 +195,58 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
             "You can not assign a new value to update_interval after initialization."
         )
 
+    @property
+    def executor(self) -> Optional[Executor]:
+        """:class:`concurrent.futures.Executor`: Optional. The executor used by
+        :meth:`run_in_executor`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._executor
+
+    async def run_in_executor(self, func: Callable[..., _RT], *args: object) -> _RT:
+        """Runs ``func(*args)`` in :attr:`executor` or, if no executor was passed, directly.
+
+        Calls of this method are executed strictly in the order in which they were made, i.e.
+        a call starts only once all previous calls have finished, even if the executor has
+        multiple workers. This ensures that e.g. an older snapshot of the data never overwrites
+        a newer one. Any data passed in :paramref:`args` must therefore be a snapshot that is not
+        modified by the event loop afterwards.
+
+        Note:
+            When using a :class:`concurrent.futures.ProcessPoolExecutor`, :paramref:`func` and
+            :paramref:`args` must be picklable.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            func (:term:`callable`): The function to run.
+            *args: Positional arguments for :paramref:`func`.
+
+        Returns:
+            The return value of :paramref:`func`.
+        """
+        if self._executor is None:
+            return func(*args)
+
+        task = asyncio.create_task(self._run_after(self._executor_task, func, args))
+        self._executor_task = task
+        # Shielding the task ensures that cancelling the caller doesn't break the order
+        return await asyncio.shield(task)
+
+    async def _run_after(
+        self, previous: Optional[asyncio.Task], func: Callable[..., _RT], args: tuple
+    ) -> _RT:
+        if previous is not None:
+            await asyncio.wait((previous,))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def _wait_for_executor(self) -> None:
+        """Waits until all calls of :meth:`run_in_executor` have finished."""
+        if self._executor_task is not None:
+            await asyncio.wait((self._executor_task,))
+
     def set_bot(self, bot: Bot) -> None:
         """Set the Bot to be used by this persistence instance.
 
@@ -221,6 +300,48 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
                 The restored chat data.
         """
 
+    async def load_user_data(self, user_id: int) -> Optional[UD]:
+        """Will be called by :class:`telegram.ext.Application` *instead of*
+        :meth:`get_user_data` if
+        :meth:`telegram.ext.ApplicationBuilder.user_chat_data_cache_size` is used. It should
+        return the ``user_data`` of a single user, if stored.
+
+        The default implementation calls :meth:`get_user_data` and picks the entry of
+        :paramref:`user_id`. Subclasses should override this method with an implementation that
+        loads only the requested entry.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            user_id (:obj:`int`): The user to load the data for.
+
+        Returns:
+            :obj:`dict` | :attr:`telegram.ext.ContextTypes.user_data` | :obj:`None`: The
+            restored user data or :obj:`None`, if no data is stored for the user.
+        """
+        return (await self.get_user_data()).get(user_id)
+
+    async def load_chat_data(self, chat_id: int) -> Optional[CD]:
+        """Will be called by :class:`telegram.ext.Application` *instead of*
+        :meth:`get_chat_data` if
+        :meth:`telegram.ext.ApplicationBuilder.user_chat_data_cache_size` is used. It should
+        return the ``chat_data`` of a single chat, if stored.
+
+        The default implementation calls :meth:`get_chat_data` and picks the entry of
+        :paramref:`chat_id`. Subclasses should override this method with an implementation that
+        loads only the requested entry.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            chat_id (:obj:`int`): The chat to load the data for.
+
+        Returns:
+            :obj:`dict` | :attr:`telegram.ext.ContextTypes.chat_data` | :obj:`None`: The
+            restored chat data or :obj:`None`, if no data is stored for the chat.
+        """
+        return (await self.get_chat_data()).get(chat_id)
+
     @abstractmethod
     async def get_bot_data(self) -> BD:
         """Will be called by :class:`telegram.ext.Application` upon creation with a
@@ -313,6 +434,41 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
                 The :attr:`telegram.ext.Application.bot_data`.
         """
 
+    async def update_bot_data_delta(self, changed: Dict[Any, Any], deleted: Set[Any]) -> None:
+        """Will be called by the :class:`telegram.ext.Application` *instead of*
+        :meth:`update_bot_data` if this method is overridden by a subclass and
+        :attr:`telegram.ext.Application.bot_data` is a :obj:`dict`. In this case, the application
+        keeps track of the keys of :attr:`~telegram.ext.Application.bot_data` that were accessed
+        and passes only the corresponding entries. This avoids copying the whole
+        :attr:`~telegram.ext.Application.bot_data` on each run of
+        :meth:`telegram.ext.Application.update_persistence`.
+
+        The default implementation applies the changes to a copy of the data returned by
+        :meth:`get_bot_data` and passes the result to :meth:`update_bot_data`. Subclasses should
+        override this method with an implementation that writes only the changed entries.
+
+        Note:
+            Since values may be modified in place after being read, all entries that were
+            accessed are passed - including those that were only read. Changes to values that
+            are made without accessing :attr:`~telegram.ext.Application.bot_data` (e.g. via a
+            reference that is stored elsewhere) are not detected.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            changed (:obj:`dict`): The entries of :attr:`~telegram.ext.Application.bot_data` that
+                may have changed since the last call. Keys that are not contained in this
+                dictionary are unchanged.
+            deleted (Set[:obj:`object`]): The keys that were removed from
+                :attr:`~telegram.ext.Application.bot_data` since the last call.
+        """
+        # This method is only called if bot_data is a dict
+        bot_data: Dict[Any, Any] = copy(await self.get_bot_data())  # type: ignore[assignment]
+        for key in deleted:
+            bot_data.pop(key, None)
+        bot_data.update(changed)
+        await self.update_bot_data(bot_data)  # type: ignore[arg-type]
+
     @abstractmethod
     async def update_callback_data(self, data: CDCData) -> None:
         """Will be called by the :class:`telegram.ext.Application` after a handler has
@@ -425,4 +581,7 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
 
         .. versionchanged:: 20.0
            Changed this method into an :external:func:`~abc.abstractmethod`.
+
+        .. versionchanged:: NEXT.VERSION
+           Is called only after all calls of :meth:`run_in_executor` have finished.
         """
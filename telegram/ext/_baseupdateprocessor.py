@@ -18,9 +18,11 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the BaseProcessor class."""
 from abc import ABC, abstractmethod
-from asyncio import BoundedSemaphore
+from asyncio import BoundedSemaphore, Lock
 from types import TracebackType
-from typing import Any, AsyncContextManager, Awaitable, Optional, Type, TypeVar, final
+from typing import Any, AsyncContextManager, Awaitable, List, Optional, Type, TypeVar, final
+
+from telegram._update import Update
 
 _BUPT = TypeVar("_BUPT", bound="BaseUpdateProcessor")
 
@@ -182,3 +184,119 @@ class SimpleUpdateProcessor(BaseUpdateProcessor):
 
     async def shutdown(self) -> None:
         """Does nothing."""
+
+
+class ShardedUpdateProcessor(BaseUpdateProcessor):
+    """Instance of :class:`telegram.ext.BaseUpdateProcessor` that processes updates from
+    different chats concurrently while guaranteeing that updates from the same chat are processed
+    one after another in the order in which they were received.
+
+    Each update is assigned to one of :attr:`shards` lanes based on the id of
+    :attr:`telegram.Update.effective_chat` or, if that is not available,
+    :attr:`telegram.Update.effective_user`. Updates in the same lane are processed sequentially,
+    updates in different lanes are processed concurrently. Updates that can not be associated
+    with a chat or user (e.g. :attr:`telegram.Update.poll` or objects that are not instances of
+    :class:`telegram.Update`) are processed immediately without any ordering guarantees.
+
+    Note:
+        * Since different chats may be assigned to the same lane, a slow update from one chat
+          may delay the processing of updates from other chats in the same lane. Increase
+          :paramref:`shards` to reduce the likelihood of this.
+        * While an update waits for its lane to become available, it does *not* count towards
+          :attr:`max_concurrent_updates`.
+
+    Example:
+        .. code:: python
+
+            application = (
+                ApplicationBuilder()
+                .token("TOKEN")
+                .concurrent_updates(ShardedUpdateProcessor(max_concurrent_updates=256))
+                .build()
+            )
+
+    .. seealso:: :wiki:`Concurrency`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        max_concurrent_updates (:obj:`int`): The maximum number of updates to be processed
+            concurrently.
+        shards (:obj:`int`, optional): The number of lanes that updates are distributed over.
+            Defaults to :paramref:`max_concurrent_updates`.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`max_concurrent_updates` or :paramref:`shards` is a
+            non-positive integer.
+    """
+
+    __slots__ = ("_lanes",)
+
+    def __init__(self, max_concurrent_updates: int, shards: Optional[int] = None):
+        super().__init__(max_concurrent_updates)
+        if shards is None:
+            shards = self.max_concurrent_updates
+        if shards < 1:
+            raise ValueError("`shards` must be a positive integer!")
+        self._lanes: List[Lock] = [Lock() for _ in range(shards)]
+
+    @property
+    def shards(self) -> int:
+        """:obj:`int`: The number of lanes that updates are distributed over."""
+        return len(self._lanes)
+
+    def _get_lane(self, update: object) -> Optional[Lock]:
+        if not isinstance(update, Update):
+            return None
+        if update.effective_chat:
+            key = update.effective_chat.id
+        elif update.effective_user:
+            key = update.effective_user.id
+        else:
+            return None
+        return self._lanes[hash(key) % len(self._lanes)]
+
+    async def do_process_update(
+        self,
+        update: object,
+        coroutine: "Awaitable[Any]",
+    ) -> None:
+        """Awaits the coroutine once all previously received updates from the same lane have been
+        processed.
+
+        Args:
+            update (:obj:`object`): The update to be processed.
+            coroutine (:term:`Awaitable`): The coroutine that will be awaited to process the
+                update.
+        """
+        lane = self._get_lane(update)
+        if lane is None:
+            await coroutine
+            return
+
+        lane_acquired = False
+        try:
+            if lane.locked():
+                # Waiting for the lane should not block a slot that updates from other lanes
+                # could use in the meantime. `process_update` releases the slot once we're done,
+                # so we have to make sure that we hold it again when leaving this method.
+                self._semaphore.release()
+                try:
+                    await lane.acquire()
+                    lane_acquired = True
+                finally:
+                    await self._semaphore.acquire()
+            else:
+                await lane.acquire()
+                lane_acquired = True
+
+            await coroutine
+        finally:
+            if lane_acquired:
+                lane.release()
+
+    async def initialize(self) -> None:
+        """Does nothing."""
+
+    async def shutdown(self) -> None:
+        """Does nothing."""
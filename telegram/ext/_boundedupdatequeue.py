@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the BoundedUpdateQueue class."""
+import asyncio
+from typing import Optional
+
+from telegram._utils.logging import get_logger
+
+_LOGGER = get_logger(__name__, class_name="BoundedUpdateQueue")
+
+
+class BoundedUpdateQueue(asyncio.Queue):
+    """An :class:`asyncio.Queue` for :attr:`telegram.ext.Application.update_queue` that applies
+    backpressure to the sources of updates when the application can not keep up with processing
+    them.
+
+    Once the number of queued items reaches :paramref:`high_watermark`, the queue is considered
+    :attr:`congested` until it has been drained to :paramref:`low_watermark`. While the queue is
+    congested,
+
+    * the webhook server started by :meth:`telegram.ext.Updater.start_webhook` answers requests
+      with ``503 Service Unavailable`` instead of accepting the updates. Telegram then tries to
+      deliver them again later.
+    * :meth:`telegram.ext.Updater.start_polling` pauses calling :meth:`telegram.Bot.get_updates`.
+      Updates that were not fetched remain on the Telegram servers.
+
+    The queue itself is not size limited, i.e. :meth:`put` never blocks. Items are therefore
+    never lost, and the queue can exceed :paramref:`high_watermark` by at most the updates
+    returned by a single call of :meth:`~telegram.Bot.get_updates` or the updates that were
+    already being received by the webhook server.
+
+    Examples:
+        .. code:: python
+
+            application = (
+                ApplicationBuilder()
+                .token("TOKEN")
+                .update_queue(BoundedUpdateQueue(high_watermark=1000, low_watermark=500))
+                .build()
+            )
+
+    .. seealso:: :meth:`telegram.ext.ApplicationBuilder.update_queue`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        high_watermark (:obj:`int`): The number of queued items at which the queue becomes
+            :attr:`congested`.
+        low_watermark (:obj:`int`, optional): The number of queued items at which the queue is no
+            longer :attr:`congested`. Must be smaller than :paramref:`high_watermark`. Defaults to
+            half of :paramref:`high_watermark`.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`high_watermark` is not a positive integer or
+            :paramref:`low_watermark` is not between ``0`` and :paramref:`high_watermark`.
+    """
+
+    __slots__ = (
+        "_capacity_event",
+        "_congested",
+        "_congestion_count",
+        "_high_watermark",
+        "_low_watermark",
+        "_peak_size",
+        "_rejected_updates",
+    )
+
+    def __init__(self, high_watermark: int, low_watermark: Optional[int] = None):
+        if high_watermark < 1:
+            raise ValueError("`high_watermark` must be a positive integer!")
+        if low_watermark is None:
+            low_watermark = high_watermark // 2
+        if not 0 <= low_watermark < high_watermark:
+            raise ValueError("`low_watermark` must be between 0 and `high_watermark`!")
+
+        super().__init__()
+        self._high_watermark: int = high_watermark
+        self._low_watermark: int = low_watermark
+        self._congested: bool = False
+        self._capacity_event: asyncio.Event = asyncio.Event()
+        self._capacity_event.set()
+
+        self._peak_size: int = 0
+        self._congestion_count: int = 0
+        self._rejected_updates: int = 0
+
+    @property
+    def high_watermark(self) -> int:
+        """:obj:`int`: The number of queued items at which the queue becomes
+        :attr:`congested`.
+        """
+        return self._high_watermark
+
+    @property
+    def low_watermark(self) -> int:
+        """:obj:`int`: The number of queued items at which the queue is no longer
+        :attr:`congested`.
+        """
+        return self._low_watermark
+
+    @property
+    def congested(self) -> bool:
+        """:obj:`bool`: Whether the queue currently does not accept new updates."""
+        return self._congested
+
+    @property
+    def peak_size(self) -> int:
+        """:obj:`int`: The highest number of items that were queued at the same time."""
+        return self._peak_size
+
+    @property
+    def congestion_count(self) -> int:
+        """:obj:`int`: How often the queue became :attr:`congested`."""
+        return self._congestion_count
+
+    @property
+    def rejected_updates(self) -> int:
+        """:obj:`int`: The number of webhook requests that were rejected because the queue was
+        :attr:`congested`.
+        """
+        return self._rejected_updates
+
+    def reset_statistics(self) -> None:
+        """Resets :attr:`peak_size`, :attr:`congestion_count` and :attr:`rejected_updates`."""
+        self._peak_size = self.qsize()
+        self._congestion_count = 0
+        self._rejected_updates = 0
+
+    def record_rejection(self) -> None:
+        """Counts an update that was rejected because the queue was :attr:`congested`. Called by
+        the webhook server of :class:`telegram.ext.Updater`.
+        """
+        self._rejected_updates += 1
+
+    async def wait_for_capacity(self) -> None:
+        """Waits until the queue is no longer :attr:`congested`. Returns immediately if the queue
+        is not congested.
+        """
+        await self._capacity_event.wait()
+
+    def put_nowait(self, item: object) -> None:
+        """Puts an item into the queue. See :meth:`asyncio.Queue.put_nowait`.
+
+        Args:
+            item (:obj:`object`): The item.
+        """
+        super().put_nowait(item)
+        size = self.qsize()
+        self._peak_size = max(self._peak_size, size)
+        if not self._congested and size >= self._high_watermark:
+            _LOGGER.warning(
+                "Update queue reached %d items, no longer accepting new updates until it is "
+                "drained to %d items",
+                size,
+                self._low_watermark,
+            )
+            self._congested = True
+            self._congestion_count += 1
+            self._capacity_event.clear()
+
+    def get_nowait(self) -> object:
+        """Removes and returns an item from the queue. See :meth:`asyncio.Queue.get_nowait`.
+
+        Returns:
+            :obj:`object`: The item.
+        """
+        item = super().get_nowait()
+        if self._congested and self.qsize() <= self._low_watermark:
+            _LOGGER.info("Update queue drained, accepting new updates again")
+            self._congested = False
+            self._capacity_event.set()
+        return item
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the BulkSendResult class."""
+from typing import NamedTuple, Optional, Union
+
+
+class BulkSendResult(NamedTuple):
+    """The outcome of sending to a single recipient via :meth:`telegram.ext.ExtBot.send_bulk`.
+
+    Sending to the recipient succeeded, if and only if :attr:`error` is :obj:`None`.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        chat_id (:obj:`int` | :obj:`str`): The recipient.
+        result (:obj:`object`, optional): The return value of the callback, e.g. the sent
+            :class:`telegram.Message`.
+        error (:exc:`Exception`, optional): The exception raised by the callback, e.g.
+            :exc:`telegram.error.Forbidden` if the user blocked the bot.
+        attempts (:obj:`int`, optional): How often the callback was called for the recipient.
+            Greater than ``1`` if the request was repeated after :exc:`telegram.error.RetryAfter`.
+            Defaults to ``1``.
+
+    Attributes:
+        chat_id (:obj:`int` | :obj:`str`): The recipient.
+        result (:obj:`object`): Optional. The return value of the callback.
+        error (:exc:`Exception`): Optional. The exception raised by the callback.
+        attempts (:obj:`int`): How often the callback was called for the recipient.
+    """
+
+    chat_id: Union[int, str]
+    result: object = None
+    error: Optional[Exception] = None
+    attempts: int = 1
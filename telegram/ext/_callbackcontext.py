@@ -229,9 +229,18 @@ class CallbackContext(Generic[BT, UD, CD, BD]):
         Will be called by :meth:`telegram.ext.Application.process_update` and
         :meth:`telegram.ext.Job.run`.
 
+        If :meth:`telegram.ext.ApplicationBuilder.user_chat_data_cache_size` is used, this also
+        loads :attr:`chat_data` and :attr:`user_data` from the persistence, if necessary.
+
         .. versionadded:: 13.6
+
+        .. versionchanged:: NEXT.VERSION
+            Loads :attr:`chat_data` and :attr:`user_data` on demand.
         """
         if self.application.persistence:
+            await self.application._load_user_chat_data(  # pylint: disable=protected-access
+                chat_id=self._chat_id, user_id=self._user_id
+            )
             if self.application.persistence.store_data.bot_data:
                 await self.application.persistence.refresh_bot_data(self.bot_data)
             if self.application.persistence.store_data.chat_data and self._chat_id is not None:
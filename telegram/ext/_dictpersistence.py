@@ -17,11 +17,14 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the DictPersistence class."""
-import json
+import asyncio
+from concurrent.futures import Executor
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any, Dict, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, cast
 
+from telegram._utils.jsoncodec import JSONCodec, get_json_codec
 from telegram.ext import BasePersistence, PersistenceInput
+from telegram.ext._extbot import ExtBot
 from telegram.ext._utils.types import CDCData, ConversationDict, ConversationKey
 
 if TYPE_CHECKING:
@@ -43,7 +46,8 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
           writing them to file/database.
 
         * This implementation of :class:`BasePersistence` does not handle data that cannot be
-          serialized by :func:`json.dumps`.
+          serialized by the JSON codec in use, see
+          :meth:`telegram.ext.ApplicationBuilder.json_codec`.
 
     .. seealso:: :wiki:`Making Your Bot Persistent <Making-your-bot-persistent>`
 
@@ -72,6 +76,13 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
             wait between two consecutive runs of updating the persistence. Defaults to 60 seconds.
 
             .. versionadded:: 20.0
+        executor (:class:`concurrent.futures.Executor`, optional): If passed, the JSON strings
+            are no longer created lazily when accessing e.g. :attr:`user_data_json`. Instead,
+            each time the data changes, a snapshot of it is JSON-serialized in this executor,
+            such that accessing the JSON strings does not block the event loop. See also
+            :meth:`~telegram.ext.BasePersistence.run_in_executor`.
+
+            .. versionadded:: NEXT.VERSION
     Attributes:
         store_data (:class:`~telegram.ext.PersistenceInput`): Specifies which kinds of data will
             be saved by this persistence instance.
@@ -86,6 +97,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         "_chat_data_json",
         "_conversations",
         "_conversations_json",
+        "_serialization_tasks",
         "_user_data",
         "_user_data_json",
     )
@@ -99,8 +111,11 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         conversations_json: str = "",
         callback_data_json: str = "",
         update_interval: float = 60,
+        executor: Optional[Executor] = None,
     ):
-        super().__init__(store_data=store_data, update_interval=update_interval)
+        super().__init__(
+            store_data=store_data, update_interval=update_interval, executor=executor
+        )
         self._user_data = None
         self._chat_data = None
         self._bot_data = None
@@ -111,6 +126,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         self._bot_data_json: Optional[str] = None
         self._callback_data_json: Optional[str] = None
         self._conversations_json: Optional[str] = None
+        self._serialization_tasks: Dict[str, asyncio.Task] = {}
         if user_data_json:
             try:
                 self._user_data = self._decode_user_chat_data_from_json(user_data_json)
@@ -125,7 +141,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
                 raise TypeError("Unable to deserialize chat_data_json. Not valid JSON") from exc
         if bot_data_json:
             try:
-                self._bot_data = json.loads(bot_data_json)
+                self._bot_data = self._json_codec.loads(bot_data_json)
                 self._bot_data_json = bot_data_json
             except (ValueError, AttributeError) as exc:
                 raise TypeError("Unable to deserialize bot_data_json. Not valid JSON") from exc
@@ -133,7 +149,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
                 raise TypeError("bot_data_json must be serialized dict")
         if callback_data_json:
             try:
-                data = json.loads(callback_data_json)
+                data = self._json_codec.loads(callback_data_json)
             except (ValueError, AttributeError) as exc:
                 raise TypeError(
                     "Unable to deserialize callback_data_json. Not valid JSON"
@@ -179,7 +195,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         """:obj:`str`: The user_data serialized as a JSON-string."""
         if self._user_data_json:
             return self._user_data_json
-        return json.dumps(self.user_data)
+        return self._json_codec.dumps(self.user_data)
 
     @property
     def chat_data(self) -> Optional[Dict[int, Dict[Any, Any]]]:
@@ -191,7 +207,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         """:obj:`str`: The chat_data serialized as a JSON-string."""
         if self._chat_data_json:
             return self._chat_data_json
-        return json.dumps(self.chat_data)
+        return self._json_codec.dumps(self.chat_data)
 
     @property
     def bot_data(self) -> Optional[Dict[Any, Any]]:
@@ -203,7 +219,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         """:obj:`str`: The bot_data serialized as a JSON-string."""
         if self._bot_data_json:
             return self._bot_data_json
-        return json.dumps(self.bot_data)
+        return self._json_codec.dumps(self.bot_data)
 
     @property
     def callback_data(self) -> Optional[CDCData]:
@@ -222,7 +238,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         """
         if self._callback_data_json:
             return self._callback_data_json
-        return json.dumps(self.callback_data)
+        return self._json_codec.dumps(self.callback_data)
 
     @property
     def conversations(self) -> Optional[Dict[str, ConversationDict]]:
@@ -236,7 +252,15 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
             return self._conversations_json
         if self.conversations:
             return self._encode_conversations_to_json(self.conversations)
-        return json.dumps(self.conversations)
+        return self._json_codec.dumps(self.conversations)
+
+    @property
+    def _json_codec(self) -> JSONCodec:
+        # The data passed on initialization is decoded before the bot is set, so the default
+        # codec is used for that
+        if isinstance(self.bot, ExtBot):
+            return self.bot.json_codec
+        return get_json_codec()
 
     async def get_user_data(self) -> Dict[int, Dict[object, object]]:
         """Returns the user_data created from the ``user_data_json`` or an empty :obj:`dict`.
@@ -258,6 +282,32 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
             self._chat_data = {}
         return deepcopy(self.chat_data)  # type: ignore[arg-type]
 
+    async def load_user_data(self, user_id: int) -> Optional[Dict[object, object]]:
+        """Returns the user_data of the given user, if stored.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            user_id (:obj:`int`): The user to load the data for.
+
+        Returns:
+            :obj:`dict` | :obj:`None`: The restored user data.
+        """
+        return deepcopy((self.user_data or {}).get(user_id))
+
+    async def load_chat_data(self, chat_id: int) -> Optional[Dict[object, object]]:
+        """Returns the chat_data of the given chat, if stored.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            chat_id (:obj:`int`): The chat to load the data for.
+
+        Returns:
+            :obj:`dict` | :obj:`None`: The restored chat data.
+        """
+        return deepcopy((self.chat_data or {}).get(chat_id))
+
     async def get_bot_data(self) -> Dict[object, object]:
         """Returns the bot_data created from the ``bot_data_json`` or an empty :obj:`dict`.
 
@@ -310,6 +360,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
             return
         self._conversations[name][key] = new_state
         self._conversations_json = None
+        await self._serialize("conversations")
 
     async def update_user_data(self, user_id: int, data: Dict[Any, Any]) -> None:
         """Will update the user_data (if changed).
@@ -324,6 +375,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
             return
         self._user_data[user_id] = data
         self._user_data_json = None
+        await self._serialize("user_data")
 
     async def update_chat_data(self, chat_id: int, data: Dict[Any, Any]) -> None:
         """Will update the chat_data (if changed).
@@ -338,6 +390,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
             return
         self._chat_data[chat_id] = data
         self._chat_data_json = None
+        await self._serialize("chat_data")
 
     async def update_bot_data(self, data: Dict[Any, Any]) -> None:
         """Will update the bot_data (if changed).
@@ -349,6 +402,34 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
             return
         self._bot_data = data
         self._bot_data_json = None
+        await self._serialize("bot_data")
+
+    async def update_bot_data_delta(self, changed: Dict[Any, Any], deleted: Set[Any]) -> None:
+        """Will apply the changes to the bot_data (if any).
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            changed (:obj:`dict`): The entries of :attr:`telegram.ext.Application.bot_data` that
+                may have changed.
+            deleted (Set[:obj:`object`]): The keys that were removed from
+                :attr:`telegram.ext.Application.bot_data`.
+        """
+        if self._bot_data is None:
+            self._bot_data = {}
+        deleted = deleted & self._bot_data.keys()
+        changed = {
+            key: value
+            for key, value in changed.items()
+            if key not in self._bot_data or self._bot_data[key] != value
+        }
+        if not (changed or deleted):
+            return
+        self._bot_data.update(changed)
+        for key in deleted:
+            del self._bot_data[key]
+        self._bot_data_json = None
+        await self._serialize("bot_data")
 
     async def update_callback_data(self, data: CDCData) -> None:
         """Will update the callback_data (if changed).
@@ -364,6 +445,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
             return
         self._callback_data = data
         self._callback_data_json = None
+        await self._serialize("callback_data")
 
     async def drop_chat_data(self, chat_id: int) -> None:
         """Will delete the specified key from the :attr:`chat_data`.
@@ -377,6 +459,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
             return
         self._chat_data.pop(chat_id, None)
         self._chat_data_json = None
+        await self._serialize("chat_data")
 
     async def drop_user_data(self, user_id: int) -> None:
         """Will delete the specified key from the :attr:`user_data`.
@@ -390,6 +473,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
             return
         self._user_data.pop(user_id, None)
         self._user_data_json = None
+        await self._serialize("user_data")
 
     async def refresh_user_data(self, user_id: int, user_data: Dict[Any, Any]) -> None:
         """Does nothing.
@@ -419,8 +503,39 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         .. seealso:: :meth:`telegram.ext.BasePersistence.flush`
         """
 
-    @staticmethod
-    def _encode_conversations_to_json(conversations: Dict[str, ConversationDict]) -> str:
+    async def _serialize(self, kind: str) -> None:
+        if self.executor is None:
+            return
+        # All changes made while the application updates the persistence are serialized at once
+        if (task := self._serialization_tasks.get(kind)) is None:
+            task = asyncio.create_task(self.__serialize(kind))
+            self._serialization_tasks[kind] = task
+        await asyncio.shield(task)
+
+    async def __serialize(self, kind: str) -> None:
+        await asyncio.sleep(0)
+        # Changes made from now on are serialized by a new task
+        del self._serialization_tasks[kind]
+
+        # The values are replaced rather than modified on update, so shallow copies suffice
+        if kind == "conversations":
+            conversations = {
+                name: states.copy() for name, states in (self.conversations or {}).items()
+            }
+            json_string = await self.run_in_executor(
+                self._encode_conversations_to_json, conversations
+            )
+        else:
+            data = getattr(self, kind)
+            if isinstance(data, dict):
+                data = data.copy()
+            json_string = await self.run_in_executor(self._json_codec.dumps, data)
+
+        # If the data has changed in the meantime, this JSON string is already outdated
+        if kind not in self._serialization_tasks:
+            setattr(self, f"_{kind}_json", json_string)
+
+    def _encode_conversations_to_json(self, conversations: Dict[str, ConversationDict]) -> str:
         """Helper method to encode a conversations dict (that uses tuples as keys) to a
         JSON-serializable way. Use :meth:`self._decode_conversations_from_json` to decode.
 
@@ -430,15 +545,15 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         Returns:
             :obj:`str`: The JSON-serialized conversations dict
         """
+        json_codec = self._json_codec
         tmp: Dict[str, JSONDict] = {}
         for handler, states in conversations.items():
             tmp[handler] = {}
             for key, state in states.items():
-                tmp[handler][json.dumps(key)] = state
-        return json.dumps(tmp)
+                tmp[handler][json_codec.dumps(key)] = state
+        return json_codec.dumps(tmp)
 
-    @staticmethod
-    def _decode_conversations_from_json(json_string: str) -> Dict[str, ConversationDict]:
+    def _decode_conversations_from_json(self, json_string: str) -> Dict[str, ConversationDict]:
         """Helper method to decode a conversations dict (that uses tuples as keys) from a
         JSON-string created with :meth:`self._encode_conversations_to_json`.
 
@@ -448,16 +563,16 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
         Returns:
             :obj:`dict`: The conversations dict after decoding
         """
-        tmp = json.loads(json_string)
+        json_codec = self._json_codec
+        tmp = json_codec.loads(json_string)
         conversations: Dict[str, ConversationDict] = {}
         for handler, states in tmp.items():
             conversations[handler] = {}
             for key, state in states.items():
-                conversations[handler][tuple(json.loads(key))] = state
+                conversations[handler][tuple(json_codec.loads(key))] = state
         return conversations
 
-    @staticmethod
-    def _decode_user_chat_data_from_json(data: str) -> Dict[int, Dict[object, object]]:
+    def _decode_user_chat_data_from_json(self, data: str) -> Dict[int, Dict[object, object]]:
         """Helper method to decode chat or user data (that uses ints as keys) from a
         JSON-string.
 
@@ -468,7 +583,7 @@ class DictPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any,
             :obj:`dict`: The user/chat_data defaultdict after decoding
         """
         tmp: Dict[int, Dict[object, object]] = {}
-        decoded_data = json.loads(data)
+        decoded_data = self._json_codec.loads(data)
         for user, user_data in decoded_data.items():
             int_user_id = int(user)
             tmp[int_user_id] = {}
@@ -18,15 +18,23 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains an object that represents a Telegram Bot with convenience extensions."""
+import asyncio
+import functools
 from copy import copy
 from datetime import datetime
+from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
     Callable,
     Dict,
     Generic,
+    Iterable,
     List,
+    Mapping,
     Optional,
     Sequence,
     Tuple,
@@ -89,12 +97,17 @@ from telegram import (
 )
 from telegram._utils.datetime import to_timestamp
 from telegram._utils.defaultvalue import DEFAULT_NONE, DefaultValue
+from telegram._utils.jsoncodec import use_json_codec
 from telegram._utils.logging import get_logger
 from telegram._utils.repr import build_repr_with_selected_attrs
 from telegram._utils.types import CorrectOptionID, FileInput, JSONDict, ODVInput, ReplyMarkup
+from telegram.error import RetryAfter
+from telegram.ext._bulksendresult import BulkSendResult
 from telegram.ext._callbackdatacache import CallbackDataCache
+from telegram.ext._responsecache import ResponseCache
+from telegram.ext._uploadcache import UploadCache
 from telegram.ext._utils.types import RLARGS
-from telegram.request import BaseRequest
+from telegram.request import BaseRequest, JSONCodec
 from telegram.warnings import PTBUserWarning
 
 if TYPE_CHECKING:
@@ -166,10 +179,47 @@ class ExtBot(Bot, Generic[RLARGS]):
             limiting the number of requests made by the bot per time interval.
 
             .. versionadded:: 20.0
+        lazy_de_json (:obj:`bool`, optional): Whether objects received from Telegram should
+            convert nested objects only when they are first accessed. See
+            :meth:`telegram.ext.ApplicationBuilder.lazy_de_json` for details. Defaults to
+            :obj:`False`.
+
+            .. versionadded:: NEXT.VERSION
+        upload_cache (:class:`telegram.ext.UploadCache`, optional): A cache for the file ids of
+            uploaded files, which allows sending the same file multiple times while uploading it
+            only once.
+
+            .. versionadded:: NEXT.VERSION
+        response_cache (:class:`telegram.ext.ResponseCache`, optional): A cache for the results
+            of read-only methods such as :meth:`~telegram.Bot.get_chat_member`.
+
+            .. versionadded:: NEXT.VERSION
+        request_pools (Mapping[:obj:`str`, :class:`telegram.request.BaseRequest`], optional):
+            Request objects to use instead of :paramref:`request` for specific Bot API methods,
+            keyed by the name of the method in the Bot API, e.g. ``"sendVideo"``. Use the key
+            ``"file_download"`` for downloads via :class:`telegram.File`. See
+            :meth:`telegram.ext.ApplicationBuilder.request_pool` for details.
+
+            .. versionadded:: NEXT.VERSION
+        json_codec (:class:`telegram.request.JSONCodec`, optional): The codec used for the
+            JSON of the requests made by this bot. See
+            :meth:`telegram.ext.ApplicationBuilder.json_codec` for details. Defaults to
+            :class:`telegram.request.JSONCodec`, i.e. the standard library's :mod:`json`.
+
+            .. versionadded:: NEXT.VERSION
 
     """
 
-    __slots__ = ("_callback_data_cache", "_defaults", "_rate_limiter")
+    __slots__ = (
+        "_callback_data_cache",
+        "_defaults",
+        "_json_codec",
+        "_lazy_de_json",
+        "_rate_limiter",
+        "_request_pools",
+        "_response_cache",
+        "_upload_cache",
+    )
 
     _LOGGER = get_logger(__name__, class_name="ExtBot")
 
@@ -189,6 +239,11 @@ class ExtBot(Bot, Generic[RLARGS]):
         defaults: Optional["Defaults"] = None,
         arbitrary_callback_data: Union[bool, int] = False,
         local_mode: bool = False,
+        lazy_de_json: bool = False,
+        upload_cache: Optional[UploadCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        request_pools: Optional[Mapping[str, BaseRequest]] = None,
+        json_codec: Optional[JSONCodec] = None,
     ): ...
 
     @overload
@@ -205,6 +260,11 @@ class ExtBot(Bot, Generic[RLARGS]):
         arbitrary_callback_data: Union[bool, int] = False,
         local_mode: bool = False,
         rate_limiter: Optional["BaseRateLimiter[RLARGS]"] = None,
+        lazy_de_json: bool = False,
+        upload_cache: Optional[UploadCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        request_pools: Optional[Mapping[str, BaseRequest]] = None,
+        json_codec: Optional[JSONCodec] = None,
     ): ...
 
     def __init__(
@@ -220,7 +280,17 @@ class ExtBot(Bot, Generic[RLARGS]):
         arbitrary_callback_data: Union[bool, int] = False,
         local_mode: bool = False,
         rate_limiter: Optional["BaseRateLimiter[RLARGS]"] = None,
+        lazy_de_json: bool = False,
+        upload_cache: Optional[UploadCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        request_pools: Optional[Mapping[str, BaseRequest]] = None,
+        json_codec: Optional[JSONCodec] = None,
     ):
+        if request_pools and "getUpdates" in request_pools:
+            raise ValueError(
+                "Use `get_updates_request` to set the request object for `getUpdates`."
+            )
+
         super().__init__(
             token=token,
             base_url=base_url,
@@ -234,6 +304,11 @@ class ExtBot(Bot, Generic[RLARGS]):
         with self._unfrozen():
             self._defaults: Optional[Defaults] = defaults
             self._rate_limiter: Optional[BaseRateLimiter] = rate_limiter
+            self._lazy_de_json: bool = lazy_de_json
+            self._upload_cache: Optional[UploadCache] = upload_cache
+            self._response_cache: Optional[ResponseCache] = response_cache
+            self._request_pools: Dict[str, BaseRequest] = dict(request_pools or {})
+            self._json_codec: JSONCodec = json_codec or JSONCodec()
             self._callback_data_cache: Optional[CallbackDataCache] = None
 
             # set up callback_data
@@ -282,24 +357,66 @@ class ExtBot(Bot, Generic[RLARGS]):
         """
         return self._callback_data_cache
 
+    @property
+    def request_pools(self) -> Mapping[str, BaseRequest]:
+        """Mapping[:obj:`str`, :class:`telegram.request.BaseRequest`]: The request objects used
+        for specific Bot API methods instead of :attr:`request`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return MappingProxyType(self._request_pools)
+
+    @property
+    def json_codec(self) -> JSONCodec:
+        """:class:`telegram.request.JSONCodec`: The codec used for the JSON of the requests made
+        by this bot.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._json_codec
+
+    def _get_request(self, endpoint: str) -> BaseRequest:
+        if (request := self._request_pools.get(endpoint)) is not None:
+            return request
+        return super()._get_request(endpoint)
+
+    def __get_pool_requests(self) -> List[BaseRequest]:
+        requests: List[BaseRequest] = []
+        for request in self._request_pools.values():
+            if all(request is not other for other in (*self._request, *requests)):
+                requests.append(request)
+        return requests
+
     async def initialize(self) -> None:
         """See :meth:`telegram.Bot.initialize`. Also initializes the
         :paramref:`ExtBot.rate_limiter` (if set)
-        by calling :meth:`telegram.ext.BaseRateLimiter.initialize`.
+        by calling :meth:`telegram.ext.BaseRateLimiter.initialize` and the
+        :paramref:`ExtBot.request_pools` (if set).
+
+        .. versionchanged:: NEXT.VERSION
+            Initializes the :paramref:`ExtBot.request_pools`.
         """
         # Initialize before calling super, because super calls get_me
         if self.rate_limiter:
             await self.rate_limiter.initialize()
+        if not self._initialized:
+            await asyncio.gather(*(request.initialize() for request in self.__get_pool_requests()))
         await super().initialize()
 
     async def shutdown(self) -> None:
         """See :meth:`telegram.Bot.shutdown`. Also shuts down the
         :paramref:`ExtBot.rate_limiter` (if set) by
-        calling :meth:`telegram.ext.BaseRateLimiter.shutdown`.
+        calling :meth:`telegram.ext.BaseRateLimiter.shutdown` and the
+        :paramref:`ExtBot.request_pools` (if set).
+
+        .. versionchanged:: NEXT.VERSION
+            Shuts down the :paramref:`ExtBot.request_pools`.
         """
         # Shut down the rate limiter before shutting down the request objects!
         if self.rate_limiter:
             await self.rate_limiter.shutdown()
+        if self._initialized:
+            await asyncio.gather(*(request.shutdown() for request in self.__get_pool_requests()))
         await super().shutdown()
 
     @classmethod
@@ -334,7 +451,7 @@ class ExtBot(Bot, Generic[RLARGS]):
         pool_timeout: ODVInput[float] = DEFAULT_NONE,
     ) -> Union[bool, JSONDict, List[JSONDict]]:
         """Order of method calls is: Bot.some_method -> Bot._post -> Bot._do_post.
-        So we can override Bot._do_post to add rate limiting.
+        So we can override Bot._do_post to add rate limiting and caching.
         """
         rate_limit_args = self._extract_rl_kwargs(data)
         if not self.rate_limiter and rate_limit_args is not None:
@@ -342,9 +459,42 @@ class ExtBot(Bot, Generic[RLARGS]):
                 "`rate_limit_args` can only be used if a `ExtBot.rate_limiter` is set."
             )
 
+        async def do_post(request_data: JSONDict) -> Union[bool, JSONDict, List[JSONDict]]:
+            return await self._do_rate_limited_post(
+                endpoint=endpoint,
+                data=request_data,
+                rate_limit_args=rate_limit_args,
+                read_timeout=read_timeout,
+                write_timeout=write_timeout,
+                connect_timeout=connect_timeout,
+                pool_timeout=pool_timeout,
+            )
+
+        callback: Callable[[JSONDict], Awaitable[Union[bool, JSONDict, List[JSONDict]]]] = do_post
+        if self.upload_cache is not None:
+            callback = functools.partial(
+                self.upload_cache.process_request, endpoint, callback=callback
+            )
+        if self.response_cache is not None:
+            callback = functools.partial(
+                self.response_cache.process_request, endpoint, callback=callback
+            )
+        return await callback(data)
+
+    async def _do_rate_limited_post(
+        self,
+        endpoint: str,
+        data: JSONDict,
+        rate_limit_args: Optional[RLARGS],
+        *,
+        read_timeout: ODVInput[float] = DEFAULT_NONE,
+        write_timeout: ODVInput[float] = DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = DEFAULT_NONE,
+    ) -> Union[bool, JSONDict, List[JSONDict]]:
         # getting updates should not be rate limited!
         if endpoint == "getUpdates" or not self.rate_limiter:
-            return await super()._do_post(
+            return await self._do_post_with_json_codec(
                 endpoint=endpoint,
                 data=data,
                 write_timeout=write_timeout,
@@ -365,7 +515,7 @@ class ExtBot(Bot, Generic[RLARGS]):
             rate_limit_args,
         )
         return await self.rate_limiter.process_request(
-            callback=super()._do_post,
+            callback=self._do_post_with_json_codec,
             args=(endpoint, data),
             kwargs=kwargs,
             endpoint=endpoint,
@@ -373,6 +523,14 @@ class ExtBot(Bot, Generic[RLARGS]):
             rate_limit_args=rate_limit_args,
         )
 
+    async def _do_post_with_json_codec(
+        self, *args: Any, **kwargs: Any
+    ) -> Union[bool, JSONDict, List[JSONDict]]:
+        # The rate limiter may make the request in a different task, so the codec is set right
+        # before making the actual request
+        with use_json_codec(self._json_codec):
+            return await super()._do_post(*args, **kwargs)
+
     @property
     def defaults(self) -> Optional["Defaults"]:
         """The :class:`telegram.ext.Defaults` used by this bot, if any."""
@@ -388,6 +546,169 @@ class ExtBot(Bot, Generic[RLARGS]):
         # This is a property because the rate limiter shouldn't be changed at runtime
         return self._rate_limiter
 
+    @property
+    def lazy_de_json(self) -> bool:
+        """:obj:`bool`: Whether objects received from Telegram convert nested objects only when
+        they are first accessed.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._lazy_de_json
+
+    @property
+    def upload_cache(self) -> Optional[UploadCache]:
+        """:class:`telegram.ext.UploadCache`: Optional. The cache for the file ids of uploaded
+        files.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._upload_cache
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """:class:`telegram.ext.ResponseCache`: Optional. The cache for the results of read-only
+        methods.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._response_cache
+
+    async def send_bulk(
+        self,
+        chat_ids: Union[Iterable[Union[int, str]], AsyncIterable[Union[int, str]]],
+        callback: Callable[[Union[int, str]], Awaitable[object]],
+        max_concurrent_requests: int = 16,
+        max_retries: int = 3,
+    ) -> AsyncIterator[BulkSendResult]:
+        """Sends to many recipients concurrently, e.g. for broadcasting a message to all users
+        of the bot. For each recipient, :paramref:`callback` is awaited with the chat id of the
+        recipient and the outcome is reported as :class:`telegram.ext.BulkSendResult` as soon as
+        it is available:
+
+        .. code:: python
+
+            async for result in bot.send_bulk(
+                user_ids, lambda chat_id: bot.send_message(chat_id, "Announcement")
+            ):
+                if isinstance(result.error, Forbidden):
+                    remove_user(result.chat_id)
+
+        The recipients are consumed lazily and at most :paramref:`max_concurrent_requests`
+        results are pending at any time, so the memory usage does not depend on the number of
+        recipients. The results are yielded in the order in which the requests finish, which may
+        differ from the order of :paramref:`chat_ids`.
+
+        If the callback raises :exc:`telegram.error.RetryAfter`, only the affected recipient
+        waits for the requested time before the callback is called again. Other exceptions
+        (e.g. :exc:`telegram.error.Forbidden` if the user blocked the bot) are reported via
+        :attr:`telegram.ext.BulkSendResult.error` and don't stop the remaining recipients.
+
+        Tip:
+            This method does not enforce any limits on the number of requests per time
+            interval. Use a :attr:`rate_limiter` (e.g. :class:`telegram.ext.AIORateLimiter`) to
+            respect the global and per-chat flood limits of Telegram. Passing
+            ``rate_limit_args`` in the callback allows to treat the bulk requests differently
+            from other requests of the bot.
+
+        Note:
+            If the iteration is stopped early (e.g. via ``break``), the pending requests are
+            cancelled once the generator is closed.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            chat_ids (Iterable[:obj:`int` | :obj:`str`] | AsyncIterable[:obj:`int` | :obj:`str`]):
+                The recipients. May be a (potentially infinite) iterator or async iterator, e.g.
+                one that fetches the recipients from a database page by page.
+            callback (:term:`coroutine function`): The function to call for each recipient.
+                Must accept the chat id as single positional argument.
+            max_concurrent_requests (:obj:`int`, optional): The maximum number of recipients
+                that are processed concurrently. Should not exceed the connection pool size of
+                the :attr:`~telegram.Bot.request` object of the bot. Defaults to ``16``.
+            max_retries (:obj:`int`, optional): How often the callback is called again for a
+                recipient after :exc:`telegram.error.RetryAfter`. Defaults to ``3``.
+
+        Yields:
+            :class:`telegram.ext.BulkSendResult`: The outcome for each recipient.
+
+        Raises:
+            :exc:`ValueError`: If :paramref:`max_concurrent_requests` is not a positive integer.
+        """
+        if max_concurrent_requests < 1:
+            raise ValueError("`max_concurrent_requests` must be a positive integer!")
+
+        if isinstance(chat_ids, AsyncIterable):
+            async_iterator = chat_ids.__aiter__()
+            # Async iterators must not be advanced concurrently
+            lock = asyncio.Lock()
+
+            async def next_chat_id() -> Optional[Union[int, str]]:
+                async with lock:
+                    try:
+                        return await async_iterator.__anext__()
+                    except StopAsyncIteration:
+                        return None
+
+        else:
+            iterator = iter(chat_ids)
+
+            async def next_chat_id() -> Optional[Union[int, str]]:
+                return next(iterator, None)
+
+        # None signals that a worker is done. Errors of the iteration are forwarded to the caller
+        results: "asyncio.Queue[Union[BulkSendResult, Exception, None]]" = asyncio.Queue(
+            maxsize=max_concurrent_requests
+        )
+
+        async def worker() -> None:
+            try:
+                while (chat_id := await next_chat_id()) is not None:
+                    await results.put(await self._send_to_chat(chat_id, callback, max_retries))
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                await results.put(exc)
+            else:
+                await results.put(None)
+
+        workers = [asyncio.create_task(worker()) for _ in range(max_concurrent_requests)]
+        try:
+            running = len(workers)
+            while running:
+                item = await results.get()
+                if item is None:
+                    running -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _send_to_chat(
+        self,
+        chat_id: Union[int, str],
+        callback: Callable[[Union[int, str]], Awaitable[object]],
+        max_retries: int,
+    ) -> BulkSendResult:
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                result = await callback(chat_id)
+                return BulkSendResult(chat_id=chat_id, result=result, attempts=attempts)
+            except RetryAfter as exc:
+                if attempts > max_retries:
+                    return BulkSendResult(chat_id=chat_id, error=exc, attempts=attempts)
+                self._LOGGER.debug(
+                    "Sending to chat %s hit flood limits. Retrying in %s seconds",
+                    chat_id,
+                    exc.retry_after,
+                )
+                await asyncio.sleep(exc.retry_after)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                return BulkSendResult(chat_id=chat_id, error=exc, attempts=attempts)
+
     def _merge_lpo_defaults(
         self, lpo: ODVInput[LinkPreviewOptions]
     ) -> Optional[LinkPreviewOptions]:
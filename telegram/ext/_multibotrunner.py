@@ -0,0 +1,376 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the MultiBotRunner class."""
+import asyncio
+import contextlib
+import platform
+import signal
+import ssl
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterable,
+    List,
+    NamedTuple,
+    NoReturn,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from telegram._utils.defaultvalue import DEFAULT_NONE, DefaultValue
+from telegram._utils.logging import get_logger
+from telegram._utils.repr import build_repr_with_selected_attrs
+from telegram._utils.types import ODVInput
+from telegram.error import TelegramError
+from telegram.ext._application import Application
+from telegram.ext._applicationbuilder import ApplicationBuilder
+from telegram.ext._utils.asynciowebhookserver import AsyncioWebhookServer
+from telegram.ext._utils.webhookprocessor import WebhookRequestProcessor, WebhookRequestRouter
+from telegram.request import BaseRequest, HTTPXRequest
+
+_LOGGER = get_logger(__name__, class_name="MultiBotRunner")
+
+
+async def _gather(awaitables: Iterable[Awaitable[Any]]) -> None:
+    """Like :func:`asyncio.gather`, but waits for all awaitables to finish before raising the
+    first exception, such that no bot is still e.g. initializing while the runner shuts down.
+    """
+    for result in await asyncio.gather(*awaitables, return_exceptions=True):
+        if isinstance(result, BaseException):
+            raise result
+
+
+class _Bot(NamedTuple):
+    application: Application
+    url_path: str
+    secret_token: Optional[str]
+
+
+class MultiBotRunner:
+    """Runs several bots in one process on a single event loop.
+
+    Each bot is represented by its own :class:`telegram.ext.Application`, such that handlers,
+    :attr:`~telegram.ext.Application.bot_data`, persistence etc. are isolated from each other.
+    What is shared between the bots is
+
+    * the event loop, i.e. all handlers and jobs of all bots run concurrently in one thread,
+    * the :attr:`request` object and thus the connection pool used for making requests to the
+      Bot API, if the applications are built with :meth:`builder`,
+    * when using :meth:`run_webhook`, a single web server that receives the updates of all bots
+      and passes them to the respective application based on the path of the request.
+
+    Note:
+        * Because the :attr:`request` is shared, the applications are shut down only after all of
+          them have been stopped. Calling :meth:`telegram.ext.Application.stop_running` from
+          within a handler of any bot stops all bots.
+        * Each application keeps its own :class:`telegram.ext.JobQueue`. The jobs of all bots are
+          scheduled on the shared event loop, so no additional threads are started.
+        * :meth:`telegram.Bot.get_updates` keeps a connection open for up to
+          :paramref:`~telegram.Bot.get_updates.timeout` seconds. When using :meth:`run_polling`,
+          each bot therefore still uses its own
+          :meth:`~telegram.ext.ApplicationBuilder.get_updates_request`.
+
+    Example:
+        .. code:: python
+
+            runner = MultiBotRunner()
+            for token in ("TOKEN1", "TOKEN2"):
+                application = runner.builder().token(token).build()
+                application.add_handler(CommandHandler("start", start))
+                runner.add_application(application, secret_token="SECRET")
+
+            runner.run_webhook("https://example.com", port=8443)
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        request (:class:`telegram.request.BaseRequest`, optional): The request object shared by
+            the bots. Defaults to a :class:`telegram.request.HTTPXRequest` with
+            :paramref:`~telegram.request.HTTPXRequest.connection_pool_size` ``256``.
+    """
+
+    __slots__ = ("_bots", "_request")
+
+    def __init__(self, request: Optional[BaseRequest] = None):
+        self._request: BaseRequest = request or HTTPXRequest(connection_pool_size=256)
+        self._bots: List[_Bot] = []
+
+    def __repr__(self) -> str:
+        """Give a string representation of the runner in the form ``MultiBotRunner[...]``.
+
+        Returns:
+            :obj:`str`
+        """
+        return build_repr_with_selected_attrs(self, applications=len(self._bots))
+
+    @property
+    def request(self) -> BaseRequest:
+        """:class:`telegram.request.BaseRequest`: The request object shared by the bots."""
+        return self._request
+
+    @property
+    def applications(self) -> Tuple[Application, ...]:
+        """Tuple[:class:`telegram.ext.Application`]: The applications that were added with
+        :meth:`add_application`.
+        """
+        return tuple(bot.application for bot in self._bots)
+
+    def builder(self) -> ApplicationBuilder:
+        """Convenience method. Returns a new :class:`telegram.ext.ApplicationBuilder` that uses
+        :attr:`request` for making requests to the Bot API.
+
+        Returns:
+            :class:`telegram.ext.ApplicationBuilder`
+        """
+        return ApplicationBuilder().request(self._request)
+
+    def add_application(
+        self,
+        application: Application,
+        url_path: Optional[str] = None,
+        secret_token: Optional[str] = None,
+    ) -> None:
+        """Adds an application to the runner.
+
+        Args:
+            application (:class:`telegram.ext.Application`): The application.
+            url_path (:obj:`str`, optional): Path of the webhook of this bot, relative to the
+                :paramref:`~run_webhook.webhook_url` passed to :meth:`run_webhook`. Defaults to
+                the id of the bot, i.e. the part of the token before the colon.
+            secret_token (:obj:`str`, optional): The secret token passed to
+                :meth:`telegram.Bot.set_webhook` by :meth:`run_webhook`. Requests to the webhook
+                of this bot without this token in the ``X-Telegram-Bot-Api-Secret-Token`` header
+                are rejected with :class:`http.HTTPStatus.FORBIDDEN <http.HTTPStatus>`. As the
+                default :paramref:`url_path` is not secret, passing a secret token is strongly
+                recommended when using webhooks.
+
+        Raises:
+            :exc:`ValueError`: If the application was already added or another application uses
+                the same :paramref:`url_path`.
+        """
+        if url_path is None:
+            url_path = application.bot.token.split(":", 1)[0]
+        url_path = url_path.strip("/")
+
+        for bot in self._bots:
+            if bot.application is application:
+                raise ValueError("This application was already added!")
+            if bot.url_path == url_path:
+                raise ValueError(f"Another application already uses the url path '{url_path}'!")
+        self._bots.append(_Bot(application, url_path, secret_token))
+
+    def run_polling(
+        self,
+        close_loop: bool = True,
+        stop_signals: ODVInput[Sequence[int]] = DEFAULT_NONE,
+        **kwargs: Any,
+    ) -> None:
+        """Starts all applications and fetches updates for each bot via
+        :meth:`telegram.ext.Updater.start_polling` until one of the :paramref:`stop_signals` is
+        received. Afterwards, all applications are stopped and shut down.
+
+        Args:
+            close_loop (:obj:`bool`, optional): If :obj:`True`, the current event loop will be
+                closed upon shutdown. Defaults to :obj:`True`.
+            stop_signals (Sequence[:obj:`int`] | :obj:`None`, optional): Signals that will shut
+                down the runner, see :paramref:`telegram.ext.Application.run_polling.stop_signals`.
+            **kwargs: Passed to :meth:`telegram.ext.Updater.start_polling` of each bot.
+
+        Raises:
+            :exc:`RuntimeError`: If no applications were added or one of them has no
+                :attr:`~telegram.ext.Application.updater`.
+        """
+        if any(bot.application.updater is None for bot in self._bots):
+            raise RuntimeError("All applications must have an `Updater` for `run_polling`.")
+
+        async def start_polling() -> None:
+            await _gather(
+                bot.application.updater.start_polling(**kwargs)  # type: ignore[union-attr]
+                for bot in self._bots
+            )
+
+        self.__run(start_polling, None, close_loop, stop_signals)
+
+    def run_webhook(
+        self,
+        webhook_url: str,
+        listen: str = "127.0.0.1",
+        port: int = 80,
+        cert: Optional[Union[str, Path]] = None,
+        key: Optional[Union[str, Path]] = None,
+        allowed_updates: Optional[List[str]] = None,
+        drop_pending_updates: Optional[bool] = None,
+        max_connections: int = 40,
+        close_loop: bool = True,
+        stop_signals: ODVInput[Sequence[int]] = DEFAULT_NONE,
+        unix: Optional[Union[str, Path]] = None,
+    ) -> None:
+        """Starts all applications and a single web server that receives the updates of all bots
+        until one of the :paramref:`stop_signals` is received. Afterwards, the web server is
+        shut down and all applications are stopped and shut down.
+
+        For each bot, :meth:`telegram.Bot.set_webhook` is called with the url
+        :paramref:`webhook_url` followed by the :paramref:`~add_application.url_path` of the
+        bot. The web server is the same as the one used by
+        :meth:`telegram.ext.Updater.start_webhook` with ``server="asyncio"``, i.e. it does not
+        require tornado. The :attr:`~telegram.ext.Application.updater` of the applications is
+        not used and can be :obj:`None`.
+
+        Args:
+            webhook_url (:obj:`str`): The url under which the web server is reachable for
+                Telegram, e.g. ``"https://example.com"``.
+            listen (:obj:`str`, optional): IP-Address to listen on. Defaults to
+                `127.0.0.1 <https://en.wikipedia.org/wiki/Localhost>`_.
+            port (:obj:`int`, optional): Port the bot should be listening on. Must be one of
+                :attr:`telegram.constants.SUPPORTED_WEBHOOK_PORTS` unless the bots run behind a
+                proxy. Defaults to ``80``.
+            cert (:class:`pathlib.Path` | :obj:`str`, optional): Path to the SSL certificate file.
+            key (:class:`pathlib.Path` | :obj:`str`, optional): Path to the SSL key file.
+            allowed_updates (List[:obj:`str`], optional): Passed to
+                :meth:`telegram.Bot.set_webhook`.
+            drop_pending_updates (:obj:`bool`, optional): Whether to clean any pending updates on
+                Telegram servers before actually starting to receive updates. Default is
+                :obj:`False`.
+            max_connections (:obj:`int`, optional): Passed to :meth:`telegram.Bot.set_webhook`.
+                Defaults to ``40``.
+            close_loop (:obj:`bool`, optional): If :obj:`True`, the current event loop will be
+                closed upon shutdown. Defaults to :obj:`True`.
+            stop_signals (Sequence[:obj:`int`] | :obj:`None`, optional): Signals that will shut
+                down the runner, see :paramref:`telegram.ext.Application.run_webhook.stop_signals`.
+            unix (:class:`pathlib.Path` | :obj:`str`, optional): Path to the unix socket file.
+                Path does not need to exist, in which case the file will be created. If passed,
+                :paramref:`listen` and :paramref:`port` are ignored.
+
+        Raises:
+            :exc:`RuntimeError`: If no applications were added.
+        """
+        # An SSLError is raised if the private key does not match with the certificate. As in
+        # Updater.start_webhook, the certificate is only used by the server if the key is present
+        if cert is not None and key is not None:
+            try:
+                ssl_ctx: Optional[ssl.SSLContext] = ssl.create_default_context(
+                    ssl.Purpose.CLIENT_AUTH
+                )
+                ssl_ctx.load_cert_chain(cert, key)  # type: ignore[union-attr]
+            except ssl.SSLError as exc:
+                raise TelegramError("Invalid SSL Certificate") from exc
+        else:
+            ssl_ctx = None
+
+        router = WebhookRequestRouter(
+            [
+                WebhookRequestProcessor(
+                    bot.url_path,
+                    bot.application.bot,
+                    bot.application.update_queue,
+                    bot.secret_token,
+                )
+                for bot in self._bots
+            ]
+        )
+        httpd = AsyncioWebhookServer(listen, port, router, ssl_ctx, unix)
+        webhook_url = webhook_url.rstrip("/")
+        # Passing a Path or string only works with a local bot API server, so we read the contents
+        certificate = Path(cert).read_bytes() if cert else None
+
+        async def start_webhook() -> None:
+            await _gather(
+                bot.application.bot.set_webhook(
+                    url=f"{webhook_url}/{bot.url_path}",
+                    certificate=certificate,
+                    allowed_updates=allowed_updates,
+                    drop_pending_updates=drop_pending_updates,
+                    max_connections=max_connections,
+                    secret_token=bot.secret_token,
+                )
+                for bot in self._bots
+            )
+            await httpd.serve_forever()
+
+        self.__run(start_webhook, httpd, close_loop, stop_signals)
+
+    @staticmethod
+    def _raise_system_exit() -> NoReturn:
+        raise SystemExit
+
+    async def _initialize(self) -> None:
+        await _gather(bot.application.initialize() for bot in self._bots)
+        for bot in self._bots:
+            if bot.application.post_init:
+                await bot.application.post_init(bot.application)
+
+    async def _start(self) -> None:
+        await _gather(bot.application.start() for bot in self._bots)
+
+    async def _shutdown(self, httpd: Optional[AsyncioWebhookServer]) -> None:
+        if httpd is not None:
+            await httpd.shutdown()
+        applications = self.applications
+        await _gather(
+            application.updater.stop()
+            for application in applications
+            if application.updater and application.updater.running
+        )
+        await _gather(application.stop() for application in applications if application.running)
+        for application in applications:
+            if application.post_stop:
+                await application.post_stop(application)
+        # The bots share the request object, so none of them may be shut down before all of
+        # them are stopped
+        await _gather(application.shutdown() for application in applications)
+        for application in applications:
+            if application.post_shutdown:
+                await application.post_shutdown(application)
+
+    def __run(
+        self,
+        start_updates: Callable[[], Coroutine[Any, Any, None]],
+        httpd: Optional[AsyncioWebhookServer],
+        close_loop: bool,
+        stop_signals: ODVInput[Sequence[int]],
+    ) -> None:
+        if not self._bots:
+            raise RuntimeError("No applications were added to the runner.")
+
+        loop = asyncio.get_event_loop()
+        if stop_signals is DEFAULT_NONE and platform.system() != "Windows":
+            stop_signals = (signal.SIGINT, signal.SIGTERM, signal.SIGABRT)
+        with contextlib.suppress(NotImplementedError):
+            if not isinstance(stop_signals, DefaultValue):
+                for sig in stop_signals or []:
+                    loop.add_signal_handler(sig, self._raise_system_exit)
+
+        try:
+            loop.run_until_complete(self._initialize())
+            loop.run_until_complete(start_updates())
+            loop.run_until_complete(self._start())
+            loop.run_forever()
+        except (KeyboardInterrupt, SystemExit):
+            _LOGGER.debug("MultiBotRunner received stop signal. Shutting down.")
+        finally:
+            try:
+                loop.run_until_complete(self._shutdown(httpd))
+            finally:
+                if close_loop:
+                    loop.close()
@@ -0,0 +1,372 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the MultiProcessRunner class."""
+import asyncio
+import contextlib
+import multiprocessing
+import os
+import platform
+import signal
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, List, NoReturn, Optional, Sequence
+
+from telegram._update import Update
+from telegram._utils.defaultvalue import DEFAULT_NONE, DefaultValue
+from telegram._utils.logging import get_logger
+from telegram._utils.repr import build_repr_with_selected_attrs
+from telegram._utils.types import JSONDict, ODVInput
+from telegram.ext._application import Application
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+
+    from telegram.ext._updater import Updater
+
+_LOGGER = get_logger(__name__, class_name="MultiProcessRunner")
+
+ApplicationFactory = Callable[[Optional[int]], Application]
+
+# Seconds between two checks whether the worker processes are still alive
+_WORKER_CHECK_INTERVAL = 1.0
+
+
+def _get_shard(update: object, shards: int) -> int:
+    if not isinstance(update, Update):
+        return 0
+    if update.effective_chat:
+        key = update.effective_chat.id
+    elif update.effective_user:
+        key = update.effective_user.id
+    else:
+        key = update.update_id
+    return key % shards
+
+
+async def _serve_worker(application_factory: ApplicationFactory, index: int, queue: Any) -> None:
+    """Runs the application of a worker until the sentinel :obj:`None` is read from the queue.
+    ``queue`` can be any object with a blocking ``get`` method.
+    """
+    application = application_factory(index)
+    # Otherwise, the jobs scheduled on startup would run once per worker
+    if index != 0 and application._job_queue is not None:  # pylint: disable=protected-access
+        raise ValueError(
+            "Only the application of worker 0 of `MultiProcessRunner` may use a `JobQueue`. "
+            "Pass `job_queue(None)` to the `ApplicationBuilder` for the other workers."
+        )
+
+    loop = asyncio.get_running_loop()
+    try:
+        await application.initialize()
+        if application.post_init:
+            await application.post_init(application)
+        await application.start()
+        # Reading from a multiprocessing queue blocks, so we do that in a thread
+        while (data := await loop.run_in_executor(None, queue.get)) is not None:
+            await application.update_queue.put(Update.de_json(data, application.bot))
+    finally:
+        if application.running:
+            await application.stop()
+        if application.post_stop:
+            await application.post_stop(application)
+        await application.shutdown()
+        if application.post_shutdown:
+            await application.post_shutdown(application)
+
+
+def _run_worker(application_factory: ApplicationFactory, index: int, queue: Any) -> None:
+    # The main process takes care of stopping the workers via the queue. Without ignoring SIGINT
+    # here, pressing Ctrl+C would stop the workers before they received all pending updates.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_until_complete(_serve_worker(application_factory, index, queue))
+    finally:
+        loop.close()
+
+
+class MultiProcessRunner:
+    """Runs a bot on multiple processes and thus on multiple CPU cores.
+
+    The main process fetches the updates from Telegram via :meth:`run_polling` or
+    :meth:`run_webhook`. Each update is forwarded to one of :attr:`workers` worker processes,
+    each of which runs its own :class:`telegram.ext.Application`. Updates are assigned to the
+    workers based on the id of :attr:`telegram.Update.effective_chat` or, if that is not
+    available, :attr:`telegram.Update.effective_user`, such that all updates from the same chat
+    are processed by the same worker in the order in which they were received.
+
+    The applications are built by calling :paramref:`application_factory`
+
+    * with the index of the worker, i.e. an integer between ``0`` and :attr:`workers` - 1, in
+      each worker process. The handlers, error handlers,
+      :attr:`~telegram.ext.Application.post_init` etc. must be set up here. The
+      :attr:`~telegram.ext.Application.updater` of these applications is not used.
+    * with :obj:`None` in the main process. Only the :attr:`~telegram.ext.Application.updater`
+      of this application is used, handlers, persistence and the job queue are ignored.
+
+    Persistence and :class:`telegram.ext.JobQueue` are coordinated across the workers via the
+    index passed to :paramref:`application_factory`:
+
+    * Each worker uses its own persistence, i.e. the workers must not share files or database
+      tables, e.g. ``PicklePersistence(f"data_{index}.pickle")``. As all updates of a chat are
+      processed by the same worker, each persistence holds the data of the chats of its worker.
+      Keep :attr:`workers` the same across restarts, as the chats are assigned to other workers
+      otherwise.
+    * Only worker ``0`` may use a :class:`telegram.ext.JobQueue`, such that each job runs
+      exactly once. Build the applications of the other workers with ``job_queue(None)``, as a
+      job queue is set up by default if its dependencies are installed. Jobs are scheduled in
+      :attr:`~telegram.ext.Application.post_init` of worker ``0`` or in the handlers of the
+      updates processed by it.
+
+    Note:
+        * The worker processes are started with the ``"spawn"`` method by default, such that
+          :paramref:`application_factory` must be picklable, e.g. a function defined at the top
+          level of a module, and the code that calls :meth:`run_polling` or :meth:`run_webhook`
+          must be guarded by ``if __name__ == "__main__":``.
+        * Each worker has its own :attr:`~telegram.ext.Application.bot_data`. Because all updates
+          of a chat are processed by the same worker, :attr:`~telegram.ext.Application.chat_data`
+          is consistent. The same holds for :attr:`~telegram.ext.Application.user_data` as long
+          as the user interacts with the bot only in one chat, e.g. a private chat.
+        * The :attr:`~telegram.ext.CallbackContext.chat_data` and
+          :attr:`~telegram.ext.CallbackContext.user_data` of jobs are those of worker ``0`` and
+          therefore only consistent for the chats assigned to this worker.
+        * :attr:`telegram.ext.ConversationHandler.conversation_timeout` can only be used in
+          worker ``0``, as it requires a job queue.
+        * :paramref:`telegram.ext.ApplicationBuilder.arbitrary_callback_data` is not supported.
+        * If a worker process exits unexpectedly, e.g. because
+          :paramref:`application_factory` raised an exception, the runner shuts down and
+          :meth:`run_polling` or :meth:`run_webhook` raises a :exc:`RuntimeError`. Updates that
+          were already forwarded to the worker are lost.
+
+    Example:
+        .. code:: python
+
+            async def post_init(application: Application) -> None:
+                application.job_queue.run_repeating(send_report, interval=3600)
+
+            def build_application(index: Optional[int]) -> Application:
+                builder = ApplicationBuilder().token("TOKEN")
+                if index is not None:
+                    builder.persistence(PicklePersistence(f"data_{index}.pickle"))
+                if index == 0:
+                    # Jobs only run in worker 0
+                    builder.post_init(post_init)
+                else:
+                    builder.job_queue(None)
+                application = builder.build()
+                application.add_handler(CommandHandler("start", start))
+                return application
+
+            if __name__ == "__main__":
+                MultiProcessRunner(build_application, workers=4).run_polling()
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        application_factory (Callable[[:obj:`int` | :obj:`None`], \
+            :class:`telegram.ext.Application`]): The function that builds the applications.
+        workers (:obj:`int`, optional): The number of worker processes. Defaults to
+            :func:`os.cpu_count`.
+        mp_context (:class:`multiprocessing.context.BaseContext`, optional): The
+            multiprocessing context used to create the worker processes and the queues. Defaults
+            to the context of the ``"spawn"`` start method.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`workers` is a non-positive integer.
+    """
+
+    __slots__ = ("_application_factory", "_mp_context", "_workers")
+
+    def __init__(
+        self,
+        application_factory: ApplicationFactory,
+        workers: Optional[int] = None,
+        mp_context: Optional["BaseContext"] = None,
+    ):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("`workers` must be a positive integer!")
+
+        self._application_factory: ApplicationFactory = application_factory
+        self._workers: int = workers
+        self._mp_context: BaseContext = mp_context or multiprocessing.get_context("spawn")
+
+    def __repr__(self) -> str:
+        """Give a string representation of the runner in the form ``MultiProcessRunner[...]``.
+
+        Returns:
+            :obj:`str`
+        """
+        return build_repr_with_selected_attrs(self, workers=self.workers)
+
+    @property
+    def workers(self) -> int:
+        """:obj:`int`: The number of worker processes."""
+        return self._workers
+
+    def run_polling(
+        self,
+        stop_signals: ODVInput[Sequence[int]] = DEFAULT_NONE,
+        **kwargs: Any,
+    ) -> None:
+        """Starts the worker processes and fetches updates via
+        :meth:`telegram.ext.Updater.start_polling` until one of the :paramref:`stop_signals` is
+        received. Afterwards, the updater is stopped and the workers are shut down once they
+        processed all updates that were forwarded to them.
+
+        Args:
+            stop_signals (Sequence[:obj:`int`] | :obj:`None`, optional): Signals that will shut
+                down the runner, see :paramref:`telegram.ext.Application.run_polling.stop_signals`.
+            **kwargs: Passed to :meth:`telegram.ext.Updater.start_polling`.
+
+        Raises:
+            :exc:`RuntimeError`: If a worker process exits unexpectedly.
+        """
+        self.__run(lambda updater: updater.start_polling(**kwargs), stop_signals)
+
+    def run_webhook(
+        self,
+        stop_signals: ODVInput[Sequence[int]] = DEFAULT_NONE,
+        **kwargs: Any,
+    ) -> None:
+        """Starts the worker processes and fetches updates via
+        :meth:`telegram.ext.Updater.start_webhook` until one of the :paramref:`stop_signals` is
+        received. Afterwards, the updater is stopped and the workers are shut down once they
+        processed all updates that were forwarded to them.
+
+        Args:
+            stop_signals (Sequence[:obj:`int`] | :obj:`None`, optional): Signals that will shut
+                down the runner, see :paramref:`telegram.ext.Application.run_webhook.stop_signals`.
+            **kwargs: Passed to :meth:`telegram.ext.Updater.start_webhook`.
+
+        Raises:
+            :exc:`RuntimeError`: If a worker process exits unexpectedly.
+        """
+        self.__run(lambda updater: updater.start_webhook(**kwargs), stop_signals)
+
+    @staticmethod
+    def _raise_system_exit() -> NoReturn:
+        raise SystemExit
+
+    @staticmethod
+    def _forward(update: object, queues: List[Any]) -> None:
+        if not isinstance(update, Update):
+            _LOGGER.warning("Dropping %r, only updates can be forwarded to the workers.", update)
+            return
+        data: JSONDict = update.to_dict()
+        queues[_get_shard(update, len(queues))].put(data)
+
+    @staticmethod
+    async def _monitor_workers(processes: List[Any]) -> None:
+        while True:
+            for index, process in enumerate(processes):
+                if not process.is_alive():
+                    raise RuntimeError(
+                        f"Worker process {index} exited unexpectedly with exit code "
+                        f"{process.exitcode}. Updates forwarded to it were lost."
+                    )
+            await asyncio.sleep(_WORKER_CHECK_INTERVAL)
+
+    async def _forward_updates(self, updater: "Updater", queues: List[Any]) -> None:
+        while True:
+            self._forward(await updater.update_queue.get(), queues)
+            # Handing the update over to a worker counts as processed, see
+            # Updater.start_polling(confirm_after_processing=...)
+            updater.update_queue.task_done()
+
+    async def _forward_updates_to_workers(
+        self, updater: "Updater", queues: List[Any], processes: List[Any]
+    ) -> None:
+        tasks = [
+            asyncio.create_task(self._forward_updates(updater, queues)),
+            asyncio.create_task(self._monitor_workers(processes)),
+        ]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                # Raises the exception of the monitor if a worker died
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def __run(
+        self,
+        start_updater: Callable[["Updater"], Coroutine[Any, Any, Any]],
+        stop_signals: ODVInput[Sequence[int]],
+    ) -> None:
+        application = self._application_factory(None)
+        updater = application.updater
+        if updater is None:
+            raise RuntimeError(
+                "The application built for the main process must have an `Updater`."
+            )
+
+        queues = [self._mp_context.Queue() for _ in range(self.workers)]
+        processes = [
+            self._mp_context.Process(  # type: ignore[attr-defined]
+                target=_run_worker,
+                args=(self._application_factory, index, queue),
+                name=f"MultiProcessRunner:worker:{index}",
+            )
+            for index, queue in enumerate(queues)
+        ]
+        for process in processes:
+            process.start()
+
+        loop = asyncio.get_event_loop()
+        if stop_signals is DEFAULT_NONE and platform.system() != "Windows":
+            stop_signals = (signal.SIGINT, signal.SIGTERM, signal.SIGABRT)
+        with contextlib.suppress(NotImplementedError):
+            if not isinstance(stop_signals, DefaultValue):
+                for sig in stop_signals or []:
+                    loop.add_signal_handler(sig, self._raise_system_exit)
+
+        forward_task: Optional[asyncio.Task] = None
+        try:
+            loop.run_until_complete(updater.initialize())
+            loop.run_until_complete(start_updater(updater))
+            forward_task = loop.create_task(
+                self._forward_updates_to_workers(updater, queues, processes)
+            )
+            loop.run_until_complete(forward_task)
+        except (KeyboardInterrupt, SystemExit):
+            _LOGGER.debug("MultiProcessRunner received stop signal. Shutting down.")
+        finally:
+            try:
+                if forward_task is not None:
+                    forward_task.cancel()
+                    loop.run_until_complete(asyncio.gather(forward_task, return_exceptions=True))
+                if updater.running:
+                    loop.run_until_complete(updater.stop())
+                loop.run_until_complete(updater.shutdown())
+                # Updates that were fetched but not yet forwarded are still processed
+                while not updater.update_queue.empty():
+                    self._forward(updater.update_queue.get_nowait(), queues)
+            finally:
+                for queue, process in zip(queues, processes):
+                    if not process.is_alive():
+                        # Nothing reads from this queue anymore. Without this, exiting the main
+                        # process would wait until all data was written to the queue's pipe.
+                        queue.cancel_join_thread()
+                    queue.put(None)
+                for process in processes:
+                    process.join()
+                loop.close()
@@ -8,6 +8,10 @@ from telegram._utils.types import FilePathInput
 from telegram._utils.warnings import warn
 from telegram.ext import BasePersistence, PersistenceInput
 from telegram.ext._contexttypes import ContextTypes
+# Pickle files written by earlier versions reference `_reconstruct_to` in this module, so it must
+# stay importable from here
+from telegram.ext._utils.pickling import custom_reduction as _custom_reduction
+from telegram.ext._utils.pickling import reconstruct_to as _reconstruct_to  # noqa: F401
 from telegram.ext._utils.types import BD, CD, UD, CDCData, ConversationDict, ConversationKey
 
 _REPLACED_KNOWN_BOT = "a known bot replaced by PTB's PicklePersistence"
@@ -22,30 +26,6 @@ def _all_subclasses(cls: Type[TelegramObj]) -> Set[Type[TelegramObj]]:
     return set(subclasses).union([s for c in subclasses for s in _all_subclasses(c)])
 
 
-def _reconstruct_to(cls: Type[TelegramObj], kwargs: dict) -> TelegramObj:
-    """
-    This method is used for unpickling. The data, which is in the form a dictionary, is
-    converted back into a class. Works mostly the same as :meth:`TelegramObject.__setstate__`.
-    This function should be kept in place for backwards compatibility even if the pickling logic
-    is changed, since `_custom_reduction` places references to this function into the pickled data.
-    """
-    obj = cls.__new__(cls)
-    obj.__setstate__(kwargs)
-    return obj
-
-
-def _custom_reduction(cls: TelegramObj) -> Tuple[Callable, Tuple[Type[TelegramObj], dict]]:
-    """
-    This method is used for pickling. The bot attribute is preserved so _BotPickler().persistent_id
-    works as intended.
-    """
-    data = cls._get_attrs(include_private=True)  # pylint: disable=protected-access
-    # MappingProxyType is not pickable, so we convert it to a dict
-    # no need to convert back to MPT in _reconstruct_to, since it's done in __setstate__
-    data["api_kwargs"] = dict(data["api_kwargs"])  # type: ignore[arg-type]
-    return _reconstruct_to, (cls.__class__, data)
-
-
 class _BotPickler(pickle.Pickler):
     __slots__ = ("_bot",)
 
@@ -0,0 +1,327 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains an implementation of the BaseRateLimiter class based on token buckets
+with support for prioritizing requests.
+"""
+import asyncio
+import contextlib
+import heapq
+import itertools
+import time
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple, Union
+
+from telegram._utils.logging import get_logger
+from telegram._utils.types import JSONDict
+from telegram.error import RetryAfter
+from telegram.ext._baseratelimiter import BaseRateLimiter
+
+_LOGGER = get_logger(__name__, class_name="PriorityRateLimiter")
+
+
+class _TokenBucket:
+    """A token bucket holding up to ``max_rate`` tokens that refills at a rate of ``max_rate``
+    tokens per ``time_period`` seconds. Taking a token may make the number of tokens negative,
+    which effectively reserves a future token.
+    """
+
+    __slots__ = ("_capacity", "_paused_until", "_rate", "_tokens", "_updated")
+
+    def __init__(self, max_rate: float, time_period: float) -> None:
+        self._capacity: float = max_rate
+        self._rate: float = max_rate / time_period
+        self._tokens: float = max_rate
+        self._updated: float = time.monotonic()
+        self._paused_until: float = 0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def delay(self, now: float) -> float:
+        """Seconds until the next token is available."""
+        self._refill(now)
+        token_delay = (1 - self._tokens) / self._rate if self._tokens < 1 else 0
+        return max(token_delay, self._paused_until - now, 0)
+
+    def take(self, now: float) -> float:
+        """Takes a token and returns the seconds until it may be used."""
+        delay = self.delay(now)
+        self._tokens -= 1
+        return delay
+
+    def pause(self, until: float) -> None:
+        self._paused_until = max(self._paused_until, until)
+
+    def is_idle(self, now: float) -> bool:
+        """Whether the bucket is in the same state as a newly created one."""
+        self._refill(now)
+        return self._tokens >= self._capacity and self._paused_until <= now
+
+
+class PriorityRateLimiter(BaseRateLimiter[int]):
+    """
+    Implementation of :class:`~telegram.ext.BaseRateLimiter` based on
+    `token buckets <https://en.wikipedia.org/wiki/Token_bucket>`_ that allows to prioritize
+    requests, e.g. such that replies to users are sent before the messages of a broadcast that
+    is running in the background.
+
+    The rate limiting is applied on three levels:
+
+    * Requests with a ``chat_id`` parameter (see
+      :paramref:`~telegram.ext.BaseRateLimiter.process_request.data`) for private chats are
+      limited per chat by :paramref:`chat_max_rate` and :paramref:`chat_time_period`.
+    * Requests for groups and channels, i.e. with a negative integer or a ``@username`` as
+      ``chat_id``, are limited per chat by :paramref:`group_max_rate` and
+      :paramref:`group_time_period`.
+    * All requests with a ``chat_id`` parameter are additionally limited by
+      :paramref:`overall_max_rate` and :paramref:`overall_time_period`.
+
+    When requests have to wait for the overall limit, they are processed in the order of their
+    priority, which can be passed via the ``rate_limit_args`` parameter of the bot methods:
+
+    .. code:: python
+
+        await bot.send_message(chat_id, text, rate_limit_args=PriorityRateLimiter.PRIORITY_BULK)
+
+    Lower values mean higher priority. Requests of the same priority are processed in the
+    order in which they arrived. Requests without ``rate_limit_args`` have the priority
+    :paramref:`default_priority`.
+
+    In contrast to :class:`~telegram.ext.AIORateLimiter`, a :exc:`~telegram.error.RetryAfter`
+    exception only pauses the requests for the affected chat. Only if the request has no
+    ``chat_id`` parameter or the rate limiting for the type of the chat is disabled, all
+    requests are paused.
+
+    Note:
+        Within the limits of a single chat, requests are processed in the order in which they
+        arrived, regardless of their priority.
+
+    .. seealso:: :wiki:`Avoiding Flood Limits <Avoiding-flood-limits>`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        overall_max_rate (:obj:`float`): The maximum number of requests allowed for the entire bot
+            per :paramref:`overall_time_period`. When set to 0, no overall rate limiting will be
+            applied. Defaults to ``30``.
+        overall_time_period (:obj:`float`): The time period (in seconds) during which the
+            :paramref:`overall_max_rate` is enforced. Defaults to ``1``.
+        group_max_rate (:obj:`float`): The maximum number of requests allowed per group or
+            channel per :paramref:`group_time_period`. When set to 0, no rate limiting will be
+            applied to groups and channels. Defaults to ``20``.
+        group_time_period (:obj:`float`): The time period (in seconds) during which the
+            :paramref:`group_max_rate` is enforced. Defaults to ``60``.
+        chat_max_rate (:obj:`float`): The maximum number of requests allowed per private chat
+            per :paramref:`chat_time_period`. When set to 0, no rate limiting will be applied to
+            private chats. Defaults to ``1``.
+        chat_time_period (:obj:`float`): The time period (in seconds) during which the
+            :paramref:`chat_max_rate` is enforced. Defaults to ``1``.
+        default_priority (:obj:`int`): The priority of requests that don't specify one via
+            ``rate_limit_args``. Defaults to :attr:`PRIORITY_DEFAULT`.
+        max_retries (:obj:`int`): The maximum number of retries to be made in case of a
+            :exc:`~telegram.error.RetryAfter` exception. If set to 0, no retries will be made.
+            Defaults to ``0``.
+
+    """
+
+    PRIORITY_INTERACTIVE: int = 0
+    """:obj:`int`: Priority for requests that a user is waiting for, e.g. replies to messages."""
+    PRIORITY_DEFAULT: int = 10
+    """:obj:`int`: The default value of :paramref:`default_priority`."""
+    PRIORITY_BULK: int = 20
+    """:obj:`int`: Priority for requests that may be delayed, e.g. broadcasts."""
+
+    __slots__ = (
+        "_chat_buckets",
+        "_chat_max_rate",
+        "_chat_time_period",
+        "_counter",
+        "_default_priority",
+        "_dispatcher",
+        "_group_max_rate",
+        "_group_time_period",
+        "_max_retries",
+        "_overall_bucket",
+        "_waiters",
+    )
+
+    def __init__(
+        self,
+        overall_max_rate: float = 30,
+        overall_time_period: float = 1,
+        group_max_rate: float = 20,
+        group_time_period: float = 60,
+        chat_max_rate: float = 1,
+        chat_time_period: float = 1,
+        default_priority: int = PRIORITY_DEFAULT,
+        max_retries: int = 0,
+    ) -> None:
+        self._overall_bucket: Optional[_TokenBucket] = (
+            _TokenBucket(overall_max_rate, overall_time_period)
+            if overall_max_rate and overall_time_period
+            else None
+        )
+        self._group_max_rate: float = group_max_rate if group_time_period else 0
+        self._group_time_period: float = group_time_period
+        self._chat_max_rate: float = chat_max_rate if chat_time_period else 0
+        self._chat_time_period: float = chat_time_period
+        self._default_priority: int = default_priority
+        self._max_retries: int = max_retries
+
+        self._chat_buckets: Dict[Union[str, int], _TokenBucket] = {}
+        # Requests waiting for the overall bucket as heap of (priority, counter, future)
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self._dispatcher: Optional[asyncio.Task] = None
+
+    async def initialize(self) -> None:
+        """Does nothing."""
+
+    async def shutdown(self) -> None:
+        """Stops handing out tokens to waiting requests. Requests that are still waiting for a
+        token fail with a :exc:`RuntimeError`.
+        """
+        if self._dispatcher:
+            self._dispatcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._dispatcher
+            self._dispatcher = None
+
+        # Without a dispatcher, nothing would ever resolve the futures of the waiting requests
+        waiters, self._waiters = self._waiters, []
+        for _, _, future in waiters:
+            if not future.done():
+                future.set_exception(RuntimeError("The rate limiter was shut down."))
+
+    def _get_chat_bucket(self, chat_id: Union[str, int], group: bool) -> Optional[_TokenBucket]:
+        max_rate, time_period = (
+            (self._group_max_rate, self._group_time_period)
+            if group
+            else (self._chat_max_rate, self._chat_time_period)
+        )
+        if not max_rate:
+            return None
+
+        # Remove buckets that are unused for so long that they are full again. Same minimal
+        # effort approach as in AIORateLimiter
+        if len(self._chat_buckets) > 512:
+            now = time.monotonic()
+            for key, bucket in self._chat_buckets.copy().items():
+                if key != chat_id and bucket.is_idle(now):
+                    del self._chat_buckets[key]
+
+        if chat_id not in self._chat_buckets:
+            self._chat_buckets[chat_id] = _TokenBucket(max_rate, time_period)
+        return self._chat_buckets[chat_id]
+
+    async def _acquire_overall(self, priority: int) -> None:
+        bucket = self._overall_bucket
+        if bucket is None:
+            return
+        if not self._waiters and bucket.delay(time.monotonic()) == 0:
+            bucket.take(time.monotonic())
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        await future
+
+    async def _dispatch(self) -> None:
+        """Hands out the tokens of the overall bucket to the waiting requests by priority."""
+        bucket = self._overall_bucket
+        while self._waiters and bucket:
+            delay = bucket.delay(time.monotonic())
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            _, _, future = heapq.heappop(self._waiters)
+            # Cancelled requests don't need a token
+            if not future.done():
+                bucket.take(time.monotonic())
+                future.set_result(None)
+
+    async def process_request(
+        self,
+        callback: Callable[..., Coroutine[Any, Any, Union[bool, JSONDict, List[JSONDict]]]],
+        args: Any,
+        kwargs: Dict[str, Any],
+        endpoint: str,
+        data: Dict[str, Any],
+        rate_limit_args: Optional[int],
+    ) -> Union[bool, JSONDict, List[JSONDict]]:
+        """
+        Processes a request by applying rate limiting.
+
+        See :meth:`telegram.ext.BaseRateLimiter.process_request` for detailed information on the
+        arguments.
+
+        Args:
+            rate_limit_args (:obj:`None` | :obj:`int`): If set, specifies the priority of the
+                request. Lower values mean higher priority. Defaults to
+                :paramref:`PriorityRateLimiter.default_priority`.
+        """
+        priority = self._default_priority if rate_limit_args is None else rate_limit_args
+
+        chat_id = data.get("chat_id")
+        # In case user passes integer chat id as string
+        with contextlib.suppress(ValueError, TypeError):
+            chat_id = int(chat_id)
+        # string chat_id only works for channels and supergroups
+        # We can't really tell channels from groups though ...
+        group = (isinstance(chat_id, int) and chat_id < 0) or isinstance(chat_id, str)
+
+        for i in range(self._max_retries + 1):
+            chat_bucket = self._get_chat_bucket(chat_id, group) if chat_id is not None else None
+            if chat_bucket:
+                await asyncio.sleep(chat_bucket.take(time.monotonic()))
+            if chat_id is not None:
+                await self._acquire_overall(priority)
+
+            try:
+                return await callback(*args, **kwargs)
+            except RetryAfter as exc:
+                if i == self._max_retries:
+                    _LOGGER.exception(
+                        "Rate limit hit after maximum of %d retries",
+                        self._max_retries,
+                        exc_info=exc,
+                    )
+                    raise exc
+
+                _LOGGER.info(
+                    "Rate limit hit for endpoint %s and chat %s. Retrying after %f seconds",
+                    endpoint,
+                    chat_id,
+                    exc.retry_after + 0.1,
+                )
+                until = time.monotonic() + exc.retry_after + 0.1
+                if chat_bucket:
+                    # Only requests for this chat have to wait
+                    chat_bucket.pause(until)
+                    continue
+
+                if self._overall_bucket:
+                    self._overall_bucket.pause(until)
+                if chat_id is None or not self._overall_bucket:
+                    # The request itself doesn't pass the overall bucket
+                    await asyncio.sleep(until - time.monotonic())
+        return None  # type: ignore[return-value]
@@ -0,0 +1,289 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the ResponseCache class."""
+import asyncio
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Awaitable, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+from telegram._update import Update
+from telegram._utils.types import JSONDict
+
+_ResultType = Union[bool, JSONDict, List[JSONDict]]
+# endpoint, chat_id, user_id, remaining parameters
+_KeyType = Tuple[str, object, object, Tuple[Tuple[str, str], ...]]
+
+_DEFAULT_TTLS: Dict[str, float] = {
+    "getChat": 60,
+    "getChatAdministrators": 60,
+    "getChatMember": 30,
+    "getChatMemberCount": 60,
+    # The download link of a file is guaranteed to be valid for at least one hour
+    "getFile": 1800,
+    "getMe": 300,
+}
+
+# Requests made by the bot itself that change the results of the cached methods
+_CHAT_MEMBER_ENDPOINTS = frozenset(
+    (
+        "approveChatJoinRequest",
+        "banChatMember",
+        "promoteChatMember",
+        "restrictChatMember",
+        "setChatAdministratorCustomTitle",
+        "unbanChatMember",
+    )
+)
+_CHAT_ENDPOINTS = frozenset(
+    (
+        "deleteChatPhoto",
+        "deleteChatStickerSet",
+        "leaveChat",
+        "pinChatMessage",
+        "setChatDescription",
+        "setChatPermissions",
+        "setChatPhoto",
+        "setChatStickerSet",
+        "setChatTitle",
+        "unpinAllChatMessages",
+        "unpinChatMessage",
+    )
+)
+
+
+def _normalize_id(value: object) -> object:
+    # Ids may be passed as int or as str
+    if isinstance(value, str) and value.lstrip("-").isdigit():
+        return int(value)
+    return value
+
+
+class ResponseCache:
+    """A time-based cache for the results of read-only Bot API methods of
+    :class:`telegram.ext.ExtBot`, such as :meth:`~telegram.Bot.get_chat` or
+    :meth:`~telegram.Bot.get_chat_member`.
+
+    Results are cached for a configurable time per Bot API method. Concurrent identical calls
+    are coalesced into a single request. Cached results for a chat are dropped when the bot
+    receives an update that changes them, i.e.
+
+    * updates with :attr:`~telegram.Update.chat_member` or
+      :attr:`~telegram.Update.my_chat_member`,
+    * messages with :attr:`~telegram.Message.new_chat_members`,
+      :attr:`~telegram.Message.left_chat_member`, :attr:`~telegram.Message.new_chat_title`,
+      :attr:`~telegram.Message.new_chat_photo`, :attr:`~telegram.Message.delete_chat_photo`
+      or :attr:`~telegram.Message.pinned_message`,
+
+    or when the bot itself makes a request that changes them, e.g.
+    :meth:`~telegram.Bot.ban_chat_member` or :meth:`~telegram.Bot.set_chat_title`. Updates are
+    passed to the cache by :meth:`telegram.ext.Application.process_update`.
+
+    Note:
+        * Changes that the bot is not notified about, e.g. changes of the permissions of a
+          chat member when :attr:`~telegram.Update.chat_member` updates are not requested via
+          :paramref:`~telegram.ext.Application.run_polling.allowed_updates`, become visible only
+          after the cached result expired.
+        * Results of requests that pass the chat as username, e.g. ``"@username"``, are not
+          dropped by updates.
+
+    Examples:
+        .. code:: python
+
+            cache = ResponseCache(ttls={"getChatMember": 10, "getFile": 0})
+            application = ApplicationBuilder().token("TOKEN").response_cache(cache).build()
+
+    .. seealso:: :meth:`telegram.ext.ApplicationBuilder.response_cache`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        ttls (Dict[:obj:`str`, :obj:`float`], optional): The time in seconds for which the
+            results of a Bot API method are cached, keyed by the name of the method in the Bot
+            API, e.g. ``"getChat"``. Overrides the default values, which are
+
+            * ``getChat``, ``getChatAdministrators``, ``getChatMemberCount``: 60 seconds
+            * ``getChatMember``: 30 seconds
+            * ``getFile``: 30 minutes
+            * ``getMe``: 5 minutes
+
+            Pass ``0`` to disable caching for a method. Other read-only methods, e.g.
+            ``"getMyCommands"``, can be cached by passing a value for them.
+        maxsize (:obj:`int`, optional): Maximum number of results to keep in memory. If the limit
+            is reached, the least recently used result is dropped. Defaults to ``1024``.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`maxsize` is not a positive integer.
+    """
+
+    __slots__ = ("_maxsize", "_pending", "_results", "_ttls")
+
+    def __init__(self, ttls: Optional[Mapping[str, float]] = None, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError("`maxsize` must be a positive integer!")
+
+        self._ttls: Dict[str, float] = {**_DEFAULT_TTLS, **(ttls or {})}
+        self._maxsize: int = maxsize
+        self._results: "OrderedDict[_KeyType, Tuple[float, _ResultType]]" = OrderedDict()
+        self._pending: Dict[_KeyType, asyncio.Task] = {}
+
+    @property
+    def ttls(self) -> Mapping[str, float]:
+        """Mapping[:obj:`str`, :obj:`float`]: The time in seconds for which the results of the
+        Bot API methods are cached.
+        """
+        return self._ttls.copy()
+
+    @property
+    def maxsize(self) -> int:
+        """:obj:`int`: The maximum number of results stored in memory."""
+        return self._maxsize
+
+    def clear(self) -> None:
+        """Drops all cached results."""
+        self._results.clear()
+
+    def drop_chat(self, chat_id: Union[int, str], user_id: Optional[int] = None) -> None:
+        """Drops the cached results of :meth:`~telegram.Bot.get_chat`,
+        :meth:`~telegram.Bot.get_chat_administrators` and
+        :meth:`~telegram.Bot.get_chat_member_count` for the given chat. If :paramref:`user_id`
+        is passed, the result of :meth:`~telegram.Bot.get_chat_member` for this user is dropped
+        as well.
+
+        Args:
+            chat_id (:obj:`int` | :obj:`str`): The id of the chat.
+            user_id (:obj:`int`, optional): The id of the chat member.
+        """
+        chat = _normalize_id(chat_id)
+        keys: List[_KeyType] = [
+            (endpoint, chat, None, ())
+            for endpoint in ("getChat", "getChatAdministrators", "getChatMemberCount")
+        ]
+        if user_id is not None:
+            keys.append(("getChatMember", chat, _normalize_id(user_id), ()))
+        for key in keys:
+            self._results.pop(key, None)
+            # Results of requests that are still running may already be outdated
+            self._pending.pop(key, None)
+
+    def process_update(self, update: object) -> None:
+        """Drops the cached results that are changed by the given update.
+
+        Args:
+            update (:class:`telegram.Update` | :obj:`object`): The update.
+        """
+        if not isinstance(update, Update) or not (self._results or self._pending):
+            return
+
+        for member_update in (update.chat_member, update.my_chat_member):
+            if member_update:
+                self.drop_chat(member_update.chat.id, member_update.new_chat_member.user.id)
+
+        message = update.effective_message
+        if not message:
+            return
+        if message.new_chat_members:
+            for user in message.new_chat_members:
+                self.drop_chat(message.chat.id, user.id)
+        if message.left_chat_member:
+            self.drop_chat(message.chat.id, message.left_chat_member.id)
+        if (
+            message.new_chat_title
+            or message.new_chat_photo
+            or message.delete_chat_photo
+            or message.pinned_message
+        ):
+            self.drop_chat(message.chat.id)
+
+    async def process_request(
+        self,
+        endpoint: str,
+        data: JSONDict,
+        callback: Callable[[JSONDict], Awaitable[_ResultType]],
+    ) -> _ResultType:
+        """Makes a request through the cache. Called by :class:`telegram.ext.ExtBot` for every
+        request made to the Bot API.
+
+        Args:
+            endpoint (:obj:`str`): The Bot API endpoint the request is made to.
+            data (Dict[:obj:`str`, :obj:`object`]): The parameters of the request.
+            callback (Callable[[Dict[:obj:`str`, :obj:`object`]], Awaitable]): The coroutine
+                function that makes the request with the given parameters.
+
+        Returns:
+            The result of :paramref:`callback`.
+        """
+        ttl = self._ttls.get(endpoint)
+        if not ttl:
+            result = await callback(data)
+            if endpoint in _CHAT_MEMBER_ENDPOINTS or endpoint in _CHAT_ENDPOINTS:
+                self.drop_chat(data.get("chat_id", ""), data.get("user_id"))
+            return result
+
+        key = self._build_key(endpoint, data)
+        if (entry := self._results.get(key)) is not None:
+            expires, result = entry
+            if expires > time.monotonic():
+                self._results.move_to_end(key)
+                # The methods of Bot may modify the result, e.g. get_file
+                return deepcopy(result)
+            del self._results[key]
+
+        if (task := self._pending.get(key)) is None:
+            task = asyncio.create_task(self._fetch(key, ttl, data, callback))
+            self._pending[key] = task
+        # Shielding ensures that cancelling one of the callers does not cancel the request for
+        # the others. Each caller gets its own copy of the result, which is also cached.
+        return deepcopy(await asyncio.shield(task))
+
+    async def _fetch(
+        self,
+        key: _KeyType,
+        ttl: float,
+        data: JSONDict,
+        callback: Callable[[JSONDict], Awaitable[_ResultType]],
+    ) -> _ResultType:
+        try:
+            result = await callback(data)
+        finally:
+            outdated = self._pending.get(key) is not asyncio.current_task()
+            if not outdated:
+                del self._pending[key]
+
+        if outdated:
+            return result
+        self._results[key] = (time.monotonic() + ttl, result)
+        while len(self._results) > self._maxsize:
+            self._results.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _build_key(endpoint: str, data: JSONDict) -> _KeyType:
+        return (
+            endpoint,
+            _normalize_id(data.get("chat_id")),
+            _normalize_id(data.get("user_id")),
+            tuple(
+                sorted(
+                    (name, repr(value))
+                    for name, value in data.items()
+                    if name not in ("chat_id", "user_id")
+                )
+            ),
+        )
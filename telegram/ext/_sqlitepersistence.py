@@ -0,0 +1,587 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the SQLitePersistence class."""
+import asyncio
+import io
+import json
+import pickle
+import sqlite3
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar, cast, overload
+
+from telegram import Bot, TelegramObject
+from telegram._utils.types import FilePathInput
+from telegram._utils.warnings import warn
+from telegram.ext import BasePersistence, PersistenceInput
+from telegram.ext._contexttypes import ContextTypes
+from telegram.ext._utils.pickling import custom_reduction
+from telegram.ext._utils.types import BD, CD, UD, CDCData, ConversationDict, ConversationKey
+
+_RT = TypeVar("_RT")
+_Operation = Callable[[sqlite3.Connection], None]
+
+_REPLACED_KNOWN_BOT = "a known bot replaced by PTB's SQLitePersistence"
+_REPLACED_UNKNOWN_BOT = "an unknown bot replaced by PTB's SQLitePersistence"
+# Marks the row of the bot_data table that holds the whole bot_data, if it's not a dict
+_WHOLE_BOT_DATA = b""
+# Keys are pickled with a fixed protocol, so that equal keys always map to the same row
+_KEY_PROTOCOL = 4
+# Time in seconds during which writes are collected before they are committed in one transaction
+_BATCH_WINDOW = 0.01
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS user_data (id INTEGER PRIMARY KEY, data BLOB NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS chat_data (id INTEGER PRIMARY KEY, data BLOB NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS bot_data (key BLOB PRIMARY KEY, data BLOB NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS callback_keyboards (uuid TEXT PRIMARY KEY, data BLOB NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS callback_queries (id TEXT PRIMARY KEY, uuid TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS conversations ("
+    "name TEXT NOT NULL, key TEXT NOT NULL, state BLOB NOT NULL, PRIMARY KEY (name, key))",
+)
+
+
+class _BotPickler(pickle.Pickler):
+    __slots__ = ("_bot",)
+
+    def __init__(self, bot: Bot, *args: Any, **kwargs: Any):
+        self._bot = bot
+        super().__init__(*args, **kwargs)
+
+    def reducer_override(self, obj: object) -> Any:
+        # Preserves the bot of telegram objects, so that it's replaced by persistent_id
+        if not isinstance(obj, TelegramObject):
+            return NotImplemented
+        return custom_reduction(obj)
+
+    def persistent_id(self, obj: object) -> Optional[str]:
+        if obj is self._bot:
+            return _REPLACED_KNOWN_BOT
+        if isinstance(obj, Bot):
+            warn(
+                "Unknown bot instance found. Will be replaced by `None` during unpickling",
+                stacklevel=2,
+            )
+            return _REPLACED_UNKNOWN_BOT
+        return None
+
+
+class _BotUnpickler(pickle.Unpickler):
+    __slots__ = ("_bot",)
+
+    def __init__(self, bot: Bot, *args: Any, **kwargs: Any):
+        self._bot = bot
+        super().__init__(*args, **kwargs)
+
+    def persistent_load(self, pid: str) -> Optional[Bot]:
+        if pid == _REPLACED_KNOWN_BOT:
+            return self._bot
+        if pid == _REPLACED_UNKNOWN_BOT:
+            return None
+        raise pickle.UnpicklingError("Found unknown persistent id when unpickling!")
+
+
+class SQLitePersistence(BasePersistence[UD, CD, BD]):
+    """Using a SQLite database (via the standard library's :mod:`sqlite3`) for making your bot
+    persistent.
+
+    In contrast to :class:`~telegram.ext.PicklePersistence` and
+    :class:`~telegram.ext.DictPersistence`, which always serialize all data at once, every entry
+    of :attr:`~telegram.ext.Application.user_data` and :attr:`~telegram.ext.Application.chat_data`,
+    every key of :attr:`~telegram.ext.Application.bot_data`, every conversation state and every
+    keyboard stored in :class:`~telegram.ext.CallbackDataCache` is stored in a row of its own.
+    Hence, updating the persistence only writes the rows that changed. The values are stored
+    with :mod:`pickle`. :meth:`load_user_data` and :meth:`load_chat_data` are implemented, so
+    that :meth:`telegram.ext.ApplicationBuilder.user_chat_data_cache_size` can be used to load
+    only the data of active users and chats.
+
+    All database operations run in a dedicated worker thread, so they don't block the event loop.
+    The writes of one run of :meth:`telegram.ext.Application.update_persistence` are committed in
+    a single transaction. The database uses the
+    `write-ahead log <https://www.sqlite.org/wal.html>`_, such that a crash can not corrupt the
+    data.
+
+    Attention:
+        The interface provided by this class is intended to be accessed exclusively by
+        :class:`~telegram.ext.Application`. Calling any of the methods below manually might
+        interfere with the integration of persistence into :class:`~telegram.ext.Application`.
+
+    Note:
+        * This implementation of :class:`BasePersistence` uses the functionality of the pickle
+          module to support serialization of bot instances. Specifically any reference to
+          :attr:`~BasePersistence.bot` will be replaced by a placeholder before pickling and
+          :attr:`~BasePersistence.bot` will be inserted back when loading the data.
+        * If :attr:`~telegram.ext.Application.bot_data` is a :obj:`dict`, its keys must be
+          picklable and each key is stored in a row of its own. Otherwise, the whole object is
+          stored in a single row.
+        * Keys of conversations must be JSON serializable, which is the case for the keys built
+          by :class:`~telegram.ext.ConversationHandler`.
+
+    Examples:
+        :any:`Persistent Conversation Bot <examples.persistentconversationbot>`
+
+    .. seealso:: :wiki:`Making Your Bot Persistent <Making-your-bot-persistent>`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        filepath (:obj:`str` | :obj:`pathlib.Path`): The path of the database file. Will be
+            created if it doesn't exist.
+        store_data (:class:`~telegram.ext.PersistenceInput`, optional): Specifies which kinds of
+            data will be saved by this persistence instance. By default, all available kinds of
+            data will be saved.
+        update_interval (:obj:`int` | :obj:`float`, optional): The
+            :class:`~telegram.ext.Application` will update
+            the persistence in regular intervals. This parameter specifies the time (in seconds) to
+            wait between two consecutive runs of updating the persistence. Defaults to 60 seconds.
+        context_types (:class:`telegram.ext.ContextTypes`, optional): Pass an instance
+            of :class:`telegram.ext.ContextTypes` to customize the types used in the
+            ``context`` interface. If not passed, the defaults documented in
+            :class:`telegram.ext.ContextTypes` will be used.
+        executor (:class:`concurrent.futures.ThreadPoolExecutor`, optional): If passed, the
+            data loaded by :meth:`get_user_data`, :meth:`get_chat_data`, :meth:`load_user_data`,
+            :meth:`load_chat_data` and :meth:`get_bot_data` is unpickled in this executor, such
+            that loading large data does not block the event loop. The data written to the
+            database is always pickled in the worker thread of the database. See also
+            :meth:`~telegram.ext.BasePersistence.run_in_executor`.
+
+    Attributes:
+        filepath (:class:`pathlib.Path`): The path of the database file.
+        store_data (:class:`~telegram.ext.PersistenceInput`): Specifies which kinds of data will
+            be saved by this persistence instance.
+        context_types (:class:`telegram.ext.ContextTypes`): Container for the types used
+            in the ``context`` interface.
+    """
+
+    __slots__ = (
+        "_batch_task",
+        "_callback_keyboards",
+        "_callback_queries",
+        "_connection",
+        "_db_executor",
+        "_pending_operations",
+        "context_types",
+        "filepath",
+    )
+
+    @overload
+    def __init__(
+        self: "SQLitePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any, Any]]",
+        filepath: FilePathInput,
+        store_data: Optional[PersistenceInput] = None,
+        update_interval: float = 60,
+        executor: Optional[Executor] = None,
+    ): ...
+
+    @overload
+    def __init__(
+        self: "SQLitePersistence[UD, CD, BD]",
+        filepath: FilePathInput,
+        store_data: Optional[PersistenceInput] = None,
+        update_interval: float = 60,
+        context_types: Optional[ContextTypes[Any, UD, CD, BD]] = None,
+        executor: Optional[Executor] = None,
+    ): ...
+
+    def __init__(
+        self,
+        filepath: FilePathInput,
+        store_data: Optional[PersistenceInput] = None,
+        update_interval: float = 60,
+        context_types: Optional[ContextTypes[Any, UD, CD, BD]] = None,
+        executor: Optional[Executor] = None,
+    ):
+        super().__init__(
+            store_data=store_data, update_interval=update_interval, executor=executor
+        )
+        self.filepath: Path = Path(filepath)
+        self.context_types: ContextTypes[Any, UD, CD, BD] = cast(
+            ContextTypes[Any, UD, CD, BD], context_types or ContextTypes()
+        )
+        # sqlite3 connections may only be used in the thread that created them, so we use a
+        # single thread for all database operations. It's created on demand in _run_in_thread.
+        self._db_executor: Optional[ThreadPoolExecutor] = None
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pending_operations: List[_Operation] = []
+        self._batch_task: Optional[asyncio.Task] = None
+        # The callback data that was last written, used to write only the changed rows
+        self._callback_keyboards: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._callback_queries: Dict[str, str] = {}
+
+    def _dumps(self, obj: object) -> bytes:
+        with io.BytesIO() as file:
+            _BotPickler(self.bot, file, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+            return file.getvalue()
+
+    def _loads(self, data: bytes) -> Any:
+        with io.BytesIO(data) as file:
+            return _BotUnpickler(self.bot, file).load()
+
+    def _loads_rows(self, rows: List[Tuple[Any, bytes]]) -> Dict[Any, Any]:
+        return {key: self._loads(data) for key, data in rows}
+
+    @staticmethod
+    def _dump_key(key: object) -> bytes:
+        return pickle.dumps(key, protocol=_KEY_PROTOCOL)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # Must only be called from the worker thread
+        if self._connection is None:
+            # Transactions are handled explicitly in _commit
+            connection = sqlite3.connect(self.filepath, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                connection.execute(statement)
+            self._connection = connection
+        return self._connection
+
+    def _close_connection(self) -> None:
+        # Must only be called from the worker thread
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    async def _run_in_thread(self, func: Callable[[], _RT]) -> _RT:
+        if self._db_executor is None:
+            self._db_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="SQLitePersistence"
+            )
+        return await asyncio.get_running_loop().run_in_executor(self._db_executor, func)
+
+    async def _query(self, sql: str, parameters: Tuple[Any, ...] = ()) -> List[Tuple[Any, ...]]:
+        return await self._run_in_thread(
+            lambda: self._get_connection().execute(sql, parameters).fetchall()
+        )
+
+    def _commit(self, operations: List[_Operation]) -> None:
+        # Must only be called from the worker thread
+        connection = self._get_connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for operation in operations:
+                operation(connection)
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    async def _commit_batch(self) -> None:
+        # The application calls the `update_*` methods concurrently. All operations that are
+        # added within the batching window end up in the same transaction.
+        await asyncio.sleep(_BATCH_WINDOW)
+        operations, self._pending_operations = self._pending_operations, []
+        self._batch_task = None
+        await self._run_in_thread(lambda: self._commit(operations))
+
+    async def _write(self, operation: _Operation) -> None:
+        self._pending_operations.append(operation)
+        if self._batch_task is None:
+            self._batch_task = asyncio.create_task(self._commit_batch())
+        # Shielding, so that cancelling one caller doesn't abort the writes of the others
+        await asyncio.shield(self._batch_task)
+
+    async def get_user_data(self) -> Dict[int, UD]:
+        """Returns the user_data stored in the database.
+
+        Returns:
+            Dict[:obj:`int`, :obj:`dict`]: The restored user data.
+        """
+        rows = await self._query("SELECT id, data FROM user_data")
+        return await self.run_in_executor(self._loads_rows, rows)
+
+    async def get_chat_data(self) -> Dict[int, CD]:
+        """Returns the chat_data stored in the database.
+
+        Returns:
+            Dict[:obj:`int`, :obj:`dict`]: The restored chat data.
+        """
+        rows = await self._query("SELECT id, data FROM chat_data")
+        return await self.run_in_executor(self._loads_rows, rows)
+
+    async def load_user_data(self, user_id: int) -> Optional[UD]:
+        """Returns the user_data of the given user stored in the database.
+
+        Args:
+            user_id (:obj:`int`): The user to load the data for.
+
+        Returns:
+            :obj:`dict` | :obj:`None`: The restored user data or :obj:`None`, if no data is
+            stored for the user.
+        """
+        rows = await self._query("SELECT data FROM user_data WHERE id = ?", (user_id,))
+        return await self.run_in_executor(self._loads, rows[0][0]) if rows else None
+
+    async def load_chat_data(self, chat_id: int) -> Optional[CD]:
+        """Returns the chat_data of the given chat stored in the database.
+
+        Args:
+            chat_id (:obj:`int`): The chat to load the data for.
+
+        Returns:
+            :obj:`dict` | :obj:`None`: The restored chat data or :obj:`None`, if no data is
+            stored for the chat.
+        """
+        rows = await self._query("SELECT data FROM chat_data WHERE id = ?", (chat_id,))
+        return await self.run_in_executor(self._loads, rows[0][0]) if rows else None
+
+    async def get_bot_data(self) -> BD:
+        """Returns the bot_data stored in the database or a new instance of
+        :attr:`~telegram.ext.ContextTypes.bot_data`, if nothing was stored yet.
+
+        Returns:
+            :obj:`dict` | :attr:`telegram.ext.ContextTypes.bot_data`: The restored bot data.
+        """
+        rows = await self._query("SELECT key, data FROM bot_data")
+        if not rows:
+            return self.context_types.bot_data()
+        for key, data in rows:
+            if key == _WHOLE_BOT_DATA:
+                return await self.run_in_executor(self._loads, data)
+        rows = [(pickle.loads(key), data) for key, data in rows]
+        return cast(BD, await self.run_in_executor(self._loads_rows, rows))
+
+    async def get_callback_data(self) -> Optional[CDCData]:
+        """Returns the callback data stored in the database.
+
+        Returns:
+            Tuple[List[Tuple[:obj:`str`, :obj:`float`, Dict[:obj:`str`, :class:`object`]]], \
+                Dict[:obj:`str`, :obj:`str`]] | :obj:`None`: The restored metadata or
+            :obj:`None`, if no data was stored.
+        """
+        keyboard_rows = await self._query("SELECT uuid, data FROM callback_keyboards")
+        query_rows = await self._query("SELECT id, uuid FROM callback_queries")
+        self._callback_keyboards = {uuid: self._loads(data) for uuid, data in keyboard_rows}
+        self._callback_queries = dict(query_rows)
+        if not (self._callback_keyboards or self._callback_queries):
+            return None
+        return (
+            [
+                (uuid, access_time, button_data)
+                for uuid, (access_time, button_data) in self._callback_keyboards.items()
+            ],
+            dict(self._callback_queries),
+        )
+
+    async def get_conversations(self, name: str) -> ConversationDict:
+        """Returns the conversations with the given name stored in the database.
+
+        Args:
+            name (:obj:`str`): The handlers name.
+
+        Returns:
+            :obj:`dict`: The restored conversations for the handler.
+        """
+        rows = await self._query("SELECT key, state FROM conversations WHERE name = ?", (name,))
+        return {tuple(json.loads(key)): self._loads(state) for key, state in rows}
+
+    async def update_conversation(
+        self, name: str, key: ConversationKey, new_state: Optional[object]
+    ) -> None:
+        """Will update the conversations for the given handler.
+
+        Args:
+            name (:obj:`str`): The handler's name.
+            key (:obj:`tuple`): The key the state is changed for.
+            new_state (:class:`object`): The new state for the given key.
+        """
+        json_key = json.dumps(key)
+        if new_state is None:
+            await self._write(
+                lambda connection: connection.execute(
+                    "DELETE FROM conversations WHERE name = ? AND key = ?", (name, json_key)
+                )
+            )
+            return
+
+        await self._write(
+            lambda connection: connection.execute(
+                "INSERT OR REPLACE INTO conversations (name, key, state) VALUES (?, ?, ?)",
+                (name, json_key, self._dumps(new_state)),
+            )
+        )
+
+    async def update_user_data(self, user_id: int, data: UD) -> None:
+        """Will update the user_data for the given user.
+
+        Args:
+            user_id (:obj:`int`): The user the data might have been changed for.
+            data (:obj:`dict`): The :attr:`telegram.ext.Application.user_data` ``[user_id]``.
+        """
+        await self._write(
+            lambda connection: connection.execute(
+                "INSERT OR REPLACE INTO user_data (id, data) VALUES (?, ?)",
+                (user_id, self._dumps(data)),
+            )
+        )
+
+    async def update_chat_data(self, chat_id: int, data: CD) -> None:
+        """Will update the chat_data for the given chat.
+
+        Args:
+            chat_id (:obj:`int`): The chat the data might have been changed for.
+            data (:obj:`dict`): The :attr:`telegram.ext.Application.chat_data` ``[chat_id]``.
+        """
+        await self._write(
+            lambda connection: connection.execute(
+                "INSERT OR REPLACE INTO chat_data (id, data) VALUES (?, ?)",
+                (chat_id, self._dumps(data)),
+            )
+        )
+
+    async def update_bot_data(self, data: BD) -> None:
+        """Will replace the bot_data stored in the database.
+
+        Args:
+            data (:obj:`dict` | :attr:`telegram.ext.ContextTypes.bot_data`): The
+                :attr:`telegram.ext.Application.bot_data`.
+        """
+
+        def operation(connection: sqlite3.Connection) -> None:
+            connection.execute("DELETE FROM bot_data")
+            if isinstance(data, dict):
+                rows = [(self._dump_key(key), self._dumps(value)) for key, value in data.items()]
+            else:
+                rows = [(_WHOLE_BOT_DATA, self._dumps(data))]
+            connection.executemany("INSERT INTO bot_data (key, data) VALUES (?, ?)", rows)
+
+        await self._write(operation)
+
+    async def update_bot_data_delta(self, changed: Dict[Any, Any], deleted: Set[Any]) -> None:
+        """Will update the rows of the changed keys of the bot_data and delete the rows of the
+        deleted keys.
+
+        Args:
+            changed (:obj:`dict`): The entries of :attr:`telegram.ext.Application.bot_data` that
+                may have changed.
+            deleted (Set[:obj:`object`]): The keys that were removed from
+                :attr:`telegram.ext.Application.bot_data`.
+        """
+
+        def operation(connection: sqlite3.Connection) -> None:
+            connection.executemany(
+                "INSERT OR REPLACE INTO bot_data (key, data) VALUES (?, ?)",
+                [(self._dump_key(key), self._dumps(value)) for key, value in changed.items()],
+            )
+            connection.executemany(
+                "DELETE FROM bot_data WHERE key = ?", [(self._dump_key(key),) for key in deleted]
+            )
+
+        await self._write(operation)
+
+    async def update_callback_data(self, data: CDCData) -> None:
+        """Will update the rows of the keyboards and callback queries that changed since the
+        last call.
+
+        Args:
+            data (Tuple[List[Tuple[:obj:`str`, :obj:`float`, \
+                Dict[:obj:`str`, :class:`object`]]], Dict[:obj:`str`, :obj:`str`]]):
+                The relevant data to restore :class:`telegram.ext.CallbackDataCache`.
+        """
+        keyboards = {
+            uuid: (access_time, button_data) for uuid, access_time, button_data in data[0]
+        }
+        queries = data[1]
+        changed_keyboards = {
+            uuid: value
+            for uuid, value in keyboards.items()
+            if self._callback_keyboards.get(uuid) != value
+        }
+        deleted_keyboards = self._callback_keyboards.keys() - keyboards.keys()
+        changed_queries = {
+            query_id: uuid
+            for query_id, uuid in queries.items()
+            if self._callback_queries.get(query_id) != uuid
+        }
+        deleted_queries = self._callback_queries.keys() - queries.keys()
+        self._callback_keyboards = keyboards
+        self._callback_queries = dict(queries)
+        if not (changed_keyboards or deleted_keyboards or changed_queries or deleted_queries):
+            return
+
+        def operation(connection: sqlite3.Connection) -> None:
+            connection.executemany(
+                "INSERT OR REPLACE INTO callback_keyboards (uuid, data) VALUES (?, ?)",
+                [(uuid, self._dumps(value)) for uuid, value in changed_keyboards.items()],
+            )
+            connection.executemany(
+                "DELETE FROM callback_keyboards WHERE uuid = ?",
+                [(uuid,) for uuid in deleted_keyboards],
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO callback_queries (id, uuid) VALUES (?, ?)",
+                list(changed_queries.items()),
+            )
+            connection.executemany(
+                "DELETE FROM callback_queries WHERE id = ?",
+                [(query_id,) for query_id in deleted_queries],
+            )
+
+        await self._write(operation)
+
+    async def drop_chat_data(self, chat_id: int) -> None:
+        """Will delete the specified key from the ``chat_data``.
+
+        Args:
+            chat_id (:obj:`int`): The chat id to delete from the persistence.
+        """
+        await self._write(
+            lambda connection: connection.execute("DELETE FROM chat_data WHERE id = ?", (chat_id,))
+        )
+
+    async def drop_user_data(self, user_id: int) -> None:
+        """Will delete the specified key from the ``user_data``.
+
+        Args:
+            user_id (:obj:`int`): The user id to delete from the persistence.
+        """
+        await self._write(
+            lambda connection: connection.execute("DELETE FROM user_data WHERE id = ?", (user_id,))
+        )
+
+    async def refresh_user_data(self, user_id: int, user_data: UD) -> None:
+        """Does nothing.
+
+        .. seealso:: :meth:`telegram.ext.BasePersistence.refresh_user_data`
+        """
+
+    async def refresh_chat_data(self, chat_id: int, chat_data: CD) -> None:
+        """Does nothing.
+
+        .. seealso:: :meth:`telegram.ext.BasePersistence.refresh_chat_data`
+        """
+
+    async def refresh_bot_data(self, bot_data: BD) -> None:
+        """Does nothing.
+
+        .. seealso:: :meth:`telegram.ext.BasePersistence.refresh_bot_data`
+        """
+
+    async def flush(self) -> None:
+        """Waits for pending writes to be committed, closes the database connection and shuts
+        down the worker thread. Both will be recreated if the persistence is used again.
+        """
+        if self._batch_task is not None:
+            await asyncio.shield(self._batch_task)
+        if self._db_executor is None:
+            return
+        await self._run_in_thread(self._close_connection)
+        executor, self._db_executor = self._db_executor, None
+        # The connection is closed, so the worker thread is idle and this doesn't block
+        executor.shutdown(wait=True)
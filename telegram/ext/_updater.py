@@ -38,8 +38,11 @@ from typing import (
 from telegram._utils.defaultvalue import DEFAULT_80, DEFAULT_IP, DEFAULT_NONE, DefaultValue
 from telegram._utils.logging import get_logger
 from telegram._utils.repr import build_repr_with_selected_attrs
-from telegram._utils.types import DVType, ODVInput
+from telegram._utils.types import DVType, ODVInput, WebhookServerBackend
 from telegram.error import InvalidToken, RetryAfter, TelegramError, TimedOut
+from telegram.ext._boundedupdatequeue import BoundedUpdateQueue
+from telegram.ext._utils.asynciowebhookserver import AsyncioWebhookServer
+from telegram.ext._utils.webhookprocessor import WebhookRequestProcessor
 
 try:
     from telegram.ext._utils.webhookhandler import WebhookAppClass, WebhookServer
@@ -124,7 +127,7 @@ class Updater(AsyncContextManager["Updater"]):
         self._last_update_id = 0
         self._running = False
         self._initialized = False
-        self._httpd: Optional[WebhookServer] = None
+        self._httpd: Optional[Union[WebhookServer, AsyncioWebhookServer]] = None
         self.__lock = asyncio.Lock()
         self.__polling_task: Optional[asyncio.Task] = None
         self.__polling_task_stop_event: asyncio.Event = asyncio.Event()
@@ -221,11 +224,16 @@ class Updater(AsyncContextManager["Updater"]):
         allowed_updates: Optional[List[str]] = None,
         drop_pending_updates: Optional[bool] = None,
         error_callback: Optional[Callable[[TelegramError], None]] = None,
+        confirm_after_processing: bool = False,
     ) -> "asyncio.Queue[object]":
         """Starts polling updates from Telegram.
 
         .. versionchanged:: 20.0
             Removed the ``clean`` argument in favor of :paramref:`drop_pending_updates`.
+        .. versionchanged:: NEXT.VERSION
+            Polling pauses while :attr:`update_queue` is a
+            :class:`~telegram.ext.BoundedUpdateQueue` that is
+            :attr:`~telegram.ext.BoundedUpdateQueue.congested`.
 
         Args:
             poll_interval (:obj:`float`, optional): Time to wait between polling updates from
@@ -290,6 +298,24 @@ class Updater(AsyncContextManager["Updater"]):
                     The :paramref:`error_callback` must *not* be a :term:`coroutine function`! If
                     asynchronous behavior of the callback is wanted, please schedule a task from
                     within the callback.
+            confirm_after_processing (:obj:`bool`, optional): Whether fetched updates should be
+                confirmed to Telegram only after they were processed. By default, updates are
+                fetched continuously and each batch is confirmed by the next call of
+                :meth:`~telegram.Bot.get_updates` while the previous batch is still being
+                processed. If the program crashes, the updates that were fetched but not yet
+                processed are lost. If this is set to :obj:`True`, the next batch is fetched only
+                after :meth:`asyncio.Queue.task_done` was called for every item in
+                :attr:`update_queue`, which :class:`telegram.ext.Application` does once it
+                processed an update. Updates that were not processed are then fetched again on
+                the next start, i.e. every update is processed at least once. Note that this
+                reduces the throughput, because fetching and processing updates no longer
+                overlap. Defaults to :obj:`False`.
+
+                Note:
+                    Handler callbacks with :paramref:`~telegram.ext.BaseHandler.block` set to
+                    :obj:`False` may still be running when the update is considered processed.
+
+                .. versionadded:: NEXT.VERSION
 
         Returns:
             :class:`asyncio.Queue`: The update queue that can be filled from the main thread.
@@ -332,6 +358,7 @@ class Updater(AsyncContextManager["Updater"]):
                     allowed_updates=allowed_updates,
                     ready=polling_ready,
                     error_callback=error_callback,
+                    confirm_after_processing=confirm_after_processing,
                 )
 
                 _LOGGER.debug("Waiting for polling to start")
@@ -356,6 +383,7 @@ class Updater(AsyncContextManager["Updater"]):
         allowed_updates: Optional[List[str]],
         ready: asyncio.Event,
         error_callback: Optional[Callable[[TelegramError], None]],
+        confirm_after_processing: bool = False,
     ) -> None:
         _LOGGER.debug("Updater started (polling)")
 
@@ -372,6 +400,11 @@ class Updater(AsyncContextManager["Updater"]):
         _LOGGER.debug("Bootstrap done")
 
         async def polling_action_cb() -> bool:
+            if isinstance(self.update_queue, BoundedUpdateQueue) and self.update_queue.congested:
+                # Updates that we don't fetch remain on the Telegram servers
+                _LOGGER.debug("Update queue is congested, pausing polling")
+                await self.update_queue.wait_for_capacity()
+
             try:
                 updates = await self.bot.get_updates(
                     offset=self._last_update_id,
@@ -403,6 +436,10 @@ class Updater(AsyncContextManager["Updater"]):
                 else:
                     for update in updates:
                         await self.update_queue.put(update)
+                    if confirm_after_processing:
+                        # The next call of get_updates confirms all updates with lower ids, so
+                        # we may only make it once the updates are processed
+                        await self.update_queue.join()
                     self._last_update_id = updates[-1].update_id + 1  # Add one to 'confirm' it
 
             return True  # Keep fetching updates & don't quit. Polls with poll_interval.
@@ -473,6 +510,7 @@ class Updater(AsyncContextManager["Updater"]):
         max_connections: int = 40,
         secret_token: Optional[str] = None,
         unix: Optional[Union[str, Path]] = None,
+        server: WebhookServerBackend = "tornado",
     ) -> "asyncio.Queue[object]":
         """
         Starts a small http server to listen for updates via webhook. If :paramref:`cert`
@@ -482,8 +520,8 @@ class Updater(AsyncContextManager["Updater"]):
         ``https://listen:port/url_path``. Also calls :meth:`telegram.Bot.set_webhook` as required.
 
         Important:
-            If you want to use this method, you must install PTB with the optional requirement
-            ``webhooks``, i.e.
+            If you want to use this method with the default :paramref:`server`, you must install
+            PTB with the optional requirement ``webhooks``, i.e.
 
             .. code-block:: bash
 
@@ -498,6 +536,10 @@ class Updater(AsyncContextManager["Updater"]):
 
             * Removed the ``clean`` argument in favor of :paramref:`drop_pending_updates` and
               removed the deprecated argument ``force_event_loop``.
+        .. versionchanged:: NEXT.VERSION
+            The webhook server answers with ``503 Service Unavailable`` while
+            :attr:`update_queue` is a :class:`~telegram.ext.BoundedUpdateQueue` that is
+            :attr:`~telegram.ext.BoundedUpdateQueue.congested`.
 
         Args:
             listen (:obj:`str`, optional): IP-Address to listen on. Defaults to
@@ -551,13 +593,24 @@ class Updater(AsyncContextManager["Updater"]):
                     appropriate :paramref:`webhook_url`.
 
                 .. versionadded:: 20.8
+            server (:obj:`str`, optional): The implementation of the web server. Either
+                ``"tornado"`` (default) for a server based on the
+                `tornado <https://www.tornadoweb.org/>`_ library or ``"asyncio"`` for a minimal
+                HTTP/1.1 server based on :func:`asyncio.start_server`. The latter does not require
+                the optional requirement ``webhooks`` and has less overhead per request, but does
+                not support chunked request bodies.
+
+                .. versionadded:: NEXT.VERSION
         Returns:
             :class:`queue.Queue`: The update queue that can be filled from the main thread.
 
         Raises:
             :exc:`RuntimeError`: If the updater is already running or was not initialized.
+            :exc:`ValueError`: If :paramref:`server` is not one of the supported values.
         """
-        if not WEBHOOKS_AVAILABLE:
+        if server not in ("tornado", "asyncio"):
+            raise ValueError("`server` must be either 'tornado' or 'asyncio'!")
+        if server == "tornado" and not WEBHOOKS_AVAILABLE:
             raise RuntimeError(
                 "To use `start_webhook`, PTB must be installed via `pip install "
                 '"python-telegram-bot[webhooks]"`.'
@@ -605,6 +658,7 @@ class Updater(AsyncContextManager["Updater"]):
                     max_connections=max_connections,
                     secret_token=secret_token,
                     unix=unix,
+                    server=server,
                 )
 
                 _LOGGER.debug("Waiting for webhook server to start")
@@ -633,15 +687,13 @@ class Updater(AsyncContextManager["Updater"]):
         max_connections: int = 40,
         secret_token: Optional[str] = None,
         unix: Optional[Union[str, Path]] = None,
+        server: WebhookServerBackend = "tornado",
     ) -> None:
         _LOGGER.debug("Updater thread started (webhook)")
 
         if not url_path.startswith("/"):
             url_path = f"/{url_path}"
 
-        # Create Tornado app instance
-        app = WebhookAppClass(url_path, self.bot, self.update_queue, secret_token)
-
         # Form SSL Context
         # An SSLError is raised if the private key does not match with the certificate
         # Note that we only use the SSL certificate for the WebhookServer, if the key is also
@@ -658,7 +710,15 @@ class Updater(AsyncContextManager["Updater"]):
         else:
             ssl_ctx = None
         # Create and start server
-        self._httpd = WebhookServer(listen, port, app, ssl_ctx, unix)
+        if server == "asyncio":
+            processor = WebhookRequestProcessor(
+                url_path, self.bot, self.update_queue, secret_token
+            )
+            self._httpd = AsyncioWebhookServer(listen, port, processor, ssl_ctx, unix)
+        else:
+            # Create Tornado app instance
+            app = WebhookAppClass(url_path, self.bot, self.update_queue, secret_token)
+            self._httpd = WebhookServer(listen, port, app, ssl_ctx, unix)
 
         if not webhook_url:
             webhook_url = self._gen_webhook_url(
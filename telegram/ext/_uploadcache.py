@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the UploadCache class."""
+import asyncio
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from telegram._files.inputfile import InputFile
+from telegram._utils.logging import get_logger
+from telegram._utils.types import JSONDict
+from telegram.error import BadRequest
+
+_LOGGER = get_logger(__name__, class_name="UploadCache")
+
+# Maps the endpoints that upload a single file to the parameter carrying the file. The same key is
+# used for the sent file in the returned message.
+_FILE_PARAMETERS: Dict[str, str] = {
+    "sendAnimation": "animation",
+    "sendAudio": "audio",
+    "sendDocument": "document",
+    "sendPhoto": "photo",
+    "sendSticker": "sticker",
+    "sendVideo": "video",
+    "sendVideoNote": "video_note",
+    "sendVoice": "voice",
+}
+
+# Hashing releases the GIL, so larger contents are hashed in a thread to not block the event loop
+_THREAD_HASH_SIZE = 1024 * 1024
+
+
+def _hash_content(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+class UploadCache:
+    """A size-bounded cache that remembers the :attr:`~telegram.File.file_id` of files uploaded
+    by :class:`telegram.ext.ExtBot` such that sending the same file again does not upload it
+    again.
+
+    When a file is uploaded via one of :meth:`~telegram.Bot.send_animation`,
+    :meth:`~telegram.Bot.send_audio`, :meth:`~telegram.Bot.send_document`,
+    :meth:`~telegram.Bot.send_photo`, :meth:`~telegram.Bot.send_sticker`,
+    :meth:`~telegram.Bot.send_video`, :meth:`~telegram.Bot.send_video_note` or
+    :meth:`~telegram.Bot.send_voice`, the file id returned by Telegram is stored. Subsequent
+    calls of the same method with the same file send the stored file id instead. Files are
+    identified by
+
+    * the SHA-256 hash of their content, if the content was read into memory,
+    * the absolute path, size and modification time of the file, if the file is read only
+      while uploading, e.g. when passing a :class:`pathlib.Path`,
+
+    together with the method and the file name. Thumbnails and media groups are not cached.
+    If the same file is sent several times concurrently, only the first request uploads the file
+    and the others wait for the resulting file id. If Telegram rejects a cached file id, the
+    entry is dropped and the file is uploaded again.
+
+    Examples:
+        .. code:: python
+
+            application = ApplicationBuilder().token("TOKEN").upload_cache(UploadCache()).build()
+
+    .. seealso:: :meth:`telegram.ext.ApplicationBuilder.upload_cache`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        maxsize (:obj:`int`, optional): Maximum number of file ids to keep in memory. If the
+            limit is reached, the least recently used entry is dropped. Defaults to ``1024``.
+        persistent_data (Dict[:obj:`str`, :obj:`str`], optional): Data to initialize the cache
+            with, as returned by :attr:`persistence_data`.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`maxsize` is not a positive integer.
+    """
+
+    __slots__ = ("_file_ids", "_maxsize", "_pending")
+
+    def __init__(self, maxsize: int = 1024, persistent_data: Optional[Dict[str, str]] = None):
+        if maxsize < 1:
+            raise ValueError("`maxsize` must be a positive integer!")
+
+        self._maxsize: int = maxsize
+        self._file_ids: "OrderedDict[str, str]" = OrderedDict()
+        self._pending: Dict[str, asyncio.Future] = {}
+
+        if persistent_data:
+            self.load_persistence_data(persistent_data)
+
+    def load_persistence_data(self, persistent_data: Dict[str, str]) -> None:
+        """Loads data into the cache. Existing entries with the same keys are overridden.
+
+        Args:
+            persistent_data (Dict[:obj:`str`, :obj:`str`]): The data to load, as returned by
+                :attr:`persistence_data`.
+        """
+        for key, file_id in persistent_data.items():
+            self._store(key, file_id)
+
+    @property
+    def maxsize(self) -> int:
+        """:obj:`int`: The maximum number of file ids stored in memory."""
+        return self._maxsize
+
+    @property
+    def persistence_data(self) -> Dict[str, str]:
+        """Dict[:obj:`str`, :obj:`str`]: The data that needs to be persistent to allow caching
+        file ids across restarts. The data can be serialized as JSON and is ordered from the least
+        recently to the most recently used entry.
+        """
+        return dict(self._file_ids)
+
+    def clear(self) -> None:
+        """Drops all stored file ids."""
+        self._file_ids.clear()
+
+    async def process_request(
+        self,
+        endpoint: str,
+        data: JSONDict,
+        callback: Callable[[JSONDict], Awaitable[Union[bool, JSONDict, List[JSONDict]]]],
+    ) -> Union[bool, JSONDict, List[JSONDict]]:
+        """Makes a request through the cache. Called by :class:`telegram.ext.ExtBot` for every
+        request made to the Bot API.
+
+        Args:
+            endpoint (:obj:`str`): The Bot API endpoint the request is made to.
+            data (Dict[:obj:`str`, :obj:`object`]): The parameters of the request.
+            callback (Callable[[Dict[:obj:`str`, :obj:`object`]], Awaitable]): The coroutine
+                function that makes the request with the given parameters.
+
+        Returns:
+            The result of :paramref:`callback`.
+        """
+        parameter = _FILE_PARAMETERS.get(endpoint)
+        input_file = data.get(parameter) if parameter else None
+        if parameter is None or not isinstance(input_file, InputFile) or input_file.attach_name:
+            return await callback(data)
+
+        key = await self._build_key(endpoint, input_file)
+        if key is None:
+            return await callback(data)
+
+        while (pending := self._pending.get(key)) is not None:
+            # Another request is uploading the same file. We don't wait for the future directly
+            # such that cancelling this request does not cancel the future
+            await asyncio.wait((pending,))
+
+        if (file_id := self._get(key)) is not None:
+            # The file is not uploaded, so the request doesn't close a file opened for it. It's
+            # opened again in case the file id is rejected.
+            input_file.close()
+            try:
+                return await callback({**data, parameter: file_id})
+            except BadRequest as exc:
+                if "file identifier" not in exc.message.lower():
+                    raise
+                _LOGGER.debug("Telegram rejected the cached file id for %s, uploading again", key)
+                self._file_ids.pop(key, None)
+
+        self._pending[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await callback(data)
+        finally:
+            self._pending.pop(key).set_result(None)
+
+        if (file_id := self._extract_file_id(result, parameter)) is not None:
+            self._store(key, file_id)
+        return result
+
+    @staticmethod
+    async def _build_key(endpoint: str, input_file: InputFile) -> Optional[str]:
+        # Files that are read only while uploading are identified by their path instead
+        content = input_file.streaming_field_tuple[1]
+        if isinstance(content, bytes):
+            if len(content) < _THREAD_HASH_SIZE:
+                digest = _hash_content(content)
+            else:
+                loop = asyncio.get_running_loop()
+                digest = await loop.run_in_executor(None, _hash_content, content)
+        else:
+            name = getattr(content, "name", None)
+            if not isinstance(name, str):
+                return None
+            try:
+                stat = os.stat(name)
+            except OSError:
+                return None
+            digest = f"{os.path.abspath(name)}:{stat.st_size}:{stat.st_mtime_ns}"
+        return f"{endpoint}:{input_file.filename}:{digest}"
+
+    @staticmethod
+    def _extract_file_id(result: object, parameter: str) -> Optional[str]:
+        if not isinstance(result, dict):
+            return None
+        sent_file: Any = result.get(parameter)
+        # Photos are returned in different sizes, the last one being the original
+        if isinstance(sent_file, list):
+            sent_file = sent_file[-1] if sent_file else None
+        if not isinstance(sent_file, dict):
+            return None
+        return sent_file.get("file_id")
+
+    def _get(self, key: str) -> Optional[str]:
+        file_id = self._file_ids.get(key)
+        if file_id is not None:
+            self._file_ids.move_to_end(key)
+        return file_id
+
+    def _store(self, key: str, file_id: str) -> None:
+        self._file_ids[key] = file_id
+        self._file_ids.move_to_end(key)
+        while len(self._file_ids) > self._maxsize:
+            self._file_ids.popitem(last=False)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains an ASGI application that receives updates via webhook.
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+from http import HTTPStatus
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from telegram._utils.logging import get_logger
+from telegram.ext._utils.webhookprocessor import (
+    MAX_BODY_SIZE,
+    WebhookRequestError,
+    WebhookRequestProcessor,
+)
+
+_LOGGER = get_logger(__name__, class_name="Application")
+
+_Message = Dict[str, Any]
+_RESPONSE_HEADERS = [(b"content-type", b'application/json; charset="utf-8"')]
+
+
+class WebhookASGIApp:
+    """ASGI application that passes requests to a :class:`WebhookRequestProcessor`. Lifespan
+    events are handled by calling :paramref:`startup` and :paramref:`shutdown`, if passed.
+    """
+
+    __slots__ = ("_processor", "_shutdown", "_startup")
+
+    def __init__(
+        self,
+        processor: WebhookRequestProcessor,
+        startup: Optional[Callable[[], Awaitable[None]]] = None,
+        shutdown: Optional[Callable[[], Awaitable[None]]] = None,
+    ):
+        self._processor = processor
+        self._startup = startup
+        self._shutdown = shutdown
+
+    async def __call__(
+        self,
+        scope: _Message,
+        receive: Callable[[], Awaitable[_Message]],
+        send: Callable[[_Message], Awaitable[None]],
+    ) -> None:
+        if scope["type"] == "lifespan":
+            await self._handle_lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            raise ValueError(f"Unsupported ASGI scope type: {scope['type']}")
+
+        chunks: List[bytes] = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_BODY_SIZE:
+                await self._respond(send, HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+                return
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+
+        # Depending on the server, the path may or may not include the path the app is mounted at
+        path: str = scope["path"]
+        root_path: str = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path) :]
+        headers = {
+            name.decode("latin-1").lower(): value.decode("latin-1")
+            for name, value in scope["headers"]
+        }
+
+        status = HTTPStatus.OK
+        try:
+            await self._processor.process(scope["method"], path, headers, b"".join(chunks))
+        except WebhookRequestError as exc:
+            status = exc.status
+        except Exception as exc:
+            _LOGGER.debug("Exception in webhook ASGI application", exc_info=exc)
+            status = HTTPStatus.INTERNAL_SERVER_ERROR
+        await self._respond(send, status)
+
+    @staticmethod
+    async def _respond(send: Callable[[_Message], Awaitable[None]], status: HTTPStatus) -> None:
+        await send(
+            {"type": "http.response.start", "status": status.value, "headers": _RESPONSE_HEADERS}
+        )
+        await send({"type": "http.response.body", "body": b""})
+
+    async def _handle_lifespan(
+        self,
+        receive: Callable[[], Awaitable[_Message]],
+        send: Callable[[_Message], Awaitable[None]],
+    ) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                callback, event = self._startup, "lifespan.startup"
+            elif message["type"] == "lifespan.shutdown":
+                callback, event = self._shutdown, "lifespan.shutdown"
+            else:  # pragma: no cover
+                continue
+
+            try:
+                if callback:
+                    await callback()
+            except Exception as exc:
+                _LOGGER.exception("Error while handling %s", event)
+                await send({"type": f"{event}.failed", "message": repr(exc)})
+                return
+            await send({"type": f"{event}.complete"})
+            if event == "lifespan.shutdown":
+                return
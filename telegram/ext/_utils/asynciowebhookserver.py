@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+# pylint: disable=missing-module-docstring
+import asyncio
+from http import HTTPStatus
+from pathlib import Path
+from ssl import SSLContext
+from typing import Dict, Optional, Set, Tuple, Union
+
+from telegram._utils.logging import get_logger
+from telegram.ext._utils.webhookprocessor import (
+    MAX_BODY_SIZE,
+    WebhookRequestError,
+    WebhookRequestProcessor,
+    WebhookRequestRouter,
+)
+
+# This module is not visible to users, so we log as Updater
+_LOGGER = get_logger(__name__, class_name="Updater")
+
+_MAX_HEADERS = 100
+# Same as the default of tornado's HTTPServer
+_IDLE_CONNECTION_TIMEOUT = 3600
+# Time in seconds that clients have for sending the headers and the body of a request once the
+# request line was received. Protects against clients that keep connections open by sending
+# requests very slowly.
+_REQUEST_TIMEOUT = 10
+# Connections beyond this limit are rejected. Telegram opens at most 100 connections per bot.
+_MAX_CONNECTIONS = 1000
+
+
+class AsyncioWebhookServer:
+    """Minimal HTTP/1.1 server built on :func:`asyncio.start_server` that passes requests to a
+    :class:`WebhookRequestProcessor` or, for several bots, a :class:`WebhookRequestRouter`.
+    Unlike :class:`WebhookServer`, it does not require tornado. Supports keep-alive connections
+    and TLS, but no chunked request bodies, which Telegram does not send. Requests that are not
+    received within ``_REQUEST_TIMEOUT`` seconds and connections beyond
+    ``_MAX_CONNECTIONS`` are rejected.
+    """
+
+    __slots__ = (
+        "_connections",
+        "_idle_connections",
+        "_processor",
+        "_server",
+        "_server_lock",
+        "_shutdown_lock",
+        "_ssl_ctx",
+        "is_running",
+        "listen",
+        "port",
+        "unix",
+    )
+
+    def __init__(
+        self,
+        listen: str,
+        port: int,
+        processor: Union[WebhookRequestProcessor, WebhookRequestRouter],
+        ssl_ctx: Optional[SSLContext],
+        unix: Optional[Union[str, Path]] = None,
+    ):
+        if unix and not hasattr(asyncio, "start_unix_server"):
+            raise RuntimeError("This OS does not support binding unix sockets.")
+        self.listen = listen
+        self.port = port
+        self.unix = unix
+        self.is_running = False
+        self._processor = processor
+        self._ssl_ctx = ssl_ctx
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Set[asyncio.Task] = set()
+        self._idle_connections: Set[asyncio.StreamWriter] = set()
+        self._server_lock = asyncio.Lock()
+        self._shutdown_lock = asyncio.Lock()
+
+    async def serve_forever(self, ready: Optional[asyncio.Event] = None) -> None:
+        async with self._server_lock:
+            if self.unix:
+                self._server = await asyncio.start_unix_server(
+                    self._handle_connection, path=str(self.unix), ssl=self._ssl_ctx
+                )
+            else:
+                self._server = await asyncio.start_server(
+                    self._handle_connection, self.listen, self.port, ssl=self._ssl_ctx
+                )
+
+            self.is_running = True
+            if ready is not None:
+                ready.set()
+
+            _LOGGER.debug("Webhook Server started.")
+
+    async def shutdown(self) -> None:
+        async with self._shutdown_lock:
+            if not self.is_running or self._server is None:
+                _LOGGER.debug("Webhook Server is already shut down. Returning")
+                return
+            self.is_running = False
+            self._server.close()
+            # Connections that are handling a request are closed once the request is answered
+            for writer in self._idle_connections:
+                writer.close()
+            if self._connections:
+                await asyncio.wait(set(self._connections))
+            await self._server.wait_closed()
+            self._server = None
+            _LOGGER.debug("Webhook Server stopped")
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        task = asyncio.current_task()
+        if task is None:  # pragma: no cover
+            return
+        if len(self._connections) >= _MAX_CONNECTIONS:
+            _LOGGER.debug("Rejecting webhook connection: Too many open connections")
+            try:
+                await self._respond(writer, HTTPStatus.SERVICE_UNAVAILABLE, None, keep_alive=False)
+            except OSError:
+                pass
+            finally:
+                writer.close()
+            return
+        self._connections.add(task)
+        try:
+            keep_alive = True
+            while keep_alive and self.is_running:
+                self._idle_connections.add(writer)
+                try:
+                    request_line = await asyncio.wait_for(
+                        reader.readline(), timeout=_IDLE_CONNECTION_TIMEOUT
+                    )
+                finally:
+                    self._idle_connections.discard(writer)
+                if not request_line:
+                    break
+
+                keep_alive = await self._handle_request(request_line, reader, writer)
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError, OSError, ValueError) as exc:
+            # The connection was closed or timed out, or the client sent too long lines
+            _LOGGER.debug("Closing webhook connection: %r", exc)
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+    async def _handle_request(
+        self, request_line: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        """Answers a single request and returns whether the connection may be kept alive."""
+        parts = request_line.decode("latin-1").split()
+        if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+            await self._respond(writer, HTTPStatus.BAD_REQUEST, None, keep_alive=False)
+            return False
+        method, target, version = parts
+
+        try:
+            headers, body = await asyncio.wait_for(
+                self._read_request(reader), timeout=_REQUEST_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            await self._respond(writer, HTTPStatus.REQUEST_TIMEOUT, None, keep_alive=False)
+            return False
+        except WebhookRequestError as exc:
+            # The rest of the request was not read, so the connection can not be reused
+            await self._respond(writer, exc.status, exc.reason, keep_alive=False)
+            return False
+
+        keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+        status, reason = HTTPStatus.OK, None
+        try:
+            await self._processor.process(method, target.partition("?")[0], headers, body)
+        except WebhookRequestError as exc:
+            status, reason = exc.status, exc.reason
+        except Exception as exc:
+            _LOGGER.debug("Exception in AsyncioWebhookServer", exc_info=exc)
+            status = HTTPStatus.INTERNAL_SERVER_ERROR
+
+        await self._respond(writer, status, reason, keep_alive=keep_alive)
+        return keep_alive
+
+    @classmethod
+    async def _read_request(cls, reader: asyncio.StreamReader) -> Tuple[Dict[str, str], bytes]:
+        headers = await cls._read_headers(reader)
+        return headers, await cls._read_body(headers, reader)
+
+    @staticmethod
+    async def _read_headers(reader: asyncio.StreamReader) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        while (line := await reader.readline()) not in (b"\r\n", b"\n"):
+            if not line:
+                raise ConnectionResetError("Connection closed while reading the headers")
+            if len(headers) >= _MAX_HEADERS:
+                raise WebhookRequestError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE)
+            name, separator, value = line.decode("latin-1").partition(":")
+            if not separator:
+                raise WebhookRequestError(HTTPStatus.BAD_REQUEST, "Malformed header")
+            headers[name.strip().lower()] = value.strip()
+        return headers
+
+    @staticmethod
+    async def _read_body(headers: Dict[str, str], reader: asyncio.StreamReader) -> bytes:
+        if "transfer-encoding" in headers:
+            raise WebhookRequestError(
+                HTTPStatus.NOT_IMPLEMENTED, "Chunked requests are not supported"
+            )
+        try:
+            # Requests without Content-Length header have no body
+            length = int(headers.get("content-length", 0))
+        except ValueError as exc:
+            raise WebhookRequestError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length") from exc
+        if length < 0:
+            raise WebhookRequestError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+        if length > MAX_BODY_SIZE:
+            raise WebhookRequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+        return await reader.readexactly(length)
+
+    @staticmethod
+    async def _respond(
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        reason: Optional[str],
+        keep_alive: bool,
+    ) -> None:
+        connection = "" if keep_alive else "Connection: close\r\n"
+        writer.write(
+            (
+                f"HTTP/1.1 {status.value} {reason or status.phrase}\r\n"
+                'Content-Type: application/json; charset="utf-8"\r\n'
+                "Content-Length: 0\r\n"
+                f"{connection}\r\n"
+            ).encode("latin-1")
+        )
+        await writer.drain()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a helper class that pre-computes which handlers of an application can
+possibly handle an update.
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
+
+from telegram import constants
+from telegram._messageentity import MessageEntity
+from telegram._update import Update
+from telegram.ext._handlers.basehandler import BaseHandler
+from telegram.ext._handlers.callbackqueryhandler import CallbackQueryHandler
+from telegram.ext._handlers.chatboosthandler import ChatBoostHandler
+from telegram.ext._handlers.chatjoinrequesthandler import ChatJoinRequestHandler
+from telegram.ext._handlers.chatmemberhandler import ChatMemberHandler
+from telegram.ext._handlers.choseninlineresulthandler import ChosenInlineResultHandler
+from telegram.ext._handlers.commandhandler import CommandHandler
+from telegram.ext._handlers.inlinequeryhandler import InlineQueryHandler
+from telegram.ext._handlers.messagereactionhandler import MessageReactionHandler
+from telegram.ext._handlers.pollanswerhandler import PollAnswerHandler
+from telegram.ext._handlers.pollhandler import PollHandler
+from telegram.ext._handlers.precheckoutqueryhandler import PreCheckoutQueryHandler
+from telegram.ext._handlers.prefixhandler import PrefixHandler
+from telegram.ext._handlers.shippingqueryhandler import ShippingQueryHandler
+
+_UT = constants.UpdateType
+
+# The update types that the built-in handlers can possibly handle. This is only used for handlers
+# that don't override `check_update` of the respective class.
+_HANDLER_UPDATE_TYPES: Tuple[Tuple[type, FrozenSet[str]], ...] = (
+    (CallbackQueryHandler, frozenset({_UT.CALLBACK_QUERY})),
+    (ChatBoostHandler, frozenset({_UT.CHAT_BOOST, _UT.REMOVED_CHAT_BOOST})),
+    (ChatJoinRequestHandler, frozenset({_UT.CHAT_JOIN_REQUEST})),
+    (ChatMemberHandler, frozenset({_UT.CHAT_MEMBER, _UT.MY_CHAT_MEMBER})),
+    (ChosenInlineResultHandler, frozenset({_UT.CHOSEN_INLINE_RESULT})),
+    (InlineQueryHandler, frozenset({_UT.INLINE_QUERY})),
+    (MessageReactionHandler, frozenset({_UT.MESSAGE_REACTION, _UT.MESSAGE_REACTION_COUNT})),
+    (PollAnswerHandler, frozenset({_UT.POLL_ANSWER})),
+    (PollHandler, frozenset({_UT.POLL})),
+    (PreCheckoutQueryHandler, frozenset({_UT.PRE_CHECKOUT_QUERY})),
+    (ShippingQueryHandler, frozenset({_UT.SHIPPING_QUERY})),
+)
+
+# Kinds of entries in the index
+_ANY = 0
+_UPDATE_TYPE = 1
+_COMMAND = 2
+_PREFIX = 3
+
+_Entry = Tuple[BaseHandler[Any, Any], int, FrozenSet[str]]
+_CacheKey = Tuple[Optional[str], Optional[str], Optional[str]]
+
+
+def _uses_check_update_of(handler: BaseHandler[Any, Any], cls: type) -> bool:
+    # Subclasses that override `check_update` may handle arbitrary updates
+    return isinstance(handler, cls) and type(handler).check_update is cls.check_update
+
+
+def _build_entry(handler: BaseHandler[Any, Any]) -> _Entry:
+    if _uses_check_update_of(handler, CommandHandler):
+        return handler, _COMMAND, handler.commands  # type: ignore[attr-defined]
+    if _uses_check_update_of(handler, PrefixHandler):
+        return handler, _PREFIX, handler.commands  # type: ignore[attr-defined]
+    for cls, update_types in _HANDLER_UPDATE_TYPES:
+        if _uses_check_update_of(handler, cls):
+            return handler, _UPDATE_TYPE, update_types
+    return handler, _ANY, frozenset()
+
+
+def _get_update_type(update: Update) -> Optional[str]:
+    for update_type in constants.UpdateType:
+        if getattr(update, update_type, None) is not None:
+            return update_type
+    return None
+
+
+def _get_command(update: Update) -> Optional[str]:
+    # Mirrors the parsing done in CommandHandler.check_update
+    message = update.effective_message
+    if not (message and message.entities and message.text):
+        return None
+    entity = message.entities[0]
+    if entity.type != MessageEntity.BOT_COMMAND or entity.offset != 0:
+        return None
+    return message.text[1 : entity.length].split("@")[0].lower()
+
+
+def _get_prefix_command(update: Update) -> Optional[str]:
+    # Mirrors the parsing done in PrefixHandler.check_update
+    message = update.effective_message
+    if not (message and message.text):
+        return None
+    text_list = message.text.split()
+    return text_list[0].lower() if text_list else None
+
+
+class HandlerIndex:
+    """Pre-computes for each group which handlers can possibly handle an update based on the
+    type of the update and - for :class:`telegram.ext.CommandHandler` and
+    :class:`telegram.ext.PrefixHandler` - on the command contained in the update.
+    The order of the groups and of the handlers within each group is preserved, so that
+    dispatching only to the candidates returned by :meth:`get_handlers` is equivalent to
+    checking all handlers.
+
+    Handlers for which the index can't tell which updates they handle (e.g.
+    :class:`telegram.ext.TypeHandler`, :class:`telegram.ext.ConversationHandler` or custom
+    handlers) are always considered candidates.
+
+    Args:
+        handlers (Dict[:obj:`int`, List[:class:`telegram.ext.BaseHandler`]]): The handlers of
+            the application as in :attr:`telegram.ext.Application.handlers`.
+    """
+
+    __slots__ = ("_cache", "_commands", "_groups", "_prefix_commands")
+
+    def __init__(self, handlers: Mapping[int, Sequence[BaseHandler[Any, Any]]]):
+        self._groups: List[List[_Entry]] = [
+            [_build_entry(handler) for handler in group] for group in handlers.values()
+        ]
+        self._commands: FrozenSet[str] = frozenset(
+            command
+            for group in self._groups
+            for _, kind, keys in group
+            if kind == _COMMAND
+            for command in keys
+        )
+        self._prefix_commands: FrozenSet[str] = frozenset(
+            command
+            for group in self._groups
+            for _, kind, keys in group
+            if kind == _PREFIX
+            for command in keys
+        )
+        self._cache: Dict[_CacheKey, List[List[BaseHandler[Any, Any]]]] = {}
+
+    def _get_cache_key(self, update: object) -> _CacheKey:
+        if not isinstance(update, Update):
+            return None, None, None
+
+        command = _get_command(update) if self._commands else None
+        prefix_command = _get_prefix_command(update) if self._prefix_commands else None
+        # Unknown commands can't be handled by any command handler, so we don't need to
+        # distinguish them. This also keeps the cache bounded.
+        return (
+            _get_update_type(update),
+            command if command in self._commands else None,
+            prefix_command if prefix_command in self._prefix_commands else None,
+        )
+
+    @staticmethod
+    def _is_candidate(entry: _Entry, key: _CacheKey) -> bool:
+        _, kind, keys = entry
+        update_type, command, prefix_command = key
+        if kind == _ANY:
+            return True
+        if kind == _UPDATE_TYPE:
+            return update_type in keys
+        if kind == _COMMAND:
+            return command in keys
+        return prefix_command in keys
+
+    def get_handlers(self, update: object) -> List[List[BaseHandler[Any, Any]]]:
+        """Returns the handlers that can possibly handle the update.
+
+        Args:
+            update (:obj:`object`): The update to be handled.
+
+        Returns:
+            List[List[:class:`telegram.ext.BaseHandler`]]: For each group (ordered by priority)
+            that contains at least one candidate, the list of candidates of that group.
+        """
+        key = self._get_cache_key(update)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        handlers = []
+        for group in self._groups:
+            candidates = [entry[0] for entry in group if self._is_candidate(entry, key)]
+            if candidates:
+                handlers.append(candidates)
+        self._cache[key] = handlers
+        return handlers
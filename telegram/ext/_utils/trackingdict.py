@@ -16,7 +16,7 @@
 #
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
-"""This module contains a mutable mapping that keeps track of the keys that where accessed.
+"""This module contains mutable mappings that keep track of the keys that where accessed.
 
 .. versionadded:: 20.0
 
@@ -26,7 +26,21 @@ Warning:
     the changelog.
 """
 from collections import UserDict
-from typing import Final, Generic, List, Mapping, Optional, Set, Tuple, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    Final,
+    Generic,
+    ItemsView,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    ValuesView,
+)
 
 from telegram._utils.defaultvalue import DEFAULT_NONE, DefaultValue
 
@@ -122,3 +136,101 @@ class TrackingDict(UserDict, Generic[_KT, _VT]):
         self.__track_write(key)
         self[key] = default  # type: ignore[assignment]
         return default  # type: ignore[return-value]
+
+
+class AccessTrackingDict(Dict[_KT, _VT]):
+    """Dictionary that keeps track of which keys were accessed. In contrast to
+    :class:`TrackingDict`, read access is tracked as well, because values may be mutated in place
+    after being read. This is a subclass of :obj:`dict`, such that it can be used as drop-in
+    replacement for :attr:`telegram.ext.Application.bot_data`.
+
+    Note:
+        * Methods that expose all values at once, i.e. ``values()``, ``items()`` and ``copy()``,
+          mark all keys as accessed.
+        * Copying and pickling the dictionary results in a plain :obj:`dict`.
+    """
+
+    __slots__ = ("_accessed_keys",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._accessed_keys: Set[_KT] = set()
+
+    def __reduce__(self) -> Tuple[type, Tuple[Dict[_KT, _VT]]]:  # type: ignore[override]
+        return dict, (dict(self),)
+
+    def __getitem__(self, key: _KT) -> _VT:
+        self._accessed_keys.add(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key: _KT, value: _VT) -> None:
+        self._accessed_keys.add(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: _KT) -> None:
+        self._accessed_keys.add(key)
+        super().__delitem__(key)
+
+    def __ior__(self, other: Any) -> "AccessTrackingDict[_KT, _VT]":  # type: ignore[override]
+        self.update(other)
+        return self
+
+    def __track_all(self) -> None:
+        self._accessed_keys.update(self.keys())
+
+    def get(self, key: _KT, default: Any = None) -> Any:
+        self._accessed_keys.add(key)
+        return super().get(key, default)
+
+    def setdefault(self, key: _KT, default: Any = None) -> Any:
+        self._accessed_keys.add(key)
+        return super().setdefault(key, default)
+
+    def pop(self, key: _KT, *args: Any) -> Any:  # pylint: disable=arguments-differ
+        self._accessed_keys.add(key)
+        return super().pop(key, *args)
+
+    def popitem(self) -> Tuple[_KT, _VT]:
+        key, value = super().popitem()
+        self._accessed_keys.add(key)
+        return key, value
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # pylint: disable=arguments-differ
+        mapping: Dict[_KT, _VT] = dict(*args, **kwargs)
+        self._accessed_keys.update(mapping.keys())
+        super().update(mapping)
+
+    def clear(self) -> None:
+        self.__track_all()
+        super().clear()
+
+    def copy(self) -> Dict[_KT, _VT]:  # type: ignore[override]
+        # The copy shares the values, which may then be mutated
+        self.__track_all()
+        return dict(self)
+
+    def values(self) -> ValuesView[_VT]:  # type: ignore[override]
+        self.__track_all()
+        return super().values()
+
+    def items(self) -> ItemsView[_KT, _VT]:  # type: ignore[override]
+        self.__track_all()
+        return super().items()
+
+    def pop_accessed_items(self) -> Tuple[Dict[_KT, _VT], Set[_KT]]:
+        """Returns the entries that were accessed since the last time this method was called
+        along with the keys that were deleted in the meantime. Doesn't count as access.
+
+        Returns:
+            Tuple[Dict, Set]: The accessed entries and the deleted keys.
+        """
+        keys = self._accessed_keys
+        self._accessed_keys = set()
+        changed = {}
+        deleted = set()
+        for key in keys:
+            if dict.__contains__(self, key):
+                changed[key] = dict.__getitem__(self, key)
+            else:
+                deleted.add(key)
+        return changed, deleted
@@ -18,7 +18,6 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 # pylint: disable=missing-module-docstring
 import asyncio
-import json
 from http import HTTPStatus
 from pathlib import Path
 from ssl import SSLContext
@@ -38,7 +37,9 @@ except ImportError:
     UNIX_AVAILABLE = False
 
 from telegram import Update
+from telegram._utils.jsoncodec import get_json_codec
 from telegram._utils.logging import get_logger
+from telegram.ext._boundedupdatequeue import BoundedUpdateQueue
 from telegram.ext._extbot import ExtBot
 
 if TYPE_CHECKING:
@@ -154,10 +155,18 @@ class TelegramHandler(tornado.web.RequestHandler):
         _LOGGER.debug("Webhook triggered")
         self._validate_post()
 
-        json_string = self.request.body.decode()
-        data = json.loads(json_string)
+        if isinstance(self.update_queue, BoundedUpdateQueue) and self.update_queue.congested:
+            # Telegram delivers the update again later, so we don't even parse it
+            self.update_queue.record_rejection()
+            _LOGGER.debug("Update queue is congested, rejecting update")
+            raise tornado.web.HTTPError(
+                HTTPStatus.SERVICE_UNAVAILABLE, reason="Update queue is congested"
+            )
+
+        json_codec = self.bot.json_codec if isinstance(self.bot, ExtBot) else get_json_codec()
+        data = json_codec.loads(self.request.body)
         self.set_status(HTTPStatus.OK)
-        _LOGGER.debug("Webhook received data: %s", json_string)
+        _LOGGER.debug("Webhook received data: %s", data)
 
         try:
             update = Update.de_json(data, self.bot)
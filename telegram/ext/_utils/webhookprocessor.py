@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the logic for processing webhook requests that is shared between the
+web servers that don't depend on tornado.
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+import asyncio
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Sequence, Tuple
+
+from telegram import Update
+from telegram._utils.jsoncodec import get_json_codec
+from telegram._utils.logging import get_logger
+from telegram.ext._boundedupdatequeue import BoundedUpdateQueue
+from telegram.ext._extbot import ExtBot
+
+if TYPE_CHECKING:
+    from telegram import Bot
+
+# This module is not visible to users, so we log as Updater
+_LOGGER = get_logger(__name__, class_name="Updater")
+
+# Updates are small JSON documents, so there is no need to accept large bodies
+MAX_BODY_SIZE = 10 * 1024 * 1024
+
+
+class WebhookRequestError(Exception):
+    """Raised while processing a request to answer it with the given status."""
+
+    __slots__ = ("reason", "status")
+
+    def __init__(self, status: HTTPStatus, reason: Optional[str] = None):
+        super().__init__(reason)
+        self.status: HTTPStatus = status
+        self.reason: str = reason or status.phrase
+
+
+class WebhookRequestProcessor:
+    """Validates requests sent by Telegram to a webhook and puts the contained updates into the
+    update queue.
+    """
+
+    __slots__ = ("_bot", "_paths", "_secret_token", "_update_queue")
+
+    def __init__(
+        self,
+        webhook_path: str,
+        bot: "Bot",
+        update_queue: asyncio.Queue,
+        secret_token: Optional[str] = None,
+    ):
+        if not webhook_path.startswith("/"):
+            webhook_path = f"/{webhook_path}"
+        # Like the tornado based server, accept the path with and without trailing slash
+        self._paths = (webhook_path, f"{webhook_path.rstrip('/')}/")
+        self._bot = bot
+        self._update_queue = update_queue
+        self._secret_token = secret_token
+
+    @property
+    def paths(self) -> Tuple[str, str]:
+        """Tuple[:obj:`str`, :obj:`str`]: The paths on which requests are accepted."""
+        return self._paths
+
+    async def process(
+        self, method: str, path: str, headers: Mapping[str, str], body: bytes
+    ) -> None:
+        """Processes a request.
+
+        Args:
+            method (:obj:`str`): The HTTP method of the request.
+            path (:obj:`str`): The path of the request, without query string.
+            headers (Mapping[:obj:`str`, :obj:`str`]): The headers of the request, with
+                lowercase names.
+            body (:obj:`bytes`): The body of the request.
+
+        Raises:
+            :exc:`WebhookRequestError`: If the request has to be answered with an error status.
+        """
+        if path not in self._paths:
+            raise WebhookRequestError(HTTPStatus.NOT_FOUND)
+        if method != "POST":
+            raise WebhookRequestError(HTTPStatus.METHOD_NOT_ALLOWED)
+
+        _LOGGER.debug("Webhook triggered")
+        self._validate_headers(headers)
+
+        if isinstance(self._update_queue, BoundedUpdateQueue) and self._update_queue.congested:
+            # Telegram delivers the update again later, so we don't even parse it
+            self._update_queue.record_rejection()
+            _LOGGER.debug("Update queue is congested, rejecting update")
+            raise WebhookRequestError(
+                HTTPStatus.SERVICE_UNAVAILABLE, "Update queue is congested"
+            )
+
+        json_codec = self._bot.json_codec if isinstance(self._bot, ExtBot) else get_json_codec()
+        try:
+            data = json_codec.loads(body)
+        except ValueError as exc:
+            raise WebhookRequestError(HTTPStatus.BAD_REQUEST, "Invalid JSON") from exc
+        _LOGGER.debug("Webhook received data: %s", data)
+
+        try:
+            update = Update.de_json(data, self._bot)
+        except Exception as exc:
+            _LOGGER.critical(
+                "Something went wrong processing the data received from Telegram. "
+                "Received data was *not* processed!",
+                exc_info=exc,
+            )
+            raise WebhookRequestError(
+                HTTPStatus.BAD_REQUEST, "Update could not be processed"
+            ) from exc
+
+        if update:
+            _LOGGER.debug("Received Update with ID %d on Webhook", update.update_id)
+
+            # handle arbitrary callback data, if necessary
+            if isinstance(self._bot, ExtBot):
+                self._bot.insert_callback_data(update)
+
+            await self._update_queue.put(update)
+
+    def _validate_headers(self, headers: Mapping[str, str]) -> None:
+        """Only accept requests with content type JSON and the correct secret token"""
+        if headers.get("content-type") != "application/json":
+            raise WebhookRequestError(HTTPStatus.FORBIDDEN)
+        if self._secret_token is not None:
+            token = headers.get("x-telegram-bot-api-secret-token")
+            if not token:
+                _LOGGER.debug("Request did not include the secret token")
+                raise WebhookRequestError(
+                    HTTPStatus.FORBIDDEN, "Request did not include the secret token"
+                )
+            if token != self._secret_token:
+                _LOGGER.debug("Request had the wrong secret token: %s", token)
+                raise WebhookRequestError(
+                    HTTPStatus.FORBIDDEN, "Request had the wrong secret token"
+                )
+
+
+class WebhookRequestRouter:
+    """Passes each request to the :class:`WebhookRequestProcessor` responsible for its path, such
+    that a single web server can receive the updates of several bots.
+    """
+
+    __slots__ = ("_processors",)
+
+    def __init__(self, processors: Sequence[WebhookRequestProcessor]):
+        self._processors: Dict[str, WebhookRequestProcessor] = {}
+        for processor in processors:
+            for path in processor.paths:
+                if path in self._processors:
+                    raise ValueError(f"Multiple webhooks use the path {path}!")
+                self._processors[path] = processor
+
+    async def process(
+        self, method: str, path: str, headers: Mapping[str, str], body: bytes
+    ) -> None:
+        """Processes a request. See :meth:`WebhookRequestProcessor.process`."""
+        if (processor := self._processors.get(path)) is None:
+            raise WebhookRequestError(HTTPStatus.NOT_FOUND)
+        await processor.process(method, path, headers, body)
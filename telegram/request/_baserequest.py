@@ -18,13 +18,26 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains an abstract class to make POST and GET requests."""
 import abc
-import json
+import contextlib
 from http import HTTPStatus
 from types import TracebackType
-from typing import AsyncContextManager, Final, List, Optional, Tuple, Type, TypeVar, Union, final
+from typing import (
+    AsyncContextManager,
+    AsyncIterator,
+    Final,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    final,
+)
 
 from telegram._utils.defaultvalue import DEFAULT_NONE as _DEFAULT_NONE
 from telegram._utils.defaultvalue import DefaultValue
+from telegram._utils.jsoncodec import get_json_codec
 from telegram._utils.logging import get_logger
 from telegram._utils.types import JSONDict, ODVInput
 from telegram._utils.warnings import warn
@@ -76,8 +89,11 @@ class BaseRequest(
 
     Tip:
         JSON encoding and decoding is done with the standard library's :mod:`json` by default.
-        To use a custom library for this, you can override :meth:`parse_json_payload` and implement
-        custom logic to encode the keys of :attr:`telegram.request.RequestData.parameters`.
+        To use a custom library for this, you can either set a different
+        :class:`telegram.request.JSONCodec` via
+        :meth:`telegram.ext.ApplicationBuilder.json_codec` or override
+        :meth:`parse_json_payload` and implement custom logic to encode the keys of
+        :attr:`telegram.request.RequestData.parameters`.
 
     .. seealso:: :wiki:`Architecture Overview <Architecture>`,
         :wiki:`Builder Pattern <Builder-Pattern>`
@@ -258,6 +274,66 @@ class BaseRequest(
             pool_timeout=pool_timeout,
         )
 
+    @final
+    async def retrieve_stream(
+        self,
+        url: str,
+        read_timeout: ODVInput[float] = DEFAULT_NONE,
+        write_timeout: ODVInput[float] = DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = DEFAULT_NONE,
+    ) -> AsyncIterator[bytes]:
+        """Retrieve the contents of a file by its URL chunk by chunk as they arrive, such that
+        the file never has to be held in memory completely. Uses :meth:`do_stream_request`.
+
+        Warning:
+            This method will be called by the methods of :class:`telegram.File` and should *not*
+            be called manually.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            url (:obj:`str`): The web location we want to retrieve.
+            read_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the maximum
+                amount of time (in seconds) to wait for a response from Telegram's server instead
+                of the time specified during creating of this object. Defaults to
+                :attr:`DEFAULT_NONE`.
+            write_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the maximum
+                amount of time (in seconds) to wait for a write operation to complete (in terms of
+                a network socket; i.e. POSTing a request or uploading a file) instead of the time
+                specified during creating of this object. Defaults to :attr:`DEFAULT_NONE`.
+            connect_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the
+                maximum amount of time (in seconds) to wait for a connection attempt to a server
+                to succeed instead of the time specified during creating of this object. Defaults
+                to :attr:`DEFAULT_NONE`.
+            pool_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the maximum
+                amount of time (in seconds) to wait for a connection to become available instead
+                of the time specified during creating of this object. Defaults to
+                :attr:`DEFAULT_NONE`.
+
+        Yields:
+            :obj:`bytes`: The chunks of the files contents.
+
+        """
+        try:
+            async with self.do_stream_request(
+                url=url,
+                method="GET",
+                read_timeout=read_timeout,
+                write_timeout=write_timeout,
+                connect_timeout=connect_timeout,
+                pool_timeout=pool_timeout,
+            ) as (code, chunks):
+                if not HTTPStatus.OK <= code <= 299:
+                    # Error responses are small, so we can just read them completely
+                    self._raise_for_response(code, b"".join([chunk async for chunk in chunks]))
+                async for chunk in chunks:
+                    yield chunk
+        except TelegramError as exc:
+            raise exc
+        except Exception as exc:
+            raise NetworkError(f"Unknown error in HTTP implementation: {exc!r}") from exc
+
     async def _request_wrapper(
         self,
         url: str,
@@ -311,7 +387,7 @@ class BaseRequest(
         # standard deprecation policy and deprecate starting with version 20.7.
         # For our own implementation HTTPXRequest, we can handle that ourselves, so we skip the
         # warning in that case.
-        has_files = request_data and request_data.multipart_data
+        has_files = request_data and request_data.contains_files
         if (
             has_files
             and not isinstance(self, HTTPXRequest)
@@ -345,6 +421,10 @@ class BaseRequest(
             # 200-299 range are HTTP success statuses
             return payload
 
+        self._raise_for_response(code, payload)
+
+    def _raise_for_response(self, code: int, payload: bytes) -> NoReturn:
+        """Raises the exception matching an unsuccessful response of the Bot API."""
         response_data = self.parse_json_payload(payload)
 
         description = response_data.get("description")
@@ -388,10 +468,15 @@ class BaseRequest(
         """Parse the JSON returned from Telegram.
 
         Tip:
-            By default, this method uses the standard library's :func:`json.loads` and
-            ``errors="replace"`` in :meth:`bytes.decode`.
+            By default, this method uses :meth:`telegram.request.JSONCodec.loads` of the codec
+            set via :meth:`telegram.ext.ApplicationBuilder.json_codec`, which passes the
+            :obj:`bytes` directly to the JSON library. The default codec uses the standard
+            library's :func:`json.loads` and ``errors="replace"`` in :meth:`bytes.decode`.
             You can override it to customize either of these behaviors.
 
+        .. versionchanged:: NEXT.VERSION
+            Uses the configured :class:`telegram.request.JSONCodec`.
+
         Args:
             payload (:obj:`bytes`): The UTF-8 encoded JSON payload as returned by Telegram.
 
@@ -401,11 +486,12 @@ class BaseRequest(
         Raises:
             TelegramError: If loading the JSON data failed
         """
-        decoded_s = payload.decode("utf-8", "replace")
         try:
-            return json.loads(decoded_s)
+            return get_json_codec().loads(payload)
         except ValueError as exc:
-            _LOGGER.error('Can not load invalid JSON data: "%s"', decoded_s)
+            _LOGGER.error(
+                'Can not load invalid JSON data: "%s"', payload.decode("utf-8", "replace")
+            )
             raise TelegramError("Invalid server response") from exc
 
     @abc.abstractmethod
@@ -451,3 +537,69 @@ class BaseRequest(
             Tuple[:obj:`int`, :obj:`bytes`]: The HTTP return code & the payload part of the server
             response.
         """
+
+    @contextlib.asynccontextmanager
+    async def do_stream_request(
+        self,
+        url: str,
+        method: str,
+        request_data: Optional[RequestData] = None,
+        read_timeout: ODVInput[float] = DEFAULT_NONE,
+        write_timeout: ODVInput[float] = DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = DEFAULT_NONE,
+    ) -> AsyncIterator[Tuple[int, AsyncIterator[bytes]]]:
+        """Makes a request to the Bot API and provides the payload of the response chunk by
+        chunk as it arrives. Used as asynchronous context manager, which closes the response on
+        exit.
+
+        By default, this calls :meth:`do_request` and provides the complete payload as a single
+        chunk. Subclasses should override this method if the underlying library supports
+        streaming responses.
+
+        Warning:
+            This method will be called by :meth:`retrieve_stream`. It should *not* be called
+            manually.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            url (:obj:`str`): The URL to request.
+            method (:obj:`str`): HTTP method (i.e. ``'POST'``, ``'GET'``, etc.).
+            request_data (:class:`telegram.request.RequestData`, optional): An object containing
+                information about parameters and files to upload for the request.
+            read_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the maximum
+                amount of time (in seconds) to wait for a response from Telegram's server instead
+                of the time specified during creating of this object. Defaults to
+                :attr:`DEFAULT_NONE`.
+            write_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the maximum
+                amount of time (in seconds) to wait for a write operation to complete (in terms of
+                a network socket; i.e. POSTing a request or uploading a file) instead of the time
+                specified during creating of this object. Defaults to :attr:`DEFAULT_NONE`.
+            connect_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the
+                maximum amount of time (in seconds) to wait for a connection attempt to a server
+                to succeed instead of the time specified during creating of this object. Defaults
+                to :attr:`DEFAULT_NONE`.
+            pool_timeout (:obj:`float` | :obj:`None`, optional): If passed, specifies the maximum
+                amount of time (in seconds) to wait for a connection to become available instead
+                of the time specified during creating of this object. Defaults to
+                :attr:`DEFAULT_NONE`.
+
+        Yields:
+            Tuple[:obj:`int`, AsyncIterator[:obj:`bytes`]]: The HTTP return code & an
+            asynchronous iterator over the chunks of the payload part of the server response.
+        """
+        code, payload = await self.do_request(
+            url=url,
+            method=method,
+            request_data=request_data,
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+        )
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield payload
+
+        yield code, chunks()
@@ -17,7 +17,8 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains methods to make POST and GET requests using the httpx library."""
-from typing import Collection, Optional, Tuple, Union
+import contextlib
+from typing import AsyncIterator, Collection, Optional, Tuple, Union
 
 import httpx
 
@@ -250,9 +251,74 @@ class HTTPXRequest(BaseRequest):
         if self._client.is_closed:
             raise RuntimeError("This HTTPXRequest is not initialized!")
 
-        files = request_data.multipart_data if request_data else None
+        # httpx reads file handles in chunks while uploading
+        files = request_data.streaming_multipart_data if request_data else None
         data = request_data.json_parameters if request_data else None
+        timeout = self._build_timeout(
+            read_timeout, write_timeout, connect_timeout, pool_timeout, has_files=bool(files)
+        )
+
+        try:
+            res = await self._client.request(
+                method=method,
+                url=url,
+                headers={"User-Agent": self.USER_AGENT},
+                timeout=timeout,
+                files=files,
+                data=data,
+            )
+        except httpx.HTTPError as err:
+            raise self._convert_exception(err) from err
+
+        return res.status_code, res.content
+
+    @contextlib.asynccontextmanager
+    async def do_stream_request(
+        self,
+        url: str,
+        method: str,
+        request_data: Optional[RequestData] = None,
+        read_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+        write_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+    ) -> AsyncIterator[Tuple[int, AsyncIterator[bytes]]]:
+        """See :meth:`BaseRequest.do_stream_request`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        if self._client.is_closed:
+            raise RuntimeError("This HTTPXRequest is not initialized!")
 
+        # httpx reads file handles in chunks while uploading
+        files = request_data.streaming_multipart_data if request_data else None
+        data = request_data.json_parameters if request_data else None
+        timeout = self._build_timeout(
+            read_timeout, write_timeout, connect_timeout, pool_timeout, has_files=bool(files)
+        )
+
+        try:
+            async with self._client.stream(
+                method=method,
+                url=url,
+                headers={"User-Agent": self.USER_AGENT},
+                timeout=timeout,
+                files=files,
+                data=data,
+            ) as res:
+                # Errors while reading the chunks are raised here as well
+                yield res.status_code, res.aiter_bytes()
+        except httpx.HTTPError as err:
+            raise self._convert_exception(err) from err
+
+    def _build_timeout(
+        self,
+        read_timeout: ODVInput[float],
+        write_timeout: ODVInput[float],
+        connect_timeout: ODVInput[float],
+        pool_timeout: ODVInput[float],
+        has_files: bool,
+    ) -> httpx.Timeout:
         # If user did not specify timeouts (for e.g. in a bot method), use the default ones when we
         # created this instance.
         if isinstance(read_timeout, DefaultValue):
@@ -263,40 +329,33 @@ class HTTPXRequest(BaseRequest):
             pool_timeout = self._client.timeout.pool
 
         if isinstance(write_timeout, DefaultValue):
-            write_timeout = self._client.timeout.write if not files else self._media_write_timeout
+            write_timeout = (
+                self._client.timeout.write if not has_files else self._media_write_timeout
+            )
 
-        timeout = httpx.Timeout(
+        return httpx.Timeout(
             connect=connect_timeout,
             read=read_timeout,
             write=write_timeout,
             pool=pool_timeout,
         )
 
-        try:
-            res = await self._client.request(
-                method=method,
-                url=url,
-                headers={"User-Agent": self.USER_AGENT},
-                timeout=timeout,
-                files=files,
-                data=data,
-            )
-        except httpx.TimeoutException as err:
+    @staticmethod
+    def _convert_exception(err: httpx.HTTPError) -> NetworkError:
+        if isinstance(err, httpx.TimeoutException):
             if isinstance(err, httpx.PoolTimeout):
-                raise TimedOut(
+                return TimedOut(
                     message=(
                         "Pool timeout: All connections in the connection pool are occupied. "
                         "Request was *not* sent to Telegram. Consider adjusting the connection "
                         "pool size or the pool timeout."
                     )
-                ) from err
-            raise TimedOut from err
-        except httpx.HTTPError as err:
-            # HTTPError must come last as its the base httpx exception class
-            # TODO p4: do something smart here; for now just raise NetworkError
+                )
+            return TimedOut()
 
-            # We include the class name for easier debugging. Especially useful if the error
-            # message of `err` is empty.
-            raise NetworkError(f"httpx.{err.__class__.__name__}: {err}") from err
+        # HTTPError is the base httpx exception class
+        # TODO p4: do something smart here; for now just raise NetworkError
 
-        return res.status_code, res.content
+        # We include the class name for easier debugging. Especially useful if the error
+        # message of `err` is empty.
+        return NetworkError(f"httpx.{err.__class__.__name__}: {err}")
@@ -17,11 +17,12 @@
 #  You should have received a copy of the GNU Lesser Public License
 #  along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains a class that holds the parameters of a request to the Bot API."""
-import json
-from typing import Any, Dict, List, Optional, Union, final
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Type, Union, final
 from urllib.parse import urlencode
 
-from telegram._utils.types import UploadFileDict
+from telegram._utils.jsoncodec import get_json_codec
+from telegram._utils.types import StreamingUploadFileDict, UploadFileDict
 from telegram.request._requestparameter import RequestParameter
 
 
@@ -37,6 +38,13 @@ class RequestData:
         and not part of PTBs public API. Users should exclusively rely on the documented
         attributes, properties and methods.
 
+    Instances can be used as context manager. On exit, the files that were opened by the
+    contained :class:`telegram.InputFile` objects are closed, see
+    :meth:`telegram.InputFile.close`.
+
+    .. versionchanged:: NEXT.VERSION
+        Added support for the context manager protocol.
+
     Attributes:
         contains_files (:obj:`bool`): Whether this object contains files to be uploaded via
             ``multipart/form-data``.
@@ -48,6 +56,19 @@ class RequestData:
         self._parameters: List[RequestParameter] = parameters or []
         self.contains_files: bool = any(param.input_files for param in self._parameters)
 
+    def __enter__(self) -> "RequestData":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        for param in self._parameters:
+            for input_file in param.input_files or ():
+                input_file.close()
+
     @property
     def parameters(self) -> Dict[str, Union[str, int, List[Any], Dict[Any, Any]]]:
         """Gives the parameters as mapping of parameter name to the parameter value, which can be
@@ -67,8 +88,9 @@ class RequestData:
         value.
 
         Tip:
-            By default, this property uses the standard library's :func:`json.dumps`.
-            To use a custom library for JSON encoding, you can directly encode the keys of
+            This property uses the :class:`telegram.request.JSONCodec` set via
+            :meth:`telegram.ext.ApplicationBuilder.json_codec`, which defaults to the standard
+            library's :func:`json.dumps`. Alternatively, you can directly encode the keys of
             :attr:`parameters` - note that string valued keys should not be JSON encoded.
         """
         return {
@@ -105,18 +127,42 @@ class RequestData:
         """The :attr:`parameters` as UTF-8 encoded JSON payload.
 
         Tip:
-            By default, this property uses the standard library's :func:`json.dumps`.
-            To use a custom library for JSON encoding, you can directly encode the keys of
+            This property uses the :class:`telegram.request.JSONCodec` set via
+            :meth:`telegram.ext.ApplicationBuilder.json_codec`, which defaults to the standard
+            library's :func:`json.dumps`. Alternatively, you can directly encode the keys of
             :attr:`parameters` - note that string valued keys should not be JSON encoded.
         """
-        return json.dumps(self.json_parameters).encode("utf-8")
+        return get_json_codec().dumps_bytes(self.json_parameters)
 
     @property
     def multipart_data(self) -> UploadFileDict:
-        """Gives the files contained in this object as mapping of part name to encoded content."""
+        """Gives the files contained in this object as mapping of part name to encoded content.
+
+        Note:
+            Files that are read only while uploading, see
+            :paramref:`telegram.InputFile.read_file_handle`, are read completely when accessing
+            this property. Use :attr:`streaming_multipart_data` to avoid that.
+        """
         multipart_data: UploadFileDict = {}
         for param in self._parameters:
             m_data = param.multipart_data
             if m_data:
                 multipart_data.update(m_data)
         return multipart_data
+
+    @property
+    def streaming_multipart_data(self) -> StreamingUploadFileDict:
+        """Same as :attr:`multipart_data`, except that the content of files that are read only
+        while uploading is given as :term:`file object` instead of :obj:`bytes`, see
+        :attr:`telegram.InputFile.streaming_field_tuple`. Networking backends that support this
+        can read the files in chunks while uploading them, such that they never have to be held
+        in memory completely. :class:`~telegram.request.HTTPXRequest` uses this property.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        multipart_data: StreamingUploadFileDict = {}
+        for param in self._parameters:
+            m_data = param.streaming_multipart_data
+            if m_data:
+                multipart_data.update(m_data)
+        return multipart_data
@@ -17,7 +17,6 @@
 #  You should have received a copy of the GNU Lesser Public License
 #  along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains a class that describes a single parameter of a request to the Bot API."""
-import json
 from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional, Sequence, Tuple, final
@@ -28,7 +27,8 @@ from telegram._files.inputsticker import InputSticker
 from telegram._telegramobject import TelegramObject
 from telegram._utils.datetime import to_timestamp
 from telegram._utils.enum import StringEnum
-from telegram._utils.types import UploadFileDict
+from telegram._utils.jsoncodec import get_json_codec
+from telegram._utils.types import StreamingUploadFileDict, UploadFileDict
 
 
 @final
@@ -73,7 +73,7 @@ class RequestParameter:
             return self.value
         if self.value is None:
             return None
-        return json.dumps(self.value)
+        return get_json_codec().dumps(self.value)
 
     @property
     def multipart_data(self) -> Optional[UploadFileDict]:
@@ -85,6 +85,18 @@ class RequestParameter:
             for input_file in self.input_files
         }
 
+    @property
+    def streaming_multipart_data(self) -> Optional[StreamingUploadFileDict]:
+        """A dict with the file data to upload, if any. Files that are read only while
+        uploading are given as file handles, see :attr:`telegram.InputFile.streaming_field_tuple`.
+        """
+        if not self.input_files:
+            return None
+        return {
+            (input_file.attach_name or self.name): input_file.streaming_field_tuple
+            for input_file in self.input_files
+        }
+
     @staticmethod
     def _value_and_input_files_from_input(  # pylint: disable=too-many-return-statements
         value: object,
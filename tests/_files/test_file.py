@@ -23,7 +23,7 @@ from tempfile import TemporaryFile, mkstemp
 import pytest
 
 from telegram import File, FileCredentials, Voice
-from telegram.error import TelegramError
+from telegram.error import PassportDecryptionError, TelegramError
 from tests.auxil.files import data_file
 from tests.auxil.slots import mro_slots
 
@@ -153,9 +153,9 @@ class TestFileWithoutRequest(TestFileBase):
 
     async def test_download(self, monkeypatch, file):
         async def test(*args, **kwargs):
-            return self.file_content
+            yield self.file_content
 
-        monkeypatch.setattr(file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
         out_file = await file.download_to_drive()
 
         try:
@@ -168,9 +168,9 @@ class TestFileWithoutRequest(TestFileBase):
     )
     async def test_download_custom_path(self, monkeypatch, file, custom_path_type):
         async def test(*args, **kwargs):
-            return self.file_content
+            yield self.file_content
 
-        monkeypatch.setattr(file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
         file_handle, custom_path = mkstemp()
         custom_path = Path(custom_path)
         try:
@@ -183,11 +183,11 @@ class TestFileWithoutRequest(TestFileBase):
 
     async def test_download_no_filename(self, monkeypatch, file):
         async def test(*args, **kwargs):
-            return self.file_content
+            yield self.file_content
 
         file.file_path = None
 
-        monkeypatch.setattr(file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
         out_file = await file.download_to_drive()
 
         assert str(out_file)[-len(file.file_id) :] == file.file_id
@@ -198,9 +198,9 @@ class TestFileWithoutRequest(TestFileBase):
 
     async def test_download_file_obj(self, monkeypatch, file):
         async def test(*args, **kwargs):
-            return self.file_content
+            yield self.file_content
 
-        monkeypatch.setattr(file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
         with TemporaryFile() as custom_fobj:
             await file.download_to_memory(out=custom_fobj)
             custom_fobj.seek(0)
@@ -208,9 +208,9 @@ class TestFileWithoutRequest(TestFileBase):
 
     async def test_download_bytearray(self, monkeypatch, file):
         async def test(*args, **kwargs):
-            return self.file_content
+            yield self.file_content
 
-        monkeypatch.setattr(file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
 
         # Check that a download to a newly allocated bytearray works.
         buf = await file.download_as_bytearray()
@@ -225,9 +225,9 @@ class TestFileWithoutRequest(TestFileBase):
 
     async def test_download_encrypted(self, monkeypatch, bot, encrypted_file):
         async def test(*args, **kwargs):
-            return data_file("image_encrypted.jpg").read_bytes()
+            yield data_file("image_encrypted.jpg").read_bytes()
 
-        monkeypatch.setattr(encrypted_file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(encrypted_file.get_bot().request, "retrieve_stream", test)
         out_file = await encrypted_file.download_to_drive()
 
         try:
@@ -237,9 +237,9 @@ class TestFileWithoutRequest(TestFileBase):
 
     async def test_download_file_obj_encrypted(self, monkeypatch, encrypted_file):
         async def test(*args, **kwargs):
-            return data_file("image_encrypted.jpg").read_bytes()
+            yield data_file("image_encrypted.jpg").read_bytes()
 
-        monkeypatch.setattr(encrypted_file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(encrypted_file.get_bot().request, "retrieve_stream", test)
         with TemporaryFile() as custom_fobj:
             await encrypted_file.download_to_memory(out=custom_fobj)
             custom_fobj.seek(0)
@@ -247,9 +247,9 @@ class TestFileWithoutRequest(TestFileBase):
 
     async def test_download_file_obj_local_file_encrypted(self, monkeypatch, encrypted_local_file):
         async def test(*args, **kwargs):
-            return data_file("image_encrypted.jpg").read_bytes()
+            yield data_file("image_encrypted.jpg").read_bytes()
 
-        monkeypatch.setattr(encrypted_local_file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(encrypted_local_file.get_bot().request, "retrieve_stream", test)
         with TemporaryFile() as custom_fobj:
             await encrypted_local_file.download_to_memory(out=custom_fobj)
             custom_fobj.seek(0)
@@ -257,9 +257,9 @@ class TestFileWithoutRequest(TestFileBase):
 
     async def test_download_bytearray_encrypted(self, monkeypatch, encrypted_file):
         async def test(*args, **kwargs):
-            return data_file("image_encrypted.jpg").read_bytes()
+            yield data_file("image_encrypted.jpg").read_bytes()
 
-        monkeypatch.setattr(encrypted_file.get_bot().request, "retrieve", test)
+        monkeypatch.setattr(encrypted_file.get_bot().request, "retrieve_stream", test)
 
         # Check that a download to a newly allocated bytearray works.
         buf = await encrypted_file.download_as_bytearray()
@@ -272,6 +272,68 @@ class TestFileWithoutRequest(TestFileBase):
         assert buf2[len(buf) :] == buf
         assert buf2[: len(buf)] == buf
 
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+    async def test_download_encrypted_in_chunks(self, monkeypatch, encrypted_file, chunk_size):
+        # The padding at the beginning of the decrypted data may span multiple chunks
+        async def test(*args, **kwargs):
+            data = data_file("image_encrypted.jpg").read_bytes()
+            for start in range(0, len(data), chunk_size):
+                yield data[start : start + chunk_size]
+
+        monkeypatch.setattr(encrypted_file.get_bot().request, "retrieve_stream", test)
+        buf = await encrypted_file.download_as_bytearray()
+        assert buf == bytearray(data_file("image_decrypted.jpg").read_bytes())
+
+    async def test_download_encrypted_wrong_hash(self, monkeypatch, encrypted_file, tmp_path):
+        async def test(*args, **kwargs):
+            data = data_file("image_encrypted.jpg").read_bytes()
+            yield data[:32]
+            yield b"\x00" * 16
+            yield data[48:]
+
+        monkeypatch.setattr(encrypted_file.get_bot().request, "retrieve_stream", test)
+        custom_path = tmp_path / "file"
+        with pytest.raises(PassportDecryptionError, match="Hashes are not equal"):
+            await encrypted_file.download_to_drive(custom_path)
+        # The incomplete file is removed again
+        assert not custom_path.exists()
+        assert list(tmp_path.iterdir()) == []
+
+        # An existing file is left untouched
+        custom_path.write_bytes(b"existing")
+        with pytest.raises(PassportDecryptionError, match="Hashes are not equal"):
+            await encrypted_file.download_to_drive(custom_path)
+        assert custom_path.read_bytes() == b"existing"
+        assert list(tmp_path.iterdir()) == [custom_path]
+
+    async def test_download_replaces_existing_file(self, monkeypatch, file, tmp_path):
+        async def test(*args, **kwargs):
+            yield b"new content"
+
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
+        custom_path = tmp_path / "file"
+        custom_path.write_bytes(b"existing content that is longer")
+        assert await file.download_to_drive(custom_path) == custom_path
+        assert custom_path.read_bytes() == b"new content"
+        assert list(tmp_path.iterdir()) == [custom_path]
+
+    async def test_download_streams_chunks(self, monkeypatch, file):
+        received = []
+
+        async def test(*args, **kwargs):
+            for chunk in (b"chunk 1", b"chunk 2"):
+                yield chunk
+                # The chunk was already processed before the next one is requested
+                assert received[-1] == chunk
+
+        class Out:
+            def write(self, chunk):
+                received.append(chunk)
+
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", test)
+        await file.download_to_memory(Out())
+        assert received == [b"chunk 1", b"chunk 2"]
+
 
 class TestFileWithRequest(TestFileBase):
     async def test_error_get_empty_file_id(self, bot):
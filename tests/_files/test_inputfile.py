@@ -55,6 +55,57 @@ class TestInputFileWithoutRequest:
             # This exception may be thrown if the process has finished before we had the chance
             # to kill it.
 
+    def test_read_file_handle(self, png_file):
+        with png_file.open("rb") as file:
+            input_file = InputFile(file, read_file_handle=False)
+            # The file is not read before the upload
+            assert file.tell() == 0
+            assert input_file.filename == "game.png"
+            assert input_file.mimetype == "image/png"
+            assert input_file.streaming_field_tuple == ("game.png", file, "image/png")
+            assert file.tell() == 0
+
+            # The content is still available as bytes, read from the beginning of the file
+            content = png_file.read_bytes()
+            assert input_file.input_file_content == content
+            assert input_file.field_tuple == ("game.png", content, "image/png")
+            assert input_file.field_tuple == ("game.png", content, "image/png")
+
+        assert InputFile(BytesIO(b"blah"), read_file_handle=False).filename == (
+            "application.octet-stream"
+        )
+        # bytes and strings are always used directly
+        assert InputFile(b"blah", read_file_handle=False).input_file_content == b"blah"
+        assert InputFile("blah", read_file_handle=False).input_file_content == b"blah"
+
+    def test_path(self, png_file):
+        input_file = InputFile(png_file)
+        try:
+            assert input_file.filename == "game.png"
+            assert input_file.mimetype == "image/png"
+            file = input_file.streaming_field_tuple[1]
+            assert file.name == str(png_file)
+            # The file is not read before the upload
+            assert file.tell() == 0
+
+            input_file.close()
+            assert file.closed
+            # The file is opened again for the next upload
+            filename, reopened, mimetype = input_file.streaming_field_tuple
+            assert (filename, mimetype) == ("game.png", "image/png")
+            assert not reopened.closed
+            assert reopened.read() == png_file.read_bytes()
+
+            input_file.close()
+            assert input_file.field_tuple == ("game.png", png_file.read_bytes(), "image/png")
+        finally:
+            input_file.close()
+
+    def test_close_leaves_file_handles_open(self, png_file):
+        with png_file.open("rb") as file:
+            InputFile(file, read_file_handle=False).close()
+            assert not file.closed
+
     @pytest.mark.parametrize("attach", [True, False])
     def test_attach(self, attach):
         input_file = InputFile("contents", attach=attach)
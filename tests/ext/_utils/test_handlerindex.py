@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import datetime
+
+import pytest
+
+from telegram import CallbackQuery, Chat, Message, MessageEntity, Update, User
+from telegram.ext import (
+    ApplicationBuilder,
+    CallbackQueryHandler,
+    CommandHandler,
+    InlineQueryHandler,
+    MessageHandler,
+    PrefixHandler,
+    TypeHandler,
+    filters,
+)
+from telegram.ext._utils.handlerindex import HandlerIndex
+from tests.auxil.build_messages import make_command_update, make_message_update
+from tests.auxil.slots import mro_slots
+
+
+async def callback(update, context):
+    pass
+
+
+class CustomCallbackQueryHandler(CallbackQueryHandler):
+    def check_update(self, update):
+        return True
+
+
+@pytest.fixture()
+def callback_query_update():
+    return Update(
+        1, callback_query=CallbackQuery("1", User(1, "user", False), "chat_instance", data="data")
+    )
+
+
+class TestHandlerIndex:
+    start = CommandHandler("start", callback)
+    help = CommandHandler(["help", "info"], callback)
+    prefix = PrefixHandler("!", "test", callback)
+    messages = MessageHandler(filters.ALL, callback)
+    callback_query = CallbackQueryHandler(callback)
+    inline_query = InlineQueryHandler(callback)
+    type_handler = TypeHandler(str, callback)
+    custom = CustomCallbackQueryHandler(callback)
+
+    def test_slot_behaviour(self):
+        inst = HandlerIndex({})
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_commands(self, bot):
+        index = HandlerIndex(
+            {0: [self.start, self.help, self.messages], 1: [self.callback_query, self.prefix]}
+        )
+        assert index.get_handlers(make_command_update("/start", bot=bot)) == [
+            [self.start, self.messages]
+        ]
+        assert index.get_handlers(make_command_update("/info arg", bot=bot)) == [
+            [self.help, self.messages]
+        ]
+        # Commands are case-insensitive
+        upper_case_command = make_message_update(
+            "/INFO arg",
+            bot=bot,
+            entities=[MessageEntity(MessageEntity.BOT_COMMAND, 0, len("/INFO"))],
+        )
+        assert index.get_handlers(upper_case_command) == [[self.help, self.messages]]
+        assert index.get_handlers(make_command_update("/unknown", bot=bot)) == [[self.messages]]
+        assert index.get_handlers(make_message_update("!test arg")) == [
+            [self.messages],
+            [self.prefix],
+        ]
+
+    def test_update_types(self, callback_query_update):
+        index = HandlerIndex(
+            {
+                -1: [self.inline_query],
+                0: [self.messages, self.callback_query, self.type_handler, self.custom],
+            }
+        )
+        assert index.get_handlers(callback_query_update) == [
+            [self.messages, self.callback_query, self.type_handler, self.custom]
+        ]
+        assert index.get_handlers(make_message_update("text")) == [
+            [self.messages, self.type_handler, self.custom]
+        ]
+        assert index.get_handlers("string") == [[self.messages, self.type_handler, self.custom]]
+
+    def test_caching(self, bot):
+        index = HandlerIndex({0: [self.start, self.messages]})
+        first = index.get_handlers(make_command_update("/start", bot=bot))
+        assert index.get_handlers(make_command_update("/start arg", bot=bot)) is first
+
+    async def test_application_integration(self, bot):
+        app = ApplicationBuilder().bot(bot).handler_index(True).build()
+        received = []
+
+        async def start(update, context):
+            received.append("start")
+
+        async def fallback(update, context):
+            received.append("fallback")
+
+        app.add_handler(CommandHandler("start", start))
+        app.add_handler(MessageHandler(filters.ALL, fallback))
+
+        async with app:
+            await app.process_update(make_command_update("/start", bot=app.bot))
+            await app.process_update(make_message_update("text"))
+            assert received == ["start", "fallback"]
+
+            # The index must be rebuilt after modifying the handlers
+            other = CommandHandler("start", fallback)
+            app.add_handler(other, group=-1)
+            await app.process_update(make_command_update("/start", bot=app.bot))
+            assert received == ["start", "fallback", "fallback", "start"]
+
+            app.remove_handler(other, group=-1)
+            await app.process_update(make_command_update("/start", bot=app.bot))
+            assert received == ["start", "fallback", "fallback", "start", "start"]
+
+    def test_command_without_entity(self):
+        update = Update(
+            1,
+            message=Message(1, datetime.datetime.utcnow(), Chat(1, Chat.PRIVATE), text="/start"),
+        )
+        index = HandlerIndex({0: [self.start]})
+        # No bot command entity, so the command handler can't handle this
+        assert index.get_handlers(update) == []
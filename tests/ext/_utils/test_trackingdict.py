@@ -17,9 +17,12 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 
+import copy
+import pickle
+
 import pytest
 
-from telegram.ext._utils.trackingdict import TrackingDict
+from telegram.ext._utils.trackingdict import AccessTrackingDict, TrackingDict
 from tests.auxil.slots import mro_slots
 
 
@@ -172,3 +175,51 @@ class TestTrackingDict:
         assert td.pop_accessed_keys() == set()
         td.mark_as_accessed(1)
         assert td.pop_accessed_keys() == {1}
+
+
+class TestAccessTrackingDict:
+    def test_slot_behaviour(self):
+        atd = AccessTrackingDict()
+        for attr in atd.__slots__:
+            assert getattr(atd, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(atd)) == len(set(mro_slots(atd))), "duplicate slot"
+
+    def test_is_dict(self):
+        atd = AccessTrackingDict({1: 1})
+        assert isinstance(atd, dict)
+        assert atd == {1: 1}
+        assert repr(atd) == repr({1: 1})
+        assert atd.pop_accessed_items() == ({}, set())
+
+    def test_read_and_write_access(self):
+        atd = AccessTrackingDict({"list": [], "int": 1, "other": 2})
+        atd["list"].append(1)
+        atd["new"] = 1
+        del atd["int"]
+        assert atd.get("missing") is None
+        assert atd.pop_accessed_items() == ({"list": [1], "new": 1}, {"int", "missing"})
+        assert atd.pop_accessed_items() == ({}, set())
+
+        atd |= {"a": 1}
+        atd.update(b=2)
+        atd.setdefault("c", 3)
+        atd.pop("other")
+        assert atd.pop_accessed_items() == ({"a": 1, "b": 2, "c": 3}, {"other"})
+
+    @pytest.mark.parametrize("method", ["values", "items", "copy"])
+    def test_access_all(self, method):
+        atd = AccessTrackingDict({1: 1, 2: 2})
+        getattr(atd, method)()
+        assert atd.pop_accessed_items() == ({1: 1, 2: 2}, set())
+
+    def test_clear(self):
+        atd = AccessTrackingDict({1: 1, 2: 2})
+        atd.clear()
+        assert atd.pop_accessed_items() == ({}, {1, 2})
+
+    def test_copy_and_pickle(self):
+        atd = AccessTrackingDict({1: [1]})
+        for copied in (copy.copy(atd), copy.deepcopy(atd), pickle.loads(pickle.dumps(atd))):
+            assert type(copied) is dict
+            assert copied == {1: [1]}
+        assert atd.pop_accessed_items() == ({}, set())
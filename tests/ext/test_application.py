@@ -1,5 +1,6 @@
 import asyncio
 import inspect
+import json
 import logging
 import os
 import platform
@@ -8,6 +9,7 @@ import sys
 import threading
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from queue import Queue
 from random import randrange
 from threading import Thread
@@ -15,19 +17,22 @@ from typing import Optional
 
 import pytest
 
-from telegram import Bot, Chat, Message, MessageEntity, User
+from telegram import Bot, Chat, Message, MessageEntity, Update, User
 from telegram.error import TelegramError
 from telegram.ext import (
     Application,
     ApplicationBuilder,
     ApplicationHandlerStop,
     BaseHandler,
+    BasePersistence,
     CallbackContext,
     CommandHandler,
     ContextTypes,
     Defaults,
+    DictPersistence,
     JobQueue,
     MessageHandler,
+    PersistenceInput,
     PicklePersistence,
     SimpleUpdateProcessor,
     TypeHandler,
@@ -170,3 +175,362 @@ class TestApplication:
         assert app.post_stop is post_stop
 
         # These should be done by the
+
+    @pytest.mark.parametrize("concurrent_updates", [1, 10])
+    async def test_update_batch_size(self, one_time_bot, monkeypatch, concurrent_updates):
+        app = (
+            ApplicationBuilder()
+            .bot(one_time_bot)
+            .update_batch_size(3)
+            .concurrent_updates(concurrent_updates)
+            .build()
+        )
+        batches = []
+        received = []
+        original_process_updates = app.process_updates
+
+        async def process_updates(updates):
+            batches.append(list(updates))
+            await original_process_updates(updates)
+
+        async def callback(update, context):
+            received.append(update)
+
+        monkeypatch.setattr(app, "process_updates", process_updates)
+        app.add_handler(TypeHandler(int, callback))
+
+        async with app:
+            for i in range(5):
+                await app.update_queue.put(i)
+            await app.start()
+            await asyncio.sleep(0.05)
+            await app.update_queue.put(5)
+            await asyncio.sleep(0.05)
+            await app.stop()
+
+        assert batches == [[0, 1, 2], [3, 4], [5]]
+        if concurrent_updates == 1:
+            assert received == [0, 1, 2, 3, 4, 5]
+        else:
+            assert sorted(received) == [0, 1, 2, 3, 4, 5]
+        assert app.update_queue.empty()
+
+    @pytest.mark.parametrize("update_batch_size", [-1, 0])
+    def test_update_batch_size_invalid(self, update_batch_size):
+        with pytest.raises(ValueError, match="must be a positive integer"):
+            ApplicationBuilder().update_batch_size(update_batch_size)
+
+    async def test_process_updates(self, app):
+        async def callback(update, context):
+            self.count += 1
+
+        app.add_handler(TypeHandler(int, callback))
+
+        async with app:
+            await app.process_updates([1, 2, 3])
+        assert self.count == 3
+
+    @pytest.mark.parametrize("concurrent_updates", [1, 10])
+    async def test_process_updates_error(self, one_time_bot, monkeypatch, concurrent_updates):
+        app = ApplicationBuilder().bot(one_time_bot).concurrent_updates(concurrent_updates).build()
+        processed = []
+        errors = []
+        original_process_update = app.process_update
+
+        async def process_update(update):
+            if update == 2:
+                raise RuntimeError("process_update failed")
+            processed.append(update)
+            await original_process_update(update)
+
+        async def error_handler(update, context):
+            errors.append((update, str(context.error)))
+
+        monkeypatch.setattr(app, "process_update", process_update)
+        app.add_error_handler(error_handler)
+
+        async with app:
+            await app.process_updates([1, 2, 3])
+        assert sorted(processed) == [1, 3]
+        assert errors == [(2, "process_update failed")]
+
+    async def test_bot_data_delta_persistence(self, one_time_bot, monkeypatch):
+        persistence = DictPersistence(bot_data_json='{"a": [1], "b": 2, "c": 3}')
+        app = ApplicationBuilder().bot(one_time_bot).persistence(persistence).build()
+        monkeypatch.setattr(
+            persistence,
+            "update_bot_data",
+            lambda data: pytest.fail("update_bot_data should not be called"),
+        )
+
+        async with app:
+            assert isinstance(app.bot_data, dict)
+            app.bot_data["a"].append(2)
+            app.bot_data["d"] = 4
+            del app.bot_data["b"]
+            await app.update_persistence()
+            assert persistence.bot_data == {"a": [1, 2], "c": 3, "d": 4}
+
+            # Changes are copied and only accessed entries are updated
+            app.bot_data["d"] = [5]
+            await app.update_persistence()
+            assert persistence.bot_data == {"a": [1, 2], "c": 3, "d": [5]}
+            assert persistence.bot_data["d"] is not app.bot_data["d"]
+
+    async def test_bot_data_delta_persistence_default(self):
+        persistence = DictPersistence(bot_data_json='{"a": 1, "b": 2, "c": 3}')
+        await BasePersistence.update_bot_data_delta(persistence, {"a": [4], "d": 5}, {"b", "e"})
+        assert persistence.bot_data == {"a": [4], "c": 3, "d": 5}
+
+    async def test_persistence_executor(self, one_time_bot, monkeypatch):
+        executor = ThreadPoolExecutor(max_workers=2)
+        persistence = DictPersistence(executor=executor)
+        app = ApplicationBuilder().bot(one_time_bot).persistence(persistence).build()
+        dumps = []
+
+        def run_in_executor(self, func, *args):
+            dumps.append(args)
+            return BasePersistence.run_in_executor(self, func, *args)
+
+        monkeypatch.setattr(DictPersistence, "run_in_executor", run_in_executor)
+
+        async with app:
+            for user_id in range(10):
+                app.user_data[user_id]["id"] = user_id
+            app.bot_data["key"] = "value"
+            app.mark_data_for_update_persistence(user_ids=list(range(10)))
+            await app.update_persistence()
+
+            # All changes of one run are serialized at once
+            assert len(dumps) == 2
+            assert persistence._user_data_json == json.dumps(
+                {user_id: {"id": user_id} for user_id in range(10)}
+            )
+            assert persistence._bot_data_json == '{"key": "value"}'
+
+            app.user_data[0]["id"] = "new"
+            app.user_data[1]["id"] = "new"
+            app.mark_data_for_update_persistence(user_ids=[0, 1])
+        # Shutting down updates the persistence one last time
+        assert len(dumps) == 3
+        assert json.loads(persistence._user_data_json)["1"] == {"id": "new"}
+        executor.shutdown()
+
+    async def test_persistence_run_in_executor_order(self):
+        executor = ThreadPoolExecutor(max_workers=4)
+        persistence = DictPersistence(executor=executor)
+        finished = []
+
+        def job(index):
+            time.sleep(0.05 - index / 100)
+            finished.append(index)
+            return index
+
+        results = await asyncio.gather(*(persistence.run_in_executor(job, i) for i in range(5)))
+        assert results == finished == list(range(5))
+        executor.shutdown()
+
+    async def test_user_chat_data_cache_size(self, one_time_bot):
+        persistence = DictPersistence(
+            user_data_json='{"1": {"stored": 1}, "2": {"stored": 2}}',
+            store_data=PersistenceInput(chat_data=False, bot_data=False, callback_data=False),
+        )
+        app = (
+            ApplicationBuilder()
+            .bot(one_time_bot)
+            .persistence(persistence)
+            .user_chat_data_cache_size(2)
+            .build()
+        )
+
+        async def callback(update, context):
+            context.user_data["count"] = context.user_data.get("count", 0) + 1
+
+        app.add_handler(TypeHandler(Update, callback))
+
+        def update_from(user_id):
+            return make_message_update("text", user=User(user_id, "user", False))
+
+        async with app:
+            assert app.user_data == {}
+
+            await app.process_update(update_from(1))
+            await app.process_update(update_from(2))
+            assert app.user_data == {1: {"stored": 1, "count": 1}, 2: {"stored": 2, "count": 1}}
+
+            # User 1 is the least recently used one, so their data is written & evicted
+            await app.process_update(update_from(3))
+            assert app.user_data == {2: {"stored": 2, "count": 1}, 3: {"count": 1}}
+            assert persistence.user_data[1] == {"stored": 1, "count": 1}
+
+            # ... and loaded again on demand
+            await app.process_update(update_from(1))
+            assert app.user_data == {3: {"count": 1}, 1: {"stored": 1, "count": 2}}
+            assert persistence.user_data[2] == {"stored": 2, "count": 1}
+
+            await app.update_persistence()
+            assert persistence.user_data == {
+                1: {"stored": 1, "count": 2},
+                2: {"stored": 2, "count": 1},
+                3: {"count": 1},
+            }
+
+    async def test_user_chat_data_cache_size_default_loading(self, one_time_bot):
+        class Persistence(DictPersistence):
+            load_user_data = BasePersistence.load_user_data
+            load_chat_data = BasePersistence.load_chat_data
+
+        persistence = Persistence(
+            user_data_json='{"1": {"stored": 1}}', chat_data_json='{"2": {"stored": 2}}'
+        )
+        app = (
+            ApplicationBuilder()
+            .bot(one_time_bot)
+            .persistence(persistence)
+            .user_chat_data_cache_size(2)
+            .build()
+        )
+        async with app:
+            assert app.user_data == {}
+            assert app.chat_data == {}
+            await app._load_user_chat_data(chat_id=2, user_id=1)
+            assert app.user_data == {1: {"stored": 1}}
+            assert app.chat_data == {2: {"stored": 2}}
+
+    @pytest.mark.parametrize("size", [-1, 0])
+    def test_user_chat_data_cache_size_invalid(self, size):
+        with pytest.raises(ValueError, match="`size` must be a positive integer"):
+            ApplicationBuilder().user_chat_data_cache_size(size)
+
+    @staticmethod
+    async def send_asgi_request(asgi_app, path="/", body=b"", headers=None, **scope):
+        # The body is split to test that it's received in several chunks
+        messages = [
+            {"type": "http.request", "body": body[:10], "more_body": True},
+            {"type": "http.request", "body": body[10:]},
+        ]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        if headers is None:
+            headers = {"Content-Type": "application/json"}
+        await asgi_app(
+            {
+                "type": "http",
+                "method": "POST",
+                "path": path,
+                "headers": [(name.encode(), value.encode()) for name, value in headers.items()],
+                **scope,
+            },
+            receive,
+            send,
+        )
+        assert sent[1] == {"type": "http.response.body", "body": b""}
+        return sent[0]["status"]
+
+    async def test_asgi_app(self, app):
+        received = []
+        calls = []
+
+        async def callback(update, context):
+            received.append(update)
+
+        async def post_callback(application):
+            calls.append(application.running)
+
+        app.add_handler(TypeHandler(Update, callback))
+        app.post_init = app.post_stop = app.post_shutdown = post_callback
+        asgi_app = app.asgi_app("webhook", secret_token="SecretToken")
+
+        events = asyncio.Queue()
+        sent = []
+
+        async def send(message):
+            sent.append(message["type"])
+
+        lifespan = asyncio.create_task(asgi_app({"type": "lifespan"}, events.get, send))
+        await events.put({"type": "lifespan.startup"})
+        await asyncio.sleep(0.05)
+        assert sent == ["lifespan.startup.complete"]
+        assert app.running
+
+        update = make_message_update("Webhook")
+        headers = {
+            "Content-Type": "application/json",
+            "X-Telegram-Bot-Api-Secret-Token": "SecretToken",
+        }
+        status = await self.send_asgi_request(
+            asgi_app, "/webhook", update.to_json().encode(), headers
+        )
+        assert status == 200
+        await asyncio.sleep(0.05)
+        assert [u.to_dict() for u in received] == [update.to_dict()]
+
+        await events.put({"type": "lifespan.shutdown"})
+        await asyncio.wait_for(lifespan, timeout=1)
+        assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+        assert not app.running
+        assert calls == [False, False, False]
+
+    @pytest.mark.parametrize(
+        ("path", "scope", "headers", "body", "status"),
+        [
+            ("/", {}, None, None, 200),
+            ("/mount/", {"root_path": "/mount"}, None, None, 200),
+            ("/other", {}, None, None, 404),
+            ("/", {"method": "GET"}, None, None, 405),
+            ("/", {}, {"Content-Type": "text/plain"}, None, 403),
+            ("/", {}, None, b"no json", 400),
+            ("/", {}, None, b'{"unknown": 1}', 400),
+        ],
+    )
+    async def test_asgi_app_requests(self, app, path, scope, headers, body, status):
+        asgi_app = app.asgi_app(handle_lifespan=False)
+        if body is None:
+            body = make_message_update("Webhook").to_json().encode()
+        assert await self.send_asgi_request(asgi_app, path, body, headers, **scope) == status
+        assert app.update_queue.qsize() == (1 if status == 200 else 0)
+
+    async def test_asgi_app_secret_token(self, app):
+        asgi_app = app.asgi_app(secret_token="SecretToken", handle_lifespan=False)
+        body = make_message_update("Webhook").to_json().encode()
+        for token, status in ((None, 403), ("NotTheSecretToken", 403), ("SecretToken", 200)):
+            headers = {"Content-Type": "application/json"}
+            if token:
+                headers["X-Telegram-Bot-Api-Secret-Token"] = token
+            assert await self.send_asgi_request(asgi_app, "/", body, headers) == status
+
+    async def test_asgi_app_startup_failure(self, app):
+        calls = []
+
+        async def post_init(application):
+            raise RuntimeError("startup failed")
+
+        async def post_shutdown(application):
+            calls.append("post_shutdown")
+
+        app.post_init = post_init
+        app.post_shutdown = post_shutdown
+        asgi_app = app.asgi_app()
+        sent = []
+
+        async def receive():
+            return {"type": "lifespan.startup"}
+
+        async def send(message):
+            sent.append(message)
+
+        await asgi_app({"type": "lifespan"}, receive, send)
+        assert sent[0]["type"] == "lifespan.startup.failed"
+        assert "startup failed" in sent[0]["message"]
+        # The application is shut down again
+        assert not app._initialized
+        assert calls == ["post_shutdown"]
+
+        with pytest.raises(ValueError, match="Unsupported ASGI scope type"):
+            await asgi_app({"type": "websocket"}, receive, send)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+
+import pytest
+
+from telegram.ext import BoundedUpdateQueue
+from tests.auxil.slots import mro_slots
+
+
+class TestBoundedUpdateQueue:
+    def test_slot_behaviour(self):
+        inst = BoundedUpdateQueue(2)
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_init(self):
+        queue = BoundedUpdateQueue(5)
+        assert queue.high_watermark == 5
+        assert queue.low_watermark == 2
+        assert queue.maxsize == 0
+
+        with pytest.raises(ValueError, match="`high_watermark` must be a positive integer"):
+            BoundedUpdateQueue(0)
+        for low_watermark in (-1, 5, 6):
+            with pytest.raises(ValueError, match="`low_watermark` must be between"):
+                BoundedUpdateQueue(5, low_watermark)
+
+    async def test_watermarks(self):
+        queue = BoundedUpdateQueue(high_watermark=3, low_watermark=1)
+        for i in range(2):
+            await queue.put(i)
+        assert not queue.congested
+
+        await queue.put(2)
+        assert queue.congested
+        # The queue itself is not bounded
+        queue.put_nowait(3)
+        assert queue.qsize() == 4
+
+        waiter = asyncio.create_task(queue.wait_for_capacity())
+        for _ in range(2):
+            await queue.get()
+        await asyncio.sleep(0)
+        assert queue.congested
+        assert not waiter.done()
+
+        assert await queue.get() == 2
+        assert not queue.congested
+        await asyncio.wait_for(waiter, timeout=1)
+        await queue.wait_for_capacity()
+
+    async def test_statistics(self):
+        queue = BoundedUpdateQueue(high_watermark=2, low_watermark=0)
+        for _ in range(2):
+            for i in range(3):
+                queue.put_nowait(i)
+            while not queue.empty():
+                queue.get_nowait()
+        queue.record_rejection()
+        assert queue.peak_size == 3
+        assert queue.congestion_count == 2
+        assert queue.rejected_updates == 1
+
+        queue.put_nowait(0)
+        queue.reset_statistics()
+        assert queue.peak_size == 1
+        assert queue.congestion_count == 0
+        assert queue.rejected_updates == 0
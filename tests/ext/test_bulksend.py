@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+
+import pytest
+
+from telegram.error import Forbidden, RetryAfter
+from telegram.ext import BulkSendResult
+
+
+async def async_range(stop):
+    for i in range(stop):
+        await asyncio.sleep(0)
+        yield i
+
+
+class TestSendBulk:
+    @pytest.mark.parametrize("max_concurrent_requests", [-1, 0])
+    async def test_max_concurrent_requests(self, bot, max_concurrent_requests):
+        with pytest.raises(ValueError, match="must be a positive integer"):
+            async for _ in bot.send_bulk(
+                [1], lambda _: asyncio.sleep(0), max_concurrent_requests=max_concurrent_requests
+            ):
+                pass
+
+    @pytest.mark.parametrize("async_iterable", [True, False])
+    async def test_results(self, bot, async_iterable):
+        async def callback(chat_id):
+            await asyncio.sleep(0.01 * (chat_id % 3))
+            if chat_id == 5:
+                raise Forbidden("blocked")
+            return chat_id * 2
+
+        chat_ids = async_range(20) if async_iterable else range(20)
+        results = [r async for r in bot.send_bulk(chat_ids, callback, max_concurrent_requests=4)]
+
+        assert sorted(r.chat_id for r in results) == list(range(20))
+        for result in results:
+            assert isinstance(result, BulkSendResult)
+            assert result.attempts == 1
+            if result.chat_id == 5:
+                assert isinstance(result.error, Forbidden)
+                assert result.result is None
+            else:
+                assert result.error is None
+                assert result.result == result.chat_id * 2
+
+    async def test_concurrency_is_bounded(self, bot):
+        running = 0
+        max_running = 0
+
+        async def callback(chat_id):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        async for _ in bot.send_bulk(range(30), callback, max_concurrent_requests=5):
+            pass
+        assert max_running == 5
+
+    async def test_retry_after(self, bot):
+        calls = {}
+
+        async def callback(chat_id):
+            calls[chat_id] = calls.get(chat_id, 0) + 1
+            if chat_id == 1 and calls[chat_id] < 3:
+                raise RetryAfter(0)
+            if chat_id == 2:
+                raise RetryAfter(0)
+            return True
+
+        results = {
+            r.chat_id: r async for r in bot.send_bulk([0, 1, 2], callback, max_retries=2)
+        }
+        assert results[0].attempts == 1
+        assert results[1].attempts == 3
+        assert results[1].result is True
+        assert results[2].attempts == 3
+        assert isinstance(results[2].error, RetryAfter)
+
+    async def test_lazy_consumption(self, bot):
+        consumed = []
+
+        def chat_ids():
+            for i in range(1000):
+                consumed.append(i)
+                yield i
+
+        async def callback(chat_id):
+            return chat_id
+
+        generator = bot.send_bulk(chat_ids(), callback, max_concurrent_requests=2)
+        async for _ in generator:
+            break
+        await generator.aclose()
+        assert len(consumed) < 10
+
+    async def test_iterator_error(self, bot):
+        def chat_ids():
+            yield 1
+            raise RuntimeError("iteration failed")
+
+        async def callback(chat_id):
+            return chat_id
+
+        with pytest.raises(RuntimeError, match="iteration failed"):
+            async for _ in bot.send_bulk(chat_ids(), callback):
+                pass
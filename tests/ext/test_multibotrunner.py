@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+from http import HTTPStatus
+from random import randrange
+
+import pytest
+
+from telegram import Bot, Update
+from telegram.ext import MultiBotRunner, TypeHandler
+from telegram.request import HTTPXRequest
+from tests.auxil.build_messages import make_message_update
+from tests.auxil.networking import send_webhook_message
+from tests.auxil.slots import mro_slots
+
+TOKENS = ("1234:first", "5678:second")
+
+
+class FakeAPI:
+    def __init__(self):
+        self.requests = []
+
+    async def __call__(self, bot, endpoint, data, **kwargs):
+        self.requests.append((bot.token, endpoint, data))
+        if endpoint == "getMe":
+            bot_id = int(bot.token.split(":")[0])
+            return {"id": bot_id, "is_bot": True, "first_name": "bot", "username": "bot"}
+        if endpoint == "getUpdates":
+            # Each bot receives one update, afterwards there are no more updates
+            if [request[:2] for request in self.requests].count((bot.token, endpoint)) == 1:
+                return [make_message_update(bot.token).to_dict()]
+            await asyncio.sleep(0.05)
+            return []
+        return True
+
+
+class TestMultiBotRunner:
+    @pytest.fixture()
+    def runner(self):
+        runner = MultiBotRunner()
+        for token in TOKENS:
+            runner.add_application(runner.builder().token(token).build())
+        return runner
+
+    @pytest.fixture()
+    def api(self, monkeypatch):
+        api = FakeAPI()
+
+        # A FakeAPI instance is not a function, so it would not be bound to the bot
+        async def _do_post(self, endpoint, data, **kwargs):
+            return await api(self, endpoint, data, **kwargs)
+
+        monkeypatch.setattr(Bot, "_do_post", _do_post)
+        return api
+
+    def test_slot_behaviour(self):
+        inst = MultiBotRunner()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_repr(self, runner):
+        assert repr(MultiBotRunner()) == "MultiBotRunner[applications=0]"
+        assert repr(runner) == "MultiBotRunner[applications=2]"
+
+    def test_request(self, runner):
+        assert isinstance(runner.request, HTTPXRequest)
+        assert all(app.bot.request is runner.request for app in runner.applications)
+        request = HTTPXRequest()
+        assert MultiBotRunner(request).request is request
+
+    def test_add_application(self, runner):
+        first, second = runner.applications
+        with pytest.raises(ValueError, match="already added"):
+            runner.add_application(first, url_path="other")
+
+        application = runner.builder().token("1234:third").build()
+        with pytest.raises(ValueError, match="already uses the url path '1234'"):
+            runner.add_application(application)
+        with pytest.raises(ValueError, match="already uses the url path '5678'"):
+            runner.add_application(application, url_path="/5678/")
+        runner.add_application(application, url_path="/third")
+        assert runner.applications == (first, second, application)
+
+    def test_no_applications(self):
+        with pytest.raises(RuntimeError, match="No applications were added"):
+            MultiBotRunner().run_polling(close_loop=False, stop_signals=None)
+
+    def test_run_polling_no_updater(self, runner):
+        runner.add_application(runner.builder().token("9:updater").updater(None).build())
+        with pytest.raises(RuntimeError, match="must have an `Updater`"):
+            runner.run_polling(close_loop=False, stop_signals=None)
+
+    def test_run_polling(self, runner, api):
+        events = []
+        received = {}
+
+        async def callback(update, context):
+            received[context.bot.token] = update.message.text
+            if len(received) == len(TOKENS):
+                context.application.stop_running()
+
+        def track(event):
+            async def callback(application):
+                events.append((event, application.bot.token))
+
+            return callback
+
+        for application in runner.applications:
+            application.add_handler(TypeHandler(Update, callback))
+            application.post_init = track("post_init")
+            application.post_stop = track("post_stop")
+            application.post_shutdown = track("post_shutdown")
+
+        runner.run_polling(close_loop=False, stop_signals=None)
+
+        assert received == {token: token for token in TOKENS}
+        assert [event for event, _ in events] == [
+            "post_init",
+            "post_init",
+            "post_stop",
+            "post_stop",
+            "post_shutdown",
+            "post_shutdown",
+        ]
+        assert sorted(token for _, token in events) == sorted(TOKENS * 3)
+        assert all(not app.running for app in runner.applications)
+        assert all(not app.updater.running for app in runner.applications)
+
+    def test_run_webhook(self, runner, api):
+        first = runner.applications[0]
+        third = runner.builder().token("9:third").updater(None).build()
+        runner.add_application(third, url_path="bot/third", secret_token="secret")
+        port = randrange(1024, 49152)  # Select random port
+        responses = {}
+        received = {}
+        tasks = []
+
+        async def callback(update, context):
+            received[context.bot.token] = update.message.text
+
+        async def send_requests():
+            while not all(app.running for app in runner.applications):
+                await asyncio.sleep(0.01)
+            for url_path, secret_token in (
+                ("1234", None),
+                ("5678/", None),
+                ("bot/third", "secret"),
+                ("bot/third", "wrong"),
+                ("9", "secret"),
+            ):
+                response = await send_webhook_message(
+                    "127.0.0.1",
+                    port,
+                    make_message_update(url_path).to_json(),
+                    url_path,
+                    secret_token=secret_token,
+                )
+                responses[(url_path, secret_token)] = response.status_code
+            while len(received) < len(runner.applications):
+                await asyncio.sleep(0.01)
+            first.stop_running()
+
+        async def post_init(application):
+            tasks.append(asyncio.create_task(send_requests()))
+
+        for application in runner.applications:
+            application.add_handler(TypeHandler(Update, callback))
+        first.post_init = post_init
+        runner.run_webhook(
+            "https://example.com/",
+            port=port,
+            max_connections=10,
+            close_loop=False,
+            stop_signals=None,
+        )
+
+        assert responses == {
+            ("1234", None): HTTPStatus.OK,
+            ("5678/", None): HTTPStatus.OK,
+            ("bot/third", "secret"): HTTPStatus.OK,
+            ("bot/third", "wrong"): HTTPStatus.FORBIDDEN,
+            ("9", "secret"): HTTPStatus.NOT_FOUND,
+        }
+        assert received == {"1234:first": "1234", "5678:second": "5678/", "9:third": "bot/third"}
+        webhooks = {
+            token: (data["url"], data.get("secret_token"), data["max_connections"])
+            for token, endpoint, data in api.requests
+            if endpoint == "setWebhook"
+        }
+        assert webhooks == {
+            "1234:first": ("https://example.com/1234", None, 10),
+            "5678:second": ("https://example.com/5678", None, 10),
+            "9:third": ("https://example.com/bot/third", "secret", 10),
+        }
+        # The updaters are not used for webhooks
+        assert not any(endpoint == "getUpdates" for _, endpoint, _ in api.requests)
+        assert all(not app.running for app in runner.applications)
@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import multiprocessing
+import os
+import queue
+import signal
+import time
+from random import randrange
+
+import httpx
+import pytest
+
+from telegram import Bot, Chat, Poll, PollAnswer, Update, User
+from telegram.ext import (
+    ApplicationBuilder,
+    DictPersistence,
+    JobQueue,
+    MultiProcessRunner,
+    TypeHandler,
+)
+from telegram.ext._multiprocessrunner import _get_shard, _serve_worker
+from tests.auxil.build_messages import make_message_update
+from tests.auxil.envvars import TEST_WITH_OPT_DEPS
+from tests.auxil.networking import send_webhook_message
+from tests.auxil.slots import mro_slots
+
+TOKEN = "1234:token"
+
+
+def make_update(chat_id: int) -> Update:
+    return make_message_update("text", chat=Chat(chat_id, Chat.PRIVATE))
+
+
+def factory(index):
+    raise RuntimeError("Not supposed to be called")
+
+
+class FakeAPI:
+    """Answers the requests of the bots. The first call of getUpdates returns ``updates``,
+    afterwards the main process is asked to stop.
+    """
+
+    def __init__(self, updates=(), stop=True):
+        self.updates = list(updates)
+        self.stop = stop
+        self.get_updates_calls = 0
+
+    async def __call__(self, bot, endpoint, data, **kwargs):
+        if endpoint == "getMe":
+            return {"id": 1234, "is_bot": True, "first_name": "bot", "username": "bot"}
+        if endpoint == "getUpdates":
+            self.get_updates_calls += 1
+            if self.get_updates_calls == 1:
+                return [update.to_dict() for update in self.updates]
+            if self.get_updates_calls == 2 and self.stop:
+                os.kill(os.getpid(), signal.SIGUSR1)
+            await asyncio.sleep(0.05)
+            return []
+        return True
+
+
+def patch_api(monkeypatch, api):
+    # A FakeAPI instance is not a function, so it would not be bound to the bot
+    async def _do_post(self, endpoint, data, **kwargs):
+        return await api(self, endpoint, data, **kwargs)
+
+    monkeypatch.setattr(Bot, "_do_post", _do_post)
+
+
+def build_factory(results, fail_worker=None):
+    # Only works with the "fork" start method, as closures can't be pickled
+    def build(index):
+        if index is not None and index == fail_worker:
+            raise RuntimeError("Worker failed")
+        application = ApplicationBuilder().token(TOKEN).job_queue(None).build()
+
+        async def callback(update, context):
+            results.put((index, update.effective_chat.id))
+
+        application.add_handler(TypeHandler(Update, callback))
+        return application
+
+    return build
+
+
+@pytest.fixture()
+def fork_context():
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("The tests of the runner require the 'fork' start method")
+    return multiprocessing.get_context("fork")
+
+
+@pytest.fixture()
+def runner_loop():
+    # The runner closes the event loop when it's done
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    asyncio.set_event_loop(None)
+
+
+def drain(results, count):
+    return sorted(results.get(timeout=5) for _ in range(count))
+
+
+class TestMultiProcessRunner:
+    def test_slot_behaviour(self):
+        inst = MultiProcessRunner(factory, workers=2)
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    @pytest.mark.parametrize("workers", [-1, 0])
+    def test_init(self, workers):
+        with pytest.raises(ValueError, match="`workers` must be a positive integer"):
+            MultiProcessRunner(factory, workers=workers)
+
+    def test_default_workers(self):
+        assert MultiProcessRunner(factory).workers == (os.cpu_count() or 1)
+        assert MultiProcessRunner(factory, workers=3).workers == 3
+
+    def test_repr(self):
+        assert repr(MultiProcessRunner(factory, workers=3)) == "MultiProcessRunner[workers=3]"
+
+    def test_get_shard(self):
+        assert _get_shard(make_update(5), 4) == 1
+        assert _get_shard(make_update(-5), 4) == 3
+        # Updates without chat are sharded by user and, if that's not available, by update id
+        poll_answer = PollAnswer("id", [0], user=User(6, "user", False))
+        assert _get_shard(Update(1, poll_answer=poll_answer), 4) == 2
+        poll = Poll("id", "question", [], 0, False, False, Poll.REGULAR, False)
+        assert _get_shard(Update(7, poll=poll), 4) == 3
+        assert _get_shard("string", 4) == 0
+
+    def test_forward(self):
+        queues = [queue.Queue(), queue.Queue()]
+        MultiProcessRunner._forward(make_update(3), queues)
+        MultiProcessRunner._forward("string", queues)
+        assert queues[0].empty()
+        assert queues[1].get_nowait() == make_update(3).to_dict()
+        assert queues[1].empty()
+
+    async def test_serve_worker(self, bot):
+        received = []
+        indices = []
+
+        async def callback(update, context):
+            received.append(update)
+
+        def build(index):
+            indices.append(index)
+            application = ApplicationBuilder().bot(bot).job_queue(None).build()
+            application.add_handler(TypeHandler(Update, callback))
+            return application
+
+        updates = [make_update(1), make_update(3)]
+        worker_queue = queue.Queue()
+        for update in updates:
+            worker_queue.put(update.to_dict())
+        worker_queue.put(None)
+
+        await _serve_worker(build, 1, worker_queue)
+        assert indices == [1]
+        assert [update.effective_chat.id for update in received] == [1, 3]
+        assert all(update.get_bot() is bot for update in received)
+
+    async def test_serve_worker_persistence(self, bot):
+        persistences = {}
+
+        async def callback(update, context):
+            context.chat_data["count"] = context.chat_data.get("count", 0) + 1
+
+        def build(index):
+            # Each worker uses its own persistence
+            persistences[index] = DictPersistence()
+            builder = ApplicationBuilder().bot(bot).job_queue(None)
+            application = builder.persistence(persistences[index]).build()
+            application.add_handler(TypeHandler(Update, callback))
+            return application
+
+        for index, chat_ids in enumerate([[2, 2], [1, 3, 1]]):
+            worker_queue = queue.Queue()
+            for chat_id in chat_ids:
+                worker_queue.put(make_update(chat_id).to_dict())
+            worker_queue.put(None)
+            await _serve_worker(build, index, worker_queue)
+
+        assert persistences[0].chat_data == {2: {"count": 2}}
+        assert persistences[1].chat_data == {1: {"count": 2}, 3: {"count": 1}}
+
+    @pytest.mark.skipif(not TEST_WITH_OPT_DEPS, reason="Requires the JobQueue dependencies")
+    async def test_serve_worker_job_queue(self, bot):
+        runs = []
+
+        class SlowQueue:
+            def get(self):
+                # Gives the job time to run before the worker is stopped
+                time.sleep(0.1)
+                return None
+
+        async def job(context):
+            runs.append(context.job.data)
+
+        def build(index):
+            async def post_init(application):
+                application.job_queue.run_once(job, 0, data=index)
+
+            builder = ApplicationBuilder().bot(bot).job_queue(JobQueue()).post_init(post_init)
+            return builder.build()
+
+        await _serve_worker(build, 0, SlowQueue())
+        assert runs == [0]
+
+        with pytest.raises(ValueError, match=r"Only the application of worker 0.*job_queue"):
+            await _serve_worker(build, 1, SlowQueue())
+        assert runs == [0]
+
+    def test_run_polling(self, fork_context, runner_loop, monkeypatch):
+        updates = [make_update(chat_id) for chat_id in range(4)]
+        patch_api(monkeypatch, FakeAPI(updates))
+        results = fork_context.Queue()
+
+        runner = MultiProcessRunner(build_factory(results), workers=2, mp_context=fork_context)
+        runner.run_polling(stop_signals=[signal.SIGUSR1])
+
+        # The updates of each chat are processed by the worker that the chat is assigned to
+        assert drain(results, 4) == [(0, 0), (0, 2), (1, 1), (1, 3)]
+        assert runner_loop.is_closed()
+
+    def test_run_webhook(self, fork_context, runner_loop, monkeypatch):
+        patch_api(monkeypatch, FakeAPI())
+        results = fork_context.Queue()
+        port = randrange(1024, 49152)  # Select random port
+
+        async def send_updates():
+            for chat_id in range(3):
+                while True:
+                    try:
+                        await send_webhook_message(
+                            "127.0.0.1", port, make_update(chat_id).to_json(), "TOKEN"
+                        )
+                        break
+                    except httpx.ConnectError:
+                        # The server is not up yet
+                        await asyncio.sleep(0.01)
+            os.kill(os.getpid(), signal.SIGUSR1)
+
+        task = runner_loop.create_task(send_updates())
+        runner = MultiProcessRunner(build_factory(results), workers=2, mp_context=fork_context)
+        runner.run_webhook(
+            stop_signals=[signal.SIGUSR1],
+            listen="127.0.0.1",
+            port=port,
+            url_path="TOKEN",
+            webhook_url="https://example.com/TOKEN",
+            server="asyncio",
+        )
+
+        assert task.done()
+        assert drain(results, 3) == [(0, 0), (0, 2), (1, 1)]
+
+    def test_worker_exits_unexpectedly(self, fork_context, runner_loop, monkeypatch):
+        patch_api(monkeypatch, FakeAPI(stop=False))
+        results = fork_context.Queue()
+
+        runner = MultiProcessRunner(
+            build_factory(results, fail_worker=1), workers=2, mp_context=fork_context
+        )
+        with pytest.raises(RuntimeError, match="Worker process 1 exited unexpectedly"):
+            runner.run_polling(stop_signals=[signal.SIGUSR1])
+        assert runner_loop.is_closed()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import time
+
+import pytest
+
+from telegram.error import RetryAfter
+from telegram.ext import PriorityRateLimiter
+from tests.auxil.slots import mro_slots
+
+
+async def process(limiter, callback, chat_id=None, priority=None):
+    return await limiter.process_request(
+        callback=callback,
+        args=(),
+        kwargs={},
+        endpoint="sendMessage",
+        data={} if chat_id is None else {"chat_id": chat_id},
+        rate_limit_args=priority,
+    )
+
+
+class TestPriorityRateLimiter:
+    def test_slot_behaviour(self):
+        inst = PriorityRateLimiter()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    async def test_priority(self):
+        limiter = PriorityRateLimiter(
+            overall_max_rate=1, overall_time_period=0.05, group_max_rate=0, chat_max_rate=0
+        )
+        order = []
+
+        def callback(name):
+            async def inner():
+                order.append(name)
+
+            return inner
+
+        # uses up the only token
+        await process(limiter, callback("first"), chat_id=1)
+        tasks = [
+            asyncio.create_task(
+                process(
+                    limiter,
+                    callback(f"bulk-{i}"),
+                    chat_id=1,
+                    priority=PriorityRateLimiter.PRIORITY_BULK,
+                )
+            )
+            for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        tasks.append(
+            asyncio.create_task(
+                process(
+                    limiter,
+                    callback("interactive"),
+                    chat_id=2,
+                    priority=PriorityRateLimiter.PRIORITY_INTERACTIVE,
+                )
+            )
+        )
+        await asyncio.gather(*tasks)
+        assert order == ["first", "interactive", "bulk-0", "bulk-1", "bulk-2"]
+        await limiter.shutdown()
+
+    async def test_shutdown_with_waiting_requests(self):
+        limiter = PriorityRateLimiter(
+            overall_max_rate=1, overall_time_period=10, group_max_rate=0, chat_max_rate=0
+        )
+
+        async def callback():
+            return True
+
+        # uses up the only token
+        assert await process(limiter, callback, chat_id=1) is True
+        tasks = [asyncio.create_task(process(limiter, callback, chat_id=1)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        assert not any(task.done() for task in tasks)
+
+        await asyncio.wait_for(limiter.shutdown(), 1)
+        results = await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), 1)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert "shut down" in str(results[0])
+
+    async def test_requests_without_chat_are_not_limited(self):
+        limiter = PriorityRateLimiter(overall_max_rate=1, overall_time_period=10)
+
+        async def callback():
+            return True
+
+        start = time.perf_counter()
+        for _ in range(5):
+            assert await process(limiter, callback) is True
+        assert time.perf_counter() - start < 0.5
+
+    @pytest.mark.parametrize("chat_id", [-1, "@channel", 1])
+    async def test_chat_limits(self, chat_id):
+        limiter = PriorityRateLimiter(
+            overall_max_rate=0,
+            group_max_rate=1,
+            group_time_period=0.3,
+            chat_max_rate=1,
+            chat_time_period=0.3,
+        )
+
+        async def callback():
+            return True
+
+        start = time.perf_counter()
+        await process(limiter, callback, chat_id=chat_id)
+        await process(limiter, callback, chat_id=2)
+        assert time.perf_counter() - start < 0.2
+        await process(limiter, callback, chat_id=chat_id)
+        assert time.perf_counter() - start >= 0.25
+
+    async def test_retry_after_pauses_only_chat(self):
+        limiter = PriorityRateLimiter(overall_max_rate=0, chat_max_rate=10, max_retries=1)
+        calls = 0
+
+        async def flood():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RetryAfter(1)
+            return "flood"
+
+        async def other():
+            return time.perf_counter()
+
+        start = time.perf_counter()
+        task = asyncio.create_task(process(limiter, flood, chat_id=1))
+        await asyncio.sleep(0.05)
+        assert await process(limiter, other, chat_id=2) - start < 0.5
+        assert await task == "flood"
+        assert time.perf_counter() - start >= 1
+        assert calls == 2
+
+    async def test_retry_after_max_retries(self):
+        limiter = PriorityRateLimiter(max_retries=0)
+
+        async def flood():
+            raise RetryAfter(1)
+
+        with pytest.raises(RetryAfter):
+            await process(limiter, flood, chat_id=1)
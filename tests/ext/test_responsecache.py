@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import datetime
+
+import pytest
+
+from telegram import (
+    Bot,
+    Chat,
+    ChatMemberLeft,
+    ChatMemberMember,
+    ChatMemberUpdated,
+    Message,
+    Update,
+    User,
+)
+from telegram.error import BadRequest
+from telegram.ext import ApplicationBuilder, ResponseCache
+from tests.auxil.pytest_classes import make_bot
+from tests.auxil.slots import mro_slots
+
+USER = User(2, "user", False)
+
+
+class FakeAPI:
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.requests = []
+
+    async def __call__(self, data):
+        self.requests.append(data)
+        await asyncio.sleep(self.delay)
+        return {"request": len(self.requests)}
+
+
+def member_update(chat_id):
+    return Update(
+        1,
+        chat_member=ChatMemberUpdated(
+            Chat(chat_id, Chat.GROUP),
+            USER,
+            datetime.datetime.utcnow(),
+            ChatMemberMember(USER),
+            ChatMemberLeft(USER),
+        ),
+    )
+
+
+class TestResponseCache:
+    def test_slot_behaviour(self):
+        inst = ResponseCache()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    @pytest.mark.parametrize("maxsize", [-1, 0])
+    def test_init(self, maxsize):
+        with pytest.raises(ValueError, match="`maxsize` must be a positive integer"):
+            ResponseCache(maxsize=maxsize)
+
+    def test_ttls(self):
+        cache = ResponseCache(ttls={"getChat": 5, "getMyCommands": 10})
+        assert cache.ttls["getChat"] == 5
+        assert cache.ttls["getMyCommands"] == 10
+        assert cache.ttls["getChatMember"] == 30
+
+    async def test_cached(self):
+        cache = ResponseCache()
+        api = FakeAPI()
+        data = {"chat_id": 1, "user_id": 2}
+        assert await cache.process_request("getChatMember", data, api) == {"request": 1}
+        same_data = {"chat_id": "1", "user_id": 2}
+        assert await cache.process_request("getChatMember", same_data, api) == {"request": 1}
+        other_data = {"chat_id": 1, "user_id": 3}
+        assert await cache.process_request("getChatMember", other_data, api) == {"request": 2}
+        assert await cache.process_request("getChat", {"chat_id": 1}, api) == {"request": 3}
+        assert await cache.process_request("sendMessage", data, api) == {"request": 4}
+        assert await cache.process_request("sendMessage", data, api) == {"request": 5}
+
+    async def test_expiry(self):
+        cache = ResponseCache(ttls={"getChat": 0.05, "getMe": 0})
+        api = FakeAPI()
+        await cache.process_request("getChat", {"chat_id": 1}, api)
+        await cache.process_request("getChat", {"chat_id": 1}, api)
+        await asyncio.sleep(0.1)
+        await cache.process_request("getChat", {"chat_id": 1}, api)
+        assert len(api.requests) == 2
+
+        await cache.process_request("getMe", {}, api)
+        await cache.process_request("getMe", {}, api)
+        assert len(api.requests) == 4
+
+    async def test_coalescing(self):
+        cache = ResponseCache()
+        api = FakeAPI(delay=0.05)
+        data = {"chat_id": 1}
+        results = await asyncio.gather(
+            *(cache.process_request("getChatAdministrators", data, api) for _ in range(5))
+        )
+        assert results == [{"request": 1}] * 5
+        assert len(api.requests) == 1
+
+    async def test_results_are_copied(self):
+        cache = ResponseCache()
+        api = FakeAPI(delay=0.05)
+        data = {"chat_id": 1}
+        results = await asyncio.gather(
+            *(cache.process_request("getChat", data, api) for _ in range(2))
+        )
+        results.append(await cache.process_request("getChat", data, api))
+        assert len({id(result) for result in results}) == 3
+        for result in results:
+            result["request"] = "modified"
+        assert await cache.process_request("getChat", data, api) == {"request": 1}
+
+    async def test_coalescing_cancel_and_error(self):
+        cache = ResponseCache()
+        api = FakeAPI(delay=0.05)
+        task = asyncio.create_task(cache.process_request("getChat", {"chat_id": 1}, api))
+        other_task = asyncio.create_task(cache.process_request("getChat", {"chat_id": 1}, api))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        assert await other_task == {"request": 1}
+
+        async def fail(data):
+            await asyncio.sleep(0.01)
+            raise BadRequest("Chat not found")
+
+        results = await asyncio.gather(
+            *(cache.process_request("getChat", {"chat_id": 2}, fail) for _ in range(2)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, BadRequest) for result in results)
+        # Errors are not cached
+        assert await cache.process_request("getChat", {"chat_id": 2}, api) == {"request": 2}
+
+    async def test_maxsize(self):
+        cache = ResponseCache(maxsize=2)
+        api = FakeAPI()
+        for chat_id in (1, 2, 1, 3, 1, 2):
+            await cache.process_request("getChat", {"chat_id": chat_id}, api)
+        assert [data["chat_id"] for data in api.requests] == [1, 2, 3, 2]
+
+        cache.clear()
+        await cache.process_request("getChat", {"chat_id": 1}, api)
+        assert len(api.requests) == 5
+
+    @pytest.mark.parametrize(
+        "update",
+        [
+            member_update(1),
+            Update(
+                1,
+                message=Message(
+                    1, datetime.datetime.utcnow(), Chat(1, Chat.GROUP), new_chat_members=[USER]
+                ),
+            ),
+            Update(
+                1,
+                message=Message(
+                    1, datetime.datetime.utcnow(), Chat(1, Chat.GROUP), left_chat_member=USER
+                ),
+            ),
+        ],
+    )
+    async def test_process_update(self, update):
+        cache = ResponseCache()
+        api = FakeAPI()
+        requests = [
+            ("getChat", {"chat_id": 1}),
+            ("getChatAdministrators", {"chat_id": 1}),
+            ("getChatMemberCount", {"chat_id": 1}),
+            ("getChatMember", {"chat_id": 1, "user_id": 2}),
+            ("getChatMember", {"chat_id": 1, "user_id": 3}),
+            ("getChat", {"chat_id": 4}),
+        ]
+        for endpoint, data in requests:
+            await cache.process_request(endpoint, data, api)
+
+        cache.process_update(update)
+        cache.process_update("not an update")
+        for endpoint, data in requests:
+            await cache.process_request(endpoint, data, api)
+        assert len(api.requests) == 10
+
+    async def test_drop_running_request(self):
+        cache = ResponseCache()
+        api = FakeAPI(delay=0.05)
+        task = asyncio.create_task(cache.process_request("getChat", {"chat_id": 1}, api))
+        await asyncio.sleep(0.01)
+        cache.drop_chat(1)
+        assert await task == {"request": 1}
+        # The result of the request may be outdated and is hence not cached
+        assert await cache.process_request("getChat", {"chat_id": 1}, api) == {"request": 2}
+
+    async def test_own_requests(self):
+        cache = ResponseCache()
+        api = FakeAPI()
+        await cache.process_request("getChatMember", {"chat_id": 1, "user_id": 2}, api)
+        await cache.process_request("getChat", {"chat_id": 1}, api)
+        await cache.process_request("banChatMember", {"chat_id": 1, "user_id": 2}, api)
+        await cache.process_request("getChatMember", {"chat_id": 1, "user_id": 2}, api)
+        await cache.process_request("setChatTitle", {"chat_id": 1, "title": "title"}, api)
+        await cache.process_request("getChat", {"chat_id": 1}, api)
+        assert [data.get("title") for data in api.requests] == [None] * 4 + ["title", None]
+        assert len(api.requests) == 6
+
+    async def test_application(self, bot_info, monkeypatch):
+        requests = []
+
+        async def do_post(_, endpoint, data, **kwargs):
+            requests.append(endpoint)
+            if endpoint == "getChatMember":
+                return ChatMemberMember(USER).to_dict()
+            return True
+
+        monkeypatch.setattr(Bot, "_do_post", do_post)
+        cache = ResponseCache()
+        bot = make_bot(bot_info, response_cache=cache)
+        app = ApplicationBuilder().bot(bot).build()
+        assert app.bot.response_cache is cache
+
+        async with app:
+            for _ in range(2):
+                assert (await app.bot.get_chat_member(1, 2)).user == USER
+            await app.process_update(member_update(1))
+            await app.bot.get_chat_member(1, 2)
+        assert requests.count("getChatMember") == 2
+
+    async def test_get_file(self, bot_info, monkeypatch):
+        requests = []
+
+        async def do_post(_, endpoint, data, **kwargs):
+            requests.append(endpoint)
+            return {"file_id": "id", "file_unique_id": "unique_id", "file_path": "photos/1.jpg"}
+
+        monkeypatch.setattr(Bot, "_do_post", do_post)
+        bot = make_bot(bot_info, response_cache=ResponseCache())
+        async with bot:
+            first = await bot.get_file("id")
+            second = await bot.get_file("id")
+        # get_file modifies the result, which must not affect the cached result
+        assert first.file_path == second.file_path == f"{bot.base_file_url}/photos/1.jpg"
+        assert requests == ["getFile"]
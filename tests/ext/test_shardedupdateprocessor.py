@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import datetime
+
+import pytest
+
+from telegram import Chat, Message, Update
+from telegram.ext import ShardedUpdateProcessor
+from tests.auxil.slots import mro_slots
+
+
+def make_update(update_id: int, chat_id: int) -> Update:
+    return Update(
+        update_id,
+        message=Message(
+            update_id, datetime.datetime.utcnow(), chat=Chat(chat_id, Chat.PRIVATE), text="text"
+        ),
+    )
+
+
+class TestShardedUpdateProcessor:
+    def test_slot_behaviour(self):
+        inst = ShardedUpdateProcessor(1)
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    @pytest.mark.parametrize("shards", [-1, 0])
+    def test_init(self, shards):
+        with pytest.raises(ValueError, match="`shards` must be a positive integer"):
+            ShardedUpdateProcessor(1, shards=shards)
+
+    def test_default_shards(self):
+        assert ShardedUpdateProcessor(3).shards == 3
+        assert ShardedUpdateProcessor(3, shards=7).shards == 7
+
+    async def test_same_chat_is_ordered(self):
+        processor = ShardedUpdateProcessor(16)
+        results = []
+
+        async def callback(number: int, delay: float):
+            await asyncio.sleep(delay)
+            results.append(number)
+
+        # The first update takes the longest, so without the ordering guarantee it would
+        # finish last
+        await asyncio.gather(
+            *(
+                processor.process_update(make_update(i, 1), callback(i, 0.3 - i * 0.1))
+                for i in range(3)
+            )
+        )
+        assert results == [0, 1, 2]
+
+    async def test_different_chats_are_concurrent(self):
+        processor = ShardedUpdateProcessor(16)
+        results = []
+
+        async def callback(chat_id: int, delay: float):
+            await asyncio.sleep(delay)
+            results.append(chat_id)
+
+        await asyncio.gather(
+            processor.process_update(make_update(1, 1), callback(1, 0.3)),
+            processor.process_update(make_update(2, 2), callback(2, 0.1)),
+        )
+        assert results == [2, 1]
+
+    async def test_waiting_does_not_block_slot(self):
+        """While an update waits for its lane, updates from other lanes may use the slot."""
+        processor = ShardedUpdateProcessor(max_concurrent_updates=2, shards=2)
+        results = []
+        event = asyncio.Event()
+
+        async def blocking():
+            await event.wait()
+            results.append("blocking")
+
+        async def callback(name: str):
+            results.append(name)
+
+        # chat ids 0 and 2 are in the same lane, chat id 1 is in the other lane
+        tasks = [
+            asyncio.create_task(processor.process_update(make_update(1, 0), blocking())),
+            asyncio.create_task(processor.process_update(make_update(2, 2), callback("same"))),
+        ]
+        await asyncio.sleep(0.05)
+        await processor.process_update(make_update(3, 1), callback("other"))
+        assert results == ["other"]
+
+        event.set()
+        await asyncio.gather(*tasks)
+        assert results == ["other", "blocking", "same"]
+
+    async def test_non_update_objects(self):
+        processor = ShardedUpdateProcessor(1)
+        test_flag = False
+
+        async def coroutine():
+            nonlocal test_flag
+            test_flag = True
+
+        await processor.process_update("string update", coroutine())
+        assert test_flag
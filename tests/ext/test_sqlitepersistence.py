@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from telegram import Chat, User
+from telegram.ext import ApplicationBuilder, ContextTypes, SQLitePersistence
+from tests.auxil.slots import mro_slots
+
+
+class CustomBotData:
+    def __init__(self, value=None):
+        self.value = value
+
+
+class UnpicklingThread:
+    """Records the thread it was unpickled in."""
+
+    def __init__(self):
+        self.thread = None
+
+    def __getstate__(self):
+        return {"thread": None}
+
+    def __setstate__(self, state):
+        self.thread = threading.current_thread().name
+
+
+@pytest.fixture()
+def database(tmp_path):
+    return tmp_path / "persistence.sqlite"
+
+
+@pytest.fixture()
+async def persistence(database, bot):
+    persistence = SQLitePersistence(database)
+    persistence.set_bot(bot)
+    yield persistence
+    await persistence.flush()
+
+
+def reopen(database, bot, **kwargs):
+    persistence = SQLitePersistence(database, **kwargs)
+    persistence.set_bot(bot)
+    return persistence
+
+
+class TestSQLitePersistence:
+    async def test_slot_behaviour(self, persistence):
+        for attr in persistence.__slots__:
+            assert getattr(persistence, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(persistence)) == len(set(mro_slots(persistence))), "duplicate slot"
+
+    async def test_no_data(self, persistence):
+        assert await persistence.get_user_data() == {}
+        assert await persistence.get_chat_data() == {}
+        assert await persistence.get_bot_data() == {}
+        assert await persistence.get_callback_data() is None
+        assert await persistence.get_conversations("name") == {}
+
+    async def test_round_trip(self, persistence, database, bot):
+        user = User(1, "user", False)
+        # The bot of the persistence is restored on loading
+        user.set_bot(bot)
+        await asyncio.gather(
+            persistence.update_user_data(1, {"user": user}),
+            persistence.update_user_data(2, {"to": "be deleted"}),
+            persistence.update_chat_data(-1, {"chat": Chat(-1, Chat.GROUP)}),
+            persistence.update_bot_data({"key": "value", ("tuple", 1): [1, 2]}),
+            persistence.update_conversation("name", (1, 2), "state"),
+            persistence.update_conversation("name", (3, 4), "to be deleted"),
+            persistence.update_callback_data(([("uuid", 1.5, {"button": 1})], {"query": "uuid"})),
+        )
+        await persistence.drop_user_data(2)
+        await persistence.update_conversation("name", (3, 4), None)
+        await persistence.flush()
+
+        other_persistence = reopen(database, bot)
+        user_data = await other_persistence.get_user_data()
+        assert user_data == {1: {"user": User(1, "user", False)}}
+        assert user_data[1]["user"].get_bot() is bot
+        assert await other_persistence.get_chat_data() == {-1: {"chat": Chat(-1, Chat.GROUP)}}
+        assert await other_persistence.get_bot_data() == {"key": "value", ("tuple", 1): [1, 2]}
+        assert await other_persistence.get_conversations("name") == {(1, 2): "state"}
+        assert await other_persistence.get_conversations("other") == {}
+        assert await other_persistence.get_callback_data() == (
+            [("uuid", 1.5, {"button": 1})],
+            {"query": "uuid"},
+        )
+        await other_persistence.flush()
+
+    async def test_bot_data_delta(self, persistence, database, bot):
+        await persistence.update_bot_data({"a": 1, "b": 2})
+        await persistence.update_bot_data_delta({"a": 3, "c": 4}, {"b"})
+        await persistence.flush()
+
+        other_persistence = reopen(database, bot)
+        assert await other_persistence.get_bot_data() == {"a": 3, "c": 4}
+        await other_persistence.flush()
+
+    async def test_custom_bot_data(self, database, bot):
+        context_types = ContextTypes(bot_data=CustomBotData)
+        persistence = reopen(database, bot, context_types=context_types)
+        assert isinstance(await persistence.get_bot_data(), CustomBotData)
+
+        await persistence.update_bot_data(CustomBotData("value"))
+        await persistence.flush()
+        other_persistence = reopen(database, bot, context_types=context_types)
+        bot_data = await other_persistence.get_bot_data()
+        assert isinstance(bot_data, CustomBotData)
+        assert bot_data.value == "value"
+        await other_persistence.flush()
+
+    async def test_callback_data_writes_changed_rows_only(self, persistence, database):
+        await persistence.update_callback_data(
+            ([("1", 1.0, {"a": 1}), ("2", 2.0, {"b": 2})], {"query": "1"})
+        )
+        await persistence.flush()
+        with sqlite3.connect(database) as connection:
+            connection.execute("UPDATE callback_keyboards SET data = x'00' WHERE uuid = '1'")
+
+        # Keyboard "1" is unchanged, so its (now corrupted) row must not be rewritten
+        await persistence.update_callback_data(([("1", 1.0, {"a": 1}), ("3", 3.0, {})], {}))
+        await persistence.flush()
+        with sqlite3.connect(database) as connection:
+            rows = dict(connection.execute("SELECT uuid, data FROM callback_keyboards"))
+            assert rows.keys() == {"1", "3"}
+            assert rows["1"] == b"\x00"
+            assert connection.execute("SELECT * FROM callback_queries").fetchall() == []
+
+    async def test_batched_commit(self, persistence, monkeypatch):
+        batches = []
+        original_commit = SQLitePersistence._commit
+
+        def commit(self, operations):
+            batches.append(len(operations))
+            original_commit(self, operations)
+
+        async def update(i):
+            # Writes that don't start in the same iteration of the event loop are batched, too
+            for _ in range(i % 5):
+                await asyncio.sleep(0)
+            await persistence.update_user_data(i, {"i": i})
+
+        monkeypatch.setattr(SQLitePersistence, "_commit", commit)
+        await asyncio.gather(*(update(i) for i in range(50)))
+        assert batches == [50]
+        assert len(await persistence.get_user_data()) == 50
+
+    async def test_failed_batch_is_rolled_back(self, persistence):
+        await persistence.update_user_data(1, {"value": 1})
+        results = await asyncio.gather(
+            persistence.update_user_data(1, {"value": 2}),
+            persistence.update_chat_data(1, {"unpicklable": lambda: None}),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, Exception) for result in results)
+        assert await persistence.get_user_data() == {1: {"value": 1}}
+        assert await persistence.get_chat_data() == {}
+
+    async def test_flush_shuts_down_executor(self, persistence):
+        await persistence.update_user_data(1, {"value": 1})
+        executor = persistence._db_executor
+        await persistence.flush()
+        assert persistence._db_executor is None
+        with pytest.raises(RuntimeError, match="shutdown"):
+            executor.submit(print)
+
+        # The persistence can still be used after flushing
+        assert await persistence.get_user_data() == {1: {"value": 1}}
+        assert persistence._db_executor is not executor
+
+    async def test_executor(self, persistence, database, bot):
+        await asyncio.gather(
+            persistence.update_user_data(1, {"value": UnpicklingThread()}),
+            persistence.update_chat_data(-1, {"value": UnpicklingThread()}),
+            persistence.update_bot_data({"key": UnpicklingThread()}),
+        )
+        await persistence.flush()
+
+        with ThreadPoolExecutor(thread_name_prefix="test_executor") as executor:
+            other_persistence = reopen(database, bot, executor=executor)
+            assert other_persistence.executor is executor
+            loaded = [
+                (await other_persistence.get_user_data())[1]["value"],
+                (await other_persistence.load_chat_data(-1))["value"],
+                (await other_persistence.get_bot_data())["key"],
+            ]
+            assert all(value.thread.startswith("test_executor") for value in loaded)
+
+            # The database has its own thread, which is independent of the executor
+            assert other_persistence._db_executor not in (None, executor)
+            await other_persistence.flush()
+            assert other_persistence._db_executor is None
+            assert executor.submit(int).result() == 0
+
+    async def test_wal_mode(self, persistence, database):
+        await persistence.update_user_data(1, {})
+        with sqlite3.connect(database) as connection:
+            assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+    async def test_application_integration(self, database, bot):
+        persistence = SQLitePersistence(database)
+        app = ApplicationBuilder().bot(bot).persistence(persistence).build()
+        async with app:
+            app.bot_data["key"] = "value"
+            app.user_data[1]["key"] = "value"
+            app.mark_data_for_update_persistence(user_ids=1)
+            await app.update_persistence()
+
+        other_persistence = reopen(database, bot)
+        assert await other_persistence.get_bot_data() == {"key": "value"}
+        assert await other_persistence.get_user_data() == {1: {"key": "value"}}
+        await other_persistence.flush()
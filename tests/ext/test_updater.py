@@ -29,7 +29,8 @@ import pytest
 from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram._utils.defaultvalue import DEFAULT_NONE
 from telegram.error import InvalidToken, RetryAfter, TelegramError, TimedOut
-from telegram.ext import ExtBot, InvalidCallbackData, Updater
+from telegram.ext import BoundedUpdateQueue, ExtBot, InvalidCallbackData, Updater
+from telegram.ext._utils import asynciowebhookserver
 from telegram.request import HTTPXRequest
 from tests.auxil.build_messages import make_message, make_message_update
 from tests.auxil.envvars import TEST_WITH_OPT_DEPS
@@ -402,6 +403,78 @@ class TestUpdater:
 
         assert log_found
 
+    async def test_polling_confirm_after_processing(self, monkeypatch, updater):
+        offsets = []
+
+        async def get_updates(*args, offset=None, **kwargs):
+            offsets.append(offset)
+            await asyncio.sleep(0)
+            if len(offsets) == 1:
+                return [Update(update_id=1), Update(update_id=2)]
+            return []
+
+        monkeypatch.setattr(updater.bot, "get_updates", get_updates)
+
+        async with updater:
+            await updater.start_polling(confirm_after_processing=True)
+            await asyncio.sleep(0.05)
+            # No further updates are fetched while the first batch is not processed
+            assert offsets == [0]
+            for _ in range(2):
+                await updater.update_queue.get()
+                updater.update_queue.task_done()
+            await asyncio.sleep(0.05)
+            assert offsets[1] == 3
+            await updater.stop()
+
+        assert offsets[-1] == 3
+
+    async def test_polling_confirm_after_processing_stop(self, monkeypatch, updater):
+        offsets = []
+
+        async def get_updates(*args, offset=None, **kwargs):
+            offsets.append(offset)
+            await asyncio.sleep(0)
+            return [Update(update_id=1), Update(update_id=2)] if len(offsets) == 1 else []
+
+        monkeypatch.setattr(updater.bot, "get_updates", get_updates)
+
+        async with updater:
+            await updater.start_polling(confirm_after_processing=True)
+            await asyncio.sleep(0.05)
+            await updater.update_queue.get()
+            updater.update_queue.task_done()
+            await updater.stop()
+
+        # The unprocessed update is not confirmed and hence fetched again on the next start
+        assert offsets == [0, 0]
+
+    async def test_polling_bounded_update_queue(self, monkeypatch, updater):
+        offsets = []
+
+        async def get_updates(*args, offset=None, **kwargs):
+            offsets.append(offset)
+            await asyncio.sleep(0)
+            return [Update(update_id=offset + i) for i in range(2)]
+
+        monkeypatch.setattr(updater.bot, "get_updates", get_updates)
+        updater.update_queue = BoundedUpdateQueue(high_watermark=2, low_watermark=0)
+
+        async with updater:
+            await updater.start_polling()
+            await asyncio.sleep(0.05)
+            # Polling pauses after the first batch filled the queue
+            assert offsets == [0]
+            assert updater.update_queue.congested
+
+            await updater.update_queue.get()
+            await asyncio.sleep(0)
+            assert updater.update_queue.congested
+            await updater.update_queue.get()
+            await asyncio.sleep(0.05)
+            assert offsets == [0, 2]
+            await updater.stop()
+
     async def test_start_polling_already_running(self, updater):
         async with updater:
             await updater.start_polling()
@@ -1135,6 +1208,32 @@ class TestUpdater:
 
             await updater.stop()
 
+    async def test_webhook_bounded_update_queue(self, monkeypatch, updater):
+        async def return_true(*args, **kwargs):
+            return True
+
+        monkeypatch.setattr(updater.bot, "set_webhook", return_true)
+        monkeypatch.setattr(updater.bot, "delete_webhook", return_true)
+        updater.update_queue = BoundedUpdateQueue(high_watermark=1)
+
+        ip = "127.0.0.1"
+        port = randrange(1024, 49152)  # Select random port
+        async with updater:
+            await updater.start_webhook(ip, port)
+
+            update = make_message_update(message="test_message")
+            response = await send_webhook_message(ip, port, update.to_json())
+            assert response.status_code == HTTPStatus.OK
+            response = await send_webhook_message(ip, port, update.to_json())
+            assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+            assert updater.update_queue.qsize() == 1
+            assert updater.update_queue.rejected_updates == 1
+
+            await updater.update_queue.get()
+            response = await send_webhook_message(ip, port, update.to_json())
+            assert response.status_code == HTTPStatus.OK
+            await updater.stop()
+
     async def test_webhook_update_de_json_fails(self, monkeypatch, updater, caplog):
         async def delete_webhook(*args, **kwargs):
             return True
@@ -1185,3 +1284,254 @@ class TestUpdater:
 
             await updater.stop()
             assert not updater.running
+
+
+class TestAsyncioWebhookServer:
+    """The asyncio based webhook server does not require the optional dependencies"""
+
+    @pytest.fixture()
+    def webhook_updater(self, monkeypatch, updater):
+        async def return_true(*args, **kwargs):
+            return True
+
+        monkeypatch.setattr(updater.bot, "set_webhook", return_true)
+        monkeypatch.setattr(updater.bot, "delete_webhook", return_true)
+        return updater
+
+    @staticmethod
+    async def send_raw(reader, writer, request):
+        writer.write(request)
+        head = await reader.readuntil(b"\r\n\r\n")
+        return int(head.split(b" ", 2)[1]), head
+
+    async def test_invalid_server(self, webhook_updater):
+        async with webhook_updater:
+            with pytest.raises(ValueError, match="`server` must be either"):
+                await webhook_updater.start_webhook(server="invalid")
+            assert not webhook_updater.running
+
+    @pytest.mark.parametrize("secret_token", ["SecretToken", None])
+    @pytest.mark.parametrize("unix", [None, True])
+    async def test_webhook_basic(self, webhook_updater, secret_token, unix):
+        if unix and platform.system() == "Windows":
+            pytest.skip("Windows doesn't support unix bind")
+        updater = webhook_updater
+        file_path = TEST_DATA_PATH / "asyncio.sock"
+        ip = "127.0.0.1"
+        port = randrange(1024, 49152)  # Select random port
+        kwargs = {"unix": file_path} if unix else {"port": port}
+
+        try:
+            async with updater:
+                await updater.start_webhook(
+                    url_path="TOKEN",
+                    secret_token=secret_token,
+                    webhook_url="string",
+                    server="asyncio",
+                    **kwargs,
+                )
+                assert updater.running
+
+                update = make_message_update("Webhook")
+                for url_path in ("TOKEN", "TOKEN/"):
+                    response = await send_webhook_message(
+                        ip,
+                        port,
+                        update.to_json(),
+                        url_path,
+                        secret_token=secret_token,
+                        unix=kwargs.get("unix"),
+                    )
+                    assert response.status_code == HTTPStatus.OK
+                    assert (await updater.update_queue.get()).to_dict() == update.to_dict()
+
+                response = await send_webhook_message(
+                    ip, port, "123456", "webhook_handler.py", unix=kwargs.get("unix")
+                )
+                assert response.status_code == HTTPStatus.NOT_FOUND
+
+                response = await send_webhook_message(
+                    ip, port, None, "TOKEN", get_method="HEAD", unix=kwargs.get("unix")
+                )
+                assert response.status_code == HTTPStatus.METHOD_NOT_ALLOWED
+
+                response = await send_webhook_message(
+                    ip,
+                    port,
+                    update.to_json(),
+                    "TOKEN",
+                    content_type="text/plain",
+                    secret_token=secret_token,
+                    unix=kwargs.get("unix"),
+                )
+                assert response.status_code == HTTPStatus.FORBIDDEN
+
+                response = await send_webhook_message(
+                    ip,
+                    port,
+                    "no json",
+                    "TOKEN",
+                    secret_token=secret_token,
+                    unix=kwargs.get("unix"),
+                )
+                assert response.status_code == HTTPStatus.BAD_REQUEST
+
+                if secret_token:
+                    for token, reason in (
+                        (None, "Request did not include the secret token"),
+                        ("NotTheSecretToken", "Request had the wrong secret token"),
+                    ):
+                        response = await send_webhook_message(
+                            ip,
+                            port,
+                            update.to_json(),
+                            "TOKEN",
+                            secret_token=token,
+                            unix=kwargs.get("unix"),
+                        )
+                        assert response.status_code == HTTPStatus.FORBIDDEN
+                        assert response.reason_phrase == reason
+
+                await updater.stop()
+                assert not updater.running
+                assert updater.update_queue.empty()
+        finally:
+            file_path.unlink(missing_ok=True)
+
+    async def test_keep_alive(self, webhook_updater):
+        updater = webhook_updater
+        ip = "127.0.0.1"
+        port = randrange(1024, 49152)  # Select random port
+        body = make_message_update("Webhook").to_json().encode()
+        request = (
+            b"POST / HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+            b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+        )
+
+        async with updater:
+            await updater.start_webhook(ip, port, server="asyncio")
+            reader, writer = await asyncio.open_connection(ip, port)
+            try:
+                for _ in range(2):
+                    status, head = await self.send_raw(reader, writer, request)
+                    assert status == HTTPStatus.OK
+                    assert b"Connection: close" not in head
+                status, head = await self.send_raw(
+                    reader,
+                    writer,
+                    request.replace(b"Host: localhost", b"Host: localhost\r\nConnection: close"),
+                )
+                assert status == HTTPStatus.OK
+                assert b"Connection: close" in head
+                assert await reader.read() == b""
+                assert updater.update_queue.qsize() == 3
+                writer.close()
+
+                # Idle connections are closed on shutdown
+                reader, writer = await asyncio.open_connection(ip, port)
+                status, _ = await self.send_raw(reader, writer, request)
+                assert status == HTTPStatus.OK
+                await asyncio.wait_for(updater.stop(), timeout=1)
+                assert await reader.read() == b""
+            finally:
+                writer.close()
+
+    @pytest.mark.parametrize(
+        ("request_bytes", "status"),
+        [
+            (b"GARBAGE\r\n\r\n", HTTPStatus.BAD_REQUEST),
+            (b"POST / HTTP/2\r\n\r\n", HTTPStatus.BAD_REQUEST),
+            (b"POST / HTTP/1.1\r\nNoHeader\r\n\r\n", HTTPStatus.BAD_REQUEST),
+            (b"POST / HTTP/1.1\r\nContent-Length: abc\r\n\r\n", HTTPStatus.BAD_REQUEST),
+            (
+                b"POST / HTTP/1.1\r\nContent-Length: 1000000000\r\n\r\n",
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+            ),
+            (b"POST / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n", HTTPStatus.NOT_IMPLEMENTED),
+        ],
+    )
+    async def test_invalid_requests(self, webhook_updater, request_bytes, status):
+        updater = webhook_updater
+        ip = "127.0.0.1"
+        port = randrange(1024, 49152)  # Select random port
+
+        async with updater:
+            await updater.start_webhook(ip, port, server="asyncio")
+            reader, writer = await asyncio.open_connection(ip, port)
+            try:
+                assert (await self.send_raw(reader, writer, request_bytes))[0] == status
+                # The connection is closed since the rest of the request can't be read
+                assert await reader.read() == b""
+            finally:
+                writer.close()
+            await updater.stop()
+
+    async def test_request_timeout(self, webhook_updater, monkeypatch):
+        monkeypatch.setattr(asynciowebhookserver, "_REQUEST_TIMEOUT", 0.1)
+        updater = webhook_updater
+        ip = "127.0.0.1"
+        port = randrange(1024, 49152)  # Select random port
+
+        async with updater:
+            await updater.start_webhook(ip, port, server="asyncio")
+            for partial_request in (
+                b"POST / HTTP/1.1\r\nContent-Type: application/json\r\n",
+                b"POST / HTTP/1.1\r\nContent-Length: 10\r\n\r\n12345",
+            ):
+                reader, writer = await asyncio.open_connection(ip, port)
+                try:
+                    status, _ = await asyncio.wait_for(
+                        self.send_raw(reader, writer, partial_request), timeout=1
+                    )
+                    assert status == HTTPStatus.REQUEST_TIMEOUT
+                    assert await reader.read() == b""
+                finally:
+                    writer.close()
+            await updater.stop()
+
+    async def test_max_connections(self, webhook_updater, monkeypatch):
+        monkeypatch.setattr(asynciowebhookserver, "_MAX_CONNECTIONS", 1)
+        updater = webhook_updater
+        ip = "127.0.0.1"
+        port = randrange(1024, 49152)  # Select random port
+        body = make_message_update("Webhook").to_json().encode()
+        request = (
+            b"POST / HTTP/1.1\r\nContent-Type: application/json\r\n"
+            b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+        )
+
+        async with updater:
+            await updater.start_webhook(ip, port, server="asyncio")
+            reader, writer = await asyncio.open_connection(ip, port)
+            try:
+                # The first connection is kept alive ...
+                assert (await self.send_raw(reader, writer, request))[0] == HTTPStatus.OK
+                # ... so another one is rejected without reading the request
+                other_reader, other_writer = await asyncio.open_connection(ip, port)
+                try:
+                    status, head = await self.send_raw(other_reader, other_writer, b"")
+                    assert status == HTTPStatus.SERVICE_UNAVAILABLE
+                    assert b"Connection: close" in head
+                    assert await other_reader.read() == b""
+                finally:
+                    other_writer.close()
+            finally:
+                writer.close()
+            assert updater.update_queue.qsize() == 1
+            await updater.stop()
+
+    async def test_bounded_update_queue(self, webhook_updater):
+        updater = webhook_updater
+        updater.update_queue = BoundedUpdateQueue(high_watermark=1)
+        ip = "127.0.0.1"
+        port = randrange(1024, 49152)  # Select random port
+
+        async with updater:
+            await updater.start_webhook(ip, port, server="asyncio")
+            update = make_message_update("Webhook")
+            response = await send_webhook_message(ip, port, update.to_json())
+            assert response.status_code == HTTPStatus.OK
+            response = await send_webhook_message(ip, port, update.to_json())
+            assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+            assert updater.update_queue.rejected_updates == 1
+            await updater.stop()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import datetime
+import os
+
+import pytest
+
+from telegram import Bot, Chat, Document, InputFile, Message, PhotoSize
+from telegram.error import BadRequest
+from telegram.ext import ApplicationBuilder, UploadCache
+from tests.auxil.pytest_classes import make_bot
+from tests.auxil.slots import mro_slots
+
+
+def build_message(**kwargs):
+    return Message(1, datetime.datetime.utcnow(), chat=Chat(1, Chat.PRIVATE), **kwargs).to_dict()
+
+
+class FakeAPI:
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.requests = []
+
+    async def __call__(self, data):
+        self.requests.append(data)
+        await asyncio.sleep(self.delay)
+        if isinstance(data.get("document"), str):
+            return build_message(document=Document(data["document"], "unique"))
+        return build_message(document=Document(f"id_{len(self.requests)}", "unique"))
+
+
+class TestUploadCache:
+    def test_slot_behaviour(self):
+        inst = UploadCache()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    @pytest.mark.parametrize("maxsize", [-1, 0])
+    def test_init(self, maxsize):
+        with pytest.raises(ValueError, match="`maxsize` must be a positive integer"):
+            UploadCache(maxsize=maxsize)
+
+    async def test_reuse_file_id(self):
+        cache = UploadCache()
+        api = FakeAPI()
+        data = {"chat_id": 1, "document": InputFile(b"content", filename="file.txt")}
+        await cache.process_request("sendDocument", data, api)
+        other_data = {"chat_id": 2, "document": InputFile(b"content", filename="file.txt")}
+        await cache.process_request("sendDocument", other_data, api)
+
+        assert isinstance(api.requests[0]["document"], InputFile)
+        assert api.requests[1] == {"chat_id": 2, "document": "id_1"}
+        # The passed data is not changed
+        assert isinstance(other_data["document"], InputFile)
+
+    @pytest.mark.parametrize(
+        ("endpoint", "content", "filename"),
+        [
+            ("sendDocument", b"other content", "file.txt"),
+            ("sendDocument", b"content", "other.txt"),
+            ("sendVideo", b"content", "file.txt"),
+        ],
+    )
+    async def test_different_files(self, endpoint, content, filename):
+        cache = UploadCache()
+        api = FakeAPI()
+        await cache.process_request(
+            "sendDocument", {"document": InputFile(b"content", filename="file.txt")}, api
+        )
+        await cache.process_request(
+            endpoint, {"document": InputFile(content, filename=filename)}, api
+        )
+        assert all(isinstance(data["document"], InputFile) for data in api.requests)
+
+    async def test_not_cached(self):
+        cache = UploadCache()
+        api = FakeAPI()
+        for _ in range(2):
+            await cache.process_request("sendDocument", {"document": "file_id"}, api)
+            await cache.process_request(
+                "sendDocument", {"document": InputFile(b"content", attach=True)}, api
+            )
+            await cache.process_request("sendMessage", {"text": "text"}, api)
+        assert cache.persistence_data == {}
+
+    async def test_file_handle(self, tmp_path):
+        path = tmp_path / "file.txt"
+        path.write_bytes(b"content")
+        cache = UploadCache()
+        api = FakeAPI()
+
+        async def send():
+            with path.open("rb") as file:
+                data = {"document": InputFile(file, read_file_handle=False)}
+                await cache.process_request("sendDocument", data, api)
+
+        await send()
+        await send()
+        assert api.requests[1]["document"] == "id_1"
+
+        # Modifying the file invalidates the entry
+        path.write_bytes(b"new content")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        await send()
+        assert isinstance(api.requests[2]["document"], InputFile)
+
+    async def test_concurrent_uploads(self):
+        cache = UploadCache()
+        api = FakeAPI(delay=0.05)
+        await asyncio.gather(
+            *(
+                cache.process_request(
+                    "sendDocument", {"document": InputFile(b"content", filename="file")}, api
+                )
+                for _ in range(5)
+            )
+        )
+        assert isinstance(api.requests[0]["document"], InputFile)
+        assert [data["document"] for data in api.requests[1:]] == ["id_1"] * 4
+
+    async def test_failed_upload(self):
+        cache = UploadCache()
+        api = FakeAPI()
+
+        async def fail(data):
+            raise BadRequest("failed")
+
+        with pytest.raises(BadRequest, match="failed"):
+            await cache.process_request("sendDocument", {"document": InputFile(b"content")}, fail)
+        await cache.process_request("sendDocument", {"document": InputFile(b"content")}, api)
+        assert isinstance(api.requests[0]["document"], InputFile)
+
+    async def test_rejected_file_id(self):
+        cache = UploadCache()
+        api = FakeAPI()
+        await cache.process_request("sendDocument", {"document": InputFile(b"content")}, api)
+        key = next(iter(cache.persistence_data))
+        cache.load_persistence_data({key: "invalid_id"})
+
+        async def reject_file_id(data):
+            if data["document"] == "invalid_id":
+                raise BadRequest("Wrong file identifier/http url specified")
+            return await api(data)
+
+        await cache.process_request(
+            "sendDocument", {"document": InputFile(b"content")}, reject_file_id
+        )
+        assert isinstance(api.requests[1]["document"], InputFile)
+        assert cache.persistence_data[key] == "id_2"
+
+    async def test_photo(self):
+        cache = UploadCache()
+
+        async def api(data):
+            return build_message(
+                photo=[PhotoSize("small", "unique", 1, 1), PhotoSize("large", "unique", 2, 2)]
+            )
+
+        await cache.process_request("sendPhoto", {"photo": InputFile(b"content")}, api)
+        assert list(cache.persistence_data.values()) == ["large"]
+
+    async def test_maxsize(self):
+        cache = UploadCache(maxsize=2)
+        api = FakeAPI()
+        for content in (b"1", b"2", b"1", b"3"):
+            await cache.process_request("sendDocument", {"document": InputFile(content)}, api)
+        assert list(cache.persistence_data.values()) == ["id_1", "id_4"]
+
+        other_cache = UploadCache(maxsize=2, persistent_data=cache.persistence_data)
+        assert other_cache.persistence_data == cache.persistence_data
+        other_cache.clear()
+        assert other_cache.persistence_data == {}
+
+    async def test_ext_bot(self, bot_info, monkeypatch):
+        requests = []
+
+        async def do_post(_, endpoint, data, **kwargs):
+            requests.append(data["document"])
+            return build_message(document=Document("file_id", "unique"))
+
+        monkeypatch.setattr(Bot, "_do_post", do_post)
+        ext_bot = make_bot(bot_info, upload_cache=UploadCache())
+        for chat_id in (1, 2):
+            message = await ext_bot.send_document(chat_id, b"content", filename="file.pdf")
+            assert message.document.file_id == "file_id"
+        assert isinstance(requests[0], InputFile)
+        assert requests[1] == "file_id"
+
+    def test_application_builder(self, bot_info):
+        cache = UploadCache()
+        app = ApplicationBuilder().token(bot_info["token"]).upload_cache(cache).build()
+        assert app.bot.upload_cache is cache
@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import json
+
+import pytest
+
+from telegram import MessageEntity
+from telegram._utils.jsoncodec import (
+    ORJSON_AVAILABLE,
+    UJSON_AVAILABLE,
+    get_json_codec,
+    use_json_codec,
+)
+from telegram.ext import ApplicationBuilder, DictPersistence, ExtBot, TypeHandler
+from telegram.request import BaseRequest, JSONCodec, OrjsonCodec, RequestData, UJSONCodec
+from telegram.request._requestparameter import RequestParameter
+from tests.auxil.slots import mro_slots
+
+
+class RecordingCodec(JSONCodec):
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls = []
+
+    def dumps(self, obj):
+        self.calls.append("dumps")
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.calls.append("loads")
+        return super().loads(data)
+
+
+class OfflineRequest(BaseRequest):
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
+
+    async def do_request(self, url, method, request_data=None, *args, **kwargs):
+        if request_data is not None:
+            assert request_data.json_payload
+        if url.endswith("getMe"):
+            return 200, json.dumps({"ok": True, "result": self.bot.bot.to_dict()}).encode()
+        return 200, b'{"ok": true, "result": true}'
+
+
+def make_ext_bot(bot, json_codec):
+    return ExtBot(
+        bot.token,
+        request=OfflineRequest(bot),
+        get_updates_request=OfflineRequest(bot),
+        json_codec=json_codec,
+    )
+
+
+@pytest.fixture()
+def recording_codec():
+    codec = RecordingCodec()
+    with use_json_codec(codec):
+        yield codec
+
+
+class TestJSONCodec:
+    @pytest.mark.parametrize("cls", [JSONCodec, OrjsonCodec, UJSONCodec])
+    def test_slot_behaviour(self, cls):
+        if cls is OrjsonCodec and not ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        if cls is UJSONCodec and not UJSON_AVAILABLE:
+            pytest.skip("ujson not installed")
+        inst = cls()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_default_codec(self):
+        assert type(get_json_codec()) is JSONCodec
+
+    def test_roundtrip(self):
+        codec = JSONCodec()
+        obj = {"a": [1, 2.5, None, True], "b": "ß"}
+        assert codec.dumps(obj) == json.dumps(obj)
+        assert codec.dumps_bytes(obj) == json.dumps(obj).encode("utf-8")
+        assert codec.loads(codec.dumps(obj)) == obj
+        assert codec.loads(codec.dumps_bytes(obj)) == obj
+
+    def test_loads_invalid_utf8(self):
+        assert JSONCodec().loads(b'{"a": "\xff"}') == {"a": "�"}
+
+    def test_loads_invalid(self):
+        with pytest.raises(ValueError):
+            JSONCodec().loads(b"{not json")
+
+    def test_get_fastest_available(self):
+        codec = JSONCodec.get_fastest_available()
+        if ORJSON_AVAILABLE:
+            assert isinstance(codec, OrjsonCodec)
+        elif UJSON_AVAILABLE:
+            assert isinstance(codec, UJSONCodec)
+        else:
+            assert type(codec) is JSONCodec
+
+    @pytest.mark.skipif(ORJSON_AVAILABLE, reason="orjson is installed")
+    def test_orjson_missing(self):
+        with pytest.raises(RuntimeError, match="`orjson` must be installed"):
+            OrjsonCodec()
+
+    @pytest.mark.skipif(UJSON_AVAILABLE, reason="ujson is installed")
+    def test_ujson_missing(self):
+        with pytest.raises(RuntimeError, match="`ujson` must be installed"):
+            UJSONCodec()
+
+    @pytest.mark.skipif(not ORJSON_AVAILABLE, reason="orjson is not installed")
+    def test_orjson_non_str_keys(self):
+        codec = OrjsonCodec()
+        assert codec.loads(codec.dumps({1: "a"})) == {"1": "a"}
+
+    def test_custom_codec_is_used(self, recording_codec):
+        RequestData([RequestParameter("param", [1, 2], input_files=None)]).json_payload
+        assert recording_codec.calls == ["dumps", "dumps"]
+
+        recording_codec.calls.clear()
+        assert MessageEntity("type", 1, 1).to_json()
+        assert recording_codec.calls == ["dumps"]
+
+        recording_codec.calls.clear()
+        persistence = DictPersistence(bot_data_json='{"a": 1}')
+        assert persistence.bot_data == {"a": 1}
+        assert recording_codec.calls == ["loads"]
+
+    def test_use_json_codec(self):
+        original = get_json_codec()
+        codec = JSONCodec()
+        with use_json_codec(codec):
+            assert get_json_codec() is codec
+        assert get_json_codec() is original
+
+    async def test_ext_bot_codec(self, bot):
+        codec_1 = RecordingCodec()
+        codec_2 = RecordingCodec()
+        bot_1 = make_ext_bot(bot, codec_1)
+        bot_2 = make_ext_bot(bot, codec_2)
+        assert bot_1.json_codec is codec_1
+        assert type(ExtBot(bot.token).json_codec) is JSONCodec
+
+        async with bot_1, bot_2:
+            codec_1.calls.clear()
+            codec_2.calls.clear()
+            assert await bot_1.delete_message(1, 1)
+            assert set(codec_1.calls) == {"dumps", "loads"}
+            assert codec_2.calls == []
+
+            codec_1.calls.clear()
+            assert await bot_2.delete_message(1, 1)
+            assert codec_1.calls == []
+            assert set(codec_2.calls) == {"dumps", "loads"}
+
+        assert get_json_codec() not in (codec_1, codec_2)
+
+    def test_dict_persistence_uses_bot_codec(self, bot):
+        codec = RecordingCodec()
+        persistence = DictPersistence()
+        persistence.set_bot(make_ext_bot(bot, codec))
+        assert persistence.user_data_json == "null"
+        assert codec.calls == ["dumps"]
+
+    async def test_application_builder(self, bot):
+        codec = RecordingCodec()
+        app = ApplicationBuilder().token(bot.token).json_codec(codec).build()
+        assert app.bot.json_codec is codec
+        assert get_json_codec() is not codec
+
+        # Each application has its own codec
+        other_app = ApplicationBuilder().token(bot.token).json_codec(JSONCodec()).build()
+        assert other_app.bot.json_codec is not codec
+        assert app.bot.json_codec is codec
+
+    def test_application_builder_with_bot(self, bot):
+        with pytest.raises(RuntimeError, match="`json_codec` may only be set, if no bot"):
+            ApplicationBuilder().bot(bot).json_codec(JSONCodec())
+        with pytest.raises(RuntimeError, match="`bot` may only be set, if no json_codec"):
+            ApplicationBuilder().json_codec(JSONCodec()).bot(bot)
+
+    async def test_application_processes_updates_with_codec(self, bot):
+        codec = RecordingCodec()
+        app = ApplicationBuilder().bot(make_ext_bot(bot, codec)).build()
+        codecs = []
+
+        async def callback(update, context):
+            codecs.append(get_json_codec())
+
+        app.add_handler(TypeHandler(int, callback))
+        async with app:
+            await app.start()
+            await app.update_queue.put(1)
+            await asyncio.sleep(0.05)
+            await app.stop()
+
+        assert codecs == [codec]
+        assert get_json_codec() is not codec
@@ -24,12 +24,14 @@ import logging
 from collections import defaultdict
 from dataclasses import dataclass
 from http import HTTPStatus
+from io import BytesIO
 from typing import Any, Callable, Coroutine, Tuple
 
 import httpx
 import pytest
 from httpx import AsyncHTTPTransport
 
+from telegram import InputFile
 from telegram._utils.defaultvalue import DEFAULT_NONE
 from telegram.error import (
     BadRequest,
@@ -333,6 +335,29 @@ class TestRequestWithoutRequest:
 
         assert await httpx_request.retrieve(None, None) == server_response
 
+    async def test_retrieve_stream_default_implementation(self, monkeypatch, httpx_request):
+        """The default implementation of do_stream_request provides the payload in one chunk"""
+        server_response = b'{"result": "test_string\x80"}'
+
+        monkeypatch.setattr(HTTPXRequest, "do_stream_request", BaseRequest.do_stream_request)
+        monkeypatch.setattr(httpx_request, "do_request", mocker_factory(response=server_response))
+
+        chunks = [chunk async for chunk in httpx_request.retrieve_stream(None)]
+        assert chunks == [server_response]
+
+    async def test_retrieve_stream_error_response(self, monkeypatch, httpx_request):
+        server_response = b'{"ok": false, "description": "File not found"}'
+
+        monkeypatch.setattr(HTTPXRequest, "do_stream_request", BaseRequest.do_stream_request)
+        monkeypatch.setattr(
+            httpx_request,
+            "do_request",
+            mocker_factory(response=server_response, return_code=HTTPStatus.BAD_REQUEST),
+        )
+
+        with pytest.raises(BadRequest, match="File not found"):
+            [chunk async for chunk in httpx_request.retrieve_stream(None)]
+
     async def test_timeout_propagation_to_do_request(self, monkeypatch, httpx_request):
         async def make_assertion(*args, **kwargs):
             self.test_flag = (
@@ -663,6 +688,79 @@ class TestHTTPXRequestWithoutRequest:
         assert code == 123
         assert content == b"content"
 
+    async def test_do_stream_request(self, monkeypatch):
+        content = b"content" * 100_000
+
+        def handler(request):
+            return httpx.Response(123, content=content)
+
+        monkeypatch.setattr(
+            HTTPXRequest,
+            "_build_client",
+            lambda _: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        async with HTTPXRequest() as httpx_request:
+            async with httpx_request.do_stream_request("https://url", "GET") as (code, chunks):
+                assert code == 123
+                assert b"".join([chunk async for chunk in chunks]) == content
+
+    async def test_do_request_streams_file_handle(self, monkeypatch):
+        content = b"content" * 100_000
+        read_sizes = []
+
+        class FileHandle(BytesIO):
+            name = "file.txt"
+
+            def read(self, size=-1):
+                read_sizes.append(size)
+                return super().read(size)
+
+        def handler(request):
+            self.test_flag = (request.headers.get("Content-Length"), request.read())
+            return httpx.Response(HTTPStatus.OK)
+
+        monkeypatch.setattr(
+            HTTPXRequest,
+            "_build_client",
+            lambda _: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        input_file = InputFile(FileHandle(content), read_file_handle=False)
+        request_data = RequestData([RequestParameter.from_input("document", input_file)])
+        async with HTTPXRequest() as httpx_request:
+            await httpx_request.do_request("https://url", "POST", request_data=request_data)
+
+        content_length, body = self.test_flag
+        # The length is known without reading the file and the file is read in chunks
+        assert int(content_length) == len(body)
+        assert content in body
+        assert b'filename="file.txt"' in body
+        assert read_sizes
+        assert all(size > 0 for size in read_sizes)
+
+    @pytest.mark.parametrize(
+        ("raised_exception", "expected_class", "expected_message"),
+        [
+            (httpx.TimeoutException("timeout"), TimedOut, "Timed out"),
+            (httpx.ReadError("read_error"), NetworkError, "httpx.ReadError: read_error"),
+        ],
+    )
+    async def test_do_stream_request_exceptions(
+        self, monkeypatch, raised_exception, expected_class, expected_message
+    ):
+        def handler(request):
+            raise raised_exception
+
+        monkeypatch.setattr(
+            HTTPXRequest,
+            "_build_client",
+            lambda _: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        async with HTTPXRequest() as httpx_request:
+            with pytest.raises(expected_class, match=expected_message) as exc_info:
+                [chunk async for chunk in httpx_request.retrieve_stream("https://url")]
+
+        assert exc_info.value.__cause__ is raised_exception
+
     @pytest.mark.parametrize(
         ("raised_exception", "expected_class", "expected_message"),
         [
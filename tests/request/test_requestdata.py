@@ -226,3 +226,44 @@ class TestRequestDataWithoutRequest:
             )
             == expected_url
         )
+
+    def test_context_manager_closes_opened_files(self):
+        with data_file("telegram.jpg").open("rb") as file_handle:
+            path_file = InputFile(data_file("telegram.png"))
+            attached_path_file = InputFile(data_file("telegram.jpg"), attach=True)
+            handle_file = InputFile(file_handle, read_file_handle=False)
+            request_data = RequestData(
+                [
+                    RequestParameter.from_input("document", path_file),
+                    RequestParameter.from_input("thumbnail", attached_path_file),
+                    RequestParameter.from_input("photo", handle_file),
+                ]
+            )
+            with request_data as entered:
+                assert entered is request_data
+                files = request_data.streaming_multipart_data
+                assert files["document"][1] is path_file.streaming_field_tuple[1]
+                assert files[attached_path_file.attach_name][1] is (
+                    attached_path_file.streaming_field_tuple[1]
+                )
+                assert files["photo"][1] is file_handle
+                assert not any(file.closed for _, file, _ in files.values())
+
+            assert files["document"][1].closed
+            assert files[attached_path_file.attach_name][1].closed
+            # File handles passed by the user are not closed
+            assert not file_handle.closed
+
+    def test_streaming_multipart_data(self, file_rqs):
+        # Files that were read into memory are the same for both
+        assert file_rqs.streaming_multipart_data == file_rqs.multipart_data
+
+        path_file = InputFile(data_file("telegram.png"))
+        with RequestData([RequestParameter.from_input("document", path_file)]) as request_data:
+            filename, content, mimetype = request_data.streaming_multipart_data["document"]
+            assert (filename, mimetype) == ("telegram.png", "image/png")
+            assert content.name == str(data_file("telegram.png"))
+            # multipart_data always contains bytes
+            assert request_data.multipart_data == {
+                "document": ("telegram.png", data_file("telegram.png").read_bytes(), "image/png")
+            }
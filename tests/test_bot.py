@@ -20,6 +20,7 @@ import asyncio
 import copy
 import datetime as dtm
 import inspect
+import json
 import logging
 import pickle
 import re
@@ -45,6 +46,7 @@ from telegram import (
     ChatAdministratorRights,
     ChatPermissions,
     Dice,
+    File,
     InlineKeyboardButton,
     InlineKeyboardMarkup,
     InlineQueryResultArticle,
@@ -87,7 +89,7 @@ from telegram.constants import (
     ReactionEmoji,
 )
 from telegram.error import BadRequest, EndPointNotFound, InvalidToken, NetworkError
-from telegram.ext import ExtBot, InvalidCallbackData
+from telegram.ext import ApplicationBuilder, ExtBot, InvalidCallbackData
 from telegram.helpers import escape_markdown
 from telegram.request import BaseRequest, HTTPXRequest, RequestData
 from telegram.warnings import PTBDeprecationWarning, PTBUserWarning
@@ -2092,6 +2094,83 @@ class TestBotWithoutRequest:
             api_kwargs={"chat_id": 2, "user_id": 32, "until_date": until_timestamp},
         )
 
+    async def test_request_pools(self, bot):
+        class RecordingRequest(BaseRequest):
+            def __init__(self):
+                self.methods = []
+                self.initialized = False
+
+            async def initialize(self):
+                self.initialized = True
+
+            async def shutdown(self):
+                self.initialized = False
+
+            async def do_request(self, url, method, request_data=None, *args, **kwargs):
+                self.methods.append(url.rsplit("/", 1)[-1])
+                if url.endswith("getMe"):
+                    return 200, json.dumps({"ok": True, "result": bot.bot.to_dict()}).encode()
+                if url.endswith("file_path"):
+                    return 200, b"content"
+                return 200, b'{"ok": true, "result": true}'
+
+        request = RecordingRequest()
+        media_request = RecordingRequest()
+        download_request = RecordingRequest()
+        ext_bot = ExtBot(
+            bot.token,
+            request=request,
+            get_updates_request=RecordingRequest(),
+            request_pools={
+                "sendChatAction": media_request,
+                "setChatTitle": media_request,
+                "file_download": download_request,
+            },
+        )
+        assert ext_bot.request_pools == {
+            "sendChatAction": media_request,
+            "setChatTitle": media_request,
+            "file_download": download_request,
+        }
+
+        async with ext_bot:
+            assert media_request.initialized
+            assert download_request.initialized
+            await ext_bot.send_chat_action(1, "typing")
+            await ext_bot.set_chat_title(1, "title")
+            await ext_bot.delete_message(1, 1)
+            file = File("file_id", "unique_id", file_path="file_path")
+            file.set_bot(ext_bot)
+            assert await file.download_as_bytearray() == bytearray(b"content")
+
+        assert not media_request.initialized
+        assert not download_request.initialized
+        assert request.methods == ["getMe", "deleteMessage"]
+        assert media_request.methods == ["sendChatAction", "setChatTitle"]
+        assert download_request.methods == ["file_path"]
+
+    def test_request_pools_get_updates(self, bot):
+        with pytest.raises(ValueError, match="Use `get_updates_request`"):
+            ExtBot(bot.token, request_pools={"getUpdates": HTTPXRequest()})
+        with pytest.raises(ValueError, match="Use `get_updates_request`"):
+            ApplicationBuilder().request_pool(["getUpdates"], HTTPXRequest())
+
+    def test_request_pools_application_builder(self, bot):
+        media_request = HTTPXRequest()
+        download_request = HTTPXRequest()
+        application = (
+            ApplicationBuilder()
+            .token(bot.token)
+            .request_pool(["sendVideo", "sendDocument"], media_request)
+            .request_pool(["file_download"], download_request)
+            .build()
+        )
+        assert application.bot.request_pools == {
+            "sendVideo": media_request,
+            "sendDocument": media_request,
+            "file_download": download_request,
+        }
+
 
 class TestBotWithRequest:
     """
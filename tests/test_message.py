@@ -16,7 +16,8 @@
 #
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
-from copy import copy
+import pickle
+from copy import copy, deepcopy
 from datetime import datetime
 
 import pytest
@@ -78,7 +79,7 @@ from tests.auxil.bot_method_checks import (
     check_shortcut_signature,
 )
 from tests.auxil.build_messages import make_message
-from tests.auxil.pytest_classes import PytestExtBot, PytestMessage
+from tests.auxil.pytest_classes import PytestExtBot, PytestMessage, make_bot
 from tests.auxil.slots import mro_slots
 
 
@@ -504,6 +505,75 @@ class TestMessageWithoutRequest(TestMessageBase):
         for slot in new.__slots__:
             assert not isinstance(new[slot], dict)
 
+    def test_de_json_absent_and_none_fields(self, bot, message_params):
+        """Only present fields are converted - absent fields must lead to the same result as
+        fields that are explicitly passed as None."""
+        minimal = {
+            "message_id": 1,
+            "date": int(datetime.now().timestamp()),
+            "chat": message_params.chat.to_dict(),
+        }
+        with_none = dict(minimal, **{key: None for key in Message._get_de_json_converters()})
+        assert Message.de_json(minimal, bot).to_dict() == Message.de_json(with_none, bot).to_dict()
+
+        full = Message.de_json(message_params.to_dict(), bot)
+        for key in Message._get_de_json_converters():
+            if key in message_params.to_dict():
+                assert not isinstance(full[key], dict), key
+
+    @pytest.fixture()
+    def lazy_json_dict(self):
+        chat = {"id": 1, "type": Chat.PRIVATE}
+        date = int(datetime.now().timestamp())
+        return {
+            "message_id": 1,
+            "date": date,
+            "chat": chat,
+            "from": {"id": 2, "first_name": "name", "is_bot": False},
+            "text": "/start arg",
+            "entities": [{"type": MessageEntity.BOT_COMMAND, "offset": 0, "length": 6}],
+            "reply_to_message": {"message_id": 2, "date": date, "chat": chat, "text": "text"},
+            "reply_markup": {"inline_keyboard": [[{"text": "text", "callback_data": "data"}]]},
+        }
+
+    def test_lazy_de_json(self, bot, bot_info, lazy_json_dict):
+        lazy_bot = make_bot(bot_info, lazy_de_json=True)
+        assert lazy_bot.lazy_de_json
+
+        eager = Message.de_json(lazy_json_dict, bot)
+        lazy = Message.de_json(lazy_json_dict, lazy_bot)
+        assert set(lazy._lazy_data) == {"entities", "reply_to_message", "reply_markup"}
+        assert lazy == eager
+        assert lazy.text == eager.text
+        assert lazy.from_user == eager.from_user
+
+        # conversion on first access
+        reply_to_message = lazy.reply_to_message
+        assert isinstance(reply_to_message, Message)
+        assert reply_to_message.get_bot() is lazy_bot
+        assert set(lazy._lazy_data) == {"entities", "reply_markup"}
+        assert lazy.reply_to_message is reply_to_message
+        assert lazy.parse_entities() == eager.parse_entities()
+
+        assert lazy.to_dict() == eager.to_dict()
+        assert not lazy._lazy_data
+
+        with pytest.raises(AttributeError, match="can't be set"):
+            lazy.reply_markup = None
+        with pytest.raises(AttributeError, match="no attribute 'unknown'"):
+            lazy.unknown
+
+    def test_lazy_de_json_copy_and_pickle(self, bot, bot_info, lazy_json_dict):
+        lazy_bot = make_bot(bot_info, lazy_de_json=True)
+        eager = Message.de_json(lazy_json_dict, bot)
+
+        copied = deepcopy(Message.de_json(lazy_json_dict, lazy_bot))
+        assert copied.to_dict() == eager.to_dict()
+        assert copied.reply_to_message.get_bot() is lazy_bot
+
+        unpickled = pickle.loads(pickle.dumps(Message.de_json(lazy_json_dict, lazy_bot)))
+        assert unpickled.to_dict() == eager.to_dict()
+
     def test_de_json_localization(self, bot, raw_bot, tz_bot):
         json_dict = {
             "message_id": 12,
@@ -90,6 +90,32 @@ class TestTelegramObject:
         assert to.api_kwargs == {"foo": "bar"}
         assert to.get_bot() is bot
 
+    def test_de_json_api_kwargs_repeated(self, bot):
+        class SubClass(TelegramObject):
+            def __init__(self, arg: int, **kwargs):
+                super().__init__(**kwargs)
+                self.arg = arg
+
+        for _ in range(2):
+            to = SubClass.de_json(data={"arg": 1, "foo": "bar"}, bot=bot)
+            assert to.arg == 1
+            assert to.api_kwargs == {"foo": "bar"}
+            assert to.get_bot() is bot
+
+        # Once the unknown arguments are known, data without them must still work
+        to = SubClass.de_json(data={"arg": 2}, bot=bot)
+        assert to.arg == 2
+        assert to.api_kwargs == {}
+
+    def test_convert_fields(self, bot):
+        data = {"a": 1, "b": 2, "c": None}
+        TelegramObject._convert_fields(
+            data,
+            bot,
+            {"a": lambda value, b: (value, b), "c": lambda *_: "c", "d": lambda *_: pytest.fail()},
+        )
+        assert data == {"a": (1, bot), "b": 2, "c": "c"}
+
     def test_de_list(self, bot):
         class SubClass(TelegramObject):
             def __init__(self, arg: int, **kwargs):
@@ -207,6 +233,36 @@ class TestTelegramObject:
         assert isinstance(to_dict_recurse["subclass"], dict)
         assert to_dict_recurse["subclass"]["recursive"] == "recursive"
 
+    def test_get_attrs_names_per_class(self):
+        class Parent(TelegramObject):
+            __slots__ = ("_private", "parent")
+
+            def __init__(self):
+                super().__init__()
+                self.parent = 1
+                self._private = 2
+
+        class Child(Parent):
+            __slots__ = ("child",)
+
+            def __init__(self):
+                super().__init__()
+                self.child = 3
+
+        # Computing the names for the parent first must not affect the child and vice versa
+        for _ in range(2):
+            assert set(Parent()._get_attrs_names(include_private=False)) == {
+                "parent",
+                "api_kwargs",
+            }
+            assert set(Child()._get_attrs_names(include_private=False)) == {
+                "child",
+                "parent",
+                "api_kwargs",
+            }
+            assert "_private" in set(Child()._get_attrs_names(include_private=True))
+            assert Child().to_dict() == {"child": 3, "parent": 1}
+
     def test_to_dict_default_value(self):
         class SubClass(TelegramObject):
             def __init__(self):